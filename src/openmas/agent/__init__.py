@@ -2,15 +2,20 @@
 
 from openmas.agent.base import BaseAgent
 from openmas.agent.bdi import BdiAgent
+from openmas.agent.beliefs import BeliefBase
 from openmas.agent.mcp import McpAgent, mcp_prompt, mcp_resource, mcp_tool
 from openmas.agent.mcp_client import McpClientAgent
 from openmas.agent.mcp_prompt import PromptMcpAgent
 from openmas.agent.mcp_server import McpServerAgent
+from openmas.agent.runtime import AgentRuntime
 from openmas.agent.spade_bdi_agent import SpadeBdiAgent
+from openmas.communication.executor import offload
 
 __all__ = [
+    "AgentRuntime",
     "BaseAgent",
     "BdiAgent",
+    "BeliefBase",
     "McpAgent",
     "McpClientAgent",
     "McpServerAgent",
@@ -19,4 +24,5 @@ __all__ = [
     "mcp_tool",
     "mcp_prompt",
     "mcp_resource",
+    "offload",
 ]
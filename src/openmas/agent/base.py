@@ -4,12 +4,13 @@ import abc
 import asyncio
 from contextlib import suppress
 from pathlib import Path
-from typing import Any, Dict, Optional, Set, Type, Union
+from typing import Any, Dict, List, Optional, Set, Type, Union
 
 from pydantic import ValidationError
 
 from openmas.assets.manager import AssetManager
 from openmas.communication import BaseCommunicator, discover_local_communicators
+from openmas.communication.executor import HandlerExecutor
 from openmas.config import AgentConfig, load_config
 from openmas.exceptions import ConfigurationError, DependencyError, LifecycleError
 from openmas.logging import configure_logging, get_logger
@@ -90,10 +91,20 @@ class BaseAgent(abc.ABC):
 
         self.communicator = communicator_class(self.config.name, self.config.service_urls)
 
+        # Pools for handlers marked with offload(), shared by every communicator of the agent
+        self.handler_executor = HandlerExecutor(
+            thread_workers=getattr(self.config, "handler_thread_workers", None),
+            process_workers=getattr(self.config, "handler_process_workers", None),
+            name=self.config.name,
+        )
+        self.communicator.handler_executor = self.handler_executor
+
         # Internal state
         self._is_running = False
         self._task: Optional[asyncio.Task] = None
         self._background_tasks: Set[asyncio.Task] = set()
+        # Required assets pinned in the cache while the agent runs
+        self._pinned_assets: List[str] = []
 
         # Store project root for prompt/template resolution
         self.project_root = project_root or Path.cwd()
@@ -171,6 +182,7 @@ class BaseAgent(abc.ABC):
             communicator: The communicator to use
         """
         self.communicator = communicator
+        self.communicator.handler_executor = self.handler_executor
         self.logger.info("Set communicator", agent_name=self.name, communicator_type=communicator.__class__.__name__)
 
     def create_background_task(self, coro: Any) -> asyncio.Task:
@@ -188,10 +200,31 @@ class BaseAgent(abc.ABC):
         task.add_done_callback(self._background_tasks.discard)
         return task
 
+    async def _pin_required_assets(self) -> None:
+        """Pin the agent's required assets, so that cache eviction leaves them alone while it runs."""
+        if self.asset_manager is None:
+            return
+        for asset_name in getattr(self.config, "required_assets", None) or []:
+            try:
+                await self.asset_manager.pin_asset(asset_name)
+            except KeyError:
+                self.logger.warning("Required asset is not configured in the project", asset=asset_name)
+                continue
+            self._pinned_assets.append(asset_name)
+
+    def _unpin_required_assets(self) -> None:
+        """Release the pins taken by _pin_required_assets()."""
+        if self.asset_manager is not None:
+            for asset_name in self._pinned_assets:
+                self.asset_manager.unpin_asset(asset_name)
+        self._pinned_assets.clear()
+
     async def start(self) -> None:
         """Start the agent.
 
         This method initializes the agent, sets up the communicator, and starts the main loop.
+        The agent's ``required_assets`` are pinned in the asset cache until it stops, so paths
+        obtained from the asset manager stay valid while it runs.
         """
         if self._is_running:
             raise LifecycleError("Agent is already running")
@@ -207,11 +240,13 @@ class BaseAgent(abc.ABC):
 
         try:
             # Call setup hook - wrap in try/except to catch any exceptions
+            await self._pin_required_assets()
             self.logger.debug("Setting up agent")
             await self.setup()
             self.logger.debug("Agent setup complete")
         except Exception as e:
             self.logger.error("Error in agent setup", error=str(e), exc_info=True)
+            self._unpin_required_assets()
             # Try to stop the communicator if setup fails
             try:
                 await self.communicator.stop()
@@ -278,6 +313,13 @@ class BaseAgent(abc.ABC):
         except Exception as e:
             self.logger.error("Error stopping communicator", error=str(e), exc_info=True)
 
+        # Wait for offloaded handlers off the event loop, but not for a hung one; the pools are
+        # recreated on the next start
+        await asyncio.to_thread(
+            self.handler_executor.shutdown, timeout=getattr(self.config, "handler_shutdown_timeout", None)
+        )
+
+        self._unpin_required_assets()
         self._is_running = False
         self.logger.info("Agent stopped", agent_name=self.name)
 
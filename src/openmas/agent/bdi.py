@@ -6,16 +6,40 @@ intentions management.
 """
 
 import asyncio
+import itertools
+import re
+import time
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Type
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from openmas.agent.base import BaseAgent
+from openmas.agent.bdi_snapshot import BdiSnapshotStore
+from openmas.agent.beliefs import BeliefBase
 from openmas.assets.manager import AssetManager
 from openmas.config import AgentConfig
 from openmas.logging import get_logger
 
 logger = get_logger(__name__)
 
+_REMOVED = object()
+# Ids given to intentions added without one
+_AUTO_INTENTION_ID = re.compile(r"intention-(\d+)")
+
 
 class BdiAgent(BaseAgent):
     """Base agent class for BDI agents in OpenMAS.
@@ -33,6 +57,11 @@ class BdiAgent(BaseAgent):
         env_prefix: str = "",
         bdi_enabled: bool = True,
         deliberation_cycle_interval: float = 0.1,
+        event_driven: bool = False,
+        max_pending_notifications: int = 10_000,
+        snapshot_dir: Optional[Union[str, Path]] = None,
+        snapshot_interval: float = 300.0,
+        journal_flush_interval: float = 1.0,
         project_root: Optional[Path] = None,
         asset_manager: Optional[AssetManager] = None,
     ) -> None:
@@ -45,6 +74,15 @@ class BdiAgent(BaseAgent):
             env_prefix: Optional prefix for environment variables
             bdi_enabled: Whether BDI reasoning is enabled
             deliberation_cycle_interval: Interval between deliberation cycles (in seconds)
+            event_driven: Run the reasoning cycle only when beliefs, desires or intentions change
+                (or request_cycle() is called) instead of every deliberation_cycle_interval
+            max_pending_notifications: Number of undelivered change notifications at which
+                wait_for_notification_capacity() (awaited by the reasoning cycle after each step)
+                waits for the hooks to catch up
+            snapshot_dir: Optional directory for persisting beliefs, desires and intentions.
+                State is restored from it when the agent starts and saved when it stops.
+            snapshot_interval: Seconds between full snapshots while running
+            journal_flush_interval: Seconds between appends of recent changes to the journal
             project_root: The project root directory for resolving prompt/template files
             asset_manager: The asset manager for accessing required assets
         """
@@ -58,31 +96,72 @@ class BdiAgent(BaseAgent):
         )
 
         # BDI state
-        self._beliefs: Dict[str, Any] = {}
+        self._beliefs = BeliefBase()
         self._desires: Set[str] = set()
-        self._intentions: List[Dict[str, Any]] = []
+        # Intentions keyed by their "id", in insertion order
+        self._intentions: "OrderedDict[Any, Dict[str, Any]]" = OrderedDict()
+        self._intention_ids = itertools.count(1)
         self._bdi_enabled = bdi_enabled
         self._deliberation_cycle_interval = deliberation_cycle_interval
         self._bdi_task: Optional[asyncio.Task] = None
+        self._event_driven = event_driven
+        self._cycle_requested = asyncio.Event()
+
+        # Change notifications waiting for delivery, in the order the changes were made: the hook
+        # to call with (item, added), or None for a batch of consecutive belief changes that is
+        # coalesced per belief until the dispatcher takes it
+        if max_pending_notifications < 1:
+            raise ValueError("max_pending_notifications must be at least 1")
+        self._pending_changes: Deque[Tuple[Optional[Callable[..., Awaitable[None]]], Any, bool]] = deque()
+        self._pending_count = 0
+        self._max_pending_notifications = max_pending_notifications
+        self._notification_capacity = asyncio.Event()
+        self._notification_task: Optional[asyncio.Task] = None
+
+        # Persistence: changes since the last journal flush, coalesced per item
+        self._snapshot_store = BdiSnapshotStore(snapshot_dir) if snapshot_dir is not None else None
+        self._snapshot_interval = snapshot_interval
+        self._journal_flush_interval = journal_flush_interval
+        self._snapshot_lock = asyncio.Lock()
+        self._last_snapshot = time.monotonic()
+        self._journal_beliefs: Dict[str, Any] = {}
+        self._journal_desires: Dict[str, bool] = {}
+        self._journal_intentions: Dict[Any, Any] = {}
 
         self.logger.info(
             "Initialized BDI agent",
             agent_name=self.name,
             bdi_enabled=bdi_enabled,
             cycle_interval=deliberation_cycle_interval,
+            event_driven=event_driven,
         )
 
     # Belief management methods
-    def add_belief(self, belief_name: str, belief_value: Any) -> None:
+    def add_belief(self, belief_name: str, belief_value: Any, tags: Optional[Iterable[str]] = None) -> None:
         """Add or update a belief.
 
         Args:
-            belief_name: The name of the belief
+            belief_name: The name of the belief. Dotted names (``room.kitchen.temperature``)
+                can be queried by prefix.
             belief_value: The value of the belief
+            tags: Optional tags for the belief, replacing its current tags
         """
-        self._beliefs[belief_name] = belief_value
+        changed = self._beliefs.set(belief_name, belief_value, tags)
+        if changed and self._snapshot_store is not None:
+            self._journal_beliefs[belief_name] = [belief_value, sorted(self._beliefs.tags_of(belief_name))]
         self.logger.debug("Added belief", agent_name=self.name, belief=belief_name, value=belief_value)
-        asyncio.create_task(self.on_belief_change(belief_name, belief_value))
+        if changed:
+            self.request_cycle()
+        self._queue_belief_change(belief_name, belief_value)
+
+    def add_beliefs(self, beliefs: Mapping[str, Any]) -> None:
+        """Add or update several beliefs at once.
+
+        Args:
+            beliefs: Mapping of belief names to values
+        """
+        for belief_name, belief_value in beliefs.items():
+            self.add_belief(belief_name, belief_value)
 
     def remove_belief(self, belief_name: str) -> None:
         """Remove a belief.
@@ -90,10 +169,12 @@ class BdiAgent(BaseAgent):
         Args:
             belief_name: The name of the belief
         """
-        if belief_name in self._beliefs:
-            del self._beliefs[belief_name]
+        if self._beliefs.remove(belief_name):
+            if self._snapshot_store is not None:
+                self._journal_beliefs[belief_name] = _REMOVED
             self.logger.debug("Removed belief", agent_name=self.name, belief=belief_name)
-            asyncio.create_task(self.on_belief_change(belief_name, None))
+            self.request_cycle()
+            self._queue_belief_change(belief_name, None)
 
     def get_belief(self, belief_name: str, default: Any = None) -> Any:
         """Get the value of a belief.
@@ -110,11 +191,68 @@ class BdiAgent(BaseAgent):
     def get_all_beliefs(self) -> Dict[str, Any]:
         """Get all beliefs.
 
+        This copies the belief base; use :attr:`beliefs` or :meth:`query_beliefs` to avoid
+        the copy for large belief bases.
+
         Returns:
             A dictionary of all beliefs
         """
         return self._beliefs.copy()
 
+    @property
+    def beliefs(self) -> Mapping[str, Any]:
+        """Get a read-only live view of all beliefs."""
+        return self._beliefs.view()
+
+    @property
+    def belief_version(self) -> int:
+        """Get the belief base version, which increases with every belief change."""
+        return self._beliefs.version
+
+    def query_beliefs(
+        self,
+        pattern: Optional[str] = None,
+        tag: Optional[str] = None,
+        predicate: Optional[Callable[[str, Any], bool]] = None,
+    ) -> Dict[str, Any]:
+        """Find beliefs by name pattern, tag and/or predicate.
+
+        Args:
+            pattern: fnmatch-style name pattern, e.g. ``room.*.temperature``
+            tag: Only include beliefs with this tag
+            predicate: Only include beliefs for which ``predicate(name, value)`` is true
+
+        Returns:
+            Mapping of matching belief names to values
+        """
+        return self._beliefs.query(pattern=pattern, tag=tag, predicate=predicate)
+
+    def beliefs_changed_since(self, version: int) -> Dict[str, Any]:
+        """Get the beliefs that changed after a belief base version.
+
+        Example:
+            seen = self.belief_version
+            ...
+            for name, value in self.beliefs_changed_since(seen).items():
+                ...
+
+        Only the most recent removals are remembered. If ``version`` is older than
+        :attr:`belief_compacted_version`, removals may be missing and all beliefs should be
+        re-read instead.
+
+        Args:
+            version: A previous value of :attr:`belief_version`
+
+        Returns:
+            Mapping of changed belief names to their current values (None if removed)
+        """
+        return self._beliefs.changed_since(version)
+
+    @property
+    def belief_compacted_version(self) -> int:
+        """Get the newest version whose removals beliefs_changed_since() may no longer report."""
+        return self._beliefs.compacted_version
+
     # Desire management methods
     def add_desire(self, desire: str) -> None:
         """Add a desire.
@@ -122,9 +260,13 @@ class BdiAgent(BaseAgent):
         Args:
             desire: The desire to add
         """
+        if desire not in self._desires:
+            self.request_cycle()
+        if desire not in self._desires and self._snapshot_store is not None:
+            self._journal_desires[desire] = True
         self._desires.add(desire)
         self.logger.debug("Added desire", agent_name=self.name, desire=desire)
-        asyncio.create_task(self.on_desire_change(desire, True))
+        self._queue_change(self.on_desire_change, desire, True)
 
     def remove_desire(self, desire: str) -> None:
         """Remove a desire.
@@ -134,8 +276,11 @@ class BdiAgent(BaseAgent):
         """
         if desire in self._desires:
             self._desires.remove(desire)
+            if self._snapshot_store is not None:
+                self._journal_desires[desire] = False
             self.logger.debug("Removed desire", agent_name=self.name, desire=desire)
-            asyncio.create_task(self.on_desire_change(desire, False))
+            self.request_cycle()
+            self._queue_change(self.on_desire_change, desire, False)
 
     def get_all_desires(self) -> Set[str]:
         """Get all desires.
@@ -149,12 +294,29 @@ class BdiAgent(BaseAgent):
     def add_intention(self, intention: Dict[str, Any]) -> None:
         """Add an intention.
 
+        An intention with the same "id" as an existing one replaces it, keeping its position;
+        on_intention_change() then sees the old intention removed before the new one is added.
+        Adding an intention equal to the stored one is not a change and does nothing, so to
+        update an intention add a changed copy rather than modifying the stored one in place.
+        An intention without an "id" is given one (``intention-<n>``), so it can be removed and
+        survives a restart.
+
         Args:
             intention: The intention to add, typically a dictionary with at least an "id" key
         """
-        self._intentions.append(intention)
+        key = self._ensure_intention_id(intention)
+        replaced = self._intentions.get(key)
+        if replaced is not None and replaced == intention:
+            return
+        self._intentions[key] = intention
+        if self._snapshot_store is not None:
+            self._journal_intentions[key] = intention
+        if replaced is not None:
+            self.logger.debug("Replaced intention", agent_name=self.name, intention=replaced)
+            self._queue_change(self.on_intention_change, replaced, False)
         self.logger.debug("Added intention", agent_name=self.name, intention=intention)
-        asyncio.create_task(self.on_intention_change(intention, True))
+        self.request_cycle()
+        self._queue_change(self.on_intention_change, intention, True)
 
     def remove_intention(self, intention_id: str) -> None:
         """Remove an intention.
@@ -162,20 +324,38 @@ class BdiAgent(BaseAgent):
         Args:
             intention_id: The ID of the intention to remove
         """
-        for i, intention in enumerate(self._intentions):
-            if intention.get("id") == intention_id:
-                removed = self._intentions.pop(i)
-                self.logger.debug("Removed intention", agent_name=self.name, intention=removed)
-                asyncio.create_task(self.on_intention_change(removed, False))
-                break
+        removed = self._intentions.pop(intention_id, None)
+        if removed is not None:
+            if self._snapshot_store is not None:
+                self._journal_intentions[intention_id] = _REMOVED
+            self.logger.debug("Removed intention", agent_name=self.name, intention=removed)
+            self.request_cycle()
+            self._queue_change(self.on_intention_change, removed, False)
+
+    def get_intention(self, intention_id: str) -> Optional[Dict[str, Any]]:
+        """Get an intention by ID.
+
+        Args:
+            intention_id: The ID of the intention
+
+        Returns:
+            The intention, or None if there is no intention with that ID
+        """
+        return self._intentions.get(intention_id)
 
     def get_all_intentions(self) -> List[Dict[str, Any]]:
         """Get all intentions.
 
         Returns:
-            A list of all intentions
+            A list of all intentions, in the order they were added
         """
-        return self._intentions.copy()
+        return list(self._intentions.values())
+
+    def _ensure_intention_id(self, intention: Dict[str, Any]) -> Any:
+        """Get the id of an intention, assigning the next unused one if it has none."""
+        if "id" not in intention:
+            intention["id"] = f"intention-{next(self._intention_ids)}"
+        return intention["id"]
 
     # BDI lifecycle hooks (to be overridden by subclasses)
     async def update_beliefs(self) -> None:
@@ -213,6 +393,18 @@ class BdiAgent(BaseAgent):
         pass
 
     # Event hooks
+    async def on_beliefs_changed(self, diff: Dict[str, Any]) -> None:
+        """Called once per batch of belief changes.
+
+        Changes made in quick succession (for example a bulk perception update) are
+        delivered together, with only the latest value of each belief. This is called
+        before the per-belief on_belief_change hook.
+
+        Args:
+            diff: Mapping of changed belief names to their new values (None if removed)
+        """
+        pass
+
     async def on_belief_change(self, belief_name: str, belief_value: Any) -> None:
         """Called when a belief is added, updated, or removed.
 
@@ -246,7 +438,127 @@ class BdiAgent(BaseAgent):
         """
         pass
 
+    # Change notification dispatch
+    @property
+    def pending_notifications(self) -> int:
+        """Get the number of change notifications waiting for delivery."""
+        return self._pending_count
+
+    def _queue_change(self, hook: Callable[..., Awaitable[None]], item: Any, added: bool) -> None:
+        """Queue a desire or intention change notification."""
+        self._pending_changes.append((hook, item, added))
+        self._pending_count += 1
+        self._schedule_notifications()
+
+    def _queue_belief_change(self, belief_name: str, belief_value: Any) -> None:
+        """Queue a belief change, coalescing it with the belief changes queued just before."""
+        if self._pending_changes and self._pending_changes[-1][0] is None:
+            batch = self._pending_changes[-1][1]
+        else:
+            batch = {}
+            self._pending_changes.append((None, batch, True))
+        if belief_name not in batch:
+            self._pending_count += 1
+        batch[belief_name] = belief_value
+        self._schedule_notifications()
+
+    async def flush_notifications(self) -> None:
+        """Wait until all pending change notifications have been delivered.
+
+        Producers of bulk updates can await this to apply backpressure.
+        """
+        while True:
+            task = self._notification_task
+            if task is asyncio.current_task():
+                # Called from a hook; the remaining changes are delivered after it returns
+                return
+            if task is None or task.done():
+                if not self.pending_notifications:
+                    return
+                self._schedule_notifications()
+                task = self._notification_task
+                if task is None:
+                    return
+            await asyncio.shield(task)
+
+    async def wait_for_notification_capacity(self) -> None:
+        """Wait until fewer than max_pending_notifications change notifications are pending.
+
+        The reasoning cycle awaits this after each step. Other producers (message handlers,
+        perception callbacks) should await it after bulk updates, so that changes cannot pile
+        up faster than the hooks consume them.
+        """
+        while self.pending_notifications >= self._max_pending_notifications:
+            if self._notification_task is asyncio.current_task():
+                # Called from a hook; waiting would block the dispatcher itself
+                return
+            self._notification_capacity.clear()
+            self._schedule_notifications()
+            if self._notification_task is None:
+                return
+            await self._notification_capacity.wait()
+
+    def _schedule_notifications(self) -> None:
+        """Start the notification dispatcher unless it is already running."""
+        if self._notification_task is not None and not self._notification_task.done():
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop yet; pending changes are delivered once the agent runs
+            return
+        self._notification_task = self.create_background_task(self._dispatch_notifications())
+
+    async def _dispatch_notifications(self) -> None:
+        """Deliver pending change notifications in the order the changes were made."""
+        try:
+            while self._pending_changes:
+                hook, item, added = self._pending_changes.popleft()
+                self._pending_count -= len(item) if hook is None else 1
+                if self._pending_count < self._max_pending_notifications:
+                    self._notification_capacity.set()
+
+                if hook is None:
+                    await self._call_hook(self.on_beliefs_changed(item))
+                    for belief_name, belief_value in item.items():
+                        await self._call_hook(self.on_belief_change(belief_name, belief_value))
+                else:
+                    await self._call_hook(hook(item, added))
+        finally:
+            # Wake producers waiting for capacity even if the dispatcher was cancelled
+            self._notification_capacity.set()
+
+    async def _call_hook(self, hook: Awaitable[None]) -> None:
+        """Await a change hook, logging rather than propagating its errors."""
+        try:
+            await hook
+        except Exception as e:
+            self.logger.exception("Error in BDI change hook", agent_name=self.name, error=str(e))
+
     # BDI reasoning cycle
+    def request_cycle(self) -> None:
+        """Request a run of the reasoning cycle.
+
+        In event-driven mode the cycle sleeps until this is called. Belief, desire and
+        intention changes call it automatically; perception sources (callbacks, message
+        handlers) should call it when new percepts are available. Requests made while a
+        cycle is running are coalesced into a single follow-up cycle.
+        """
+        self._cycle_requested.set()
+
+    def schedule_cycle(self, delay: float) -> asyncio.TimerHandle:
+        """Request a run of the reasoning cycle after a delay.
+
+        Use this for timer-driven behaviour (deadlines, periodic checks) in event-driven mode.
+
+        Args:
+            delay: Delay in seconds
+
+        Returns:
+            A handle that can be used to cancel the timer
+        """
+        return asyncio.get_running_loop().call_later(delay, self.request_cycle)
+
     async def _run_bdi_cycle(self) -> None:
         """Run the BDI reasoning cycle.
 
@@ -255,34 +567,179 @@ class BdiAgent(BaseAgent):
         2. Deliberation (desire selection)
         3. Planning (intention selection)
         4. Intention execution
+
+        In interval mode the loop repeats every deliberation_cycle_interval. In event-driven
+        mode it runs once at start and then waits for request_cycle(). After each step it waits
+        while max_pending_notifications or more change notifications are undelivered.
         """
-        self.logger.info("Starting BDI reasoning cycle", agent_name=self.name)
+        self.logger.info("Starting BDI reasoning cycle", agent_name=self.name, event_driven=self._event_driven)
+        self._cycle_requested.set()
 
         while self._bdi_enabled:
             try:
+                if self._event_driven:
+                    await self._cycle_requested.wait()
+                    self._cycle_requested.clear()
+
                 # Step 1: Update beliefs based on perception
                 await self.update_beliefs()
+                await self.wait_for_notification_capacity()
 
                 # Step 2: Deliberate (select desires based on beliefs)
                 await self.deliberate()
+                await self.wait_for_notification_capacity()
 
                 # Step 3: Plan (create intentions to achieve desires)
                 await self.plan()
+                await self.wait_for_notification_capacity()
 
                 # Step 4: Execute intentions
                 await self.execute_intentions()
+                await self.wait_for_notification_capacity()
 
                 # Wait before next cycle
-                await asyncio.sleep(self._deliberation_cycle_interval)
+                if not self._event_driven:
+                    await asyncio.sleep(self._deliberation_cycle_interval)
 
             except asyncio.CancelledError:
                 self.logger.info("BDI reasoning cycle cancelled", agent_name=self.name)
                 break
             except Exception as e:
                 self.logger.exception("Error in BDI reasoning cycle", agent_name=self.name, error=str(e))
-                await asyncio.sleep(self._deliberation_cycle_interval)
+                if not self._event_driven:
+                    await asyncio.sleep(self._deliberation_cycle_interval)
+
+    # Persistence
+    async def restore_snapshot(self) -> bool:
+        """Restore beliefs, desires and intentions from the snapshot directory.
+
+        Restored state replaces the current state without calling the change hooks. This is
+        called automatically by :meth:`start` when a snapshot directory is configured.
+
+        Returns:
+            True if saved state was found and restored
+        """
+        if self._snapshot_store is None:
+            return False
+        state = await asyncio.to_thread(self._snapshot_store.load)
+        if state is None:
+            return False
+
+        self._beliefs.clear()
+        for belief_name, (belief_value, tags) in state["beliefs"].items():
+            self._beliefs.set(belief_name, belief_value, tags)
+        self._desires = set(state["desires"])
+        # Continue numbering after the ids given to intentions before the restart
+        numbers = [
+            int(match.group(1))
+            for match in (_AUTO_INTENTION_ID.fullmatch(str(intention.get("id"))) for intention in state["intentions"])
+            if match is not None
+        ]
+        self._intention_ids = itertools.count(max(numbers, default=0) + 1)
+        self._intentions = OrderedDict(
+            (self._ensure_intention_id(intention), intention) for intention in state["intentions"]
+        )
+        self._journal_beliefs.clear()
+        self._journal_desires.clear()
+        self._journal_intentions.clear()
+        self.logger.info(
+            "Restored BDI state",
+            agent_name=self.name,
+            beliefs=len(self._beliefs),
+            desires=len(self._desires),
+            intentions=len(self._intentions),
+        )
+        return True
+
+    async def save_snapshot(self) -> None:
+        """Write a full snapshot of beliefs, desires and intentions.
+
+        This is called periodically while the agent runs and when it stops.
+        """
+        store = self._snapshot_store
+        if store is None:
+            return
+        async with self._snapshot_lock:
+            state = {
+                "beliefs": {
+                    name: [value, sorted(self._beliefs.tags_of(name))] for name, value in self._beliefs.items()
+                },
+                "desires": sorted(self._desires),
+                "intentions": list(self._intentions.values()),
+            }
+            journal = self._take_journal()
+            try:
+                # Serialized here, as the state keeps changing while the thread writes it
+                payload = store.encode_snapshot(state)
+                await asyncio.to_thread(store.write_encoded_snapshot, payload)
+            except BaseException:
+                self._restore_journal(*journal)
+                raise
+            self._last_snapshot = time.monotonic()
+
+    async def flush_journal(self) -> None:
+        """Append the changes made since the last flush to the journal."""
+        store = self._snapshot_store
+        if store is None or not (self._journal_beliefs or self._journal_desires or self._journal_intentions):
+            return
+        async with self._snapshot_lock:
+            beliefs, desires, intentions = self._take_journal()
+            delta = {
+                "beliefs": {name: entry for name, entry in beliefs.items() if entry is not _REMOVED},
+                "removed_beliefs": [name for name, entry in beliefs.items() if entry is _REMOVED],
+                "desires": desires,
+                "intentions": [entry for entry in intentions.values() if entry is not _REMOVED],
+                "removed_intentions": [key for key, entry in intentions.items() if entry is _REMOVED],
+            }
+            try:
+                # Serialized here, as the state keeps changing while the thread writes it
+                record = store.encode_record(delta)
+                await asyncio.to_thread(store.append_record, record)
+            except BaseException:
+                # Nothing was written (e.g. a value is not JSON-serializable); keep the changes
+                # for the next flush or snapshot instead of dropping them
+                self._restore_journal(beliefs, desires, intentions)
+                raise
+
+    def _take_journal(self) -> Tuple[Dict[str, Any], Dict[str, bool], Dict[Any, Any]]:
+        """Take the unpersisted changes, leaving empty journals for changes made meanwhile."""
+        taken = self._journal_beliefs, self._journal_desires, self._journal_intentions
+        self._journal_beliefs, self._journal_desires, self._journal_intentions = {}, {}, {}
+        return taken
+
+    def _restore_journal(self, beliefs: Dict[str, Any], desires: Dict[str, bool], intentions: Dict[Any, Any]) -> None:
+        """Put back changes taken with _take_journal() that failed to persist.
+
+        Changes made since they were taken are newer, so they win over the restored ones.
+        """
+        self._journal_beliefs = {**beliefs, **self._journal_beliefs}
+        self._journal_desires = {**desires, **self._journal_desires}
+        self._journal_intentions = {**intentions, **self._journal_intentions}
+
+    async def _run_persistence(self) -> None:
+        """Periodically flush the journal and write snapshots."""
+        while True:
+            await asyncio.sleep(self._journal_flush_interval)
+            try:
+                if time.monotonic() - self._last_snapshot >= self._snapshot_interval:
+                    await self.save_snapshot()
+                else:
+                    await self.flush_journal()
+            except Exception as e:
+                self.logger.exception("Failed to persist BDI state", agent_name=self.name, error=str(e))
 
     # BaseAgent lifecycle methods
+    async def start(self) -> None:
+        """Start the agent, restoring saved BDI state first if a snapshot directory is set."""
+        await self.restore_snapshot()
+        await super().start()
+
+    async def stop(self) -> None:
+        """Stop the agent, saving a final snapshot if a snapshot directory is set."""
+        await super().stop()
+        if self._snapshot_store is not None:
+            await self.save_snapshot()
+
     async def setup(self) -> None:
         """Set up the BDI agent.
 
@@ -296,6 +753,12 @@ class BdiAgent(BaseAgent):
 
         This method starts the BDI reasoning cycle and runs until the agent is stopped.
         """
+        # Deliver changes made before the event loop was running
+        self._schedule_notifications()
+
+        if self._snapshot_store is not None:
+            self.create_background_task(self._run_persistence())
+
         if self._bdi_enabled:
             self._bdi_task = asyncio.create_task(self._run_bdi_cycle())
 
@@ -0,0 +1,222 @@
+"""Snapshot and restore of BDI agent state.
+
+A :class:`BdiSnapshotStore` keeps an agent's beliefs, desires and intentions in a directory:
+
+* ``snapshot.json`` holds the complete state as of a sequence number. It is replaced
+  atomically, so a crash never leaves a half-written snapshot.
+* ``journal.jsonl`` holds the changes made since the snapshot, one JSON record per flush.
+  Records are appended, so persisting a change costs only the size of the change.
+
+Loading reads the snapshot and replays journal records with a higher sequence number. A
+truncated last journal line (from a crash mid-write) is ignored and cut off the journal, so that
+later records are appended after the last complete one. Belief values, desires and intentions
+must be JSON-serializable, and intentions are identified by their "id".
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from openmas.logging import get_logger
+
+logger = get_logger(__name__)
+
+SNAPSHOT_FORMAT = 1
+
+
+def empty_state() -> Dict[str, Any]:
+    """Create an empty BDI state.
+
+    Returns:
+        A state with no beliefs, desires or intentions
+    """
+    return {"beliefs": {}, "desires": [], "intentions": []}
+
+
+def apply_delta(state: Dict[str, Any], delta: Dict[str, Any]) -> None:
+    """Apply a journal record to a state in place.
+
+    Args:
+        state: A state as returned by :meth:`BdiSnapshotStore.load`
+        delta: A journal record
+    """
+    beliefs = state["beliefs"]
+    for name in delta.get("removed_beliefs", []):
+        beliefs.pop(name, None)
+    beliefs.update(delta.get("beliefs", {}))
+
+    desires = dict.fromkeys(state["desires"])
+    for desire, added in delta.get("desires", {}).items():
+        if added:
+            desires[desire] = None
+        else:
+            desires.pop(desire, None)
+    state["desires"] = list(desires)
+
+    removed = set(delta.get("removed_intentions", []))
+    added = delta.get("intentions", [])
+    replaced = {intention["id"] for intention in added if isinstance(intention, dict) and "id" in intention}
+    state["intentions"] = [
+        intention for intention in state["intentions"] if intention.get("id") not in removed | replaced
+    ] + added
+
+
+class BdiSnapshotStore:
+    """On-disk snapshot plus append-only journal of a BDI agent's state."""
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        """Initialize the store.
+
+        Args:
+            directory: Directory for the snapshot and journal files (created if missing)
+        """
+        self.directory = Path(directory)
+        self.snapshot_path = self.directory / "snapshot.json"
+        self.journal_path = self.directory / "journal.jsonl"
+        self.seq = 0
+        self.journal_records = 0
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Load the latest state.
+
+        Returns:
+            The state with "beliefs" (name to ``[value, tags]``), "desires" and "intentions",
+            or None if nothing has been saved yet
+        """
+        state: Optional[Dict[str, Any]] = None
+        if self.snapshot_path.exists():
+            with self.snapshot_path.open("r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            self.seq = snapshot.get("seq", 0)
+            state = {key: snapshot[key] for key in empty_state()}
+
+        self.journal_records = 0
+        if self.journal_path.exists():
+            # Offset after the last complete record, where the next record has to be appended
+            valid_end = 0
+            torn = missing_newline = False
+            with self.journal_path.open("rb") as f:
+                for line in f:
+                    try:
+                        delta = json.loads(line)
+                    except ValueError:
+                        logger.warning("Ignoring truncated BDI journal record", path=str(self.journal_path))
+                        torn = True
+                        break
+                    valid_end += len(line)
+                    missing_newline = not line.endswith(b"\n")
+                    if delta.get("seq", 0) <= self.seq:
+                        continue
+                    if state is None:
+                        state = empty_state()
+                    apply_delta(state, delta)
+                    self.seq = delta["seq"]
+                    self.journal_records += 1
+            if torn or missing_newline:
+                self._repair_journal(valid_end, missing_newline)
+        return state
+
+    def _repair_journal(self, valid_end: int, missing_newline: bool) -> None:
+        """Cut a torn record off the end of the journal.
+
+        Records appended after a torn one would otherwise be unreadable, because loading stops
+        at the first line that is not valid JSON.
+
+        Args:
+            valid_end: Offset after the last complete record
+            missing_newline: Whether the last complete record lacks its line terminator
+        """
+        with self.journal_path.open("r+b") as f:
+            f.truncate(valid_end)
+            if missing_newline:
+                f.seek(valid_end)
+                f.write(b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def append(self, delta: Dict[str, Any]) -> None:
+        """Append a change record to the journal.
+
+        Args:
+            delta: The changes, with any of the keys "beliefs", "removed_beliefs", "desires",
+                "intentions" and "removed_intentions"
+        """
+        self.append_record(self.encode_record(delta))
+
+    def encode_record(self, delta: Dict[str, Any]) -> str:
+        """Serialize a change record for :meth:`append_record`.
+
+        Serializing is separate from writing so that callers can take a consistent copy of
+        live state on their own thread and leave only the write to another one.
+
+        Args:
+            delta: The changes, as for :meth:`append`
+
+        Returns:
+            The serialized record, numbered after the current sequence number
+
+        Raises:
+            TypeError: If the changes are not JSON-serializable
+        """
+        return json.dumps({"seq": self.seq + 1, **delta}, separators=(",", ":"))
+
+    def append_record(self, record: str) -> None:
+        """Append a record serialized with :meth:`encode_record` to the journal.
+
+        Args:
+            record: The serialized record
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self.journal_path.open("a", encoding="utf-8") as f:
+            f.write(record + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.seq += 1
+        self.journal_records += 1
+
+    def write_snapshot(self, state: Dict[str, Any]) -> None:
+        """Write a complete snapshot and clear the journal.
+
+        Args:
+            state: The complete state, in the format returned by :meth:`load`
+        """
+        self.write_encoded_snapshot(self.encode_snapshot(state))
+
+    def encode_snapshot(self, state: Dict[str, Any]) -> str:
+        """Serialize a complete state for :meth:`write_encoded_snapshot`.
+
+        Args:
+            state: The complete state, in the format returned by :meth:`load`
+
+        Returns:
+            The serialized snapshot as of the current sequence number
+
+        Raises:
+            TypeError: If the state is not JSON-serializable
+        """
+        return json.dumps({"format": SNAPSHOT_FORMAT, "seq": self.seq, **state}, separators=(",", ":"))
+
+    def write_encoded_snapshot(self, payload: str) -> None:
+        """Write a snapshot serialized with :meth:`encode_snapshot` and clear the journal.
+
+        Args:
+            payload: The serialized snapshot
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.snapshot_path.with_suffix(".json.tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        # Journal records up to self.seq are now covered by the snapshot
+        self.journal_path.unlink(missing_ok=True)
+        self.journal_records = 0
+
+    def clear(self) -> None:
+        """Delete the snapshot and journal."""
+        self.snapshot_path.unlink(missing_ok=True)
+        self.journal_path.unlink(missing_ok=True)
+        self.seq = 0
+        self.journal_records = 0
@@ -0,0 +1,292 @@
+"""Indexed belief storage for BDI agents.
+
+Beliefs are stored by name. Dotted names (``room.kitchen.temperature``) are indexed by each
+of their prefixes (``room``, ``room.kitchen``), and beliefs can carry tags, so queries only
+look at matching beliefs instead of scanning the whole belief base. Every change bumps a
+global version counter, which makes it cheap to find what changed since a given point.
+
+Removed beliefs leave a tombstone so that consumers behind the current version learn about the
+removal. Only the most recent ``max_tombstones`` are kept; :attr:`BeliefBase.compacted_version`
+tells how far back removals are still reported.
+"""
+
+import fnmatch
+import re
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional, Set, Tuple
+
+_MISSING = object()
+_WILDCARD = re.compile(r"[*?\[]")
+
+
+def _value_changed(old: Any, new: Any) -> bool:
+    """Check whether a belief value changed, treating incomparable values as changed."""
+    if old is new:
+        return False
+    try:
+        return bool(old != new)
+    except Exception:
+        return True
+
+
+def _prefixes(name: str) -> Iterator[str]:
+    """Yield the dotted prefixes of a belief name, e.g. ``a`` and ``a.b`` for ``a.b.c``."""
+    index = name.find(".")
+    while index != -1:
+        yield name[:index]
+        index = name.find(".", index + 1)
+
+
+class BeliefBase:
+    """A belief store with prefix and tag indexes and per-belief versions."""
+
+    def __init__(self, max_tombstones: int = 10_000) -> None:
+        """Initialize an empty belief base.
+
+        Args:
+            max_tombstones: Number of removed beliefs remembered for :meth:`changed_since`
+        """
+        self._values: Dict[str, Any] = {}
+        self._tags: Dict[str, Set[str]] = {}
+        self._tag_index: Dict[str, Set[str]] = {}
+        self._prefix_index: Dict[str, Set[str]] = {}
+        # Version of the last change to each belief (including removals), oldest first
+        self._changes: "OrderedDict[str, int]" = OrderedDict()
+        # Names of removed beliefs that are still in _changes, oldest removal first
+        self._tombstones: "OrderedDict[str, None]" = OrderedDict()
+        self._max_tombstones = max_tombstones
+        self.version = 0
+        self.compacted_version = 0
+
+    def __len__(self) -> int:
+        """Get the number of beliefs."""
+        return len(self._values)
+
+    def __contains__(self, name: object) -> bool:
+        """Check whether a belief exists."""
+        return name in self._values
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over belief names."""
+        return iter(self._values)
+
+    def __getitem__(self, name: str) -> Any:
+        """Get the value of a belief, raising KeyError if it does not exist."""
+        return self._values[name]
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        """Add or update a belief, keeping its tags."""
+        self.set(name, value)
+
+    def __delitem__(self, name: str) -> None:
+        """Remove a belief, raising KeyError if it does not exist."""
+        if not self.remove(name):
+            raise KeyError(name)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Get the value of a belief.
+
+        Args:
+            name: The name of the belief
+            default: Value returned if the belief does not exist
+
+        Returns:
+            The value of the belief or the default value
+        """
+        return self._values.get(name, default)
+
+    def items(self) -> Iterable[Tuple[str, Any]]:
+        """Get a live view of (name, value) pairs."""
+        return self._values.items()
+
+    def view(self) -> Mapping[str, Any]:
+        """Get a read-only live view of all beliefs, without copying."""
+        return MappingProxyType(self._values)
+
+    def copy(self) -> Dict[str, Any]:
+        """Get a copy of all beliefs as a dictionary."""
+        return self._values.copy()
+
+    def set(self, name: str, value: Any, tags: Optional[Iterable[str]] = None) -> bool:
+        """Add or update a belief.
+
+        Args:
+            name: The name of the belief
+            value: The value of the belief
+            tags: Optional tags replacing the belief's current tags (None keeps them)
+
+        Returns:
+            True if the value or tags changed
+        """
+        changed = _value_changed(self._values.get(name, _MISSING), value)
+        if name not in self._values:
+            self._tombstones.pop(name, None)
+            for prefix in _prefixes(name):
+                self._prefix_index.setdefault(prefix, set()).add(name)
+        self._values[name] = value
+
+        if tags is not None:
+            new_tags = set(tags)
+            if new_tags != self._tags.get(name, set()):
+                self._untag(name)
+                if new_tags:
+                    self._tags[name] = new_tags
+                    for tag in new_tags:
+                        self._tag_index.setdefault(tag, set()).add(name)
+                changed = True
+
+        if changed:
+            self._touch(name)
+        return changed
+
+    def remove(self, name: str) -> bool:
+        """Remove a belief.
+
+        Args:
+            name: The name of the belief
+
+        Returns:
+            True if the belief existed
+        """
+        if name not in self._values:
+            return False
+        del self._values[name]
+        self._untag(name)
+        for prefix in _prefixes(name):
+            names = self._prefix_index[prefix]
+            names.discard(name)
+            if not names:
+                del self._prefix_index[prefix]
+        self._touch(name)
+        self._tombstones[name] = None
+        while len(self._tombstones) > self._max_tombstones:
+            forgotten, _ = self._tombstones.popitem(last=False)
+            self.compacted_version = max(self.compacted_version, self._changes.pop(forgotten))
+        return True
+
+    def clear(self) -> None:
+        """Remove all beliefs."""
+        for name in list(self._values):
+            self.remove(name)
+
+    def version_of(self, name: str) -> int:
+        """Get the version at which a belief last changed.
+
+        Args:
+            name: The name of the belief
+
+        Returns:
+            The version of the last change, or 0 if the belief never existed
+        """
+        return self._changes.get(name, 0)
+
+    def changed_since(self, version: int) -> Dict[str, Any]:
+        """Get the beliefs changed after a version.
+
+        The cost is proportional to the number of changed beliefs, not the size of the
+        belief base. Removals at or before :attr:`compacted_version` are no longer reported,
+        so a consumer holding an older version should re-read all beliefs instead.
+
+        Args:
+            version: A previous value of :attr:`version`
+
+        Returns:
+            Mapping of changed belief names to their current values (None if removed)
+        """
+        changed: Dict[str, Any] = {}
+        for name in reversed(self._changes):
+            if self._changes[name] <= version:
+                break
+            changed[name] = self._values.get(name)
+        return changed
+
+    def tags_of(self, name: str) -> Set[str]:
+        """Get the tags of a belief.
+
+        Args:
+            name: The name of the belief
+
+        Returns:
+            The belief's tags
+        """
+        return set(self._tags.get(name, ()))
+
+    def with_prefix(self, prefix: str) -> Dict[str, Any]:
+        """Get the beliefs under a dotted prefix.
+
+        Args:
+            prefix: A dotted prefix such as ``room.kitchen`` (without a trailing dot)
+
+        Returns:
+            Mapping of matching belief names to values
+        """
+        return {name: self._values[name] for name in self._prefix_index.get(prefix, ())}
+
+    def with_tag(self, tag: str) -> Dict[str, Any]:
+        """Get the beliefs carrying a tag.
+
+        Args:
+            tag: The tag
+
+        Returns:
+            Mapping of matching belief names to values
+        """
+        return {name: self._values[name] for name in self._tag_index.get(tag, ())}
+
+    def query(
+        self,
+        pattern: Optional[str] = None,
+        tag: Optional[str] = None,
+        predicate: Optional[Callable[[str, Any], bool]] = None,
+    ) -> Dict[str, Any]:
+        """Find beliefs by name pattern, tag and/or predicate.
+
+        The tag and the literal dotted prefix of the pattern are resolved through the
+        indexes, so only the candidate beliefs are matched against the pattern and predicate.
+
+        Args:
+            pattern: fnmatch-style name pattern, e.g. ``room.*.temperature``
+            tag: Only include beliefs with this tag
+            predicate: Only include beliefs for which ``predicate(name, value)`` is true
+
+        Returns:
+            Mapping of matching belief names to values
+        """
+        candidates: Optional[Set[str]] = None
+        if tag is not None:
+            candidates = set(self._tag_index.get(tag, ()))
+        if pattern is not None:
+            wildcard = _WILDCARD.search(pattern)
+            if wildcard is None:
+                exact = {pattern} if pattern in self._values else set()
+                candidates = exact if candidates is None else candidates & exact
+            else:
+                literal = pattern[: wildcard.start()]
+                prefix = literal[: literal.rfind(".")] if "." in literal else ""
+                if prefix:
+                    indexed = self._prefix_index.get(prefix, set())
+                    candidates = set(indexed) if candidates is None else candidates & indexed
+
+        names: Iterable[str] = self._values if candidates is None else candidates
+        result: Dict[str, Any] = {}
+        for name in names:
+            if pattern is not None and not fnmatch.fnmatchcase(name, pattern):
+                continue
+            value = self._values[name]
+            if predicate is not None and not predicate(name, value):
+                continue
+            result[name] = value
+        return result
+
+    def _touch(self, name: str) -> None:
+        self.version += 1
+        self._changes[name] = self.version
+        self._changes.move_to_end(name)
+
+    def _untag(self, name: str) -> None:
+        for tag in self._tags.pop(name, ()):
+            names = self._tag_index[tag]
+            names.discard(name)
+            if not names:
+                del self._tag_index[tag]
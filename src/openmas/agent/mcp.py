@@ -6,12 +6,29 @@ to expose functionality to MCP clients (like Claude) using FastMCP.
 
 import asyncio
 import inspect
-from typing import Any, Callable, Dict, List, Optional, Protocol, Type, TypeVar, cast, get_type_hints, runtime_checkable
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Protocol,
+    Type,
+    TypeVar,
+    cast,
+    get_type_hints,
+    runtime_checkable,
+)
 
 from pydantic import BaseModel, Field, create_model
 
 from openmas.agent.base import BaseAgent
 from openmas.communication.base import BaseCommunicator
+from openmas.communication.coalescing import RequestCoalescer
+from openmas.communication.streaming import sampling_result_to_chunks
 from openmas.logging import get_logger
 
 # Constants for decorator attribute names
@@ -281,6 +298,9 @@ class McpAgent(BaseAgent):
         # Flag for whether this is a server agent
         self._server_mode = False
 
+        # Optional sharing of identical concurrent requests (see enable_request_coalescing)
+        self.request_coalescer: Optional[RequestCoalescer] = None
+
         # If config has COMMUNICATOR_TYPE, use that to set up communicator
         if self.config:
             communicator_type = None
@@ -612,18 +632,22 @@ class McpAgent(BaseAgent):
         if not isinstance(self.communicator, McpCommunicatorProtocol):
             raise AttributeError("Communicator does not support sample_prompt method")
 
+        params: Dict[str, Any] = {
+            "messages": messages,
+            "system_prompt": system_prompt,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "include_context": include_context,
+            "model_preferences": model_preferences,
+            "stop_sequences": stop_sequences,
+        }
+        communicator = self.communicator
+
+        async def _sample() -> Any:
+            return await communicator.sample_prompt(target_service=target_service, timeout=timeout, **params)
+
         try:
-            result = await self.communicator.sample_prompt(
-                target_service=target_service,
-                messages=messages,
-                system_prompt=system_prompt,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                include_context=include_context,
-                model_preferences=model_preferences,
-                stop_sequences=stop_sequences,
-                timeout=timeout,
-            )
+            result = await self._coalesce(target_service, "prompt/sample", params, _sample)
             # Ensure we return a dictionary with at least a content field
             if not isinstance(result, dict):
                 return {"content": str(result)}
@@ -632,6 +656,66 @@ class McpAgent(BaseAgent):
             self.logger.error(f"Error sampling prompt from {target_service}: {e}")
             raise
 
+    async def sample_prompt_stream(
+        self,
+        target_service: str,
+        messages: List[Dict[str, Any]],
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        include_context: Optional[str] = None,
+        model_preferences: Optional[Dict[str, Any]] = None,
+        stop_sequences: Optional[List[str]] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Sample a prompt from a service, yielding content deltas as they arrive.
+
+        If the communicator provides ``sample_prompt_stream``, its chunks are passed through.
+        Otherwise the complete result of :meth:`sample_prompt` is yielded as a single delta.
+
+        Args:
+            target_service: The service to sample from
+            messages: List of message objects in the format {"role": "...", "content": "..."}
+            system_prompt: Optional system prompt
+            temperature: Optional temperature parameter
+            max_tokens: Optional maximum tokens parameter
+            include_context: Optional include_context parameter
+            model_preferences: Optional model preferences
+            stop_sequences: Optional stop sequences
+            timeout: Optional timeout in seconds
+
+        Yields:
+            Dictionaries with a "delta" field. The last one has "done" set to True and
+            carries "finish_reason" and "usage" when the service reports them.
+
+        Raises:
+            AttributeError: If the communicator doesn't support sampling
+            CommunicationError: If there's a communication problem
+        """
+        if not self.communicator:
+            raise AttributeError("Agent has no communicator set")
+
+        kwargs: Dict[str, Any] = {
+            "target_service": target_service,
+            "messages": messages,
+            "system_prompt": system_prompt,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "include_context": include_context,
+            "model_preferences": model_preferences,
+            "stop_sequences": stop_sequences,
+            "timeout": timeout,
+        }
+
+        if hasattr(self.communicator, "sample_prompt_stream"):
+            async for chunk in self.communicator.sample_prompt_stream(**kwargs):
+                yield chunk
+            return
+
+        result = await self.sample_prompt(**kwargs)
+        for chunk in sampling_result_to_chunks(result):
+            yield chunk
+
     async def call_tool(
         self,
         target_service: str,
@@ -660,12 +744,47 @@ class McpAgent(BaseAgent):
         if not hasattr(self.communicator, "call_tool"):
             raise AttributeError("Communicator does not support call_tool method")
 
-        return await self.communicator.call_tool(
-            target_service=target_service,
-            tool_name=tool_name,
-            arguments=arguments,
-            timeout=timeout,
-        )
+        communicator = self.communicator
+
+        async def _call() -> Any:
+            return await communicator.call_tool(
+                target_service=target_service,
+                tool_name=tool_name,
+                arguments=arguments,
+                timeout=timeout,
+            )
+
+        return await self._coalesce(target_service, f"tool/call/{tool_name}", arguments, _call)
+
+    def enable_request_coalescing(self, methods: Iterable[str]) -> RequestCoalescer:
+        """Share identical concurrent requests made by this agent.
+
+        While a coalesced request is in flight, further calls with the same target service,
+        method and parameters wait for its result instead of issuing their own. Only enable
+        this for methods without side effects. The first caller's timeout applies to the
+        shared call.
+
+        Args:
+            methods: Method names or fnmatch patterns to coalesce, e.g. ``"tool/call/search"``,
+                ``"tool/call/*"`` or ``"prompt/sample"``
+
+        Returns:
+            The RequestCoalescer in use, which exposes coalescing metrics via ``stats()``
+        """
+        self.request_coalescer = RequestCoalescer(methods)
+        return self.request_coalescer
+
+    async def _coalesce(
+        self,
+        target_service: str,
+        method: str,
+        params: Optional[Dict[str, Any]],
+        call: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Run a request through the request coalescer if one is enabled."""
+        if self.request_coalescer is None:
+            return await call()
+        return await self.request_coalescer.run(target_service, method, params, call)
 
     async def get_prompt(
         self,
@@ -1,6 +1,6 @@
 """MCP agent with prompt support."""
 
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Set, Union
 
 from openmas.agent.mcp import McpAgent
 
@@ -8,7 +8,7 @@ from openmas.agent.mcp import McpAgent
 from openmas.logging import get_logger
 from openmas.prompt.base import Prompt, PromptManager
 from openmas.prompt.mcp import McpPromptManager
-from openmas.sampling import MessageRole, SamplingResult
+from openmas.sampling import MessageRole, SamplingChunk, SamplingContext, SamplingParameters, SamplingResult
 from openmas.sampling.providers.mcp import McpAgentSampler
 
 logger = get_logger(__name__)
@@ -208,6 +208,56 @@ class PromptMcpAgent(McpAgent):
             model=model,
         )
 
+    async def sample_batch(
+        self,
+        prompt_id: str,
+        contexts: Sequence[Optional[Dict[str, Any]]],
+        parameters: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None,
+        llm_service: Optional[str] = None,
+        max_concurrency: int = 8,
+        timeout: Optional[float] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[SamplingResult, Exception]]:
+        """Sample from a prompt once per context.
+
+        The prompt is looked up once and rendered for each context. Requests are sent with
+        at most ``max_concurrency`` in flight, or packed by the sampler if its provider has a
+        batch endpoint.
+
+        Args:
+            prompt_id: The ID of the prompt to sample from
+            contexts: Context for template rendering, one per request
+            parameters: Optional sampling parameters shared by all requests
+            model: Optional model to use
+            llm_service: Optional LLM service to sample from
+            max_concurrency: Maximum number of requests in flight
+            timeout: Optional timeout in seconds for each request
+            return_exceptions: Return failed requests' exceptions in place of their results
+                instead of raising the first one
+
+        Returns:
+            One result (or exception, if ``return_exceptions`` is set) per context, in order
+
+        Raises:
+            ValueError: If sampling is not available or the prompt is not found
+        """
+        sampler = self._require_sampler(llm_service, "sample_batch")
+
+        prompt = await self.prompt_manager.get_prompt(prompt_id)
+        if not prompt:
+            raise ValueError(f"Prompt not found: {prompt_id}")
+
+        params = SamplingParameters(**(parameters or {}))
+        sampling_contexts = [SamplingContext.from_prompt(prompt, context, params) for context in contexts]
+        return await sampler.sample_batch(
+            sampling_contexts,
+            model,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+            return_exceptions=return_exceptions,
+        )
+
     async def sample_text(
         self,
         system: Optional[str] = None,
@@ -308,3 +358,95 @@ class PromptMcpAgent(McpAgent):
 
         # Sample from the context
         return await self._sampler.sample(context, model)
+
+    def _require_sampler(self, llm_service: Optional[str], caller: str) -> McpAgentSampler:
+        """Get the sampler, creating it for the given or default LLM service if needed.
+
+        Args:
+            llm_service: Optional LLM service to use (overrides the default)
+            caller: Name of the calling method, used in error messages
+
+        Returns:
+            The sampler
+
+        Raises:
+            ValueError: If no LLM service is available
+        """
+        if not self._sampler:
+            target_service = llm_service or self._llm_service
+            if not target_service:
+                raise ValueError(
+                    f"No LLM service specified. Provide one during initialization or when calling {caller}()."
+                )
+            self._sampler = McpAgentSampler(
+                agent=self,
+                target_service=target_service,
+                default_model=self._default_model,
+            )
+        return self._sampler
+
+    async def sample_stream(
+        self,
+        prompt_id: str,
+        context: Optional[Dict[str, Any]] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None,
+        llm_service: Optional[str] = None,
+    ) -> AsyncIterator[SamplingChunk]:
+        """Sample from a prompt, yielding content as it is generated.
+
+        This is the streaming counterpart of :meth:`sample`. Use
+        :func:`openmas.sampling.collect_stream` to assemble a complete SamplingResult.
+
+        Args:
+            prompt_id: The ID of the prompt to sample from
+            context: Optional context for template rendering
+            parameters: Optional sampling parameters
+            model: Optional model to use
+            llm_service: Optional LLM service to sample from
+
+        Yields:
+            Content deltas, followed by a final chunk with usage metadata
+
+        Raises:
+            ValueError: If sampling is not available or the prompt is not found
+        """
+        sampler = self._require_sampler(llm_service, "sample_stream")
+
+        prompt = await self.prompt_manager.get_prompt(prompt_id)
+        if not prompt:
+            raise ValueError(f"Prompt not found: {prompt_id}")
+
+        sampling_context = SamplingContext.from_prompt(prompt, context, SamplingParameters(**(parameters or {})))
+        async for chunk in sampler.sample_stream(sampling_context, model):
+            yield chunk
+
+    async def chat_stream(
+        self,
+        system: Optional[str] = None,
+        messages: Optional[List[Dict[str, str]]] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None,
+        llm_service: Optional[str] = None,
+    ) -> AsyncIterator[SamplingChunk]:
+        """Chat with an LLM, yielding content as it is generated.
+
+        This is the streaming counterpart of :meth:`chat`.
+
+        Args:
+            system: Optional system prompt
+            messages: Optional list of messages
+            parameters: Optional sampling parameters
+            model: Optional model to use
+            llm_service: Optional LLM service to use (overrides the default)
+
+        Yields:
+            Content deltas, followed by a final chunk with usage metadata
+
+        Raises:
+            ValueError: If sampling is not available
+        """
+        sampler = self._require_sampler(llm_service, "chat_stream")
+        sampling_context = sampler.create_context(system=system, messages=messages, parameters=parameters)
+        async for chunk in sampler.sample_stream(sampling_context, model):
+            yield chunk
@@ -5,9 +5,11 @@ to expose functionality to MCP clients (like Claude) using FastMCP.
 """
 
 import asyncio
-from typing import Any, Dict, Optional
+import inspect
+from typing import Any, Dict, Optional, Tuple
 
 from openmas.agent.mcp import McpAgent
+from openmas.agent.mcp_workers import McpServerWorkerPool
 from openmas.exceptions import ConfigurationError
 
 
@@ -20,8 +22,25 @@ class McpServerAgent(McpAgent):
     It leverages the base McpAgent functionality for discovering decorated methods
     and works with McpSseCommunicator or McpStdioCommunicator in server mode to handle
     the actual server setup and communication.
+
+    With ``workers > 1`` (SSE only), the server runs as a pool of worker processes behind
+    a sticky router on the public port, see :mod:`openmas.agent.mcp_workers`. Each worker
+    re-creates the agent, so in-memory state is per-worker and must not be relied upon
+    for data shared between clients.
     """
 
+    _constructor_args: Tuple[Tuple[Any, ...], Dict[str, Any]]
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "McpServerAgent":
+        """Create the agent, recording its constructor arguments for worker processes.
+
+        The arguments are recorded here rather than in ``__init__``, so that they include
+        arguments a subclass consumes in its own ``__init__`` without passing them on.
+        """
+        agent = super().__new__(cls)
+        agent._constructor_args = (args, kwargs)
+        return agent
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -29,6 +48,7 @@ class McpServerAgent(McpAgent):
         server_type: str = "sse",
         host: str = "0.0.0.0",
         port: int = 8000,
+        workers: int = 1,
         **kwargs: Any,
     ):
         """Initialize the MCP server agent.
@@ -39,13 +59,24 @@ class McpServerAgent(McpAgent):
             server_type: The type of server to create ('sse' or 'stdio')
             host: The host to bind to (for 'sse' server type)
             port: The port to bind to (for 'sse' server type)
+            workers: Number of server processes (for 'sse' server type)
             **kwargs: Additional keyword arguments for the parent class
+
+        Raises:
+            ConfigurationError: If workers is invalid for the server type
         """
+        if workers < 1:
+            raise ConfigurationError(f"workers must be at least 1, got {workers}")
+        if workers > 1 and server_type.lower() != "sse":
+            raise ConfigurationError("Multiple workers are only supported for the 'sse' server type")
+
         super().__init__(name=name, config=config, **kwargs)
 
         self.server_type = server_type
         self.host = host
         self.port = port
+        self.workers = workers
+        self._worker_pool: Optional[McpServerWorkerPool] = None
 
         # Set server mode flag to help the communicator know it should act as a server
         self._server_mode = True
@@ -87,6 +118,7 @@ class McpServerAgent(McpAgent):
                 agent_name=self.name,
                 service_urls={},  # Empty as we're a server
                 server_mode=True,
+                http_host=self.host,
                 http_port=self.port,
                 server_instructions=instructions,
             )
@@ -116,8 +148,13 @@ class McpServerAgent(McpAgent):
             instructions: Optional instructions for the MCP server
 
         Raises:
+            ConfigurationError: If the worker arguments cannot be determined (with ``workers > 1``)
             RuntimeError: If server fails to start
         """
+        if self.workers > 1:
+            await self._start_worker_pool(instructions)
+            return
+
         # Set up communicator if not done already
         if not self.communicator:
             try:
@@ -140,12 +177,88 @@ class McpServerAgent(McpAgent):
             self.logger.error(f"Failed to start MCP server: {e}")
             raise RuntimeError(f"Failed to start MCP server: {e}") from e
 
+    def worker_kwargs(self) -> Dict[str, Any]:
+        """Get the keyword arguments that re-create this agent in a worker process.
+
+        By default these are the arguments the agent was constructed with, including those
+        a subclass consumes in its own ``__init__``. Workers replace ``server_type``, ``host``,
+        ``port`` and ``workers``, so a subclass must accept these and pass them on. Override
+        this method if a worker needs other arguments, for example because one of the
+        constructor arguments cannot be pickled.
+
+        Returns:
+            Keyword arguments for the agent's class
+
+        Raises:
+            ConfigurationError: If a constructor argument cannot be passed by keyword
+        """
+        args, kwargs = self._constructor_args
+        signature = inspect.signature(type(self).__init__)
+        bound = signature.bind(self, *args, **kwargs)
+        worker_kwargs: Dict[str, Any] = {}
+        for name, value in list(bound.arguments.items())[1:]:
+            kind = signature.parameters[name].kind
+            if kind is inspect.Parameter.VAR_KEYWORD:
+                worker_kwargs.update(value)
+            elif kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY):
+                worker_kwargs[name] = value
+            else:
+                raise ConfigurationError(
+                    f"Cannot re-create {type(self).__name__} in worker processes: argument '{name}' cannot be "
+                    "passed by keyword. Override worker_kwargs() to provide the worker arguments."
+                )
+        return worker_kwargs
+
+    async def _start_worker_pool(self, instructions: Optional[str] = None) -> None:
+        """Start the multi-process SSE server.
+
+        Args:
+            instructions: Optional instructions for the MCP servers
+
+        Raises:
+            ConfigurationError: If the worker arguments cannot be determined
+            RuntimeError: If the worker pool fails to start
+        """
+        if self._worker_pool is not None:
+            self.logger.warning("MCP worker pool already running, ignoring start_server() call")
+            return
+
+        pool = McpServerWorkerPool(
+            agent_class=type(self),
+            agent_kwargs=self.worker_kwargs(),
+            workers=self.workers,
+            host=self.host,
+            port=self.port,
+            instructions=instructions,
+        )
+        try:
+            await pool.start()
+        except Exception as e:
+            self.logger.error(f"Failed to start MCP worker pool: {e}")
+            await pool.stop()
+            raise RuntimeError(f"Failed to start MCP server: {e}") from e
+
+        self._worker_pool = pool
+        self.logger.info(
+            f"MCP sse server started for agent {self.name} on port {pool.port} with {self.workers} workers"
+        )
+
     async def stop_server(self) -> None:
         """Stop the MCP server.
 
         This is a convenience method that stops the communicator,
         which in turn stops the server.
         """
+        if self._worker_pool is not None:
+            try:
+                await self._worker_pool.stop()
+                self.logger.info(f"MCP worker pool stopped for agent {self.name}")
+            except Exception as e:
+                self.logger.error(f"Error while stopping MCP worker pool: {e}")
+            finally:
+                self._worker_pool = None
+            return
+
         if self.communicator:
             try:
                 await self.communicator.stop()
@@ -171,6 +284,9 @@ class McpServerAgent(McpAgent):
         Returns:
             True if the server is ready, False if timed out
         """
+        if self._worker_pool is not None:
+            return await self._worker_pool.wait_until_ready(timeout)
+
         if not hasattr(self.communicator, "_server_task"):
             return False
 
@@ -0,0 +1,427 @@
+"""Multi-worker support for MCP SSE servers.
+
+This module lets a single MCP tool service scale across CPU cores. A supervisor in the
+parent process pre-forks N worker processes, each of which re-creates the agent (and with
+it the ``@mcp_tool`` registry) and serves FastMCP over SSE on a private loopback port.
+The parent owns the public port and runs a small sticky router in front of the workers.
+
+Why sticky routing is needed: the MCP SSE transport keeps per-session state in the process
+that owns the ``GET /sse`` stream, and clients post their messages to
+``/messages/?session_id=<id>``. Those posts must reach the same worker, which plain
+``SO_REUSEPORT`` load balancing cannot guarantee. The router learns each session ID from
+the ``endpoint`` event that opens a new SSE stream and routes later posts for that session
+to the same worker. The router picks a worker per connection, so it makes every
+request ask for ``Connection: close``: a client can then not reuse a keep-alive connection
+for a request that belongs to another worker.
+
+Shared state model: workers do not share memory. Each worker holds its own agent instance,
+so instance attributes, caches and counters are per-worker. Tools that need state shared
+across workers must keep it in an external store (a database, Redis, the filesystem, or
+another agent reached through a communicator).
+"""
+
+import asyncio
+import itertools
+import multiprocessing
+import re
+import signal
+import socket
+from contextlib import suppress
+from typing import Any, Dict, List, Optional, Type
+
+from openmas.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Session IDs are the hex form of a UUID4 (see mcp.server.sse.SseServerTransport)
+_SESSION_ID_PATTERN = re.compile(rb"session_id=([0-9a-fA-F]+)")
+
+# How many bytes of an SSE response are inspected for the endpoint event
+_SESSION_SNIFF_LIMIT = 8192
+
+_EVENT_STREAM_HEADER = re.compile(rb"\r\ncontent-type: *text/event-stream", re.IGNORECASE)
+
+# The endpoint event opening the body, possibly behind the size line of its chunk
+_ENDPOINT_EVENT = re.compile(
+    rb"(?:[0-9a-fA-F]+\r\n)?event: *endpoint\r?\ndata: *[^\r\n]*[?&]session_id=([0-9a-fA-F]+)[\r\n&]"
+)
+
+_BAD_GATEWAY_RESPONSE = b"HTTP/1.1 502 Bad Gateway\r\nContent-Length: 0\r\nConnection: close\r\n\r\n"
+
+_CONNECTION_HEADER = re.compile(rb"\r\n(?:connection|keep-alive):[^\r\n]*", re.IGNORECASE)
+
+
+def _close_after_response(head: bytes) -> bytes:
+    """Rewrite an HTTP/1.1 request head so the server closes the connection after responding.
+
+    Args:
+        head: The request line and headers, ending with the blank line
+
+    Returns:
+        The head with its connection headers replaced by ``Connection: close``
+    """
+    head = _CONNECTION_HEADER.sub(b"", head[: -len(b"\r\n\r\n")])
+    return head + b"\r\nConnection: close\r\n\r\n"
+
+
+def _endpoint_session_id(response: bytes) -> Optional[str]:
+    """Get the session ID a worker announces at the start of an SSE response.
+
+    Only the ``endpoint`` event that opens the stream is considered, so session IDs that
+    appear in later events, such as tool output, are ignored.
+
+    Args:
+        response: The start of the response, including its headers
+
+    Returns:
+        The lower-case session ID, or None if the response does not (yet) announce one
+    """
+    head_end = response.find(b"\r\n\r\n")
+    if head_end < 0 or not _EVENT_STREAM_HEADER.search(response, 0, head_end):
+        return None
+    match = _ENDPOINT_EVENT.match(response, head_end + 4)
+    return match.group(1).decode("ascii").lower() if match is not None else None
+
+
+def _find_free_port(host: str = "127.0.0.1") -> int:
+    """Ask the OS for a free TCP port on the given host.
+
+    Args:
+        host: The host to bind to while probing
+
+    Returns:
+        A port number that was free at the time of the call
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return int(sock.getsockname()[1])
+
+
+class SseSessionRouter:
+    """Sticky TCP router that pins MCP SSE sessions to worker processes.
+
+    New connections are assigned to workers round-robin. A connection whose request carries
+    a known ``session_id`` query parameter is forwarded to the worker that owns that session.
+    The request is rewritten to ``Connection: close``, so each connection carries a single
+    request and the next one is routed on its own. Everything else is relayed unchanged, so
+    the router works with any HTTP/1.1 client, including the MCP SDK's SSE client.
+    """
+
+    def __init__(self, host: str, port: int, upstream_ports: List[int], upstream_host: str = "127.0.0.1") -> None:
+        """Initialize the router.
+
+        Args:
+            host: The public host to listen on
+            port: The public port to listen on
+            upstream_ports: Loopback ports of the worker servers, indexed by worker
+            upstream_host: Host the worker servers listen on
+        """
+        self.host = host
+        self.port = port
+        self.upstream_ports = upstream_ports
+        self.upstream_host = upstream_host
+
+        self._sessions: Dict[str, int] = {}
+        self._round_robin = itertools.count()
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def sessions(self) -> Dict[str, int]:
+        """Get a copy of the current session-to-worker mapping."""
+        return dict(self._sessions)
+
+    async def start(self) -> None:
+        """Start listening on the public host and port."""
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port, reuse_address=True)
+        # Record the actual port in case an ephemeral port (0) was requested
+        sockets: List[Any] = list(self._server.sockets or [])
+        if sockets:
+            self.port = int(sockets[0].getsockname()[1])
+        logger.info("SSE session router listening", host=self.host, port=self.port, workers=len(self.upstream_ports))
+
+    async def stop(self) -> None:
+        """Stop accepting new connections."""
+        if self._server is not None:
+            self._server.close()
+            with suppress(Exception):
+                await self._server.wait_closed()
+            self._server = None
+
+    def pick_worker(self, target: bytes) -> int:
+        """Choose the worker that should handle a request.
+
+        Args:
+            target: The request target (path and query) from the HTTP request line
+
+        Returns:
+            The index of the worker to forward to
+        """
+        match = _SESSION_ID_PATTERN.search(target)
+        if match is not None:
+            session_id = match.group(1).decode("ascii").lower()
+            if session_id in self._sessions:
+                return self._sessions[session_id]
+        return next(self._round_robin) % len(self.upstream_ports)
+
+    def forget_worker(self, index: int) -> None:
+        """Drop all sessions owned by a worker, e.g. after it crashed.
+
+        Args:
+            index: The worker index
+        """
+        for session_id in [sid for sid, owner in self._sessions.items() if owner == index]:
+            del self._sessions[session_id]
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Relay one client connection to the chosen worker."""
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+
+        request_line = head.split(b"\r\n", 1)[0].split(b" ")
+        target = request_line[1] if len(request_line) > 1 else b"/"
+        index = self.pick_worker(target)
+        # Only an SSE stream, opened with a GET, announces a new session
+        opens_stream = request_line[0] == b"GET"
+
+        try:
+            upstream_reader, upstream_writer = await asyncio.open_connection(
+                self.upstream_host, self.upstream_ports[index]
+            )
+        except OSError as e:
+            logger.warning("Worker unavailable", worker=index, error=str(e))
+            writer.write(_BAD_GATEWAY_RESPONSE)
+            with suppress(Exception):
+                await writer.drain()
+            writer.close()
+            return
+
+        upstream_writer.write(_close_after_response(head))
+        session_ids: List[str] = []
+        to_worker = asyncio.create_task(self._relay(reader, upstream_writer))
+        to_client = asyncio.create_task(
+            self._relay(upstream_reader, writer, index if opens_stream else None, session_ids)
+        )
+        try:
+            await asyncio.wait({to_worker, to_client}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in (to_worker, to_client):
+                task.cancel()
+            with suppress(asyncio.CancelledError):
+                await asyncio.gather(to_worker, to_client, return_exceptions=True)
+            for stream_writer in (upstream_writer, writer):
+                stream_writer.close()
+            # The SSE stream that created a session is gone, so the session is too
+            for session_id in session_ids:
+                if self._sessions.get(session_id) == index:
+                    del self._sessions[session_id]
+
+    async def _relay(
+        self,
+        source: asyncio.StreamReader,
+        sink: asyncio.StreamWriter,
+        worker: Optional[int] = None,
+        session_ids: Optional[List[str]] = None,
+    ) -> None:
+        """Copy bytes from source to sink, optionally recording the session the response announces.
+
+        A session ID that is already routed is left alone, so a response cannot take over
+        another client's session.
+        """
+        sniffing = True
+        start = b""
+        try:
+            while True:
+                data = await source.read(65536)
+                if not data:
+                    break
+                if sniffing and worker is not None and session_ids is not None:
+                    start += data
+                    session_id = _endpoint_session_id(start)
+                    if session_id is not None:
+                        sniffing = False
+                        if session_id not in self._sessions:
+                            self._sessions[session_id] = worker
+                            session_ids.append(session_id)
+                    elif len(start) >= _SESSION_SNIFF_LIMIT:
+                        sniffing = False
+                sink.write(data)
+                await sink.drain()
+        except ConnectionError:
+            pass
+
+
+def _run_worker(agent_class: Type[Any], agent_kwargs: Dict[str, Any], port: int, instructions: Optional[str]) -> None:
+    """Entry point of a worker process."""
+    asyncio.run(_serve_worker(agent_class, agent_kwargs, port, instructions))
+
+
+async def _serve_worker(
+    agent_class: Type[Any], agent_kwargs: Dict[str, Any], port: int, instructions: Optional[str]
+) -> None:
+    """Re-create the agent in this process and serve it until SIGTERM/SIGINT."""
+    kwargs = dict(agent_kwargs)
+    kwargs.update({"server_type": "sse", "host": "127.0.0.1", "port": port, "workers": 1})
+    agent = agent_class(**kwargs)
+    agent.setup_communicator(instructions)
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        with suppress(NotImplementedError):
+            loop.add_signal_handler(sig, stop_event.set)
+
+    # BaseAgent.start() starts the communicator and runs setup(), which registers the tools
+    await agent.start()
+    try:
+        await stop_event.wait()
+    finally:
+        await agent.stop()
+
+
+class McpServerWorkerPool:
+    """Supervisor for a pool of MCP SSE worker processes behind a sticky router.
+
+    Workers are started with the ``spawn`` method, so the agent class must be importable
+    from its module and its constructor arguments must be picklable. A worker that exits
+    unexpectedly is restarted on the same port and its sessions are dropped.
+    """
+
+    def __init__(
+        self,
+        agent_class: Type[Any],
+        agent_kwargs: Dict[str, Any],
+        workers: int,
+        host: str = "0.0.0.0",
+        port: int = 8000,
+        instructions: Optional[str] = None,
+        monitor_interval: float = 0.5,
+    ) -> None:
+        """Initialize the worker pool.
+
+        Args:
+            agent_class: The McpServerAgent subclass to instantiate in each worker
+            agent_kwargs: Keyword arguments used to construct the agent in each worker
+            workers: Number of worker processes
+            host: The public host to listen on
+            port: The public port to listen on
+            instructions: Optional instructions for the MCP servers
+            monitor_interval: Seconds between worker liveness checks
+
+        Raises:
+            ValueError: If workers is less than 1
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+
+        self.agent_class = agent_class
+        self.agent_kwargs = agent_kwargs
+        self.workers = workers
+        self.host = host
+        self.port = port
+        self.instructions = instructions
+        self.monitor_interval = monitor_interval
+        self.restarts = 0
+
+        self.worker_ports: List[int] = []
+        self._processes: List[Any] = []
+        self._router: Optional[SseSessionRouter] = None
+        self._monitor_task: Optional[asyncio.Task] = None
+        self._context = multiprocessing.get_context("spawn")
+
+    @property
+    def router(self) -> Optional[SseSessionRouter]:
+        """Get the sticky router, if the pool is running."""
+        return self._router
+
+    def _spawn(self, index: int) -> Any:
+        """Start the worker process for the given index."""
+        process = self._context.Process(
+            target=_run_worker,
+            args=(self.agent_class, self.agent_kwargs, self.worker_ports[index], self.instructions),
+            name=f"mcp-worker-{index}",
+            daemon=True,
+        )
+        process.start()
+        logger.info("Started MCP worker", worker=index, pid=process.pid, port=self.worker_ports[index])
+        return process
+
+    async def start(self) -> None:
+        """Start the worker processes, the router and the supervision loop."""
+        if self._router is not None:
+            logger.warning("Worker pool already running, ignoring start() call")
+            return
+
+        self.worker_ports = [_find_free_port() for _ in range(self.workers)]
+        self._processes = [self._spawn(index) for index in range(self.workers)]
+
+        self._router = SseSessionRouter(self.host, self.port, self.worker_ports)
+        await self._router.start()
+        self.port = self._router.port
+
+        self._monitor_task = asyncio.create_task(self._monitor())
+
+    async def _monitor(self) -> None:
+        """Restart workers that exited unexpectedly."""
+        while True:
+            await asyncio.sleep(self.monitor_interval)
+            for index, process in enumerate(self._processes):
+                if process.is_alive():
+                    continue
+                logger.warning("MCP worker exited, restarting", worker=index, exitcode=process.exitcode)
+                if self._router is not None:
+                    self._router.forget_worker(index)
+                self.restarts += 1
+                self._processes[index] = self._spawn(index)
+
+    async def wait_until_ready(self, timeout: float = 30.0) -> bool:
+        """Wait until every worker accepts connections.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if all workers are ready, False if timed out
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        pending = list(self.worker_ports)
+        while pending and loop.time() < deadline:
+            port = pending[0]
+            try:
+                _, writer = await asyncio.open_connection("127.0.0.1", port)
+            except OSError:
+                await asyncio.sleep(0.1)
+                continue
+            writer.close()
+            pending.pop(0)
+        return not pending
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Stop the router and gracefully terminate all workers.
+
+        Args:
+            timeout: Seconds to wait for each worker before killing it
+        """
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._monitor_task
+            self._monitor_task = None
+
+        if self._router is not None:
+            await self._router.stop()
+            self._router = None
+
+        for process in self._processes:
+            if process.is_alive():
+                process.terminate()
+        for process in self._processes:
+            await asyncio.to_thread(process.join, timeout)
+            if process.is_alive():
+                logger.warning("MCP worker did not stop in time, killing it", pid=process.pid)
+                process.kill()
+                await asyncio.to_thread(process.join, timeout)
+        self._processes = []
@@ -0,0 +1,262 @@
+"""Hosting many agents in one process.
+
+An :class:`AgentRuntime` runs any number of :class:`~openmas.agent.base.BaseAgent` instances
+on a single event loop, instead of one interpreter per agent. Each agent is watched by its own
+supervisor task, which restarts it with exponential backoff according to its restart policy.
+Agents share one HTTP connection pool, and requests between hosted agents go through a
+:class:`~openmas.communication.router.LocalRouter` instead of the network.
+"""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+import httpx
+
+from openmas.agent.base import BaseAgent
+from openmas.communication.http import HttpCommunicator
+from openmas.communication.router import LocalRouter
+from openmas.exceptions import ConfigurationError
+from openmas.logging import get_logger
+
+logger = get_logger(__name__)
+
+RESTART_POLICIES = ("never", "on-failure", "always")
+
+
+class _HostedAgent:
+    """Supervision state of one agent in a runtime."""
+
+    def __init__(self, agent: BaseAgent, restart: str, max_restarts: int) -> None:
+        self.agent = agent
+        self.restart = restart
+        self.max_restarts = max_restarts
+        self.state = "pending"
+        self.restarts = 0
+        self.last_error: Optional[str] = None
+        self.supervisor: Optional[asyncio.Task] = None
+        self.first_attempt = asyncio.Event()
+
+
+class AgentRuntime:
+    """Runs and supervises many agents in one process.
+
+    Example:
+        ```python
+        runtime = AgentRuntime()
+        runtime.add_agent(PlannerAgent(name="planner"))
+        runtime.add_agent(WorkerAgent(name="worker"), restart="always")
+        await runtime.start()
+        await runtime.wait()
+        ```
+    """
+
+    def __init__(
+        self,
+        restart: str = "on-failure",
+        max_restarts: int = 5,
+        restart_backoff: float = 1.0,
+        max_restart_backoff: float = 30.0,
+        local_routing: bool = True,
+        share_http_client: bool = True,
+        http_limits: Optional[httpx.Limits] = None,
+    ) -> None:
+        """Initialize the runtime.
+
+        Args:
+            restart: Default restart policy: "never", "on-failure" (restart when start() or
+                run() raises) or "always" (also restart when run() returns)
+            max_restarts: Default number of restarts before an agent is marked as failed
+            restart_backoff: Delay in seconds before the first restart, doubled on each restart
+            max_restart_backoff: Upper bound for the restart delay in seconds
+            local_routing: Deliver requests between hosted agents in-process
+            share_http_client: Give all hosted HTTP communicators one shared connection pool
+            http_limits: Connection limits of the shared HTTP client
+        """
+        self._check_policy(restart)
+        self.restart = restart
+        self.max_restarts = max_restarts
+        self.restart_backoff = restart_backoff
+        self.max_restart_backoff = max_restart_backoff
+        self.local_routing = local_routing
+        self.share_http_client = share_http_client
+        self.http_limits = http_limits or httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        self.router = LocalRouter()
+        self._hosted: Dict[str, _HostedAgent] = {}
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._running = False
+
+    @property
+    def agents(self) -> Dict[str, BaseAgent]:
+        """Get the hosted agents by name."""
+        return {name: hosted.agent for name, hosted in self._hosted.items()}
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether the runtime has been started and not stopped."""
+        return self._running
+
+    def add_agent(
+        self, agent: BaseAgent, restart: Optional[str] = None, max_restarts: Optional[int] = None
+    ) -> BaseAgent:
+        """Add an agent to the runtime.
+
+        Agents added while the runtime is running are started immediately.
+
+        Args:
+            agent: The agent to host
+            restart: Restart policy for this agent (defaults to the runtime's policy)
+            max_restarts: Restart limit for this agent (defaults to the runtime's limit)
+
+        Returns:
+            The agent
+
+        Raises:
+            ConfigurationError: If an agent with the same name is already hosted or the
+                restart policy is unknown
+        """
+        if agent.name in self._hosted:
+            raise ConfigurationError(f"An agent named '{agent.name}' is already hosted by this runtime")
+        policy = restart or self.restart
+        self._check_policy(policy)
+
+        hosted = _HostedAgent(agent, policy, self.max_restarts if max_restarts is None else max_restarts)
+        self._hosted[agent.name] = hosted
+        self._attach(agent)
+        if self._running:
+            hosted.supervisor = asyncio.create_task(self._supervise(hosted), name=f"supervise_{agent.name}")
+        return agent
+
+    async def remove_agent(self, name: str) -> None:
+        """Stop an agent and remove it from the runtime.
+
+        Args:
+            name: The name of the agent
+
+        Raises:
+            KeyError: If no agent with this name is hosted
+        """
+        hosted = self._hosted.pop(name)
+        await self._stop_hosted(hosted)
+
+    async def start(self) -> None:
+        """Start all hosted agents.
+
+        Returns once every agent has made its first start attempt. Agents that fail to start
+        are retried in the background according to their restart policy.
+        """
+        if self._running:
+            return
+        self._running = True
+        for hosted in self._hosted.values():
+            # Re-attach in case a previous stop() closed the shared client
+            self._attach(hosted.agent)
+            if hosted.supervisor is None:
+                hosted.supervisor = asyncio.create_task(self._supervise(hosted), name=f"supervise_{hosted.agent.name}")
+        await asyncio.gather(*(hosted.first_attempt.wait() for hosted in self._hosted.values()))
+        logger.info("Agent runtime started", agents=len(self._hosted))
+
+    async def wait(self) -> None:
+        """Wait until every hosted agent has finished and will not be restarted."""
+        supervisors = [hosted.supervisor for hosted in self._hosted.values() if hosted.supervisor is not None]
+        if supervisors:
+            await asyncio.wait(supervisors)
+
+    async def stop(self) -> None:
+        """Stop all hosted agents and release shared resources."""
+        if not self._running:
+            return
+        self._running = False
+        await asyncio.gather(*(self._stop_hosted(hosted) for hosted in self._hosted.values()))
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        logger.info("Agent runtime stopped", agents=len(self._hosted))
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Get the supervision status of every hosted agent.
+
+        Returns:
+            Mapping of agent names to their state ("pending", "starting", "running",
+            "backoff", "finished", "failed" or "stopped"), restart count and last error
+        """
+        return {
+            name: {"state": hosted.state, "restarts": hosted.restarts, "last_error": hosted.last_error}
+            for name, hosted in self._hosted.items()
+        }
+
+    def _attach(self, agent: BaseAgent) -> None:
+        communicator = agent.communicator
+        if self.local_routing:
+            communicator.local_router = self.router
+        if self.share_http_client and isinstance(communicator, HttpCommunicator):
+            if self._http_client is None:
+                self._http_client = httpx.AsyncClient(timeout=30.0, limits=self.http_limits)
+            communicator.use_client(self._http_client)
+
+    async def _supervise(self, hosted: _HostedAgent) -> None:
+        agent = hosted.agent
+        loop = asyncio.get_running_loop()
+        delay = self.restart_backoff
+
+        while True:
+            hosted.state = "starting"
+            error: Optional[BaseException] = None
+            started_at = loop.time()
+            try:
+                await agent.start()
+            except Exception as e:
+                error = e
+            finally:
+                hosted.first_attempt.set()
+
+            if error is None:
+                hosted.state = "running"
+                self.router.register(agent.name, agent.communicator)
+                lifecycle = agent._task
+                try:
+                    if lifecycle is not None:
+                        # asyncio.wait does not raise when the lifecycle task fails or is cancelled
+                        await asyncio.wait({lifecycle})
+                        if not lifecycle.cancelled():
+                            error = lifecycle.exception()
+                finally:
+                    self.router.unregister(agent.name, agent.communicator)
+                await agent.stop()
+
+            if error is not None:
+                hosted.last_error = str(error)
+                logger.error("Hosted agent failed", agent_name=agent.name, error=str(error))
+            if hosted.restart == "never" or (hosted.restart == "on-failure" and error is None):
+                hosted.state = "failed" if error is not None else "finished"
+                return
+            if hosted.restarts >= hosted.max_restarts:
+                hosted.state = "failed"
+                logger.error("Hosted agent exceeded its restart limit", agent_name=agent.name)
+                return
+
+            # A long healthy run resets the backoff
+            if loop.time() - started_at > self.max_restart_backoff:
+                delay = self.restart_backoff
+            hosted.state = "backoff"
+            hosted.restarts += 1
+            logger.info("Restarting hosted agent", agent_name=agent.name, delay=delay, restarts=hosted.restarts)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_restart_backoff)
+
+    async def _stop_hosted(self, hosted: _HostedAgent) -> None:
+        if hosted.supervisor is not None:
+            hosted.supervisor.cancel()
+            await asyncio.gather(hosted.supervisor, return_exceptions=True)
+            hosted.supervisor = None
+        self.router.unregister(hosted.agent.name, hosted.agent.communicator)
+        try:
+            await hosted.agent.stop()
+        except Exception as e:
+            logger.error("Error stopping hosted agent", agent_name=hosted.agent.name, error=str(e))
+        hosted.state = "stopped"
+
+    @staticmethod
+    def _check_policy(policy: str) -> None:
+        if policy not in RESTART_POLICIES:
+            expected = ", ".join(RESTART_POLICIES)
+            raise ConfigurationError(f"Unknown restart policy '{policy}'. Expected one of: {expected}")
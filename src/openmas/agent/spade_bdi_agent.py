@@ -6,7 +6,7 @@ with OpenMAS using the BdiAgent base class.
 Note: This is an example implementation and requires the spade-bdi library to be installed.
 """
 
-from typing import Any, Dict, Optional, Type, TypeVar
+from typing import Any, Dict, Iterable, Optional, Type, TypeVar
 
 from openmas.agent.bdi import BdiAgent
 from openmas.config import AgentConfig
@@ -145,14 +145,15 @@ class SpadeBdiAgent(BdiAgent):
         pass
 
     # Override belief methods to integrate with SPADE-BDI
-    def add_belief(self, belief_name: str, belief_value: Any) -> None:
+    def add_belief(self, belief_name: str, belief_value: Any, tags: Optional[Iterable[str]] = None) -> None:
         """Add or update a belief, synchronizing with SPADE-BDI.
 
         Args:
             belief_name: The name of the belief
             belief_value: The value of the belief
+            tags: Optional tags for the belief, replacing its current tags
         """
-        super().add_belief(belief_name, belief_value)
+        super().add_belief(belief_name, belief_value, tags)
 
         # Synchronize with SPADE-BDI
         if self._spade_bdi_agent:
@@ -6,16 +6,21 @@ from openmas.assets.downloaders import (
     HfDownloader,
     HttpDownloader,
     LocalFileHandler,
+    PeerMirrorDownloader,
     get_downloader_for_source,
 )
 from openmas.assets.exceptions import (
+    AssetCancelledError,
     AssetConfigurationError,
     AssetDownloadError,
     AssetError,
     AssetUnpackError,
     AssetVerificationError,
 )
-from openmas.assets.manager import AssetManager
+from openmas.assets.manager import AssetManager, PrefetchReport, PrefetchResult
+from openmas.assets.server import AssetCacheServer
+from openmas.assets.store import ContentStore
+from openmas.assets.utils import BandwidthLimiter
 
 __all__ = [
     # Configuration
@@ -24,11 +29,17 @@ __all__ = [
     "AssetSettings",
     # Asset Manager
     "AssetManager",
+    "PrefetchReport",
+    "PrefetchResult",
+    "BandwidthLimiter",
+    "ContentStore",
+    "AssetCacheServer",
     # Downloaders
     "BaseDownloader",
     "HttpDownloader",
     "HfDownloader",
     "LocalFileHandler",
+    "PeerMirrorDownloader",
     "get_downloader_for_source",
     # Exceptions
     "AssetError",
@@ -36,4 +47,5 @@ __all__ = [
     "AssetDownloadError",
     "AssetVerificationError",
     "AssetUnpackError",
+    "AssetCancelledError",
 ]
@@ -2,7 +2,7 @@
 
 from enum import Enum
 from pathlib import Path
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
@@ -71,6 +71,14 @@ class AssetSourceConfig(BaseModel):
     progress_report_interval_mb: float = Field(
         default=10.0, gt=0, description="Report progress approximately every X MB downloaded."
     )
+    download_segments: int = Field(
+        default=4,
+        ge=1,
+        description="Parallel range requests used for large HTTP downloads; 1 downloads in a single stream.",
+    )
+    segment_threshold_mb: float = Field(
+        default=64.0, gt=0, description="Size from which HTTP downloads are split into parallel segments."
+    )
 
     @model_validator(mode="after")
     def validate_source_fields(self) -> "AssetSourceConfig":
@@ -114,6 +122,11 @@ class AssetConfig(BaseModel):
         description="If true and unpack is set, the unpacked content is expected to be a single file, "
         "and the path returned will be to this file directly within the asset's named directory.",
     )
+    stream_unpack: bool = Field(
+        default=False,
+        description="If true, a tar, tar.gz or tar.bz2 archive is extracted while it downloads instead of being "
+        "stored and unpacked afterwards. Not available for Hugging Face Hub sources.",
+    )
     description: Optional[str] = None
     retries: int = Field(default=0, ge=0, description="Number of times to retry download on failure.")
     retry_delay_seconds: float = Field(default=5.0, ge=0, description="Seconds to wait between retries.")
@@ -130,6 +143,11 @@ class AssetConfig(BaseModel):
         """Validate that unpack_format is present if unpack is True."""
         if self.unpack and not self.unpack_format:
             raise ValueError("unpack_format is required when unpack is True")
+        if self.stream_unpack:
+            if not self.unpack or self.unpack_format not in ("tar", "tar.gz", "tar.bz2"):
+                raise ValueError("stream_unpack requires unpack with a tar, tar.gz or tar.bz2 unpack_format")
+            if self.source.type == "hf":
+                raise ValueError("stream_unpack is not supported for Hugging Face Hub sources")
         return self
 
 
@@ -137,3 +155,45 @@ class AssetSettings(BaseModel):
     """Settings for asset management."""
 
     cache_dir: Optional[Path] = None
+    paranoid_verification: bool = Field(
+        default=False,
+        description="Re-hash cached assets on every access instead of trusting the digest recorded "
+        "when they were last verified.",
+    )
+    lock_timeout: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Seconds to wait for another process holding an asset's lock, or None to wait indefinitely.",
+    )
+    prefetch_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Number of assets AssetManager.prefetch() downloads, verifies and unpacks at the same time.",
+    )
+    max_download_rate_mb: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Combined rate limit of concurrent HTTP downloads in megabytes per second, or None for no limit.",
+    )
+    content_store: bool = Field(
+        default=False,
+        description="Store downloaded files once by SHA-256 in a content-addressed store in the cache directory, "
+        "with asset entries linking to them, so identical files are neither stored nor downloaded twice.",
+    )
+    store_link_mode: Literal["hardlink", "symlink"] = Field(
+        default="hardlink",
+        description="How asset entries link to the content store; hard links fall back to symbolic links "
+        "where they are not supported.",
+    )
+    max_cache_size_gb: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Maximum total size of the asset cache in gigabytes. After each download, the least recently "
+        "accessed assets that are neither locked nor pinned are evicted until the cache fits. None for no limit.",
+    )
+    peer_mirrors: List[str] = Field(
+        default_factory=list,
+        description="Base URLs of asset cache servers on other nodes (`openmas assets serve`), tried in order "
+        "before the source of assets that have a sha256 checksum. Unpacked assets are not shared: their archive "
+        "is removed after unpacking, so they always come from their source.",
+    )
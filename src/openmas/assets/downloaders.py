@@ -1,16 +1,25 @@
 """Downloader implementations for the asset management module."""
 
 import asyncio
+import hashlib
+import json
 import os
 import shutil
 import sys
+import time
 from pathlib import Path
-from typing import Any, Dict, Optional, Type
+from typing import Any, AsyncIterator, Dict, List, Optional, Type
 
 import httpx
 
 from openmas.assets.config import AssetSourceConfig
-from openmas.assets.exceptions import AssetAuthenticationError, AssetConfigurationError, AssetDownloadError
+from openmas.assets.exceptions import (
+    AssetAuthenticationError,
+    AssetConfigurationError,
+    AssetDownloadError,
+    AssetVerificationError,
+)
+from openmas.assets.utils import BandwidthLimiter, ProgressCallback
 from openmas.logging import get_logger
 
 logger = get_logger(__name__)
@@ -38,61 +47,202 @@ except ImportError:
 class BaseDownloader:
     """Base class for asset downloaders."""
 
-    async def download(self, source_config: AssetSourceConfig, target_path: Path, **kwargs: Any) -> None:
+    async def download(self, source_config: AssetSourceConfig, target_path: Path, **kwargs: Any) -> Optional[str]:
         """Download an asset from the specified source to the target path.
 
         Args:
             source_config: Configuration for the source
             target_path: Path where the asset should be downloaded
-            **kwargs: Additional keyword arguments for the downloader
+            **kwargs: Additional keyword arguments for the downloader. Downloaders that hash
+                while downloading accept ``expected_checksum`` and only move the asset into
+                place if it matches.
+
+        Returns:
+            The ``sha256:<hex_digest>`` checksum of the downloaded file if the downloader
+            computed it, otherwise None
 
         Raises:
             NotImplementedError: This method must be implemented by subclasses
         """
         raise NotImplementedError("Subclasses must implement download()")
 
+    def stream(
+        self, source_config: AssetSourceConfig, progress: Optional[ProgressCallback] = None, **kwargs: Any
+    ) -> AsyncIterator[bytes]:
+        """Stream the bytes of an asset in order, without storing them.
+
+        Args:
+            source_config: Configuration for the source
+            progress: Optional callback receiving the bytes received so far and the total
+                size, or 0 if the size is unknown
+            **kwargs: Additional keyword arguments for the downloader
+
+        Returns:
+            An async iterator over the chunks of the asset
+
+        Raises:
+            NotImplementedError: If the downloader cannot stream assets
+        """
+        raise NotImplementedError(f"{type(self).__name__} cannot stream assets")
+
+
+class _Segment:
+    """A byte range of a download and the next byte still to be fetched."""
+
+    def __init__(self, start: int, end: Optional[int], next_byte: Optional[int] = None) -> None:
+        self.start = start
+        # Inclusive end of the range, or None if the size is unknown
+        self.end = end
+        self.next = start if next_byte is None else next_byte
+
+    @property
+    def done(self) -> bool:
+        return self.end is not None and self.next > self.end
+
+    @property
+    def range_header(self) -> str:
+        return f"bytes={self.next}-" if self.end is None else f"bytes={self.next}-{self.end}"
+
+    def as_list(self) -> List[Optional[int]]:
+        return [self.start, self.end, self.next]
+
+
+class _StreamHasher:
+    """SHA-256 of a download, fed with its bytes in file order as they arrive."""
+
+    def __init__(self) -> None:
+        self.sha256 = hashlib.sha256()
+        # Number of bytes hashed so far, which is also the offset of the next byte to hash
+        self.position = 0
+
+    def update(self, data: Any) -> None:
+        self.sha256.update(data)
+        self.position += len(data)
+
+    def feed(self, offset: int, data: Any) -> None:
+        """Hash bytes written at an offset if they are the next ones in file order."""
+        if offset == self.position:
+            self.update(data)
+
+    def checksum(self, size: int) -> Optional[str]:
+        """Get the checksum if every one of the size bytes was hashed."""
+        return f"sha256:{self.sha256.hexdigest()}" if self.position == size else None
+
+
+def _checksums_match(expected: str, actual: str) -> bool:
+    return expected.lower() == actual.lower()
+
+
+class _RangeNotHonoured(Exception):
+    """The server answered a range request with the full body or an unsatisfiable range."""
+
+
+class _DownloadProgress:
+    """Progress of one download: a tqdm bar on terminals, interval logs otherwise.
+
+    A callback, if given, receives every update regardless of the progress_report setting.
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        total: Optional[int],
+        interval_bytes: int,
+        initial: int = 0,
+        callback: Optional[ProgressCallback] = None,
+    ) -> None:
+        self.enabled = enabled
+        self.callback = callback
+        self.total = total
+        self.interval_bytes = interval_bytes
+        self.downloaded = initial
+        self.next_log = initial + interval_bytes
+        self.use_tqdm = bool(enabled and TQDM_AVAILABLE and total and sys.stdout.isatty())
+        self._bar_context: Any = None
+        self._bar: Any = None
+
+    def __enter__(self) -> "_DownloadProgress":
+        if self.use_tqdm:
+            self._bar_context = tqdm(
+                total=self.total,
+                initial=self.downloaded,
+                unit="B",
+                unit_scale=True,
+                desc="Downloading asset",
+                leave=False,
+            )
+            self._bar = self._bar_context.__enter__()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._bar_context is not None:
+            self._bar_context.__exit__(*exc_info)
+
+    def update(self, size: int) -> None:
+        self.downloaded += size
+        if self.callback is not None:
+            self.callback(self.downloaded, self.total or 0)
+        if self._bar is not None:
+            self._bar.update(size)
+        elif self.enabled and self.total and self.downloaded >= self.next_log:
+            percent = self.downloaded / self.total * 100
+            logger.info(
+                f"Download progress: {self.downloaded / (1024 * 1024):.2f} MB "
+                f"/ {self.total / (1024 * 1024):.2f} MB ({percent:.1f}%)"
+            )
+            self.next_log = self.downloaded + self.interval_bytes
+
 
 class HttpDownloader(BaseDownloader):
-    """Downloader for HTTP sources."""
+    """Downloader for HTTP sources.
+
+    Downloads are written to ``<target>.partial`` and renamed into place once complete. If
+    the server supports range requests and identifies the resource with an ``ETag`` or
+    ``Last-Modified`` header, progress is recorded in ``<target>.partial.json`` and a failed
+    download resumes where it stopped. Large files are split into segments fetched over
+    parallel connections and written at their offsets into a preallocated file.
 
-    def __init__(self, chunk_size: int = 8192, progress_interval_mb: int = 10):
+    The SHA-256 of the file is computed while it downloads, so the asset can be verified
+    without reading it again. Given an ``expected_checksum``, a download that does not match
+    is discarded instead of being moved into place.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 8192,
+        progress_interval_mb: int = 10,
+        segments: int = 4,
+        segment_threshold_mb: float = 64.0,
+        max_chunk_size: int = 4 * 1024 * 1024,
+        segment_retries: int = 3,
+    ):
         """Initialize the HTTP downloader.
 
         Args:
-            chunk_size: Size of chunks to download at a time (bytes)
+            chunk_size: Size of chunks to download at a time (bytes), and the smallest write of segments
             progress_interval_mb: Interval for logging progress (megabytes)
+            segments: Default number of parallel segments for large files
+            segment_threshold_mb: Default size from which files are downloaded in segments (megabytes)
+            max_chunk_size: Largest write of segments (bytes); writes grow towards it on fast connections
+            segment_retries: Times a segment is retried from where it stopped after a connection error
         """
         self.chunk_size = chunk_size
         self.progress_interval_mb = progress_interval_mb
         self.progress_interval_bytes = progress_interval_mb * 1024 * 1024
+        self.segments = segments
+        self.segment_threshold_mb = segment_threshold_mb
+        self.max_chunk_size = max(max_chunk_size, chunk_size)
+        self.segment_retries = segment_retries
 
-    async def download(self, source_config: AssetSourceConfig, target_path: Path, **kwargs: Any) -> None:
-        """Download an asset from an HTTP source to the target path.
-
-        Args:
-            source_config: Configuration for the HTTP source
-            target_path: Path where the asset should be downloaded
-            **kwargs: Additional keyword arguments for the downloader
+    def _auth_headers(self, source_config: AssetSourceConfig, **kwargs: Any) -> Dict[str, str]:
+        """Build the authentication headers of a source.
 
         Raises:
-            AssetConfigurationError: If the source configuration is invalid
-            AssetDownloadError: If there is an error downloading the asset
-            AssetAuthenticationError: If authentication is required but the token is not available
+            AssetAuthenticationError: If the token is missing and ``strict_authentication`` is set
         """
-        if source_config.type != "http":
-            raise AssetConfigurationError(f"Expected source type 'http', got '{source_config.type}'")
-
-        if not source_config.url:
-            raise AssetConfigurationError("URL is required for HTTP downloads")
-
         url = source_config.url
-        logger.info(f"Downloading asset from {url} to {target_path}")
-
-        # Ensure the parent directory exists
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-
         # Prepare headers if authentication is specified
-        headers = {}
+        headers: Dict[str, str] = {}
         if source_config.authentication and source_config.authentication.http:
             http_auth = source_config.authentication.http
             token_env_var = http_auth.token_env_var
@@ -123,109 +273,145 @@ class HttpDownloader(BaseDownloader):
 
                 headers[http_auth.header_name] = auth_value
                 logger.debug(f"Using authentication with header: {http_auth.header_name}")
+        return headers
+
+    def _check_source(self, source_config: AssetSourceConfig) -> str:
+        if source_config.type != "http":
+            raise AssetConfigurationError(f"Expected source type 'http', got '{source_config.type}'")
+
+        if not source_config.url:
+            raise AssetConfigurationError("URL is required for HTTP downloads")
+        return source_config.url
+
+    async def stream(
+        self, source_config: AssetSourceConfig, progress: Optional[ProgressCallback] = None, **kwargs: Any
+    ) -> AsyncIterator[bytes]:
+        """Stream an asset from an HTTP source in one request, without storing it.
 
+        Args:
+            source_config: Configuration for the HTTP source
+            progress: Optional callback receiving the bytes received so far and the total
+                size, or 0 if the size is unknown
+            **kwargs: Additional keyword arguments for the downloader, such as ``rate_limiter``
+                (a :class:`BandwidthLimiter` shared with other downloads)
+
+        Yields:
+            The chunks of the response body
+
+        Raises:
+            AssetConfigurationError: If the source configuration is invalid
+            AssetDownloadError: If there is an error downloading the asset
+            AssetAuthenticationError: If authentication fails
+        """
+        url = self._check_source(source_config)
+        logger.info(f"Streaming asset from {url}")
+        headers = self._auth_headers(source_config, **kwargs)
+        rate_limiter: Optional[BandwidthLimiter] = kwargs.get("rate_limiter")
         try:
-            # Use httpx for async HTTP requests
             async with httpx.AsyncClient(follow_redirects=True) as client:
                 async with client.stream("GET", url, headers=headers, timeout=30.0) as response:
-                    if response.status_code >= 400:
-                        error_message = f"HTTP error {response.status_code}: {response.reason_phrase}"
-                        # Provide more context for auth-related errors
-                        if response.status_code in (401, 403):
-                            if source_config.authentication and source_config.authentication.http:
-                                error_message += (
-                                    f". This might be an authentication issue. "
-                                    f"Check that the token in '{source_config.authentication.http.token_env_var}' "
-                                    f"is correct and has appropriate permissions."
-                                )
-                            else:
-                                error_message += (
-                                    ". This resource may require authentication. "
-                                    "Consider adding authentication details to your asset configuration."
-                                )
-                            # Raise a specific authentication error for 401/403 responses
-                            raise AssetAuthenticationError(
-                                error_message,
-                                source_type="http",
-                                source_info=url,
-                                token_env_var=(
-                                    source_config.authentication.http.token_env_var
-                                    if source_config.authentication and source_config.authentication.http
-                                    else None
-                                ),
-                            )
-                        else:
-                            raise AssetDownloadError(
-                                error_message,
-                                source_type="http",
-                                source_info=url,
-                            )
-
-                    # Get total size if available
-                    total_size = int(response.headers.get("content-length", "0")) or None
-                    if total_size:
-                        logger.info(f"Total asset size: {total_size / (1024 * 1024):.2f} MB")
-
-                    # Determine if we should use progress reporting
-                    use_progress_reporting = source_config.progress_report
-                    progress_interval_mb = getattr(
-                        source_config, "progress_report_interval_mb", self.progress_interval_mb
-                    )
-                    progress_interval_bytes = int(progress_interval_mb * 1024 * 1024)
-
-                    # Determine if we should use tqdm progress bar (for interactive terminal)
-                    use_tqdm = use_progress_reporting and TQDM_AVAILABLE and total_size and sys.stdout.isatty()
-
-                    # Stream the response to the file
-                    with open(target_path, "wb") as f:
-                        downloaded = 0
-                        next_log = progress_interval_bytes
-
-                        if use_tqdm:
-                            # Use tqdm for nice progress bars in terminal
-                            with tqdm(
-                                total=total_size,
-                                unit="B",
-                                unit_scale=True,
-                                desc="Downloading asset",
-                                leave=False,
-                            ) as pbar:
-                                async for chunk in response.aiter_bytes(self.chunk_size):
-                                    f.write(chunk)
-                                    downloaded += len(chunk)
-                                    pbar.update(len(chunk))
-                        else:
-                            # Use interval-based logging for non-interactive terminals
-                            async for chunk in response.aiter_bytes(self.chunk_size):
-                                f.write(chunk)
-                                downloaded += len(chunk)
-
-                                # Log progress at intervals if progress reporting is enabled
-                                if use_progress_reporting and total_size and downloaded >= next_log:
-                                    progress = downloaded / total_size * 100
-                                    logger.info(
-                                        f"Download progress: {downloaded / (1024 * 1024):.2f} MB "
-                                        f"/ {total_size / (1024 * 1024):.2f} MB ({progress:.1f}%)"
-                                    )
-                                    next_log = downloaded + progress_interval_bytes
-
-                    # Log final download completion
-                    if use_progress_reporting:
-                        logger.info(f"Download complete: {downloaded / (1024 * 1024):.2f} MB")
+                    _raise_for_status(response, source_config, url)
+                    total_size = int(response.headers.get("content-length", "0"))
+                    received = 0
+                    async for chunk in response.aiter_bytes():
+                        received += len(chunk)
+                        if progress is not None:
+                            progress(received, total_size)
+                        if rate_limiter is not None:
+                            await rate_limiter.consume(len(chunk))
+                        yield chunk
+        except httpx.RequestError as e:
+            raise AssetDownloadError(f"Error downloading asset: {str(e)}", source_type="http", source_info=url) from e
+
+    async def download(self, source_config: AssetSourceConfig, target_path: Path, **kwargs: Any) -> Optional[str]:
+        """Download an asset from an HTTP source to the target path.
+
+        Args:
+            source_config: Configuration for the HTTP source
+            target_path: Path where the asset should be downloaded
+            **kwargs: Additional keyword arguments for the downloader: ``expected_checksum``
+                (``sha256:<hex_digest>``) to verify the download against, ``progress`` (a callback
+                receiving the bytes downloaded so far and the total size, or 0 if unknown) and
+                ``rate_limiter`` (a :class:`BandwidthLimiter` shared with other downloads)
+
+        Returns:
+            The ``sha256:<hex_digest>`` checksum of the downloaded file
+
+        Raises:
+            AssetConfigurationError: If the source configuration is invalid
+            AssetDownloadError: If there is an error downloading the asset
+            AssetAuthenticationError: If authentication is required but the token is not available
+            AssetVerificationError: If the download does not match ``expected_checksum``
+        """
+        url = self._check_source(source_config)
+        logger.info(f"Downloading asset from {url} to {target_path}")
+
+        # Ensure the parent directory exists
+        target_path.parent.mkdir(parents=True, exist_ok=True)
 
+        headers = self._auth_headers(source_config, **kwargs)
+
+        transfer = _HttpTransfer(
+            self,
+            source_config,
+            url,
+            headers,
+            target_path,
+            progress_callback=kwargs.get("progress"),
+            rate_limiter=kwargs.get("rate_limiter"),
+        )
+        try:
+            # Use httpx for async HTTP requests
+            async with httpx.AsyncClient(follow_redirects=True) as client:
+                downloaded = None
+                state = transfer.load_state()
+                if state is not None:
+                    try:
+                        downloaded = await transfer.resume(client, state)
+                    except _RangeNotHonoured as e:
+                        logger.info(f"Cannot resume download of {url} ({e}), starting over")
+                if downloaded is None:
+                    try:
+                        downloaded = await transfer.start(client, parallel=True)
+                    except _RangeNotHonoured as e:
+                        logger.info(f"Server did not honour a range request ({e}), downloading in one stream")
+                        downloaded = await transfer.start(client, parallel=False)
+
+            # Log final download completion
+            if source_config.progress_report:
+                logger.info(f"Download complete: {downloaded / (1024 * 1024):.2f} MB")
+
+            checksum = transfer.hasher.checksum(downloaded)
+            expected_checksum = kwargs.get("expected_checksum")
+            if checksum and expected_checksum and not _checksums_match(expected_checksum, checksum):
+                # A complete download with the wrong content cannot be resumed either
+                transfer.partial_path.unlink(missing_ok=True)
+                transfer.state_path.unlink(missing_ok=True)
+                raise AssetVerificationError(
+                    f"Downloaded file from {url} failed checksum verification. "
+                    f"Expected: {expected_checksum}, got: {checksum}"
+                )
+
+            os.replace(transfer.partial_path, target_path)
+            transfer.state_path.unlink(missing_ok=True)
+            return checksum
+
+        # A partial download is kept so that the next attempt can resume it, but a stale
+        # copy at the target path is removed so that it is not mistaken for the asset
         except httpx.RequestError as e:
-            # Clean up partial download
             if target_path.exists():
                 target_path.unlink()
             raise AssetDownloadError(f"Error downloading asset: {str(e)}", source_type="http", source_info=url) from e
         except AssetAuthenticationError:
-            # Clean up partial download
             if target_path.exists():
                 target_path.unlink()
             # Re-raise the authentication error
             raise
+        except AssetVerificationError:
+            if target_path.exists():
+                target_path.unlink()
+            raise
         except Exception as e:
-            # Clean up partial download
             if target_path.exists():
                 target_path.unlink()
             raise AssetDownloadError(
@@ -235,6 +421,405 @@ class HttpDownloader(BaseDownloader):
             ) from e
 
 
+def _raise_for_status(response: httpx.Response, source_config: AssetSourceConfig, url: str) -> None:
+    """Raise the matching asset error for an HTTP error response."""
+    if response.status_code < 400:
+        return
+    error_message = f"HTTP error {response.status_code}: {response.reason_phrase}"
+    auth = source_config.authentication
+    # Provide more context for auth-related errors
+    if response.status_code in (401, 403):
+        if auth and auth.http:
+            error_message += (
+                f". This might be an authentication issue. "
+                f"Check that the token in '{auth.http.token_env_var}' "
+                f"is correct and has appropriate permissions."
+            )
+        else:
+            error_message += (
+                ". This resource may require authentication. "
+                "Consider adding authentication details to your asset configuration."
+            )
+        # Raise a specific authentication error for 401/403 responses
+        raise AssetAuthenticationError(
+            error_message,
+            source_type="http",
+            source_info=url,
+            token_env_var=auth.http.token_env_var if auth and auth.http else None,
+        )
+    raise AssetDownloadError(error_message, source_type="http", source_info=url)
+
+
+class _HttpTransfer:
+    """One download of an HTTP asset into its ``.partial`` file."""
+
+    def __init__(
+        self,
+        downloader: HttpDownloader,
+        source_config: AssetSourceConfig,
+        url: str,
+        headers: Dict[str, str],
+        target_path: Path,
+        progress_callback: Optional[ProgressCallback] = None,
+        rate_limiter: Optional[BandwidthLimiter] = None,
+    ) -> None:
+        self.downloader = downloader
+        self.source_config = source_config
+        self.url = url
+        self.headers = headers
+        self.partial_path = target_path.with_name(target_path.name + ".partial")
+        self.state_path = target_path.with_name(target_path.name + ".partial.json")
+        self.segments = int(getattr(source_config, "download_segments", downloader.segments))
+        threshold_mb = getattr(source_config, "segment_threshold_mb", downloader.segment_threshold_mb)
+        self.segment_threshold = int(threshold_mb * 1024 * 1024)
+        progress_interval_mb = getattr(source_config, "progress_report_interval_mb", downloader.progress_interval_mb)
+        self.progress_interval_bytes = int(progress_interval_mb * 1024 * 1024)
+        self.progress_callback = progress_callback
+        self.rate_limiter = rate_limiter
+        self._last_checkpoint = 0.0
+        self.hasher = _StreamHasher()
+        # Set after segment writes, to wake the task hashing what they wrote
+        self._written: Optional[asyncio.Event] = None
+
+    def _progress(self, total: Optional[int], initial: int = 0) -> _DownloadProgress:
+        return _DownloadProgress(
+            self.source_config.progress_report, total, self.progress_interval_bytes, initial, self.progress_callback
+        )
+
+    def load_state(self) -> Optional[Dict[str, Any]]:
+        """Load the progress of an earlier attempt, if it can be resumed."""
+        try:
+            state = json.loads(self.state_path.read_text())
+            self.partial_path.stat()
+        except (OSError, TypeError, ValueError):
+            return None
+        if not isinstance(state, dict) or state.get("url") != self.url or not state.get("validator"):
+            return None
+        return state
+
+    def save_state(self, state: Dict[str, Any], segments: List[_Segment]) -> None:
+        """Record the progress of the segments, replacing the state file atomically."""
+        state["segments"] = [segment.as_list() for segment in segments]
+        tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(state))
+        os.replace(tmp_path, self.state_path)
+
+    def checkpoint(self, state: Dict[str, Any], segments: List[_Segment]) -> None:
+        """Save the state at most once per second."""
+        now = time.monotonic()
+        if now - self._last_checkpoint >= 1.0:
+            self._last_checkpoint = now
+            self.save_state(state, segments)
+
+    def raise_for_status(self, response: httpx.Response) -> None:
+        """Raise the matching asset error for an HTTP error response."""
+        _raise_for_status(response, self.source_config, self.url)
+
+    def _range_headers(self, segment: _Segment, validator: str) -> Dict[str, str]:
+        return {**self.headers, "Range": segment.range_header, "If-Range": validator}
+
+    def _check_range_response(self, response: httpx.Response, segment: _Segment) -> None:
+        # A 200 means the resource changed (If-Range) or ranges are not supported
+        if response.status_code in (200, 416):
+            raise _RangeNotHonoured(f"HTTP {response.status_code} for range {segment.range_header}")
+        self.raise_for_status(response)
+        content_range = response.headers.get("content-range", "")
+        if content_range and not content_range.startswith(f"bytes {segment.next}-"):
+            raise _RangeNotHonoured(f"unexpected Content-Range '{content_range}'")
+
+    async def start(self, client: httpx.AsyncClient, parallel: bool) -> int:
+        """Download the asset from the beginning.
+
+        Returns:
+            The number of bytes downloaded
+        """
+        async with client.stream("GET", self.url, headers=self.headers, timeout=30.0) as response:
+            self.raise_for_status(response)
+            self.state_path.unlink(missing_ok=True)
+            self.hasher = _StreamHasher()
+
+            # Get total size if available
+            total_size = int(response.headers.get("content-length", "0")) or None
+            if total_size:
+                logger.info(f"Total asset size: {total_size / (1024 * 1024):.2f} MB")
+
+            # Resuming needs byte ranges of the unencoded body and a validator for If-Range
+            etag = response.headers.get("etag", "")
+            validator = etag if etag and not etag.startswith("W/") else response.headers.get("last-modified")
+            resumable = (
+                response.headers.get("accept-ranges", "").lower() == "bytes"
+                and response.headers.get("content-encoding", "identity").lower() == "identity"
+                and bool(validator)
+            )
+            state = {"url": self.url, "size": total_size, "validator": validator}
+
+            if (
+                parallel
+                and resumable
+                and total_size
+                and self.segments > 1
+                and total_size >= self.segment_threshold
+                and hasattr(os, "pwrite")
+            ):
+                size = total_size // self.segments
+                segments = [
+                    _Segment(i * size, (i + 1) * size - 1 if i < self.segments - 1 else total_size - 1)
+                    for i in range(self.segments)
+                ]
+                logger.info(f"Downloading in {self.segments} parallel segments")
+                # Preallocate the file so that every segment can write at its offset
+                with open(self.partial_path, "wb") as f:
+                    f.truncate(total_size)
+                state["parallel"] = True
+                self.save_state(state, segments)
+                with self._progress(total_size) as progress:
+                    await self._run_segments(client, state, segments, progress, response)
+                    return progress.downloaded
+
+            segment = _Segment(0, total_size - 1 if total_size else None)
+            if resumable:
+                self.save_state(state, [segment])
+            with open(self.partial_path, "wb") as f, self._progress(total_size) as progress:
+                try:
+                    await self._stream_to_file(response, f, progress)
+                except BaseException:
+                    if resumable:
+                        f.flush()
+                        self.save_state(state, [segment])
+                    raise
+                return progress.downloaded
+
+    async def resume(self, client: httpx.AsyncClient, state: Dict[str, Any]) -> int:
+        """Continue the download recorded in the state file.
+
+        Returns:
+            The number of bytes of the asset, including those from earlier attempts
+
+        Raises:
+            _RangeNotHonoured: If the resource changed or the server no longer serves ranges
+        """
+        segments = [_Segment(*values) for values in state.get("segments", [])]
+        if not segments:
+            raise _RangeNotHonoured("no recorded segments")
+        total_size = state.get("size")
+        if not state.get("parallel"):
+            # A single stream only appends, so the file size tells how far it got
+            segments[0].next = self.partial_path.stat().st_size
+        resumed_at = sum(segment.next - segment.start for segment in segments)
+        logger.info(f"Resuming download of {self.url} at {resumed_at / (1024 * 1024):.2f} MB")
+        self.hasher = _StreamHasher()
+
+        if state.get("parallel"):
+            with self._progress(total_size, resumed_at) as progress:
+                await self._run_segments(client, state, segments, progress)
+                return progress.downloaded
+
+        # The bytes from earlier attempts are hashed before new ones are appended
+        fd = os.open(self.partial_path, os.O_RDONLY)
+        try:
+            await self._hash_written(fd, segments)
+        finally:
+            os.close(fd)
+        segment = segments[0]
+        if segment.done:
+            return resumed_at
+        async with client.stream(
+            "GET", self.url, headers=self._range_headers(segment, state["validator"]), timeout=30.0
+        ) as response:
+            self._check_range_response(response, segment)
+            with open(self.partial_path, "ab") as f, self._progress(total_size, resumed_at) as progress:
+                await self._stream_to_file(response, f, progress)
+                return progress.downloaded
+
+    async def _stream_to_file(self, response: httpx.Response, f: Any, progress: _DownloadProgress) -> None:
+        async for chunk in response.aiter_bytes(self.downloader.chunk_size):
+            f.write(chunk)
+            self.hasher.update(chunk)
+            progress.update(len(chunk))
+            if self.rate_limiter is not None:
+                await self.rate_limiter.consume(len(chunk))
+
+    def _hashable(self, segments: List[_Segment]) -> int:
+        """Get the number of bytes written in file order past the hash position."""
+        position = self.hasher.position
+        for segment in segments:
+            if segment.start <= position and (segment.end is None or position <= segment.end):
+                return segment.next - position
+        return 0
+
+    async def _hash_written(self, fd: int, segments: List[_Segment]) -> None:
+        """Hash the bytes that segments wrote ahead of the hash position.
+
+        The file is read back on a worker thread while the data is still in the page cache.
+        A cancelled call waits for the read in progress, so that the caller can close the file.
+        """
+        while True:
+            size = min(self._hashable(segments), 1024 * 1024)
+            if size <= 0:
+                return
+            position = self.hasher.position
+            read = asyncio.ensure_future(asyncio.to_thread(os.pread, fd, size, position))
+            try:
+                data = await asyncio.shield(read)
+            except asyncio.CancelledError:
+                await asyncio.wait([read])
+                raise
+            if not data:
+                return
+            self.hasher.feed(position, data)
+
+    async def _follow_segments(self, fd: int, segments: List[_Segment], written: asyncio.Event) -> None:
+        """Hash the segments in file order as they are written, until the end of the file."""
+        while True:
+            await self._hash_written(fd, segments)
+            if all(segment.done for segment in segments):
+                return
+            await written.wait()
+            written.clear()
+
+    async def _run_segments(
+        self,
+        client: httpx.AsyncClient,
+        state: Dict[str, Any],
+        segments: List[_Segment],
+        progress: _DownloadProgress,
+        first_response: Optional[httpx.Response] = None,
+    ) -> None:
+        """Fetch the unfinished segments concurrently, stopping all of them if one fails.
+
+        Bytes that follow the hash position are hashed as they are written, and a separate
+        task reads back the later segments once the ones before them are complete.
+        """
+        fd = os.open(self.partial_path, os.O_RDWR)
+        self._written = written = asyncio.Event()
+        follower = asyncio.create_task(self._follow_segments(fd, segments, written))
+        try:
+            tasks = [
+                asyncio.create_task(
+                    self._fetch_segment(
+                        client, state, segments, segment, fd, progress, first_response if index == 0 else None
+                    )
+                )
+                for index, segment in enumerate(segments)
+                if not segment.done
+            ]
+            try:
+                await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            for task in tasks:
+                error = None if task.cancelled() else task.exception()
+                if error is not None:
+                    raise error
+            written.set()
+            await follower
+        except BaseException:
+            self.save_state(state, segments)
+            raise
+        finally:
+            follower.cancel()
+            await asyncio.gather(follower, return_exceptions=True)
+            self._written = None
+            os.close(fd)
+
+    async def _fetch_segment(
+        self,
+        client: httpx.AsyncClient,
+        state: Dict[str, Any],
+        segments: List[_Segment],
+        segment: _Segment,
+        fd: int,
+        progress: _DownloadProgress,
+        response: Optional[httpx.Response] = None,
+    ) -> None:
+        """Fetch one segment, retrying from where it stopped after connection errors."""
+        failures = 0
+        while not segment.done:
+            try:
+                if response is not None:
+                    # The first segment reads the start of the initial response
+                    first, response = response, None
+                    await self._write_segment(first, fd, state, segments, segment, progress)
+                else:
+                    async with client.stream(
+                        "GET", self.url, headers=self._range_headers(segment, state["validator"]), timeout=30.0
+                    ) as ranged:
+                        self._check_range_response(ranged, segment)
+                        await self._write_segment(ranged, fd, state, segments, segment, progress)
+                if segment.done:
+                    return
+                error: Exception = httpx.ReadError("connection closed before the end of the range")
+            except httpx.TransportError as e:
+                error = e
+            failures += 1
+            if failures > self.downloader.segment_retries:
+                raise error
+            delay = min(0.5 * 2 ** (failures - 1), 8.0)
+            logger.warning(
+                f"Segment {segment.start}-{segment.end} of {self.url} failed at byte {segment.next} ({error}), "
+                f"retrying in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+
+    async def _write_segment(
+        self,
+        response: httpx.Response,
+        fd: int,
+        state: Dict[str, Any],
+        segments: List[_Segment],
+        segment: _Segment,
+        progress: _DownloadProgress,
+    ) -> None:
+        """Write a response body at the segment's offset until the end of the segment.
+
+        Received bytes are buffered and written in one call. The write size adapts to the
+        connection: it doubles while buffers fill in under 0.1s and halves when they take
+        more than 0.5s, so fast links make few large writes and slow ones still report progress.
+        """
+        assert segment.end is not None
+        target = self.downloader.chunk_size
+        buffer = bytearray()
+        last_write = time.monotonic()
+
+        def write() -> None:
+            self.hasher.feed(segment.next, buffer)
+            view = memoryview(buffer)
+            while view:
+                written = os.pwrite(fd, view, segment.next)
+                segment.next += written
+                progress.update(written)
+                view = view[written:]
+            view.release()
+            del buffer[:]
+            if self._written is not None:
+                self._written.set()
+
+        try:
+            async for data in response.aiter_bytes():
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.consume(len(data))
+                remaining = segment.end + 1 - segment.next - len(buffer)
+                buffer += data[:remaining]
+                complete = segment.next + len(buffer) > segment.end
+                if complete or len(buffer) >= target:
+                    write()
+                    now = time.monotonic()
+                    if now - last_write < 0.1:
+                        target = min(target * 2, self.downloader.max_chunk_size)
+                    elif now - last_write > 0.5:
+                        target = max(target // 2, self.downloader.chunk_size)
+                    last_write = now
+                    self.checkpoint(state, segments)
+                if complete:
+                    break
+        finally:
+            # Keep whatever arrived before an error
+            if buffer:
+                write()
+
+
 class HfDownloader(BaseDownloader):
     """Downloader for Hugging Face Hub sources."""
 
@@ -314,7 +899,7 @@ class HfDownloader(BaseDownloader):
                     # Just log the error but don't fail the download
                     logger.warning(f"Failed to clean up temporary cache directory: {e}")
 
-    async def download(self, source_config: AssetSourceConfig, target_path: Path, **kwargs: Any) -> None:
+    async def download(self, source_config: AssetSourceConfig, target_path: Path, **kwargs: Any) -> Optional[str]:
         """Download an asset from Hugging Face Hub to the target path.
 
         Args:
@@ -322,6 +907,9 @@ class HfDownloader(BaseDownloader):
             target_path: Path where the asset should be downloaded
             **kwargs: Additional keyword arguments for the downloader
 
+        Returns:
+            None, since the Hugging Face Hub client does not expose the bytes it downloads
+
         Raises:
             AssetConfigurationError: If the source configuration is invalid
             AssetDownloadError: If there is an error downloading the asset
@@ -390,7 +978,7 @@ class HfDownloader(BaseDownloader):
                     None, lambda: self._download(repo_id, filename, revision, token, target_path)
                 )
                 logger.info(f"Successfully downloaded asset from Hugging Face Hub to {downloaded_path}")
-                return
+                return None
             except Exception as e:
                 error_msg = str(e)
 
@@ -429,19 +1017,47 @@ class HfDownloader(BaseDownloader):
 
 
 class LocalFileHandler(BaseDownloader):
-    """Handler for local file sources."""
+    """Handler for local file sources.
+
+    Given an ``expected_checksum``, files are hashed while they are copied to
+    ``<target>.partial``, which is only moved into place if the checksum matches.
+    """
+
+    def __init__(self, chunk_size: int = 1024 * 1024):
+        """Initialize the local file handler.
+
+        Args:
+            chunk_size: Size of the chunks files are copied in when they are hashed (bytes)
+        """
+        self.chunk_size = chunk_size
 
-    async def download(self, source_config: AssetSourceConfig, target_path: Path, **kwargs: Any) -> None:
+    def _copy_and_hash(self, source_path: Path, partial_path: Path) -> str:
+        """Copy a file while hashing it, on a worker thread."""
+        sha256 = hashlib.sha256()
+        with open(source_path, "rb") as src, open(partial_path, "wb") as dst:
+            while chunk := src.read(self.chunk_size):
+                sha256.update(chunk)
+                dst.write(chunk)
+        shutil.copystat(source_path, partial_path)
+        return f"sha256:{sha256.hexdigest()}"
+
+    async def download(self, source_config: AssetSourceConfig, target_path: Path, **kwargs: Any) -> Optional[str]:
         """Copy a local asset to the target path.
 
         Args:
             source_config: Configuration for the local source
             target_path: Path where the asset should be copied
-            **kwargs: Additional keyword arguments for the handler
+            **kwargs: Additional keyword arguments for the handler, such as
+                ``expected_checksum`` (``sha256:<hex_digest>``) to verify a copied file against
+
+        Returns:
+            The ``sha256:<hex_digest>`` checksum of a copied file if ``expected_checksum`` was
+            given, otherwise None
 
         Raises:
             AssetConfigurationError: If the source configuration is invalid
             AssetDownloadError: If there is an error copying the asset
+            AssetVerificationError: If a copied file does not match ``expected_checksum``
         """
         if source_config.type != "local":
             raise AssetConfigurationError(f"Expected source type 'local', got '{source_config.type}'")
@@ -463,6 +1079,10 @@ class LocalFileHandler(BaseDownloader):
         # Ensure the parent directory exists
         target_path.parent.mkdir(parents=True, exist_ok=True)
 
+        expected_checksum = kwargs.get("expected_checksum")
+        if expected_checksum and source_path.is_file():
+            return await self._verified_copy(source_path, target_path, expected_checksum)
+
         try:
             # Handle directory vs file
             if source_path.is_dir():
@@ -487,6 +1107,152 @@ class LocalFileHandler(BaseDownloader):
                 source_type="local",
                 source_info=str(source_path),
             ) from e
+        return None
+
+    async def stream(
+        self, source_config: AssetSourceConfig, progress: Optional[ProgressCallback] = None, **kwargs: Any
+    ) -> AsyncIterator[bytes]:
+        """Stream a local file in chunks read on a worker thread.
+
+        Args:
+            source_config: Configuration for the local source
+            progress: Optional callback receiving the bytes read so far and the file size
+            **kwargs: Additional keyword arguments for the handler
+
+        Yields:
+            The chunks of the file
+
+        Raises:
+            AssetConfigurationError: If the source configuration is invalid
+            AssetDownloadError: If the source is not a file or cannot be read
+        """
+        if source_config.type != "local":
+            raise AssetConfigurationError(f"Expected source type 'local', got '{source_config.type}'")
+        if not source_config.path:
+            raise AssetConfigurationError("path is required for local file sources")
+
+        source_path = source_config.path
+        if not source_path.is_file():
+            raise AssetDownloadError(
+                f"Local source path is not a file: {source_path}", source_type="local", source_info=str(source_path)
+            )
+        logger.info(f"Streaming local asset from {source_path}")
+        try:
+            total_size = source_path.stat().st_size
+            with open(source_path, "rb") as f:
+                received = 0
+                while chunk := await asyncio.to_thread(f.read, self.chunk_size):
+                    received += len(chunk)
+                    if progress is not None:
+                        progress(received, total_size)
+                    yield chunk
+        except OSError as e:
+            raise AssetDownloadError(
+                f"Error reading local asset: {str(e)}", source_type="local", source_info=str(source_path)
+            ) from e
+
+    async def _verified_copy(self, source_path: Path, target_path: Path, expected_checksum: str) -> str:
+        """Copy a file to the target path if its checksum, computed during the copy, matches."""
+        partial_path = target_path.with_name(target_path.name + ".partial")
+        try:
+            checksum = await asyncio.to_thread(self._copy_and_hash, source_path, partial_path)
+        except Exception as e:
+            partial_path.unlink(missing_ok=True)
+            raise AssetDownloadError(
+                f"Error copying local asset: {str(e)}",
+                source_type="local",
+                source_info=str(source_path),
+            ) from e
+        if not _checksums_match(expected_checksum, checksum):
+            partial_path.unlink(missing_ok=True)
+            raise AssetVerificationError(
+                f"Local file {source_path} failed checksum verification. "
+                f"Expected: {expected_checksum}, got: {checksum}"
+            )
+        if target_path.is_dir():
+            shutil.rmtree(target_path)
+        os.replace(partial_path, target_path)
+        logger.info(f"Copied file: {source_path} -> {target_path}")
+        return checksum
+
+
+class PeerMirrorDownloader(BaseDownloader):
+    """Downloader trying the asset caches of peer nodes before the asset's own source.
+
+    Peers are base URLs of :class:`~openmas.assets.server.AssetCacheServer` instances, which
+    serve verified files by SHA-256 digest. A file from a peer is downloaded like any HTTP
+    asset and verified against the expected checksum as it arrives. A peer that does not have
+    the file, cannot be reached or serves other bytes is skipped. If no peer provides the file,
+    or the download has no ``sha256:`` checksum to request and verify it by, the origin
+    downloader is used.
+    """
+
+    def __init__(
+        self, peers: List[str], origin: BaseDownloader, http_downloader: Optional[HttpDownloader] = None
+    ) -> None:
+        """Initialize the downloader.
+
+        Args:
+            peers: Base URLs of the peer cache servers, tried in order
+            origin: Downloader for the asset's own source
+            http_downloader: Downloader for the peers, defaulting to a new HttpDownloader
+        """
+        self.peers = [peer.rstrip("/") for peer in peers]
+        self.origin = origin
+        self.http_downloader = http_downloader or HttpDownloader()
+
+    def _peer_source(self, peer: str, digest: str, source_config: AssetSourceConfig) -> AssetSourceConfig:
+        return AssetSourceConfig(
+            type="http",
+            authentication=None,
+            url=f"{peer}/assets/sha256/{digest}",
+            progress_report=source_config.progress_report,
+            progress_report_interval_mb=source_config.progress_report_interval_mb,
+            download_segments=source_config.download_segments,
+            segment_threshold_mb=source_config.segment_threshold_mb,
+        )
+
+    async def download(self, source_config: AssetSourceConfig, target_path: Path, **kwargs: Any) -> Optional[str]:
+        """Download an asset from the first peer that has it, or from its source.
+
+        Args:
+            source_config: Configuration for the asset's own source
+            target_path: Path where the asset should be downloaded
+            **kwargs: Keyword arguments for the downloaders; ``expected_checksum`` selects and
+                verifies the file on the peers
+
+        Returns:
+            The ``sha256:<hex_digest>`` checksum of the downloaded file if the downloader that
+            succeeded computed it, otherwise None
+
+        Raises:
+            AssetDownloadError: If the origin fails after all peers did
+            AssetVerificationError: If the origin's download does not match ``expected_checksum``
+        """
+        expected_checksum = kwargs.get("expected_checksum")
+        if expected_checksum and expected_checksum.lower().startswith("sha256:") and self.peers:
+            digest = expected_checksum[7:].lower()
+            # Downloaded under another name, so that the origin's own partial download is kept
+            # for the origin downloader to resume
+            peer_path = target_path.with_name(target_path.name + ".peer")
+            for peer in self.peers:
+                try:
+                    checksum = await self.http_downloader.download(
+                        self._peer_source(peer, digest, source_config), peer_path, **kwargs
+                    )
+                except (AssetDownloadError, AssetVerificationError) as e:
+                    logger.info(f"Peer {peer} could not provide {target_path.name}: {e}")
+                    continue
+                os.replace(peer_path, target_path)
+                logger.info(f"Downloaded {target_path.name} from peer {peer}")
+                return checksum
+
+            # A partial download from a peer cannot be resumed from another source
+            peer_path.with_name(peer_path.name + ".partial").unlink(missing_ok=True)
+            peer_path.with_name(peer_path.name + ".partial.json").unlink(missing_ok=True)
+            logger.info(f"No peer provided {target_path.name}, downloading it from its source")
+
+        return await self.origin.download(source_config, target_path, **kwargs)
 
 
 def get_downloader_for_source(source_config: AssetSourceConfig) -> BaseDownloader:
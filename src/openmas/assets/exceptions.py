@@ -63,3 +63,9 @@ class AssetUnpackError(AssetError):
     """Exception raised when there is an error unpacking an asset."""
 
     pass
+
+
+class AssetCancelledError(AssetError):
+    """Exception raised when hashing or unpacking an asset is cancelled."""
+
+    pass
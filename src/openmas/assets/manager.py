@@ -1,26 +1,133 @@
 """Asset management functionality for OpenMAS."""
 
 import asyncio
+import functools
+import hashlib
 import json
 import os
 import shutil
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager, nullcontext
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional
+
+import filelock
 
 from openmas.assets.config import AssetConfig
-from openmas.assets.downloaders import get_downloader_for_source
+from openmas.assets.downloaders import PeerMirrorDownloader, get_downloader_for_source
 from openmas.assets.exceptions import (
+    AssetCancelledError,
     AssetConfigurationError,
     AssetDownloadError,
     AssetUnpackError,
     AssetVerificationError,
 )
-from openmas.assets.utils import asset_lock, async_asset_lock, unpack_archive, verify_checksum
+from openmas.assets.store import ContentStore, digest_of
+from openmas.assets.utils import (
+    BandwidthLimiter,
+    LockWaitStats,
+    ProgressCallback,
+    asset_lock,
+    async_asset_lock,
+    calculate_sha256,
+    unpack_archive,
+    unpack_stream,
+    verify_checksum,
+)
 from openmas.config import ProjectConfig
 from openmas.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Called on the event loop with the asset name, the stage ("download", "verify" or "unpack"), and
+# the bytes processed so far and in total (0 if unknown)
+AssetProgressCallback = Callable[[str, str, int, int], None]
+
+
+def _process_alive(pid: int) -> bool:
+    """Check whether a process exists, erring on the side of yes."""
+    if os.name == "nt":
+        # Signal 0 would terminate the process on Windows
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # The process exists but belongs to another user
+        return True
+    return True
+
+
+class PrefetchResult:
+    """Outcome of prefetching one asset."""
+
+    def __init__(
+        self,
+        name: str,
+        path: Optional[Path] = None,
+        error: Optional[BaseException] = None,
+        downloaded: bool = False,
+        duration: float = 0.0,
+    ) -> None:
+        self.name = name
+        self.path = path
+        self.error = error
+        # False if the asset was already in the cache
+        self.downloaded = downloaded
+        self.duration = duration
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "status": "failed" if self.error else "downloaded" if self.downloaded else "cached",
+            "path": str(self.path) if self.path else None,
+            "error": str(self.error) if self.error else None,
+            "duration": round(self.duration, 3),
+        }
+
+
+class PrefetchReport:
+    """Summary of an :meth:`AssetManager.prefetch` run."""
+
+    def __init__(self, results: List[PrefetchResult], elapsed: float) -> None:
+        self.results = results
+        self.elapsed = elapsed
+
+    @property
+    def succeeded(self) -> List[PrefetchResult]:
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> List[PrefetchResult]:
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def paths(self) -> Dict[str, Path]:
+        """Paths of the assets that are ready, by name."""
+        return {result.name: result.path for result in self.results if result.path is not None}
+
+    def summary(self) -> str:
+        downloaded = sum(1 for result in self.succeeded if result.downloaded)
+        return (
+            f"Prefetched {len(self.succeeded)}/{len(self.results)} assets in {self.elapsed:.1f}s "
+            f"({downloaded} downloaded, {len(self.succeeded) - downloaded} cached, {len(self.failed)} failed)"
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "elapsed": round(self.elapsed, 3),
+            "succeeded": len(self.succeeded),
+            "failed": len(self.failed),
+            "assets": [result.as_dict() for result in self.results],
+        }
+
 
 class AssetManager:
     """Manages downloading, caching, and verification of assets used by agents."""
@@ -46,11 +153,47 @@ class AssetManager:
         else:
             self.cache_dir = Path.home() / ".openmas" / "assets"
 
+        # Re-hash cached assets on every access instead of trusting recorded digests
+        asset_settings = project_config.settings.assets if project_config.settings else None
+        self.paranoid = bool(getattr(asset_settings, "paranoid_verification", False))
+        self.lock_timeout: Optional[float] = getattr(asset_settings, "lock_timeout", None)
+        self.lock_stats = LockWaitStats()
+        self.prefetch_concurrency = int(getattr(asset_settings, "prefetch_concurrency", 4))
+        # Shared by all HTTP downloads of this manager, so concurrent downloads split the budget
+        max_download_rate_mb = getattr(asset_settings, "max_download_rate_mb", None)
+        self.rate_limiter: Optional[BandwidthLimiter] = (
+            BandwidthLimiter(max_download_rate_mb * 1024 * 1024) if max_download_rate_mb else None
+        )
+        max_cache_size_gb = getattr(asset_settings, "max_cache_size_gb", None)
+        self.max_cache_bytes: Optional[int] = int(max_cache_size_gb * 1024**3) if max_cache_size_gb else None
+        # Asset cache servers of other nodes, tried before the source of checksummed assets
+        self.peer_mirrors: List[str] = list(getattr(asset_settings, "peer_mirrors", None) or [])
+        # Pins held by this manager, counted by lock file
+        self._pins: Dict[Path, int] = {}
+        # Number of completed downloads per asset, which tells prefetch() apart from cache hits
+        self._download_counts: Dict[str, int] = {}
+        # In-process locks per event loop and asset, so concurrent requests for the same asset
+        # wait for one download instead of polling the file lock
+        self._asset_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Lock]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # Checksums that downloaders computed while downloading, by downloaded path
+        self._download_checksums: Dict[Path, str] = {}
+
         # Ensure cache directory and locks directory exist
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.locks_dir = self.cache_dir / ".locks"
         self.locks_dir.mkdir(parents=True, exist_ok=True)
 
+        # Files of downloaded assets are stored once by digest and linked into their entries
+        self.store: Optional[ContentStore] = None
+        if getattr(asset_settings, "content_store", False):
+            self.store = ContentStore(
+                self.cache_dir / ".store",
+                link_mode=getattr(asset_settings, "store_link_mode", "hardlink"),
+                lock_timeout=self.lock_timeout,
+            )
+
         # We're no longer initializing downloaders directly here
         # Instead, we'll use get_downloader_for_source to get the appropriate downloader
         # when needed
@@ -100,7 +243,9 @@ class AssetManager:
             "path": final_asset_path if exists else None,
         }
 
-    async def get_asset_path(self, asset_name: str, force_download: bool = False) -> Path:
+    async def get_asset_path(
+        self, asset_name: str, force_download: bool = False, progress: Optional[AssetProgressCallback] = None
+    ) -> Path:
         """Get the path to a cached asset, downloading it if necessary.
 
         This method handles the complete asset retrieval workflow:
@@ -110,9 +255,21 @@ class AssetManager:
         4. Unpack the asset if specified
         5. Return the path to the asset
 
+        Hashing and unpacking run in a worker thread, so the event loop keeps serving other
+        work while a large asset is materialized. Cancelling the call stops them at the next
+        chunk or archive member and removes partially unpacked files.
+
+        When ``max_cache_size_gb`` is set, the returned path is not protected from eviction:
+        a download by another task or process may evict the asset while it is being read.
+        Use :meth:`pinned_asset` (or :meth:`pin_asset`) for as long as the path is used. A
+        running agent pins its ``required_assets`` automatically.
+
         Args:
             asset_name: The name of the asset to retrieve.
             force_download: If True, re-download the asset even if it exists in cache.
+            progress: Optional callback for download, hashing and unpacking progress, called on
+                the event loop with the asset name, the stage ("download", "verify" or "unpack"),
+                and the bytes processed so far and in total (0 if unknown).
 
         Returns:
             Path to the cached asset.
@@ -122,6 +279,8 @@ class AssetManager:
             AssetDownloadError: If there is an error downloading the asset.
             AssetVerificationError: If the asset fails checksum verification.
             AssetUnpackError: If there is an error unpacking the asset.
+            filelock.Timeout: If another process holds the asset's lock for longer than the
+                configured lock timeout.
         """
         if asset_name not in self.assets:
             raise KeyError(f"Asset '{asset_name}' not found in project configuration")
@@ -157,34 +316,13 @@ class AssetManager:
             final_asset_path = asset_dir
 
         # Check if we need to download or unpack
-        need_download = force_download
-
-        # Check if metadata exists and matches our configuration
-        if not force_download and metadata_path.exists() and final_asset_path.exists():
-            try:
-                with open(metadata_path, "r") as f:
-                    metadata = json.load(f)
-                # Verify that metadata matches our expectations
-                if (
-                    metadata.get("name") != asset_config.name
-                    or metadata.get("version") != asset_config.version
-                    or metadata.get("source_type") != asset_config.source.type
-                ):
-                    logger.warning(
-                        f"Asset metadata mismatch for '{asset_name}'. "
-                        f"Expected {asset_config.name}/{asset_config.version}/{asset_config.source.type}, "
-                        f"got {metadata.get('name')}/{metadata.get('version')}/{metadata.get('source_type')}"
-                    )
-                    need_download = True
-            except (json.JSONDecodeError, FileNotFoundError):
-                logger.warning(f"Asset metadata file for '{asset_name}' is invalid or missing")
-                need_download = True
-        else:
-            need_download = True
+        need_download = force_download or self._needs_download(asset_config, metadata_path, final_asset_path)
 
         # Try to lock and download if necessary
-        async with async_asset_lock(lock_path):
-            # Re-check after acquiring the lock
+        async with self._get_asset_lock(asset_name), async_asset_lock(lock_path, self.lock_timeout, self.lock_stats):
+            # Re-check after acquiring the lock: another task or process may have downloaded it meanwhile
+            if need_download and not force_download:
+                need_download = self._needs_download(asset_config, metadata_path, final_asset_path)
             if not force_download and metadata_path.exists() and final_asset_path.exists() and not need_download:
                 # Verify the asset if a checksum is provided
                 if asset_config.checksum:
@@ -199,8 +337,14 @@ class AssetManager:
                             final_asset_path = asset_to_verify  # Update final path
                             logger.debug(f"Using previously unpacked file for verification: {asset_to_verify}")
 
-                    if not self.verify_asset(asset_config, asset_to_verify):
+                    if not await self._run_off_loop(
+                        self.verify_asset, asset_config, asset_to_verify, stage="verify", progress=progress
+                    ):
                         logger.warning(f"Asset '{asset_name}' failed checksum verification. Removing downloaded file.")
+                        content = self._read_metadata(metadata_path).get("content")
+                        if self.store is not None and content:
+                            # Other entries may link to the same corrupt object
+                            await asyncio.to_thread(self.store.discard, digest_of(content["digest"]))
                         if asset_to_verify.exists():
                             if asset_to_verify.is_dir():
                                 shutil.rmtree(asset_to_verify)
@@ -240,10 +384,13 @@ class AssetManager:
                         final_asset_path.unlink()
                     logger.info(f"Removed existing asset '{asset_name}' for forced download")
 
+                stream_unpack = bool(asset_config.unpack and getattr(asset_config, "stream_unpack", False))
+
                 # Initialize retry variables
                 max_attempts = asset_config.retries + 1  # +1 for the initial attempt
                 attempts = 0
                 downloaded_path = None
+                content_digest: Optional[str] = None
 
                 # Retry loop for download
                 while attempts < max_attempts:
@@ -251,11 +398,40 @@ class AssetManager:
                     downloaded_path = None
                     try:
                         logger.info(f"Download attempt {attempts}/{max_attempts} for asset '{asset_name}'")
-                        downloaded_path = await self.download_asset(asset_config)
+                        if stream_unpack:
+                            # Extracted and verified as the archive arrives
+                            downloaded_path = await self._download_and_unpack(asset_config, asset_dir, progress)
+                            break
+                        if (
+                            self.store is not None
+                            and not asset_config.unpack
+                            and asset_config.checksum
+                            and not force_download
+                            and await asyncio.to_thread(
+                                self.store.link, digest_of(asset_config.checksum), final_asset_path
+                            )
+                        ):
+                            # Another asset, version or project already downloaded these contents
+                            logger.info(f"Asset '{asset_name}' linked from the content store")
+                            downloaded_path = final_asset_path
+                            content_digest = digest_of(asset_config.checksum)
+                            break
+                        downloaded_path = await self.download_asset(asset_config, progress=progress)
+                        streamed_checksum = self._download_checksums.pop(downloaded_path, None)
 
-                        # Verify the checksum if provided
+                        # Verify the checksum if provided, unless the downloader already hashed
+                        # the bytes it wrote and found them to match
                         if asset_config.checksum:
-                            if not self.verify_asset(asset_config, downloaded_path):
+                            if streamed_checksum and streamed_checksum.lower() == asset_config.checksum.lower():
+                                logger.debug(f"Asset '{asset_name}' was verified while downloading")
+                            elif not await self._run_off_loop(
+                                self.verify_asset,
+                                asset_config,
+                                downloaded_path,
+                                full=True,
+                                stage="verify",
+                                progress=progress,
+                            ):
                                 # If checksum fails, clean up and retry or fail
                                 logger.warning(
                                     f"Asset '{asset_name}' failed checksum verification. Removing downloaded file."
@@ -268,6 +444,11 @@ class AssetManager:
                                 )
                             logger.info(f"Asset '{asset_name}' checksum verified successfully")
 
+                        if self.store is not None and not asset_config.unpack and downloaded_path.is_file():
+                            content_digest = await self._store_download(
+                                asset_config, downloaded_path, streamed_checksum, progress
+                            )
+
                         # If we get here, download and verification succeeded
                         break
 
@@ -339,7 +520,18 @@ class AssetManager:
 
                 # Unpack if needed
                 if asset_config.unpack and downloaded_path is not None:
-                    unpacked_path = self.unpack_asset(asset_config, downloaded_path, asset_dir)
+                    if stream_unpack:
+                        unpacked_path = downloaded_path
+                    else:
+                        unpacked_path = await self._run_off_loop(
+                            self.unpack_asset,
+                            asset_config,
+                            downloaded_path,
+                            asset_dir,
+                            lock=False,
+                            stage="unpack",
+                            progress=progress,
+                        )
 
                     # If unpack_destination_is_file is True, update final_asset_path to the actual file
                     if asset_config.unpack_destination_is_file and unpacked_path != asset_dir:
@@ -355,7 +547,7 @@ class AssetManager:
                     unpacked_marker.touch()
 
                 # Write metadata file
-                metadata = {
+                metadata: Dict[str, Any] = {
                     "name": asset_config.name,
                     "version": asset_config.version,
                     "asset_type": asset_config.asset_type,
@@ -364,22 +556,38 @@ class AssetManager:
                     "unpack": asset_config.unpack,
                     "unpack_format": asset_config.unpack_format,
                     "description": asset_config.description,
+                    "last_accessed": time.time(),
                 }
+                # Record the verified digest so later cache hits can skip re-hashing
+                if asset_config.checksum:
+                    if asset_config.unpack:
+                        metadata["verified"] = {"digest": asset_config.checksum, "unpacked": True}
+                    elif final_asset_path.is_file():
+                        metadata["verified"] = self._verification_record(asset_config.checksum, final_asset_path)
+                if content_digest:
+                    metadata["content"] = {"digest": f"sha256:{content_digest}", "path": str(final_asset_path)}
 
-                with open(metadata_path, "w") as f:
-                    json.dump(metadata, f, indent=2)
+                self._write_metadata(metadata_path, metadata)
+                self._download_counts[asset_name] = self._download_counts.get(asset_name, 0) + 1
 
                 logger.debug(f"Wrote asset metadata to {metadata_path}")
+
+                if self.max_cache_bytes is not None:
+                    # The lock held on this asset keeps it from being evicted itself
+                    await asyncio.to_thread(self.evict_to_limit)
             else:
                 logger.info(f"Asset '{asset_name}' found in cache")
+                self._record_access(metadata_path)
 
         return final_asset_path
 
-    async def download_asset(self, asset_config: AssetConfig) -> Path:
+    async def download_asset(self, asset_config: AssetConfig, progress: Optional[AssetProgressCallback] = None) -> Path:
         """Download an asset to the cache directory.
 
         Args:
             asset_config: The configuration for the asset to download.
+            progress: Optional callback receiving the bytes downloaded under the "download"
+                stage, for downloaders that report it.
 
         Returns:
             Path to the downloaded asset.
@@ -387,6 +595,8 @@ class AssetManager:
         Raises:
             AssetConfigurationError: If the source configuration is invalid.
             AssetDownloadError: If there is an error downloading the asset.
+            AssetVerificationError: If the downloader hashed the asset and it does not match
+                its checksum.
         """
         # Determine the target path for the asset
         target_path = self._get_cache_path_for_asset(asset_config)
@@ -412,14 +622,25 @@ class AssetManager:
         try:
             # Get the appropriate downloader based on the source type
             downloader = get_downloader_for_source(source_config)
-
-            # Download the asset
-            await downloader.download(source_config, download_path)
+            # Peers serve verified files, and no cache keeps the archive of an unpacked asset
+            if self.peer_mirrors and asset_config.checksum and not asset_config.unpack:
+                downloader = PeerMirrorDownloader(self.peer_mirrors, downloader)
+
+            # Download the asset, letting the downloader verify it as the bytes arrive
+            checksum = await downloader.download(
+                source_config,
+                download_path,
+                expected_checksum=asset_config.checksum,
+                progress=self._stage_progress(asset_config, "download", progress),
+                rate_limiter=self.rate_limiter,
+            )
+            if isinstance(checksum, str):
+                self._download_checksums[download_path] = checksum
 
             # Return the path to the downloaded asset
             return download_path
 
-        except (AssetConfigurationError, AssetDownloadError):
+        except (AssetConfigurationError, AssetDownloadError, AssetVerificationError):
             # Re-raise these exceptions as they already have appropriate context
             raise
         except Exception as e:
@@ -430,30 +651,58 @@ class AssetManager:
                 source_info=str(source_config),
             ) from e
 
-    def verify_asset(self, asset_config: AssetConfig, asset_path: Path) -> bool:
+    def verify_asset(
+        self,
+        asset_config: AssetConfig,
+        asset_path: Path,
+        full: bool = False,
+        progress: Optional[ProgressCallback] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> bool:
         """Verify an asset's integrity using its checksum.
 
+        A cached file whose size, modification time and inode match the values recorded when it
+        was last verified is not re-hashed, unless ``full`` is set or the manager is paranoid.
+        Unpacked assets are verified through their archive at download time; afterwards only the
+        recorded digest can be checked, since the archive has been removed.
+
         Args:
             asset_config: The asset configuration containing the checksum.
             asset_path: The path to the asset to verify.
+            full: If True, always re-hash the file.
+            progress: Optional callback receiving the bytes hashed so far and the file size.
+            cancel_event: Optional event that stops hashing when set.
 
         Returns:
             True if the asset is valid, False otherwise.
 
         Raises:
             AssetVerificationError: If verification fails due to an error.
+            AssetCancelledError: If the cancel event was set.
             ValueError: If the checksum format is invalid.
         """
         if not asset_config.checksum:
             logger.info(f"No checksum specified for asset '{asset_config.name}', skipping verification")
             return True
 
+        asset_dir = self._get_cache_path_for_asset(asset_config)
+        metadata_path = asset_dir / ".asset_info.json"
+        record = self._read_metadata(metadata_path).get("verified")
+        if isinstance(record, dict) and record.get("digest") == asset_config.checksum:
+            if record.get("unpacked") and ((asset_dir / ".unpacked").exists() or (asset_path / ".unpacked").exists()):
+                logger.debug(f"Asset '{asset_config.name}' was verified before unpacking")
+                return True
+            if not (full or self.paranoid) and record == self._verification_record(asset_config.checksum, asset_path):
+                logger.debug(f"Asset '{asset_config.name}' is unchanged since its last verification, skipping re-hash")
+                return True
+
         logger.info(f"Verifying asset '{asset_config.name}' using checksum: {asset_config.checksum}")
 
         try:
-            result = verify_checksum(asset_path, asset_config.checksum)
+            result = verify_checksum(asset_path, asset_config.checksum, progress=progress, cancel_event=cancel_event)
             if result:
                 logger.info(f"Asset '{asset_config.name}' verified successfully")
+                self._record_verification(metadata_path, asset_config.checksum, asset_path)
             else:
                 logger.warning(
                     f"Asset '{asset_config.name}' checksum verification failed. " f"Expected: {asset_config.checksum}"
@@ -463,19 +712,31 @@ class AssetManager:
             logger.error(f"Error verifying asset '{asset_config.name}': {str(e)}")
             raise
 
-    def unpack_asset(self, asset_config: AssetConfig, archive_path: Path, target_dir: Path) -> Path:
+    def unpack_asset(
+        self,
+        asset_config: AssetConfig,
+        archive_path: Path,
+        target_dir: Path,
+        lock: bool = True,
+        progress: Optional[ProgressCallback] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> Path:
         """Unpack an archived asset.
 
         Args:
             asset_config: The asset configuration.
             archive_path: The path to the archive file.
             target_dir: The directory to unpack the archive to.
+            lock: Acquire the asset's lock; pass False if the caller already holds it.
+            progress: Optional callback receiving the uncompressed bytes extracted so far and in total.
+            cancel_event: Optional event that stops unpacking when set; partially unpacked files are removed.
 
         Returns:
             Path to the unpacked directory or file (if unpack_destination_is_file is True)
 
         Raises:
             AssetUnpackError: If there is an error unpacking the asset.
+            AssetCancelledError: If the cancel event was set.
             ValueError: If the format is not supported.
         """
         if not asset_config.unpack:
@@ -494,7 +755,7 @@ class AssetManager:
         unpacked_path = target_dir  # Default to returning the target directory
 
         try:
-            with asset_lock(lock_path):
+            with asset_lock(lock_path, self.lock_timeout, self.lock_stats) if lock else nullcontext():
                 # Check if we've already unpacked and the marker exists
                 unpacked_marker = target_dir / ".unpacked"
                 if unpacked_marker.exists():
@@ -528,6 +789,8 @@ class AssetManager:
                     target_dir,
                     asset_config.unpack_format,
                     destination_is_file=asset_config.unpack_destination_is_file,
+                    progress=progress,
+                    cancel_event=cancel_event,
                 )
 
                 # Create a marker file to indicate successful unpacking
@@ -560,11 +823,152 @@ class AssetManager:
                 except Exception:
                     logger.warning(f"Failed to clean up after unpacking error for asset '{asset_config.name}'")
 
-            if isinstance(e, (AssetUnpackError, ValueError)):
+            if isinstance(e, (AssetUnpackError, AssetCancelledError, ValueError)):
                 raise
             else:
                 raise AssetUnpackError(f"Error unpacking asset '{asset_config.name}': {str(e)}") from e
 
+    async def _store_download(
+        self,
+        asset_config: AssetConfig,
+        downloaded_path: Path,
+        streamed_checksum: Optional[str],
+        progress: Optional[AssetProgressCallback],
+    ) -> str:
+        """Move a verified download into the content store and link it back into place.
+
+        Args:
+            asset_config: The asset configuration.
+            downloaded_path: The downloaded file.
+            streamed_checksum: Checksum the downloader computed while downloading, if any.
+            progress: Optional progress callback, reporting under the "verify" stage if the
+                file must be hashed first.
+
+        Returns:
+            Hex digest of the file.
+        """
+        assert self.store is not None
+        checksum = asset_config.checksum or streamed_checksum
+        if checksum:
+            digest = digest_of(checksum)
+        else:
+            digest = await self._run_off_loop(
+                self._hash_file, asset_config, downloaded_path, stage="verify", progress=progress
+            )
+        await asyncio.to_thread(self.store.add, digest, downloaded_path, downloaded_path)
+        return digest
+
+    @staticmethod
+    def _hash_file(
+        asset_config: AssetConfig,
+        path: Path,
+        progress: Optional[ProgressCallback] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> str:
+        """Hash a downloaded file without a configured checksum, for use with _run_off_loop."""
+        return calculate_sha256(path, progress=progress, cancel_event=cancel_event)
+
+    def collect_store_garbage(self) -> Optional[Dict[str, int]]:
+        """Remove content store objects that no cache entry links to any more.
+
+        Returns:
+            The number of objects removed and the bytes freed, or None if the content store is
+            disabled.
+        """
+        if self.store is None:
+            return None
+        return self.store.collect()
+
+    @staticmethod
+    def _verification_record(checksum: str, asset_path: Path) -> Optional[Dict[str, Any]]:
+        """Build the record identifying a verified file.
+
+        Args:
+            checksum: The checksum the file was verified against.
+            asset_path: The verified file.
+
+        Returns:
+            The digest with the file's name, size, modification time and inode, or None if the
+            path is not a file.
+        """
+        try:
+            stat = asset_path.stat()
+        except OSError:
+            return None
+        if not asset_path.is_file():
+            return None
+        return {
+            "digest": checksum,
+            "path": asset_path.name,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "inode": stat.st_ino,
+        }
+
+    @staticmethod
+    def _read_metadata(metadata_path: Path) -> Dict[str, Any]:
+        """Read an asset's metadata file.
+
+        Args:
+            metadata_path: Path to the ``.asset_info.json`` file.
+
+        Returns:
+            The metadata, or an empty dictionary if the file is missing or invalid.
+        """
+        try:
+            with open(metadata_path, "r") as f:
+                metadata = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return metadata if isinstance(metadata, dict) else {}
+
+    @staticmethod
+    def _write_metadata(metadata_path: Path, metadata: Dict[str, Any]) -> None:
+        """Atomically write an asset's metadata file.
+
+        Args:
+            metadata_path: Path to the ``.asset_info.json`` file.
+            metadata: The metadata to write.
+        """
+        tmp_path = metadata_path.with_name(metadata_path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(metadata, f, indent=2)
+        os.replace(tmp_path, metadata_path)
+
+    def _record_verification(self, metadata_path: Path, checksum: str, asset_path: Path) -> None:
+        """Record a successful verification in an existing metadata file.
+
+        Args:
+            metadata_path: Path to the ``.asset_info.json`` file.
+            checksum: The checksum the file was verified against.
+            asset_path: The verified file.
+        """
+        metadata = self._read_metadata(metadata_path)
+        record = self._verification_record(checksum, asset_path)
+        # Files being downloaded have no metadata yet; it is written once the asset is ready
+        if not metadata or record is None or metadata.get("verified") == record:
+            return
+        metadata["verified"] = record
+        try:
+            self._write_metadata(metadata_path, metadata)
+        except OSError as e:
+            logger.debug(f"Could not record verification in {metadata_path}: {e}")
+
+    def _record_access(self, metadata_path: Path) -> None:
+        """Record the time an asset was last accessed, which orders cache eviction.
+
+        Args:
+            metadata_path: Path to the ``.asset_info.json`` file.
+        """
+        metadata = self._read_metadata(metadata_path)
+        if not metadata:
+            return
+        metadata["last_accessed"] = time.time()
+        try:
+            self._write_metadata(metadata_path, metadata)
+        except OSError as e:
+            logger.debug(f"Could not record access in {metadata_path}: {e}")
+
     def _get_cache_path_for_asset(self, asset_config: AssetConfig) -> Path:
         """Get the cache path for an asset.
 
@@ -591,14 +995,248 @@ class AssetManager:
         Returns:
             Path to the asset's lock file.
         """
+        return self._lock_path_for(asset_config.name, asset_config.version)
+
+    def _lock_path_for(self, asset_name: str, asset_version: Optional[str]) -> Path:
+        """Get the lock file path for an asset name and version, which cache entries record."""
         # Create a unique filename based on the asset name and version
-        asset_name = asset_config.name
-        asset_version = asset_config.version or "latest"
-        lock_filename = f"{asset_name}_{asset_version}.lock"
+        lock_filename = f"{asset_name}_{asset_version or 'latest'}.lock"
 
         # Return the full path to the lock file
         return self.locks_dir / lock_filename
 
+    def _needs_download(self, asset_config: AssetConfig, metadata_path: Path, final_asset_path: Path) -> bool:
+        """Check whether the cached copy of an asset is missing or was fetched for another configuration.
+
+        Args:
+            asset_config: The asset configuration.
+            metadata_path: Path to the asset's metadata file.
+            final_asset_path: Path where the asset is expected in the cache.
+
+        Returns:
+            True if the asset has to be downloaded.
+        """
+        if not (metadata_path.exists() and final_asset_path.exists()):
+            return True
+        try:
+            with open(metadata_path, "r") as f:
+                metadata = json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            logger.warning(f"Asset metadata file for '{asset_config.name}' is invalid or missing")
+            return True
+        # Verify that metadata matches our expectations
+        if (
+            metadata.get("name") != asset_config.name
+            or metadata.get("version") != asset_config.version
+            or metadata.get("source_type") != asset_config.source.type
+        ):
+            logger.warning(
+                f"Asset metadata mismatch for '{asset_config.name}'. "
+                f"Expected {asset_config.name}/{asset_config.version}/{asset_config.source.type}, "
+                f"got {metadata.get('name')}/{metadata.get('version')}/{metadata.get('source_type')}"
+            )
+            return True
+        return False
+
+    async def _download_and_unpack(
+        self, asset_config: AssetConfig, asset_dir: Path, progress: Optional[AssetProgressCallback] = None
+    ) -> Path:
+        """Download an archive and extract it as it arrives, without storing the archive.
+
+        The archive is extracted into a staging directory while its compressed bytes are
+        hashed, and the contents are only moved into the asset directory once the checksum
+        matches.
+
+        Args:
+            asset_config: The configuration of the asset, with a tar ``unpack_format``.
+            asset_dir: The asset's cache directory.
+            progress: Optional callback receiving the archive bytes received under the
+                ``"unpack"`` stage.
+
+        Returns:
+            Path to the unpacked directory or file (if unpack_destination_is_file is True)
+
+        Raises:
+            AssetDownloadError: If there is an error downloading the archive.
+            AssetVerificationError: If the archive does not match its checksum.
+            AssetUnpackError: If there is an error unpacking the archive.
+        """
+        source_config = asset_config.source
+        downloader = get_downloader_for_source(source_config)
+        staging_dir = asset_dir / ".unpacking"
+        if staging_dir.exists():
+            shutil.rmtree(staging_dir)
+        sha256 = hashlib.sha256()
+        report = self._stage_progress(asset_config, "unpack", progress)
+
+        async def chunks() -> AsyncIterator[bytes]:
+            async for chunk in downloader.stream(source_config, progress=report, rate_limiter=self.rate_limiter):
+                sha256.update(chunk)
+                yield chunk
+
+        logger.info(f"Downloading and unpacking asset '{asset_config.name}' to {asset_dir}")
+        try:
+            staged_path = await unpack_stream(
+                chunks(),
+                staging_dir,
+                asset_config.unpack_format or "",
+                destination_is_file=asset_config.unpack_destination_is_file,
+            )
+            checksum = f"sha256:{sha256.hexdigest()}"
+            if asset_config.checksum and checksum.lower() != asset_config.checksum.lower():
+                raise AssetVerificationError(
+                    f"Asset '{asset_config.name}' failed checksum verification. "
+                    f"Expected: {asset_config.checksum}, got: {checksum}"
+                )
+            for entry in staging_dir.iterdir():
+                destination = asset_dir / entry.name
+                if destination.is_dir() and not destination.is_symlink():
+                    shutil.rmtree(destination)
+                elif destination.is_symlink() or destination.exists():
+                    destination.unlink()
+                os.replace(entry, destination)
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+        logger.info(f"Successfully unpacked asset '{asset_config.name}' to {asset_dir}")
+        return asset_dir / staged_path.relative_to(staging_dir)
+
+    @staticmethod
+    def _stage_progress(
+        asset_config: AssetConfig, stage: str, progress: Optional[AssetProgressCallback]
+    ) -> Optional[ProgressCallback]:
+        """Adapt an asset progress callback to the (done, total) callbacks of downloaders."""
+        if progress is None:
+            return None
+
+        def report(done: int, total: int) -> None:
+            progress(asset_config.name, stage, done, total)
+
+        return report
+
+    async def prefetch(
+        self,
+        names: Optional[Iterable[str]] = None,
+        concurrency: Optional[int] = None,
+        force_download: bool = False,
+        progress: Optional[AssetProgressCallback] = None,
+    ) -> PrefetchReport:
+        """Download, verify and unpack several assets concurrently.
+
+        Each asset goes through :meth:`get_asset_path`, at most ``concurrency`` at a time, so a
+        cold cache fills in roughly the time of the longest download rather than the sum of
+        all of them. HTTP downloads share the manager's rate limit
+        (``settings.assets.max_download_rate_mb``). A failing asset does not stop the others;
+        its error is recorded in the report.
+
+        Args:
+            names: Names of the assets to prefetch, or None for all assets of the project.
+            concurrency: Number of assets processed at the same time (defaults to
+                ``settings.assets.prefetch_concurrency``).
+            force_download: If True, re-download the assets even if they exist in cache.
+            progress: Optional callback for per-asset progress, as for :meth:`get_asset_path`.
+
+        Returns:
+            The outcome of every asset, in the order of the names.
+
+        Raises:
+            KeyError: If an asset is not in the project configuration.
+            ValueError: If the concurrency is not positive.
+        """
+        asset_names = list(dict.fromkeys(names)) if names is not None else list(self.assets)
+        unknown = [name for name in asset_names if name not in self.assets]
+        if unknown:
+            raise KeyError(f"Assets not found in project configuration: {', '.join(unknown)}")
+        limit = concurrency if concurrency is not None else self.prefetch_concurrency
+        if limit < 1:
+            raise ValueError("Prefetch concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(limit)
+        started = time.monotonic()
+        logger.info(f"Prefetching {len(asset_names)} assets, {limit} at a time")
+
+        async def fetch(name: str) -> PrefetchResult:
+            async with semaphore:
+                fetch_started = time.monotonic()
+                downloads = self._download_counts.get(name, 0)
+                try:
+                    path = await self.get_asset_path(name, force_download=force_download, progress=progress)
+                except Exception as e:
+                    logger.error(f"Failed to prefetch asset '{name}': {e}")
+                    return PrefetchResult(name, error=e, duration=time.monotonic() - fetch_started)
+                return PrefetchResult(
+                    name,
+                    path=path,
+                    downloaded=self._download_counts.get(name, 0) > downloads,
+                    duration=time.monotonic() - fetch_started,
+                )
+
+        results = await asyncio.gather(*(fetch(name) for name in asset_names))
+        report = PrefetchReport(list(results), time.monotonic() - started)
+        logger.info(report.summary())
+        return report
+
+    async def _run_off_loop(
+        self,
+        func: Callable[..., Any],
+        asset_config: AssetConfig,
+        *args: Any,
+        stage: str,
+        progress: Optional[AssetProgressCallback] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Run a hashing or unpacking step of an asset in a worker thread.
+
+        If the calling task is cancelled, the step is asked to stop and awaited before the
+        cancellation propagates, so it never outlives the asset lock held by the caller.
+
+        Args:
+            func: The step to run; it must accept ``progress`` and ``cancel_event`` keywords.
+            asset_config: The asset configuration, passed as the first argument.
+            *args: Further positional arguments for the step.
+            stage: Name of the step reported to the progress callback.
+            progress: Optional progress callback of the caller.
+            **kwargs: Further keyword arguments for the step.
+
+        Returns:
+            The step's result.
+        """
+        loop = asyncio.get_running_loop()
+        cancel_event = threading.Event()
+
+        def report(done: int, total: int) -> None:
+            if progress is not None:
+                loop.call_soon_threadsafe(progress, asset_config.name, stage, done, total)
+
+        future = loop.run_in_executor(
+            None,
+            functools.partial(
+                func, asset_config, *args, progress=report if progress else None, cancel_event=cancel_event, **kwargs
+            ),
+        )
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            cancel_event.set()
+            logger.info(f"Cancelling {stage} of asset '{asset_config.name}'")
+            await asyncio.wait([future])
+            raise
+
+    def _get_asset_lock(self, asset_name: str) -> asyncio.Lock:
+        """Get the in-process lock of an asset for the running event loop.
+
+        Args:
+            asset_name: The name of the asset.
+
+        Returns:
+            The asyncio lock serializing retrievals of the asset within this process.
+        """
+        loop = asyncio.get_running_loop()
+        locks = self._asset_locks.setdefault(loop, {})
+        if asset_name not in locks:
+            locks[asset_name] = asyncio.Lock()
+        return locks[asset_name]
+
     def clear_asset_cache(self, asset_name: str) -> bool:
         """Clear a specific asset from the cache.
 
@@ -627,6 +1265,7 @@ class AssetManager:
         # Lock to ensure we don't clear during a download
         with asset_lock(lock_path):
             logger.info(f"Clearing cache for asset '{asset_name}' at '{asset_dir}'")
+            content = self._read_metadata(asset_dir / ".asset_info.json").get("content")
 
             # Remove the directory
             try:
@@ -634,12 +1273,297 @@ class AssetManager:
                     shutil.rmtree(asset_dir)
                 else:
                     asset_dir.unlink()
+                if self.store is not None and content:
+                    # Deletes the stored file unless other entries still link to it
+                    self.store.release(digest_of(content["digest"]), Path(content["path"]))
                 logger.info(f"Cache for asset '{asset_name}' cleared successfully")
                 return True
             except Exception as e:
                 logger.warning(f"Error clearing cache for asset '{asset_name}': {e}")
                 return False
 
+    @staticmethod
+    def _pins_dir(lock_path: Path) -> Path:
+        return lock_path.with_name(lock_path.name + ".pins")
+
+    async def pin_asset(self, asset_name: str) -> None:
+        """Keep an asset from being evicted from the cache while this process uses it.
+
+        A pin is a file named after the process next to the asset's lock file, created under
+        the lock so that evictions in any process see it. Pins of processes that exited are
+        ignored. Pins are counted, so every call needs a matching :meth:`unpin_asset`.
+
+        Args:
+            asset_name: The name of the asset.
+
+        Raises:
+            KeyError: If the asset name is not found in the project configuration.
+        """
+        if asset_name not in self.assets:
+            raise KeyError(f"Asset '{asset_name}' not found in project configuration")
+        lock_path = self._get_lock_path_for_asset(self.assets[asset_name])
+        # Concurrent first pins wait for the pin file instead of each counting from zero
+        async with self._get_asset_lock(asset_name):
+            count = self._pins.get(lock_path, 0)
+            if count == 0:
+                async with async_asset_lock(lock_path, self.lock_timeout, self.lock_stats):
+                    pins_dir = self._pins_dir(lock_path)
+                    pins_dir.mkdir(exist_ok=True)
+                    (pins_dir / f"{os.getpid()}.{id(self)}").touch()
+            self._pins[lock_path] = count + 1
+
+    def unpin_asset(self, asset_name: str) -> None:
+        """Release a pin taken with :meth:`pin_asset`.
+
+        Args:
+            asset_name: The name of the asset.
+
+        Raises:
+            KeyError: If the asset name is not found in the project configuration.
+        """
+        if asset_name not in self.assets:
+            raise KeyError(f"Asset '{asset_name}' not found in project configuration")
+        lock_path = self._get_lock_path_for_asset(self.assets[asset_name])
+        count = self._pins.get(lock_path, 0)
+        if count > 1:
+            self._pins[lock_path] = count - 1
+        elif count == 1:
+            del self._pins[lock_path]
+            (self._pins_dir(lock_path) / f"{os.getpid()}.{id(self)}").unlink(missing_ok=True)
+
+    @asynccontextmanager
+    async def pinned_asset(self, asset_name: str, force_download: bool = False) -> AsyncIterator[Path]:
+        """Get the path to an asset, keeping it pinned in the cache until the block exits.
+
+        Args:
+            asset_name: The name of the asset.
+            force_download: If True, re-download the asset even if it exists in cache.
+
+        Yields:
+            Path to the cached asset.
+        """
+        await self.pin_asset(asset_name)
+        try:
+            yield await self.get_asset_path(asset_name, force_download=force_download)
+        finally:
+            self.unpin_asset(asset_name)
+
+    def _is_pinned(self, lock_path: Path) -> bool:
+        """Check whether a live process pins an asset, removing pins of processes that exited."""
+        pins_dir = self._pins_dir(lock_path)
+        if not pins_dir.is_dir():
+            return False
+        pinned = False
+        for pin in pins_dir.iterdir():
+            try:
+                pid = int(pin.name.split(".")[0])
+            except ValueError:
+                continue
+            if _process_alive(pid):
+                pinned = True
+            else:
+                pin.unlink(missing_ok=True)
+        return pinned
+
+    @staticmethod
+    def _entry_size(asset_dir: Path, shared_path: Optional[str]) -> int:
+        """Get the bytes of a cache entry's own files, leaving out links to the content store."""
+        size = 0
+        for root, _dirs, files in os.walk(asset_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                if os.path.islink(path) or (shared_path and os.path.abspath(path) == shared_path):
+                    continue
+                try:
+                    size += os.path.getsize(path)
+                except OSError:
+                    pass
+        return size
+
+    def _metadata_paths(self) -> Iterable[Path]:
+        """Yield the metadata files of all assets in the cache."""
+        for metadata_path in self.cache_dir.glob("*/*/*/.asset_info.json"):
+            # Skips .locks, .store and the Hugging Face cache
+            if not metadata_path.relative_to(self.cache_dir).parts[0].startswith("."):
+                yield metadata_path
+
+    def find_verified_file(self, checksum: str) -> Optional[Path]:
+        """Find a cached file known to match a checksum, for serving it to other nodes.
+
+        Content store objects qualify, as do cached files that are unchanged since they were
+        verified against the checksum. Unpacked assets do not, since their archive is gone.
+
+        Args:
+            checksum: The ``sha256:<hex_digest>`` checksum.
+
+        Returns:
+            Path to the file, or None if the cache holds no verified file with the checksum.
+
+        Raises:
+            ValueError: If the checksum is not a SHA-256 checksum.
+        """
+        digest = digest_of(checksum)
+        if self.store is not None and self.store.has(digest):
+            return self.store.object_path(digest)
+        for metadata_path in self._metadata_paths():
+            record = self._read_metadata(metadata_path).get("verified")
+            if not isinstance(record, dict) or not record.get("path"):
+                continue
+            if str(record.get("digest", "")).lower() != f"sha256:{digest}":
+                continue
+            path: Path = metadata_path.parent / record["path"]
+            if record == self._verification_record(record["digest"], path):
+                return path
+        return None
+
+    def _cache_entries(self) -> List[Dict[str, Any]]:
+        """Find the assets in the cache, including ones the project no longer configures.
+
+        Returns:
+            The entries with their metadata, lock path, size and last access time, least
+            recently accessed first.
+        """
+        entries = []
+        for metadata_path in self._metadata_paths():
+            metadata = self._read_metadata(metadata_path)
+            if not metadata.get("name"):
+                continue
+            content = metadata.get("content")
+            try:
+                last_accessed = float(metadata.get("last_accessed") or metadata_path.stat().st_mtime)
+            except OSError:
+                continue
+            entries.append(
+                {
+                    "name": metadata["name"],
+                    "version": metadata.get("version") or "latest",
+                    "asset_type": metadata.get("asset_type") or "model",
+                    "path": metadata_path.parent,
+                    "lock_path": self._lock_path_for(metadata["name"], metadata.get("version")),
+                    "content": content,
+                    "bytes": self._entry_size(
+                        metadata_path.parent, os.path.abspath(content["path"]) if content else None
+                    ),
+                    "last_accessed": last_accessed,
+                }
+            )
+        entries.sort(key=lambda entry: entry["last_accessed"])
+        return entries
+
+    def cache_usage(self) -> Dict[str, Any]:
+        """Get the size of the asset cache and of each asset in it.
+
+        Returns:
+            Dictionary with:
+                - entries: Name, version, type, path, size in bytes, last access time and
+                  whether it is pinned, for each cached asset, least recently accessed first
+                - total_bytes: Size of the cache, counting files shared through the content
+                  store once
+                - store_bytes: Size of the content store
+                - max_bytes: The configured size limit, or None
+        """
+        entries = self._cache_entries()
+        store_bytes = self.store.usage()["bytes"] if self.store is not None else 0
+        return {
+            "entries": [
+                {
+                    "name": entry["name"],
+                    "version": entry["version"],
+                    "asset_type": entry["asset_type"],
+                    "path": entry["path"],
+                    "bytes": entry["bytes"],
+                    "last_accessed": entry["last_accessed"],
+                    "pinned": self._is_pinned(entry["lock_path"]),
+                }
+                for entry in entries
+            ],
+            "total_bytes": sum(entry["bytes"] for entry in entries) + store_bytes,
+            "store_bytes": store_bytes,
+            "max_bytes": self.max_cache_bytes,
+        }
+
+    def evict_to_limit(self, max_bytes: Optional[int] = None) -> Dict[str, Any]:
+        """Evict the least recently accessed assets until the cache fits its size limit.
+
+        Assets whose lock is held, because they are being downloaded or verified right now, and
+        assets pinned by a live process are skipped. Assets the project no longer configures,
+        such as superseded versions, are evicted like any other.
+
+        Args:
+            max_bytes: The limit, defaulting to the configured ``max_cache_size_gb``.
+
+        Returns:
+            The evicted assets as ``name@version``, the bytes freed and the cache size afterwards.
+
+        Raises:
+            ValueError: If no limit is given or configured.
+        """
+        limit = self.max_cache_bytes if max_bytes is None else max_bytes
+        if limit is None:
+            raise ValueError("No cache size limit is configured (settings.assets.max_cache_size_gb)")
+
+        entries = self._cache_entries()
+        total = sum(entry["bytes"] for entry in entries)
+        if self.store is not None:
+            total += self.store.usage()["bytes"]
+        evicted = []
+        freed = 0
+        for entry in entries:
+            if total <= limit:
+                break
+            entry_freed = self._evict_entry(entry)
+            if entry_freed is None:
+                continue
+            total -= entry_freed
+            freed += entry_freed
+            evicted.append(f"{entry['name']}@{entry['version']}")
+
+        if total > limit:
+            logger.warning(
+                f"Asset cache is {total / (1024 * 1024):.2f} MB after eviction, over its limit of "
+                f"{limit / (1024 * 1024):.2f} MB, because the remaining assets are in use"
+            )
+        return {"evicted": evicted, "bytes_freed": freed, "total_bytes": total}
+
+    def _evict_entry(self, entry: Dict[str, Any]) -> Optional[int]:
+        """Remove a cache entry unless it is locked, pinned or was accessed since it was listed.
+
+        Returns:
+            The bytes freed, or None if the entry was kept.
+        """
+        label = f"{entry['name']}@{entry['version']}"
+        try:
+            with asset_lock(entry["lock_path"], timeout=0):
+                if self._is_pinned(entry["lock_path"]):
+                    logger.debug(f"Not evicting pinned asset '{label}'")
+                    return None
+                metadata = self._read_metadata(entry["path"] / ".asset_info.json")
+                if metadata.get("last_accessed", entry["last_accessed"]) != entry["last_accessed"]:
+                    return None
+
+                logger.info(f"Evicting asset '{label}' from the cache")
+                shutil.rmtree(entry["path"])
+                freed: int = entry["bytes"]
+                content = entry["content"]
+                if self.store is not None and content:
+                    digest = digest_of(content["digest"])
+                    try:
+                        object_size = self.store.object_path(digest).stat().st_size
+                    except OSError:
+                        object_size = 0
+                    if self.store.release(digest, Path(content["path"])):
+                        freed += object_size
+        except filelock.Timeout:
+            logger.debug(f"Not evicting asset '{label}', which is in use")
+            return None
+
+        # Drop the asset's directory once its last version is gone
+        try:
+            entry["path"].parent.rmdir()
+        except OSError:
+            pass
+        return freed
+
     def clear_entire_cache(self, exclude_hf_cache: bool = True) -> None:
         """Clear the entire asset cache.
 
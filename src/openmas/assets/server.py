@@ -0,0 +1,151 @@
+"""HTTP server sharing an asset cache with other nodes."""
+
+import asyncio
+import re
+import socket
+from typing import TYPE_CHECKING, Any, Optional
+
+from openmas.assets.exceptions import AssetConfigurationError
+from openmas.logging import get_logger
+
+if TYPE_CHECKING:
+    from openmas.assets.manager import AssetManager
+
+logger = get_logger(__name__)
+
+_DIGEST_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+
+class AssetCacheServer:
+    """Serves the verified files of an asset cache to peer nodes over HTTP.
+
+    Files are addressed by the SHA-256 digest of their contents, which is what the
+    ``checksum`` of an asset names, so nodes whose assets have the same checksum can share them
+    whatever the assets are called::
+
+        GET /assets/sha256/<hex digest>   the file, with support for range requests
+        GET /health                       liveness check
+
+    Only files that :meth:`AssetManager.find_verified_file` vouches for are served. Nodes list
+    the server in ``settings.assets.peer_mirrors`` and verify what they receive against the
+    checksum anyway, so a stale or misbehaving peer costs a failed attempt, not a corrupt asset.
+    """
+
+    def __init__(self, asset_manager: "AssetManager", host: str = "0.0.0.0", port: int = 8765) -> None:
+        """Initialize the server.
+
+        Args:
+            asset_manager: The manager whose cache is served
+            host: Address to listen on
+            port: Port to listen on, or 0 for any free port
+        """
+        self.asset_manager = asset_manager
+        self.host = host
+        self.port = port
+        self._server: Any = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server, for the ``peer_mirrors`` setting of other nodes."""
+        host = "127.0.0.1" if self.host in ("0.0.0.0", "") else self.host
+        return f"http://{host}:{self.port}"
+
+    def create_app(self) -> Any:
+        """Create the FastAPI application serving the cache.
+
+        Returns:
+            The application
+
+        Raises:
+            AssetConfigurationError: If FastAPI is not installed
+        """
+        try:
+            from fastapi import FastAPI, Response
+            from fastapi.responses import FileResponse, JSONResponse
+        except ImportError as e:
+            raise AssetConfigurationError(
+                f"Cannot serve the asset cache: {e}. Make sure you have fastapi and uvicorn installed: "
+                "pip install fastapi uvicorn"
+            ) from e
+
+        app = FastAPI(title="openmas-asset-cache")
+
+        @app.get("/health")  # type: ignore[misc]
+        async def health() -> Response:
+            """Report that the server is running."""
+            return JSONResponse(content={"status": "ok"})
+
+        @app.api_route("/assets/sha256/{digest}", methods=["GET", "HEAD"])  # type: ignore[misc]
+        async def get_asset(digest: str) -> Response:
+            """Serve the cached file with a digest."""
+            digest = digest.lower()
+            if not _DIGEST_PATTERN.fullmatch(digest):
+                return JSONResponse(content={"error": "Expected a hex SHA-256 digest"}, status_code=400)
+            # Scanning the cache and stat'ing files is blocking work
+            path = await asyncio.to_thread(self.asset_manager.find_verified_file, f"sha256:{digest}")
+            if path is None:
+                return JSONResponse(content={"error": "Not in cache"}, status_code=404)
+            logger.debug(f"Serving {path} to a peer")
+            return FileResponse(path, media_type="application/octet-stream")
+
+        return app
+
+    async def start(self) -> None:
+        """Start serving in a background task, returning once the server accepts connections.
+
+        Raises:
+            AssetConfigurationError: If FastAPI or uvicorn is not installed
+            OSError: If the address cannot be bound
+        """
+        if self._task is not None:
+            return
+        try:
+            import uvicorn
+        except ImportError as e:
+            raise AssetConfigurationError(
+                f"Cannot serve the asset cache: {e}. Make sure you have fastapi and uvicorn installed: "
+                "pip install fastapi uvicorn"
+            ) from e
+
+        app = self.create_app()
+        # Bound here, so that port 0 resolves to the actual port before the server starts
+        sock = socket.socket(socket.AF_INET6 if ":" in self.host else socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind((self.host, self.port))
+        except OSError:
+            sock.close()
+            raise
+        self.port = sock.getsockname()[1]
+
+        self._server = uvicorn.Server(uvicorn.Config(app=app, log_level="warning", lifespan="off"))
+        self._task = asyncio.create_task(self._server.serve(sockets=[sock]))
+        while not self._server.started:
+            if self._task.done():
+                # Surfaces the error that stopped the server
+                await self._task
+                raise OSError(f"Asset cache server on {self.host}:{self.port} stopped while starting")
+            await asyncio.sleep(0.01)
+        logger.info(f"Serving asset cache {self.asset_manager.cache_dir} at {self.url}")
+
+    async def stop(self) -> None:
+        """Stop the server and wait for it to shut down."""
+        if self._task is None:
+            return
+        self._server.should_exit = True
+        try:
+            await self._task
+        finally:
+            self._task = None
+            self._server = None
+        logger.info("Stopped asset cache server")
+
+    async def serve_forever(self) -> None:
+        """Start the server and run until cancelled."""
+        await self.start()
+        try:
+            assert self._task is not None
+            await asyncio.shield(self._task)
+        finally:
+            await self.stop()
@@ -0,0 +1,257 @@
+"""Content-addressed store deduplicating asset files across names, versions and projects."""
+
+import hashlib
+import os
+import stat
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from openmas.assets.utils import asset_lock
+from openmas.logging import get_logger
+
+logger = get_logger(__name__)
+
+LINK_MODES = ("hardlink", "symlink")
+
+
+def digest_of(checksum: str) -> str:
+    """Get the hex digest of a ``sha256:<hex_digest>`` checksum.
+
+    Args:
+        checksum: The checksum
+
+    Returns:
+        The lowercase hex digest
+
+    Raises:
+        ValueError: If the checksum is not a SHA-256 checksum
+    """
+    if not checksum.startswith("sha256:"):
+        raise ValueError("Unsupported checksum format. Only sha256:<hex_digest> is supported.")
+    return checksum[7:].lower()
+
+
+class ContentStore:
+    """Files stored once by SHA-256 digest, with cache entries linking to them.
+
+    The store lives in the cache directory and is shared by every project using it::
+
+        <root>/objects/<digest[:2]>/<digest>   the file contents, read-only
+        <root>/refs/<digest>/<ref id>          one file per cache entry, holding the entry's path
+
+    Cache entries are hard links to the objects, or symbolic links if hard links are not
+    possible or ``link_mode`` is ``"symlink"``. An object's references are its live
+    entries: a reference whose entry was deleted or replaced by other means is ignored and
+    removed by :meth:`collect`. Changes are serialized across processes by a file lock.
+    """
+
+    def __init__(self, root: Path, link_mode: str = "hardlink", lock_timeout: Optional[float] = None) -> None:
+        """Initialize the store.
+
+        Args:
+            root: Directory of the store
+            link_mode: ``"hardlink"`` or ``"symlink"``
+            lock_timeout: Seconds to wait for the store lock, or None to wait indefinitely
+        """
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"Unknown link mode '{link_mode}', expected one of: {', '.join(LINK_MODES)}")
+        self.root = root
+        self.link_mode = link_mode
+        self.lock_timeout = lock_timeout
+        self.objects_dir = root / "objects"
+        self.refs_dir = root / "refs"
+        self.lock_path = root / ".lock"
+        for directory in (self.objects_dir, self.refs_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+
+    def object_path(self, digest: str) -> Path:
+        """Get the path of the object with a digest."""
+        return self.objects_dir / digest[:2] / digest
+
+    def has(self, digest: str) -> bool:
+        """Check whether the store holds the object with a digest."""
+        return self.object_path(digest).is_file()
+
+    @staticmethod
+    def _ref_name(entry: Path) -> str:
+        return hashlib.sha256(os.path.abspath(entry).encode()).hexdigest()[:32]
+
+    def _live_refs(self, digest: str) -> Iterator[Path]:
+        """Yield the reference files of an object whose entries still link to it."""
+        refs = self.refs_dir / digest
+        if not refs.is_dir():
+            return
+        for ref in refs.iterdir():
+            if self._entry_links(Path(ref.read_text()), digest):
+                yield ref
+
+    def _entry_links(self, entry: Path, digest: str) -> bool:
+        try:
+            return os.path.samefile(entry, self.object_path(digest))
+        except OSError:
+            return False
+
+    def refcount(self, digest: str) -> int:
+        """Get the number of cache entries linking to an object.
+
+        Args:
+            digest: Hex digest of the object
+
+        Returns:
+            The number of live references
+        """
+        return sum(1 for _ in self._live_refs(digest))
+
+    def add(self, digest: str, source: Path, entry: Path) -> Path:
+        """Move a verified file into the store and link a cache entry to it.
+
+        If the store already holds the contents, the file is discarded instead.
+
+        Args:
+            digest: Hex SHA-256 digest of the file, which the caller verified
+            source: The file to store
+            entry: Path of the cache entry to link, usually the same as the source
+
+        Returns:
+            Path to the object
+        """
+        object_path = self.object_path(digest)
+        with asset_lock(self.lock_path, self.lock_timeout):
+            if object_path.is_file():
+                logger.debug(f"Content {digest[:12]} is already stored, discarding the new copy")
+                source.unlink()
+            else:
+                object_path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(source, object_path)
+                # Entries may be hard links to the object, so keep it from being changed through them
+                object_path.chmod(stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            self._link(digest, entry)
+        return object_path
+
+    def link(self, digest: str, entry: Path) -> bool:
+        """Link a cache entry to a stored object, if the store holds it.
+
+        Args:
+            digest: Hex digest of the object
+            entry: Path of the cache entry
+
+        Returns:
+            True if the entry was linked, False if the store does not hold the object
+        """
+        with asset_lock(self.lock_path, self.lock_timeout):
+            if not self.has(digest):
+                return False
+            self._link(digest, entry)
+        return True
+
+    def _link(self, digest: str, entry: Path) -> None:
+        object_path = self.object_path(digest)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = entry.with_name(f".{entry.name}.link")
+        tmp_path.unlink(missing_ok=True)
+        if self.link_mode == "hardlink":
+            try:
+                os.link(object_path, tmp_path)
+            except OSError as e:
+                logger.debug(f"Cannot hard link {entry} to the store ({e}), using a symbolic link")
+                tmp_path.symlink_to(object_path)
+        else:
+            tmp_path.symlink_to(object_path)
+        os.replace(tmp_path, entry)
+
+        refs = self.refs_dir / digest
+        refs.mkdir(parents=True, exist_ok=True)
+        (refs / self._ref_name(entry)).write_text(os.path.abspath(entry))
+
+    def release(self, digest: str, entry: Path) -> bool:
+        """Drop the reference of a removed cache entry, deleting the object if it was the last one.
+
+        Args:
+            digest: Hex digest of the object
+            entry: Path of the cache entry, which the caller has removed
+
+        Returns:
+            True if the object was deleted
+        """
+        with asset_lock(self.lock_path, self.lock_timeout):
+            (self.refs_dir / digest / self._ref_name(entry)).unlink(missing_ok=True)
+            if any(self._live_refs(digest)):
+                return False
+            self._delete(digest)
+        return True
+
+    def discard(self, digest: str) -> None:
+        """Delete an object that turned out to be corrupt, so that it is downloaded again.
+
+        Entries linking to it keep their (corrupt) data until they are verified and replaced.
+
+        Args:
+            digest: Hex digest of the object
+        """
+        with asset_lock(self.lock_path, self.lock_timeout):
+            logger.warning(f"Discarding stored content {digest[:12]}")
+            self.object_path(digest).unlink(missing_ok=True)
+
+    def _delete(self, digest: str) -> int:
+        """Delete an object and its references, returning the bytes freed."""
+        object_path = self.object_path(digest)
+        size = 0
+        try:
+            size = object_path.stat().st_size
+            object_path.unlink()
+        except FileNotFoundError:
+            pass
+        refs = self.refs_dir / digest
+        if refs.is_dir():
+            for ref in refs.iterdir():
+                ref.unlink()
+            refs.rmdir()
+        logger.debug(f"Removed unreferenced content {digest[:12]} ({size} bytes)")
+        return size
+
+    def collect(self) -> Dict[str, int]:
+        """Remove stale references and the objects no cache entry links to any more.
+
+        Returns:
+            The number of objects removed and the bytes freed
+        """
+        removed = 0
+        freed = 0
+        with asset_lock(self.lock_path, self.lock_timeout):
+            for object_path in list(self.objects_dir.glob("*/*")):
+                digest = object_path.name
+                live = set(self._live_refs(digest))
+                refs = self.refs_dir / digest
+                if refs.is_dir():
+                    for ref in refs.iterdir():
+                        if ref not in live:
+                            ref.unlink()
+                if not live:
+                    freed += self._delete(digest)
+                    removed += 1
+            # References to objects that no longer exist
+            for refs in list(self.refs_dir.iterdir()):
+                if not self.has(refs.name):
+                    self._delete(refs.name)
+        logger.info(f"Store garbage collection removed {removed} objects, freeing {freed / (1024 * 1024):.2f} MB")
+        return {"objects_removed": removed, "bytes_freed": freed}
+
+    def usage(self) -> Dict[str, Any]:
+        """Get the size of the store and how much the sharing of objects saves.
+
+        Returns:
+            The number of objects, their total size, the number of cache entries linking to
+            them, and the bytes the entries would take up without deduplication
+        """
+        objects = 0
+        size = 0
+        references = 0
+        logical = 0
+        for object_path in self.objects_dir.glob("*/*"):
+            object_size = object_path.stat().st_size
+            refcount = self.refcount(object_path.name)
+            objects += 1
+            size += object_size
+            references += refcount
+            logical += object_size * refcount
+        return {"objects": objects, "bytes": size, "references": references, "logical_bytes": logical}
@@ -1,15 +1,19 @@
 """Utilities for asset management."""
 
+import asyncio
 import hashlib
+import queue
 import tarfile
+import threading
+import time
 import zipfile
 from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
-from typing import AsyncGenerator, Generator, Optional
+from typing import Any, AsyncGenerator, AsyncIterable, Callable, Dict, Generator, List, Optional
 
 import filelock
 
-from openmas.assets.exceptions import AssetUnpackError, AssetVerificationError
+from openmas.assets.exceptions import AssetCancelledError, AssetUnpackError, AssetVerificationError
 from openmas.logging import get_logger
 
 logger = get_logger(__name__)
@@ -17,13 +21,28 @@ logger = get_logger(__name__)
 # Default chunk size for file reading (16 MB)
 DEFAULT_CHUNK_SIZE = 16 * 1024 * 1024
 
+# Called with the bytes processed so far and the total number of bytes
+ProgressCallback = Callable[[int, int], None]
 
-def calculate_sha256(file_path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+
+def _check_cancelled(cancel_event: Optional[threading.Event]) -> None:
+    if cancel_event is not None and cancel_event.is_set():
+        raise AssetCancelledError("Operation cancelled")
+
+
+def calculate_sha256(
+    file_path: Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress: Optional[ProgressCallback] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> str:
     """Calculate the SHA256 hash of a file.
 
     Args:
         file_path: Path to the file
         chunk_size: Size of chunks to read at a time (bytes)
+        progress: Optional callback receiving the bytes hashed so far and the file size
+        cancel_event: Optional event that stops hashing when set, checked between chunks
 
     Returns:
         The SHA256 hash as a hexadecimal string
@@ -31,6 +50,7 @@ def calculate_sha256(file_path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> s
     Raises:
         FileNotFoundError: If the file does not exist
         PermissionError: If the file cannot be read
+        AssetCancelledError: If the cancel event was set
     """
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
@@ -40,9 +60,15 @@ def calculate_sha256(file_path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> s
     processed = 0
 
     with open(file_path, "rb") as f:
-        while chunk := f.read(chunk_size):
+        while True:
+            _check_cancelled(cancel_event)
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
             sha256.update(chunk)
             processed += len(chunk)
+            if progress is not None:
+                progress(processed, total_size)
             # Log progress for large files (>100MB)
             if total_size > 100 * 1024 * 1024 and processed % (50 * 1024 * 1024) < chunk_size:
                 logger.debug(f"Checksumming progress: {processed / total_size:.1%}")
@@ -50,12 +76,19 @@ def calculate_sha256(file_path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> s
     return sha256.hexdigest()
 
 
-def verify_checksum(file_path: Path, expected_checksum: str) -> bool:
+def verify_checksum(
+    file_path: Path,
+    expected_checksum: str,
+    progress: Optional[ProgressCallback] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> bool:
     """Verify a file's checksum against an expected value.
 
     Args:
         file_path: Path to the file
         expected_checksum: Expected checksum in format "sha256:<hex_digest>"
+        progress: Optional callback receiving the bytes hashed so far and the file size
+        cancel_event: Optional event that stops hashing when set
 
     Returns:
         True if the checksum matches, False otherwise
@@ -64,6 +97,7 @@ def verify_checksum(file_path: Path, expected_checksum: str) -> bool:
         ValueError: If the checksum format is invalid
         FileNotFoundError: If the file does not exist
         AssetVerificationError: If the verification fails for other reasons
+        AssetCancelledError: If the cancel event was set
     """
     if not expected_checksum.startswith("sha256:"):
         raise ValueError("Unsupported checksum format. Only sha256:<hex_digest> is supported.")
@@ -74,15 +108,87 @@ def verify_checksum(file_path: Path, expected_checksum: str) -> bool:
         raise ValueError("Invalid SHA256 digest format. Expected 64 hexadecimal characters.")
 
     try:
-        actual_digest = calculate_sha256(file_path)
+        actual_digest = calculate_sha256(file_path, progress=progress, cancel_event=cancel_event)
         return actual_digest.lower() == expected_digest.lower()
-    except (FileNotFoundError, PermissionError) as e:
+    except (FileNotFoundError, PermissionError, AssetCancelledError) as e:
         raise e
     except Exception as e:
         raise AssetVerificationError(f"Error verifying checksum: {str(e)}") from e
 
 
-def unpack_archive(archive_path: Path, target_dir: Path, format: str, destination_is_file: bool = False) -> Path:
+def _track_members(
+    members: List[Any],
+    size_of: Callable[[Any], int],
+    progress: Optional[ProgressCallback],
+    cancel_event: Optional[threading.Event],
+) -> Generator[Any, None, None]:
+    """Yield archive members to an extractall() call, reporting progress and checking for cancellation.
+
+    Each member is counted once the extraction loop asks for the next one, i.e. after it was extracted.
+    """
+    total = sum(size_of(member) for member in members)
+    done = 0
+    for member in members:
+        _check_cancelled(cancel_event)
+        yield member
+        done += size_of(member)
+        if progress is not None:
+            progress(done, total)
+
+
+def _is_safe_member(member: tarfile.TarInfo) -> bool:
+    """Check a tar member for path traversal vulnerabilities (CVE-2007-4559)."""
+    # Avoid path traversal using extracted paths
+    return not member.name.startswith("/") and ".." not in member.name.split("/")
+
+
+def _primary_file(files: List[str], target_dir: Path, archive_kind: str) -> Path:
+    """Pick the file an archive unpacked with destination_is_file stands for.
+
+    Args:
+        files: Names of the files (not directories) in the archive
+        target_dir: Directory the archive was extracted to
+        archive_kind: Kind of archive for error messages ("ZIP" or "TAR")
+
+    Returns:
+        Path to the single content file, or to the first root or content file if there are several
+
+    Raises:
+        AssetUnpackError: If the archive contains no files
+    """
+    if not files:
+        raise AssetUnpackError(f"No files found in {archive_kind} archive")
+
+    # Check if there's only one file or one main file (ignoring metadata)
+    content_files = [f for f in files if not f.startswith(".") and not f.startswith("__MACOSX/")]
+
+    if len(content_files) == 1:
+        # Return the path to the single file
+        return target_dir / content_files[0]
+
+    # If multiple files, find a possible primary file or the first one
+    # Check for a common root file
+    root_files = [f for f in content_files if "/" not in f]
+    if root_files:
+        file_path = target_dir / root_files[0]
+    else:
+        file_path = target_dir / content_files[0]
+
+    logger.warning(
+        f"Multiple files found in archive when destination_is_file=True. "
+        f"Using {file_path.relative_to(target_dir)} as the primary file."
+    )
+    return file_path
+
+
+def unpack_archive(
+    archive_path: Path,
+    target_dir: Path,
+    format: str,
+    destination_is_file: bool = False,
+    progress: Optional[ProgressCallback] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> Path:
     """Unpack an archive file.
 
     Args:
@@ -90,6 +196,8 @@ def unpack_archive(archive_path: Path, target_dir: Path, format: str, destinatio
         target_dir: Directory to extract the archive to
         format: Format of the archive ("zip", "tar", "tar.gz", "tar.bz2")
         destination_is_file: If True, expects the archive to contain a single file and returns the path to it
+        progress: Optional callback receiving the uncompressed bytes extracted so far and in total
+        cancel_event: Optional event that stops extraction when set, checked between members
 
     Returns:
         Path to the unpacked directory or file (if destination_is_file is True)
@@ -98,6 +206,7 @@ def unpack_archive(archive_path: Path, target_dir: Path, format: str, destinatio
         FileNotFoundError: If the archive file does not exist
         ValueError: If the format is unsupported
         AssetUnpackError: If the unpacking fails
+        AssetCancelledError: If the cancel event was set
     """
     if not archive_path.exists():
         raise FileNotFoundError(f"Archive not found: {archive_path}")
@@ -110,37 +219,16 @@ def unpack_archive(archive_path: Path, target_dir: Path, format: str, destinatio
     try:
         if format == "zip":
             with zipfile.ZipFile(archive_path, "r") as zip_ref:
-                zip_ref.extractall(target_dir)
+                zip_ref.extractall(
+                    target_dir,
+                    members=_track_members(zip_ref.infolist(), lambda info: info.file_size, progress, cancel_event),
+                )
 
                 # If destination_is_file is True, find the content file
                 if destination_is_file:
                     # Get list of files (not directories) in the archive
                     files = [f for f in zip_ref.namelist() if not f.endswith("/")]
-
-                    if not files:
-                        raise AssetUnpackError("No files found in ZIP archive")
-
-                    # Check if there's only one file or one main file (ignoring metadata)
-                    content_files = [f for f in files if not f.startswith(".") and not f.startswith("__MACOSX/")]
-
-                    if len(content_files) == 1:
-                        # Return the path to the single file
-                        return target_dir / content_files[0]
-                    else:
-                        # If multiple files, find a possible primary file or the first one
-                        file_path = None
-                        # Check for a common root file
-                        root_files = [f for f in content_files if "/" not in f]
-                        if root_files:
-                            file_path = target_dir / root_files[0]
-                        else:
-                            file_path = target_dir / content_files[0]
-
-                        logger.warning(
-                            f"Multiple files found in archive when destination_is_file=True. "
-                            f"Using {file_path.relative_to(target_dir)} as the primary file."
-                        )
-                        return file_path
+                    return _primary_file(files, target_dir, "ZIP")
 
                 return target_dir
 
@@ -151,44 +239,17 @@ def unpack_archive(archive_path: Path, target_dir: Path, format: str, destinatio
                 "tar.bz2": "r:bz2",
             }[format]
             with tarfile.open(str(archive_path), mode) as tar_ref:  # type: ignore
-                # Check for path traversal vulnerabilities (CVE-2007-4559)
-                def is_safe(member: tarfile.TarInfo) -> bool:
-                    # Avoid path traversal using extracted paths
-                    return not member.name.startswith("/") and ".." not in member.name.split("/")
-
                 # Get safe members
-                members = [member for member in tar_ref.getmembers() if is_safe(member)]
-                tar_ref.extractall(target_dir, members=members)
+                members = [member for member in tar_ref.getmembers() if _is_safe_member(member)]
+                tar_ref.extractall(
+                    target_dir, members=_track_members(members, lambda member: member.size, progress, cancel_event)
+                )
 
                 # If destination_is_file is True, find the content file
                 if destination_is_file:
                     # Get list of files (not directories) in the archive
                     files = [m.name for m in members if m.isfile()]
-
-                    if not files:
-                        raise AssetUnpackError("No files found in TAR archive")
-
-                    # Check if there's only one file or one main file (ignoring metadata)
-                    content_files = [f for f in files if not f.startswith(".") and not f.startswith("__MACOSX/")]
-
-                    if len(content_files) == 1:
-                        # Return the path to the single file
-                        return target_dir / content_files[0]
-                    else:
-                        # If multiple files, find a possible primary file or the first one
-                        file_path = None
-                        # Check for a common root file
-                        root_files = [f for f in content_files if "/" not in f]
-                        if root_files:
-                            file_path = target_dir / root_files[0]
-                        else:
-                            file_path = target_dir / content_files[0]
-
-                        logger.warning(
-                            f"Multiple files found in archive when destination_is_file=True. "
-                            f"Using {file_path.relative_to(target_dir)} as the primary file."
-                        )
-                        return file_path
+                    return _primary_file(files, target_dir, "TAR")
 
                 return target_dir
         else:
@@ -196,46 +257,300 @@ def unpack_archive(archive_path: Path, target_dir: Path, format: str, destinatio
 
         logger.info(f"Successfully unpacked {archive_path}")
         return target_dir
+    except AssetCancelledError:
+        raise
     except (zipfile.BadZipFile, tarfile.TarError) as e:
         raise AssetUnpackError(f"Error unpacking archive: {str(e)}") from e
     except Exception as e:
         raise AssetUnpackError(f"Unexpected error unpacking archive: {str(e)}") from e
 
 
+# Tar formats that can be extracted while they are downloaded, with their stream modes
+STREAM_UNPACK_MODES = {"tar": "r|", "tar.gz": "r|gz", "tar.bz2": "r|bz2"}
+
+
+class _ChunkReader:
+    """File object for tarfile that reads the chunks the event loop hands to an extraction thread."""
+
+    def __init__(self, on_consumed: Callable[[], Any], cancel_event: threading.Event) -> None:
+        self.chunks: "queue.SimpleQueue[Optional[bytes]]" = queue.SimpleQueue()
+        self.on_consumed = on_consumed
+        self.cancel_event = cancel_event
+        self.buffer = bytearray()
+        self.eof = False
+
+    def read(self, size: int = -1) -> bytes:
+        while not self.eof and (size < 0 or len(self.buffer) < size):
+            chunk = self.chunks.get()
+            _check_cancelled(self.cancel_event)
+            if chunk is None:
+                self.eof = True
+                break
+            self.on_consumed()
+            self.buffer += chunk
+        if size < 0 or size > len(self.buffer):
+            size = len(self.buffer)
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+
+def _extract_tar_stream(reader: _ChunkReader, target_dir: Path, mode: str) -> List[str]:
+    """Extract a tar stream member by member, returning the names of the extracted files."""
+    files = []
+    try:
+        with tarfile.open(fileobj=reader, mode=mode) as tar_ref:  # type: ignore
+            for member in tar_ref:
+                if not _is_safe_member(member):
+                    logger.warning(f"Skipping unsafe archive member: {member.name}")
+                    continue
+                tar_ref.extract(member, target_dir)
+                if member.isfile():
+                    files.append(member.name)
+    except AssetCancelledError:
+        raise
+    except tarfile.TarError as e:
+        raise AssetUnpackError(f"Error unpacking archive: {str(e)}") from e
+    except Exception as e:
+        raise AssetUnpackError(f"Unexpected error unpacking archive: {str(e)}") from e
+    return files
+
+
+async def unpack_stream(
+    chunks: AsyncIterable[bytes],
+    target_dir: Path,
+    format: str,
+    destination_is_file: bool = False,
+    max_pending_chunks: int = 16,
+) -> Path:
+    """Unpack a tar archive while its bytes arrive, without storing the archive.
+
+    The archive is extracted on a worker thread in stream mode, with the same path-safety
+    checks as :func:`unpack_archive`. At most ``max_pending_chunks`` chunks wait for the
+    thread, so a slow disk slows the download down instead of buffering it in memory. The
+    chunks are consumed to the end even if the archive ends earlier, so that a caller
+    hashing them sees the whole stream.
+
+    Args:
+        chunks: The bytes of the archive, in order
+        target_dir: Directory to extract the archive to
+        format: Format of the archive ("tar", "tar.gz", "tar.bz2")
+        destination_is_file: If True, expects the archive to contain a single file and returns the path to it
+        max_pending_chunks: Number of chunks that may wait for the extraction thread
+
+    Returns:
+        Path to the unpacked directory or file (if destination_is_file is True)
+
+    Raises:
+        ValueError: If the format cannot be extracted as a stream
+        AssetUnpackError: If the unpacking fails
+    """
+    mode = STREAM_UNPACK_MODES.get(format)
+    if mode is None:
+        raise ValueError(f"Archive format cannot be unpacked while downloading: {format}")
+
+    target_dir.mkdir(parents=True, exist_ok=True)
+    logger.info(f"Unpacking stream to {target_dir} (format: {format})")
+
+    loop = asyncio.get_running_loop()
+    cancel_event = threading.Event()
+    pending = asyncio.Semaphore(max_pending_chunks)
+    reader = _ChunkReader(lambda: loop.call_soon_threadsafe(pending.release), cancel_event)
+    extraction = loop.run_in_executor(None, _extract_tar_stream, reader, target_dir, mode)
+    # Wake a producer waiting for space once the thread stops reading
+    extraction.add_done_callback(lambda _: pending.release())
+
+    try:
+        async for chunk in chunks:
+            if extraction.done():
+                if extraction.exception() is not None:
+                    break
+                # The archive ended; keep consuming the rest of the stream
+                continue
+            await pending.acquire()
+            if not extraction.done():
+                reader.chunks.put(chunk)
+        reader.chunks.put(None)
+        files = await asyncio.shield(extraction)
+    except BaseException:
+        cancel_event.set()
+        reader.chunks.put(None)
+        await asyncio.wait([extraction])
+        if not extraction.cancelled():
+            extraction.exception()
+        raise
+
+    logger.info(f"Successfully unpacked stream to {target_dir}")
+    if destination_is_file:
+        return _primary_file(files, target_dir, "TAR")
+    return target_dir
+
+
+class BandwidthLimiter:
+    """Token bucket capping the combined rate of the downloads that share it.
+
+    Downloads call :meth:`consume` for every chunk they receive. A chunk larger than the
+    tokens left puts the bucket into debt, and the download sleeps until the debt is paid
+    off at the configured rate, so concurrent downloads split the budget between them.
+    """
+
+    def __init__(self, bytes_per_second: float, burst: Optional[float] = None) -> None:
+        """Initialize the limiter.
+
+        Args:
+            bytes_per_second: Combined rate of all downloads using the limiter
+            burst: Bytes that may be received at once after an idle period (defaults to one second's worth)
+        """
+        if bytes_per_second <= 0:
+            raise ValueError("The download rate must be positive")
+        self.rate = float(bytes_per_second)
+        self.capacity = float(burst if burst is not None else bytes_per_second)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    async def consume(self, size: int) -> None:
+        """Take tokens for bytes received, sleeping while the bucket is in debt.
+
+        Args:
+            size: Number of bytes received
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= size
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate)
+
+
+class LockWaitStats:
+    """Counters for how long asset locks were waited for."""
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.acquired = 0
+        self.contended = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, contended: bool) -> None:
+        """Record a successful acquisition.
+
+        Args:
+            wait: Seconds spent waiting for the lock
+            contended: Whether the lock was held by someone else on the first attempt
+        """
+        self.acquired += 1
+        self.contended += int(contended)
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the counters as a dictionary.
+
+        Returns:
+            Acquisitions, contended acquisitions, timeouts, and total, average and maximum
+            wait in milliseconds
+        """
+        return {
+            "acquired": self.acquired,
+            "contended": self.contended,
+            "timeouts": self.timeouts,
+            "total_wait_ms": round(self.total_wait * 1000, 3),
+            "avg_wait_ms": round(self.total_wait / self.acquired * 1000, 3) if self.acquired else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+        }
+
+
 class AssetLock:
-    """A context manager for acquiring locks on assets during operations."""
+    """A context manager for acquiring locks on assets during operations.
 
-    def __init__(self, lock_path: Path, timeout: Optional[float] = None):
+    The synchronous form blocks the calling thread while it waits. The asynchronous form
+    polls the lock without blocking the event loop, backing off from ``poll_interval`` up to
+    ``max_poll_interval`` between attempts, and can be cancelled while it waits.
+    """
+
+    def __init__(
+        self,
+        lock_path: Path,
+        timeout: Optional[float] = None,
+        stats: Optional[LockWaitStats] = None,
+        poll_interval: float = 0.05,
+        max_poll_interval: float = 0.5,
+    ):
         """Initialize the lock.
 
         Args:
             lock_path: Path to the lock file
             timeout: Maximum time to wait for the lock (seconds), or None to wait indefinitely
+            stats: Optional counters to record the time spent waiting in
+            poll_interval: Initial delay between attempts of the async form (seconds)
+            max_poll_interval: Upper bound for the delay between attempts (seconds)
         """
         self.lock_path = lock_path
         self.timeout = timeout
-        self.lock = filelock.FileLock(str(lock_path), timeout=timeout or 0)
+        self.stats = stats
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.lock = filelock.FileLock(str(lock_path), timeout=-1 if timeout is None else timeout)
 
     def __enter__(self) -> "AssetLock":
         """Acquire the lock."""
         logger.debug(f"Acquiring lock: {self.lock_path}")
-        self.lock.acquire()
+        started = time.monotonic()
+        contended = False
+        try:
+            self.lock.acquire(timeout=0)
+        except filelock.Timeout:
+            contended = True
+            try:
+                self.lock.acquire()
+            except filelock.Timeout:
+                if self.stats is not None:
+                    self.stats.timeouts += 1
+                raise
+        self._record(started, contended)
         return self
 
+    def _record(self, started: float, contended: bool) -> None:
+        wait = time.monotonic() - started
+        if contended:
+            logger.debug(f"Acquired contended lock after {wait:.3f}s: {self.lock_path}")
+        if self.stats is not None:
+            self.stats.record(wait, contended)
+
     def __exit__(self, exc_type: Optional[type], exc_val: Optional[Exception], exc_tb: Optional[object]) -> None:
         """Release the lock."""
         logger.debug(f"Releasing lock: {self.lock_path}")
         self.lock.release()
 
     async def __aenter__(self) -> "AssetLock":
-        """Acquire the lock asynchronously.
+        """Acquire the lock without blocking the event loop.
 
-        Note: Since filelock doesn't support async operations directly,
-        we use it in a blocking way, but provide the async interface
-        for consistent usage in async code.
+        Raises:
+            filelock.Timeout: If the lock could not be acquired within the timeout
+            asyncio.CancelledError: If the waiting task is cancelled
         """
         logger.debug(f"Acquiring lock asynchronously: {self.lock_path}")
-        self.lock.acquire()
+        started = time.monotonic()
+        delay = self.poll_interval
+        contended = False
+        while True:
+            try:
+                self.lock.acquire(timeout=0)
+                break
+            except filelock.Timeout:
+                contended = True
+                elapsed = time.monotonic() - started
+                if self.timeout is not None and elapsed >= self.timeout:
+                    if self.stats is not None:
+                        self.stats.timeouts += 1
+                    raise
+                if self.timeout is not None:
+                    delay = min(delay, self.timeout - elapsed)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_poll_interval)
+        self._record(started, contended)
         return self
 
     async def __aexit__(self, exc_type: Optional[type], exc_val: Optional[Exception], exc_tb: Optional[object]) -> None:
@@ -245,7 +560,9 @@ class AssetLock:
 
 
 @contextmanager
-def asset_lock(lock_path: Path, timeout: Optional[float] = None) -> Generator[None, None, None]:
+def asset_lock(
+    lock_path: Path, timeout: Optional[float] = None, stats: Optional[LockWaitStats] = None
+) -> Generator[None, None, None]:
     """Context manager for acquiring an asset lock.
 
     This is a convenience wrapper around AssetLock class.
@@ -253,6 +570,7 @@ def asset_lock(lock_path: Path, timeout: Optional[float] = None) -> Generator[No
     Args:
         lock_path: Path to the lock file
         timeout: Maximum time to wait for the lock (seconds), or None to wait indefinitely
+        stats: Optional counters to record the time spent waiting in
 
     Yields:
         None
@@ -263,32 +581,39 @@ def asset_lock(lock_path: Path, timeout: Optional[float] = None) -> Generator[No
             # Perform atomic operations
         ```
     """
-    with AssetLock(lock_path, timeout) as _:
+    with AssetLock(lock_path, timeout, stats) as _:
         yield
 
 
 @asynccontextmanager
-async def async_asset_lock(lock_path: Path, timeout: Optional[float] = None) -> AsyncGenerator[None, None]:
+async def async_asset_lock(
+    lock_path: Path, timeout: Optional[float] = None, stats: Optional[LockWaitStats] = None
+) -> AsyncGenerator[None, None]:
     """Async context manager for acquiring an asset lock.
 
-    This is a convenience wrapper around AssetLock class for async usage.
+    This is a convenience wrapper around AssetLock class for async usage. Waiting for a lock
+    held by another process does not block the event loop.
 
     Args:
         lock_path: Path to the lock file
         timeout: Maximum time to wait for the lock (seconds), or None to wait indefinitely
+        stats: Optional counters to record the time spent waiting in
 
     Yields:
         None
 
+    Raises:
+        filelock.Timeout: If the lock could not be acquired within the timeout
+
     Example:
         ```python
         async with async_asset_lock(lock_path):
             # Perform async atomic operations
         ```
     """
-    lock = AssetLock(lock_path, timeout)
+    lock = AssetLock(lock_path, timeout, stats)
+    await lock.__aenter__()
     try:
-        await lock.__aenter__()
         yield
     finally:
         await lock.__aexit__(None, None, None)
@@ -3,16 +3,18 @@
 import asyncio
 import shutil
 import sys
+from datetime import datetime
 from pathlib import Path  # noqa: F401
-from typing import Optional
+from typing import List, Optional
 
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import BarColumn, DownloadColumn, Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from openmas.assets.exceptions import AssetError
 from openmas.assets.manager import AssetManager
+from openmas.assets.server import AssetCacheServer
 from openmas.cli.utils import load_project_config
 from openmas.logging import get_logger
 
@@ -84,16 +86,71 @@ def list_assets() -> None:
         sys.exit(1)
 
 
+def _prefetch_assets(
+    asset_manager: AssetManager, asset_names: List[str], force: bool, concurrency: Optional[int]
+) -> None:
+    """Download several assets concurrently with a progress bar per asset, then print a summary."""
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("{task.description}"),
+        BarColumn(),
+        DownloadColumn(),
+        transient=True,
+    ) as progress:
+        tasks = {name: progress.add_task(name, total=None) for name in asset_names}
+
+        def report(name: str, stage: str, done: int, total: int) -> None:
+            progress.update(tasks[name], description=f"{name} [{stage}]", completed=done, total=total or None)
+
+        prefetch_report = asyncio.run(
+            asset_manager.prefetch(asset_names, concurrency=concurrency, force_download=force, progress=report)
+        )
+
+    table = Table(title="Asset Downloads")
+    table.add_column("Name", style="cyan")
+    table.add_column("Status")
+    table.add_column("Time", justify="right")
+    table.add_column("Path / Error", style="dim")
+    for result in prefetch_report.results:
+        status = result.as_dict()["status"]
+        style = {"failed": "red", "downloaded": "green"}.get(status, "blue")
+        table.add_row(
+            result.name,
+            f"[{style}]{status}[/{style}]",
+            f"{result.duration:.1f}s",
+            str(result.error) if result.error else str(result.path),
+        )
+    console.print(table)
+
+    if prefetch_report.failed:
+        console.print(f"[bold red]{prefetch_report.summary()}[/bold red]")
+        sys.exit(1)
+    console.print(f"[bold green]{prefetch_report.summary()}[/bold green]")
+
+
 @assets_app.command("download")
 def download_asset(
-    asset_name: str,
+    asset_names: Optional[List[str]] = typer.Argument(None, help="Names of the assets to download."),
     force: bool = typer.Option(False, "--force", "-f", help="Force re-download even if the asset exists in cache."),
+    all_assets: bool = typer.Option(False, "--all", "-a", help="Download all assets of the project."),
+    concurrency: Optional[int] = typer.Option(
+        None,
+        "--concurrency",
+        "-j",
+        min=1,
+        help="Number of assets to download at the same time (defaults to settings.assets.prefetch_concurrency).",
+    ),
 ) -> None:
-    """Download an asset to the cache.
+    """Download assets to the cache.
+
+    Several assets, or all of them with --all, are downloaded, verified and unpacked
+    concurrently, followed by a summary.
 
     Args:
-        asset_name: The name of the asset to download.
-        force: If True, force re-download even if the asset already exists in cache.
+        asset_names: The names of the assets to download.
+        force: If True, force re-download even if the assets already exist in cache.
+        all_assets: If True, download all assets of the project.
+        concurrency: Number of assets to download at the same time.
     """
     try:
         # Load the project configuration
@@ -102,6 +159,20 @@ def download_asset(
         # Create an asset manager
         asset_manager = AssetManager(project_config)
 
+        if all_assets or len(asset_names or []) > 1:
+            names = [asset.name for asset in project_config.assets] if all_assets else list(asset_names or [])
+            unknown = [name for name in names if name not in {asset.name for asset in project_config.assets}]
+            if unknown:
+                console.print(f"[bold red]Assets not found in project configuration: {', '.join(unknown)}[/bold red]")
+                sys.exit(1)
+            _prefetch_assets(asset_manager, names, force, concurrency)
+            return
+
+        if not asset_names:
+            console.print("[bold red]Specify the assets to download, or --all[/bold red]")
+            sys.exit(1)
+        asset_name = asset_names[0]
+
         # Find the asset configuration
         asset_found = False
         for asset in project_config.assets:
@@ -139,12 +210,16 @@ def download_asset(
 
 @assets_app.command("verify")
 def verify_assets(
-    asset_name: Optional[str] = typer.Argument(None, help="Asset name to verify, or all if omitted")
+    asset_name: Optional[str] = typer.Argument(None, help="Asset name to verify, or all if omitted"),
+    full: bool = typer.Option(
+        True, "--full/--fast", help="Re-hash every file, or trust digests recorded for unchanged files."
+    ),
 ) -> None:
     """Verify the integrity of cached assets.
 
     Args:
         asset_name: The name of the asset to verify. If not provided, verify all assets.
+        full: If True, re-hash cached files even if they are unchanged since their last verification.
     """
     try:
         # Load the project configuration
@@ -152,6 +227,8 @@ def verify_assets(
 
         # Create an asset manager
         asset_manager = AssetManager(project_config)
+        if full:
+            asset_manager.paranoid = True
 
         if asset_name:
             # Verify a specific asset
@@ -296,3 +373,111 @@ def clear_cache(
     except Exception as e:
         console.print(f"[bold red]Error clearing cache: {str(e)}[/bold red]")
         sys.exit(1)
+
+
+@assets_app.command("usage")
+def cache_usage(
+    evict: bool = typer.Option(False, "--evict", help="Evict least recently used assets until the cache fits"),
+    max_size_gb: Optional[float] = typer.Option(
+        None, "--max-size-gb", help="Size limit for --evict, instead of settings.assets.max_cache_size_gb"
+    ),
+) -> None:
+    """Show how much disk space cached assets take up, optionally evicting some.
+
+    Args:
+        evict: If True, evict the least recently accessed assets that are not in use until the
+            cache fits its size limit.
+        max_size_gb: Size limit in gigabytes to evict down to.
+    """
+    try:
+        project_config = load_project_config()
+        asset_manager = AssetManager(project_config)
+
+        if evict:
+            max_bytes = int(max_size_gb * 1024**3) if max_size_gb is not None else None
+            result = asset_manager.evict_to_limit(max_bytes)
+            for label in result["evicted"]:
+                console.print(f"Evicted [cyan]{label}[/cyan]")
+            console.print(
+                f"[bold green]Evicted {len(result['evicted'])} assets, freeing "
+                f"{result['bytes_freed'] / (1024 * 1024):.2f} MB[/bold green]"
+            )
+
+        usage = asset_manager.cache_usage()
+        table = Table(title="OpenMAS Asset Cache")
+        table.add_column("Name", style="cyan")
+        table.add_column("Version", style="green")
+        table.add_column("Type", style="blue")
+        table.add_column("Size", justify="right")
+        table.add_column("Last Accessed", style="dim")
+        table.add_column("Pinned", style="yellow")
+
+        # Most recently used first; eviction starts at the bottom
+        for entry in reversed(usage["entries"]):
+            table.add_row(
+                entry["name"],
+                entry["version"],
+                entry["asset_type"],
+                f"{entry['bytes'] / (1024 * 1024):.2f} MB",
+                datetime.fromtimestamp(entry["last_accessed"]).strftime("%Y-%m-%d %H:%M:%S"),
+                "yes" if entry["pinned"] else "",
+            )
+        console.print(table)
+
+        total_mb = usage["total_bytes"] / (1024 * 1024)
+        if usage["max_bytes"]:
+            console.print(f"Total: {total_mb:.2f} MB of {usage['max_bytes'] / (1024 * 1024):.2f} MB")
+        else:
+            console.print(f"Total: {total_mb:.2f} MB (no size limit)")
+        if usage["store_bytes"]:
+            console.print(f"Content store: {usage['store_bytes'] / (1024 * 1024):.2f} MB")
+    except Exception as e:
+        console.print(f"[bold red]Error reporting cache usage: {str(e)}[/bold red]")
+        sys.exit(1)
+
+
+@assets_app.command("gc")
+def collect_garbage() -> None:
+    """Remove files of the content store that no cached asset uses any more."""
+    try:
+        project_config = load_project_config()
+        asset_manager = AssetManager(project_config)
+
+        result = asset_manager.collect_store_garbage()
+        if result is None:
+            console.print("[yellow]The content store is not enabled (settings.assets.content_store)[/yellow]")
+            sys.exit(0)
+
+        freed_mb = result["bytes_freed"] / (1024 * 1024)
+        console.print(
+            f"[bold green]Removed {result['objects_removed']} unused files, freeing {freed_mb:.2f} MB[/bold green]"
+        )
+    except Exception as e:
+        console.print(f"[bold red]Error collecting garbage: {str(e)}[/bold red]")
+        sys.exit(1)
+
+
+@assets_app.command("serve")
+def serve_cache(
+    host: str = typer.Option("0.0.0.0", "--host", help="Address to listen on"),
+    port: int = typer.Option(8765, "--port", "-p", help="Port to listen on"),
+) -> None:
+    """Serve the verified asset cache to other nodes, which list it in peer_mirrors.
+
+    Args:
+        host: Address to listen on.
+        port: Port to listen on.
+    """
+    try:
+        project_config = load_project_config()
+        asset_manager = AssetManager(project_config)
+        server = AssetCacheServer(asset_manager, host=host, port=port)
+
+        console.print(f"[bold green]Serving asset cache {asset_manager.cache_dir} on {host}:{port}[/bold green]")
+        console.print("Press Ctrl+C to stop")
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        console.print("[yellow]Stopped serving the asset cache[/yellow]")
+    except Exception as e:
+        console.print(f"[bold red]Error serving asset cache: {str(e)}[/bold red]")
+        sys.exit(1)
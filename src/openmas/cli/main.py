@@ -508,7 +508,33 @@ def deps(project_dir: Optional[Path] = None, clean: bool = False) -> None:
     type=str,
     help="Environment name to use for configuration (sets OPENMAS_ENV)",
 )
-def run(agent_name: str, project_dir: Optional[Path] = None, env: Optional[str] = None) -> None:
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of replica processes; replicas share the agent's port or MQTT subscription",
+)
+@click.option(
+    "--drain-timeout",
+    type=float,
+    default=30.0,
+    show_default=True,
+    help="Seconds workers get to shut down gracefully on SIGTERM (with --workers)",
+)
+@click.option(
+    "--status-file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write aggregated worker health as JSON to this file (with --workers)",
+)
+def run(
+    agent_name: str,
+    project_dir: Optional[Path] = None,
+    env: Optional[str] = None,
+    workers: int = 1,
+    drain_timeout: float = 30.0,
+    status_file: Optional[Path] = None,
+) -> None:
     """Run an agent from the OpenMAS project.
 
     AGENT_NAME is the name of the agent to run.
@@ -516,6 +542,10 @@ def run(agent_name: str, project_dir: Optional[Path] = None, env: Optional[str]
     from openmas.cli.run import run_project
 
     try:
+        if workers > 1:
+            from openmas.cli.workers import run_workers
+
+            sys.exit(run_workers(agent_name, workers, project_dir, env, drain_timeout, status_file))
         run_project(agent_name, project_dir, env)
     except typer.Exit as e:
         sys.exit(e.exit_code)
@@ -0,0 +1,281 @@
+"""Multi-process supervisor for ``openmas run --workers N``.
+
+The supervisor starts N replicas of an agent as separate ``openmas run`` processes, so a
+CPU-heavy agent can use every core instead of one event loop behind the GIL. Replicas share
+inbound traffic:
+
+* HTTP servers bind their port with ``SO_REUSEPORT`` (``OPENMAS_REUSE_PORT=1``) and the
+  kernel spreads connections over the replicas. gRPC servers reuse ports by default.
+* MQTT communicators receive requests through an MQTT 5 shared subscription
+  (``OPENMAS_MQTT_SHARED_GROUP``), so each request is handled by one replica.
+
+Crashed replicas are restarted with exponential backoff; replicas that exit cleanly are not.
+On SIGTERM or SIGINT, every replica is sent SIGTERM and given ``drain_timeout`` seconds to
+finish in-flight work before it is killed.
+"""
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+from types import FrameType
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import click
+
+from openmas.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class _Worker:
+    """State of one replica process."""
+
+    def __init__(self, index: int, backoff: float) -> None:
+        self.index = index
+        self.process: Optional[subprocess.Popen] = None
+        self.started_at = 0.0
+        self.restarts = 0
+        self.last_exit_code: Optional[int] = None
+        self.finished = False
+        self.backoff = backoff
+        self.next_start: Optional[float] = 0.0
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+
+class WorkerSupervisor:
+    """Starts, restarts and drains a fixed number of replica processes."""
+
+    def __init__(
+        self,
+        command: Sequence[str],
+        workers: int,
+        env: Optional[Mapping[str, str]] = None,
+        name: str = "agent",
+        restart_backoff: float = 1.0,
+        max_restart_backoff: float = 30.0,
+        drain_timeout: float = 30.0,
+        status_file: Optional[Path] = None,
+        poll_interval: float = 0.2,
+    ) -> None:
+        """Initialize the supervisor.
+
+        Args:
+            command: Command line of one replica
+            workers: Number of replicas
+            env: Base environment of the replicas (defaults to this process's environment)
+            name: Name used in logs, status and the MQTT shared subscription group
+            restart_backoff: Delay in seconds before restarting a crashed replica, doubled per crash
+            max_restart_backoff: Upper bound for the restart delay in seconds
+            drain_timeout: Seconds replicas get to shut down after SIGTERM before being killed
+            status_file: Optional path where the aggregated status is written as JSON
+            poll_interval: Seconds between health checks
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.command = list(command)
+        self.env = dict(os.environ if env is None else env)
+        self.name = name
+        self.restart_backoff = restart_backoff
+        self.max_restart_backoff = max_restart_backoff
+        self.drain_timeout = drain_timeout
+        self.status_file = status_file
+        self.poll_interval = poll_interval
+        self.workers = [_Worker(index, restart_backoff) for index in range(workers)]
+        self._stopping = False
+        self._last_status_write = 0.0
+
+    def _worker_env(self, worker: _Worker) -> Dict[str, str]:
+        env = dict(self.env)
+        env["OPENMAS_WORKER_ID"] = str(worker.index)
+        env["OPENMAS_WORKER_COUNT"] = str(len(self.workers))
+        env["OPENMAS_REUSE_PORT"] = "1"
+        env.setdefault("OPENMAS_MQTT_SHARED_GROUP", self.name)
+        return env
+
+    def _spawn(self, worker: _Worker) -> None:
+        # A separate session keeps terminal Ctrl+C away from the replicas: the supervisor
+        # forwards a single SIGTERM instead, which they handle as a graceful shutdown
+        worker.process = subprocess.Popen(self.command, env=self._worker_env(worker), start_new_session=True)
+        worker.started_at = time.monotonic()
+        worker.next_start = None
+        logger.info("Started worker", agent=self.name, worker=worker.index, pid=worker.process.pid)
+
+    def start(self) -> None:
+        """Start every replica."""
+        for worker in self.workers:
+            self._spawn(worker)
+        self.write_status(force=True)
+
+    def poll(self) -> None:
+        """Check the replicas, scheduling restarts for crashed ones and starting those due."""
+        now = time.monotonic()
+        changed = False
+        for worker in self.workers:
+            if worker.process is not None and worker.process.poll() is not None:
+                code = worker.process.returncode
+                worker.last_exit_code = code
+                worker.process = None
+                changed = True
+                if code == 0:
+                    worker.finished = True
+                    logger.info("Worker finished", agent=self.name, worker=worker.index)
+                    continue
+                # A long healthy run resets the backoff
+                if now - worker.started_at > self.max_restart_backoff:
+                    worker.backoff = self.restart_backoff
+                worker.next_start = now + worker.backoff
+                logger.warning(
+                    "Worker crashed, restarting",
+                    agent=self.name,
+                    worker=worker.index,
+                    exit_code=code,
+                    delay=worker.backoff,
+                )
+                worker.backoff = min(worker.backoff * 2, self.max_restart_backoff)
+
+            if worker.process is None and worker.next_start is not None and now >= worker.next_start:
+                worker.restarts += 1
+                self._spawn(worker)
+                changed = True
+        self.write_status(force=changed)
+
+    @property
+    def finished(self) -> bool:
+        """Check whether every replica exited cleanly."""
+        return all(worker.finished for worker in self.workers)
+
+    def request_stop(self) -> None:
+        """Ask the run loop to drain the replicas and exit."""
+        self._stopping = True
+
+    def stop(self) -> None:
+        """Send SIGTERM to every replica, wait for them to drain, and kill the stragglers."""
+        running = [worker for worker in self.workers if worker.alive]
+        for worker in running:
+            assert worker.process is not None
+            worker.process.send_signal(signal.SIGTERM)
+        deadline = time.monotonic() + self.drain_timeout
+        for worker in running:
+            assert worker.process is not None
+            try:
+                worker.process.wait(timeout=max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                logger.warning("Worker did not drain in time, killing it", agent=self.name, worker=worker.index)
+                worker.process.kill()
+                worker.process.wait()
+            worker.last_exit_code = worker.process.returncode
+            worker.process = None
+        for worker in self.workers:
+            worker.next_start = None
+        self.write_status(force=True)
+
+    def status(self) -> Dict[str, Any]:
+        """Get the aggregated health of the replicas.
+
+        Returns:
+            The agent name, counts of alive replicas and restarts, and per-replica details
+        """
+        now = time.monotonic()
+        workers: List[Dict[str, Any]] = []
+        for worker in self.workers:
+            alive = worker.alive
+            workers.append(
+                {
+                    "id": worker.index,
+                    "pid": worker.process.pid if worker.process is not None else None,
+                    "alive": alive,
+                    "uptime": round(now - worker.started_at, 1) if alive else 0.0,
+                    "restarts": worker.restarts,
+                    "last_exit_code": worker.last_exit_code,
+                }
+            )
+        return {
+            "agent": self.name,
+            "workers": len(self.workers),
+            "alive": sum(1 for worker in workers if worker["alive"]),
+            "restarts": sum(worker.restarts for worker in self.workers),
+            "replicas": workers,
+        }
+
+    def write_status(self, force: bool = False) -> None:
+        """Write the status file, at most once per second unless forced.
+
+        Args:
+            force: Write even if the file was written less than a second ago
+        """
+        if self.status_file is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_status_write < 1.0:
+            return
+        self._last_status_write = now
+        self.status_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.status_file.with_name(self.status_file.name + ".tmp")
+        tmp_path.write_text(json.dumps(self.status(), indent=2))
+        os.replace(tmp_path, self.status_file)
+
+    def run(self) -> int:
+        """Run the replicas until a stop signal arrives or all of them finish.
+
+        Returns:
+            The exit code for the supervisor process
+        """
+
+        def handle_signal(signum: int, frame: Optional[FrameType]) -> None:
+            if self._stopping:
+                return
+            click.echo(f"\nReceived {signal.Signals(signum).name}, draining {len(self.workers)} workers...")
+            self.request_stop()
+
+        previous = {sig: signal.signal(sig, handle_signal) for sig in (signal.SIGINT, signal.SIGTERM)}
+        try:
+            self.start()
+            while not self._stopping and not self.finished:
+                time.sleep(self.poll_interval)
+                self.poll()
+        finally:
+            self.stop()
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+        return 0
+
+
+def run_workers(
+    agent_name: str,
+    workers: int,
+    project_dir: Optional[Path] = None,
+    env: Optional[str] = None,
+    drain_timeout: float = 30.0,
+    status_file: Optional[Path] = None,
+) -> int:
+    """Run N replicas of an agent under a supervisor.
+
+    Args:
+        agent_name: Name of the agent to run
+        workers: Number of replica processes
+        project_dir: Optional explicit path to the project directory
+        env: Optional environment name to use for configuration
+        drain_timeout: Seconds replicas get to shut down gracefully
+        status_file: Optional path for the aggregated status JSON
+
+    Returns:
+        The exit code for the supervisor process
+    """
+    command = [sys.executable, "-m", "openmas.cli", "run", agent_name]
+    if project_dir is not None:
+        command += ["--project-dir", str(project_dir)]
+    if env:
+        command += ["--env", env]
+
+    click.echo(f"Starting {workers} workers for agent '{agent_name}'")
+    supervisor = WorkerSupervisor(
+        command, workers, name=agent_name, drain_timeout=drain_timeout, status_file=status_file
+    )
+    return supervisor.run()
@@ -15,18 +15,24 @@ from openmas.communication.base import (
     load_local_communicator,
     register_communicator,
 )
+from openmas.communication.coalescing import RequestCoalescer
+from openmas.communication.executor import HandlerExecutor, offload
 
-# Import the guaranteed-available communicator
+# Import the guaranteed-available communicators
 from openmas.communication.http import HttpCommunicator
+from openmas.communication.inproc import InProcessCommunicator
+from openmas.communication.router import LocalRouter, get_default_router
 from openmas.exceptions import DependencyError
 
 # Define available communicator types
 COMMUNICATOR_TYPES: Dict[str, Type[BaseCommunicator]] = {
     "http": HttpCommunicator,
+    "inproc": InProcessCommunicator,
 }
 
-# Register the HTTP communicator
+# Register the HTTP and in-process communicators
 register_communicator("http", HttpCommunicator)
+register_communicator("inproc", InProcessCommunicator)
 
 
 # Lazy loading functions for other communicator types
@@ -72,6 +78,25 @@ def _load_mqtt_communicator() -> Type[BaseCommunicator]:
         ) from e
 
 
+def _load_shm_communicator() -> Type[BaseCommunicator]:
+    """Lazily load the shared-memory communicator only when needed."""
+    try:
+        from openmas.communication.shm import SharedMemoryCommunicator
+
+        # Register it if not already registered
+        if "shm" not in COMMUNICATOR_TYPES:
+            register_communicator("shm", SharedMemoryCommunicator)
+            COMMUNICATOR_TYPES["shm"] = SharedMemoryCommunicator
+
+        return SharedMemoryCommunicator
+    except ImportError as e:
+        # Shared memory needs no extra packages, but the platform must support it
+        raise DependencyError(
+            f"The shared-memory communicator is not supported on this platform: {e}",
+            dependency="multiprocessing.shared_memory",
+        ) from e
+
+
 def _load_mcp_sse_communicator() -> Type[BaseCommunicator]:
     """Lazily load the MCP SSE communicator only when needed."""
     try:
@@ -134,6 +159,7 @@ def _load_mcp_stdio_communicator() -> Type[BaseCommunicator]:
 COMMUNICATOR_LOADERS = {
     "grpc": _load_grpc_communicator,
     "mqtt": _load_mqtt_communicator,
+    "shm": _load_shm_communicator,
     "mcp-sse": _load_mcp_sse_communicator,
     "mcp-stdio": _load_mcp_stdio_communicator,
 }
@@ -257,6 +283,12 @@ def get_communicator_by_type(communicator_type: str) -> Type[BaseCommunicator]:
 __all__ = [
     "BaseCommunicator",
     "HttpCommunicator",
+    "InProcessCommunicator",
+    "LocalRouter",
+    "get_default_router",
+    "RequestCoalescer",
+    "HandlerExecutor",
+    "offload",
     "register_communicator",
     "get_communicator_class",
     "get_available_communicator_types",
@@ -3,12 +3,16 @@
 # mypy: disable-error-code="assignment"
 
 import abc
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type, TypeVar
 
 from pydantic import BaseModel
 
 from openmas.logging import get_logger
 
+if TYPE_CHECKING:
+    from openmas.communication.executor import HandlerExecutor
+    from openmas.communication.router import LocalRouter
+
 logger = get_logger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
@@ -293,6 +297,10 @@ class BaseCommunicator(abc.ABC):
     Communicators handle the communication between agents and services.
     """
 
+    # How handlers receive the parameters of a message: "dict" passes them as one dictionary
+    # argument, "kwargs" as keyword arguments. The LocalRouter calls handlers the same way.
+    handler_call_style: str = "dict"
+
     def __init__(
         self,
         agent_name: str,
@@ -321,6 +329,10 @@ class BaseCommunicator(abc.ABC):
         self._port = port
         # Placeholder for server status
         self._is_server_running = False
+        # Router for co-located agents, attached by an AgentRuntime
+        self.local_router: Optional["LocalRouter"] = None
+        # Executor for handlers marked with offload(), attached by the owning agent
+        self.handler_executor: Optional["HandlerExecutor"] = None
 
         logger.debug(
             "Initialized communicator",
@@ -378,12 +390,28 @@ class BaseCommunicator(abc.ABC):
     async def register_handler(self, method: str, handler: Callable) -> None:
         """Register a handler for a method.
 
+        Implementations should pass the handler through :meth:`_prepare_handler` so that
+        handlers marked with :func:`~openmas.communication.executor.offload` run off the event loop.
+
         Args:
             method: The method name to handle
             handler: The handler function
         """
         pass
 
+    def _prepare_handler(self, handler: Callable) -> Callable:
+        """Wrap a handler marked with ``offload()`` so that it runs on the handler executor.
+
+        Args:
+            handler: The handler being registered
+
+        Returns:
+            The handler to store and call
+        """
+        from openmas.communication.executor import get_default_executor, wrap_handler
+
+        return wrap_handler(handler, lambda: getattr(self, "handler_executor", None) or get_default_executor())
+
     @abc.abstractmethod
     async def start(self) -> None:
         """Start the communicator.
@@ -0,0 +1,150 @@
+"""Request coalescing (single-flight) for communicators and agents.
+
+When many concurrent tasks issue the same request, a RequestCoalescer lets them share one
+underlying call: the first caller starts it, later callers with the same key wait for the
+same result, and the result (or exception) is fanned out to all of them. Each caller of a
+shared call gets its own deep copy of the result, so a caller may modify it freely.
+
+Only methods on an explicit allowlist are coalesced, since sharing a call is only safe for
+requests without side effects (reads, deterministic tool calls, temperature-0 sampling).
+Method names follow the communicator conventions, e.g. ``tool/call/<name>`` and
+``prompt/sample``, and the allowlist accepts ``fnmatch`` patterns such as ``tool/call/*``.
+"""
+
+import asyncio
+import copy
+import fnmatch
+import json
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, TypeVar
+
+from openmas.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class _Flight:
+    """A shared in-flight call and the number of callers waiting on it."""
+
+    def __init__(self, task: asyncio.Task) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class RequestCoalescer:
+    """Share identical concurrent requests through a single underlying call."""
+
+    def __init__(self, methods: Optional[Iterable[str]] = None) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            methods: Method names or fnmatch patterns that are safe to coalesce
+        """
+        self.methods = list(methods or [])
+        self.calls = 0
+        self.coalesced = 0
+        self._flights: Dict[str, _Flight] = {}
+
+    @staticmethod
+    def make_key(target_service: str, method: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build the coalescing key for a request.
+
+        Args:
+            target_service: The service the request is sent to
+            method: The method being called
+            params: The request parameters
+
+        Returns:
+            A canonical string identifying the request
+        """
+        encoded_params = json.dumps(params or {}, sort_keys=True, separators=(",", ":"), default=str)
+        return f"{target_service}\x00{method}\x00{encoded_params}"
+
+    def is_coalescable(self, method: str) -> bool:
+        """Check whether a method is on the allowlist.
+
+        Args:
+            method: The method name
+
+        Returns:
+            True if identical concurrent requests for this method may share a call
+        """
+        return any(fnmatch.fnmatchcase(method, pattern) for pattern in self.methods)
+
+    @property
+    def in_flight(self) -> int:
+        """Get the number of distinct calls currently in flight."""
+        return len(self._flights)
+
+    def stats(self) -> Dict[str, int]:
+        """Get coalescing metrics.
+
+        Returns:
+            Dictionary with the number of calls made, callers that joined an existing call,
+            and calls currently in flight
+        """
+        return {"calls": self.calls, "coalesced": self.coalesced, "in_flight": self.in_flight}
+
+    async def run(
+        self,
+        target_service: str,
+        method: str,
+        params: Optional[Dict[str, Any]],
+        call: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Run a request, sharing it with identical concurrent requests if allowed.
+
+        If the method is not on the allowlist, ``call`` is simply awaited. Otherwise callers
+        with the same key share one call. A caller that is cancelled stops waiting without
+        affecting the others; the shared call is cancelled only when no callers remain.
+        Callers of a shared call get deep copies of its result, except the last one to
+        resume, which gets the original once nobody else can see it.
+
+        Args:
+            target_service: The service the request is sent to
+            method: The method being called
+            params: The request parameters
+            call: Zero-argument coroutine function that performs the request
+
+        Returns:
+            The result of the (possibly shared) call
+
+        Raises:
+            Exception: Whatever the underlying call raised
+        """
+        if not self.is_coalescable(method):
+            return await call()
+
+        key = self.make_key(target_service, method, params)
+        flight = self._flights.get(key)
+        if flight is None:
+            self.calls += 1
+            flight = _Flight(asyncio.ensure_future(call()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._finish(key, flight))
+        else:
+            self.coalesced += 1
+            logger.debug("Coalescing request", target_service=target_service, method=method)
+
+        flight.waiters += 1
+        try:
+            result: T = await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+        # Callers still to resume share the result, so this one must not get the original
+        if flight.waiters > 0:
+            return copy.deepcopy(result)
+        return result
+
+    def _finish(self, key: str, flight: _Flight) -> None:
+        """Forget a completed flight so later requests start a new call."""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        # Retrieve the exception so an unobserved failure is not logged as never retrieved
+        if not flight.task.cancelled():
+            flight.task.exception()
@@ -0,0 +1,333 @@
+"""Executors for blocking and CPU-bound message handlers.
+
+Communicators call handlers on the agent's event loop, so a handler that blocks (file or
+database I/O through a synchronous library) or computes for a long time stalls every other
+request. Marking such a handler with :func:`offload` makes communicators run it on a pool
+owned by the agent instead:
+
+* ``"blocking"`` handlers run on a thread pool. They can be sync functions, or coroutine
+  functions (run on a private event loop in the worker thread).
+* ``"cpu"`` handlers run on a process pool, so they can use other cores despite the GIL.
+  Their arguments and results must be picklable, and the handler itself must be a
+  module-level function or static method, since bound methods would pickle the agent.
+
+The decorator works on methods and functions alike and can also be applied at registration
+time::
+
+    @offload("cpu")
+    def fit_model(params): ...
+
+    await communicator.register_handler("fit", fit_model)
+    await communicator.register_handler("read", offload("blocking")(read_file))
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Set, Tuple, TypeVar
+
+from openmas.exceptions import ConfigurationError
+from openmas.logging import get_logger
+
+logger = get_logger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+BLOCKING = "blocking"
+CPU = "cpu"
+OFFLOAD_KINDS = (BLOCKING, CPU)
+
+OFFLOAD_ATTR = "__openmas_offload__"
+_WRAPPED_ATTR = "__openmas_offloaded__"
+
+
+def offload(kind: str = BLOCKING) -> Callable[[F], F]:
+    """Mark a handler to run on the agent's thread pool (``"blocking"``) or process pool (``"cpu"``).
+
+    Args:
+        kind: ``"blocking"`` for the thread pool or ``"cpu"`` for the process pool
+
+    Returns:
+        A decorator returning the handler unchanged apart from the mark
+
+    Raises:
+        ValueError: If the kind is unknown
+    """
+    if kind not in OFFLOAD_KINDS:
+        raise ValueError(f"Unknown offload kind '{kind}', expected one of: {', '.join(OFFLOAD_KINDS)}")
+
+    def decorator(func: F) -> F:
+        setattr(func, OFFLOAD_ATTR, kind)
+        return func
+
+    return decorator
+
+
+def get_offload_kind(handler: Callable) -> Optional[str]:
+    """Get how a handler is marked to be offloaded.
+
+    Args:
+        handler: The handler to inspect
+
+    Returns:
+        ``"blocking"``, ``"cpu"``, or None for handlers that run on the event loop
+    """
+    if getattr(handler, _WRAPPED_ATTR, False):
+        return None
+    return getattr(handler, OFFLOAD_ATTR, None)
+
+
+def _invoke(func: Callable, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Tuple[float, Any]:
+    """Run a handler in a worker thread or process.
+
+    Returns the wall-clock start time along with the result, so the caller can measure how
+    long the call waited in the queue.
+    """
+    started_at = time.time()
+    result = func(*args, **kwargs)
+    if inspect.isawaitable(result):
+        result = asyncio.run(_await(result))
+    return started_at, result
+
+
+async def _await(awaitable: Any) -> Any:
+    return await awaitable
+
+
+class _PoolStats:
+    """Counters for one pool."""
+
+    def __init__(self, workers: int) -> None:
+        self.workers = workers
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.max_queued = 0
+        self.total_wait = 0.0
+
+    @property
+    def in_flight(self) -> int:
+        return self.submitted - self.completed - self.failed
+
+    @property
+    def queued(self) -> int:
+        return max(0, self.in_flight - self.workers)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "submitted": self.submitted,
+            "running": self.in_flight - self.queued,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "completed": self.completed,
+            "failed": self.failed,
+            "avg_wait_ms": round(self.total_wait / self.completed * 1000, 3) if self.completed else 0.0,
+        }
+
+
+class HandlerExecutor:
+    """Thread and process pools that run offloaded handlers for one agent.
+
+    Pools are created on first use and can be shut down and recreated, so an agent that is
+    stopped and started again keeps working.
+    """
+
+    def __init__(
+        self,
+        thread_workers: Optional[int] = None,
+        process_workers: Optional[int] = None,
+        mp_context: str = "spawn",
+        name: str = "openmas",
+    ) -> None:
+        """Initialize the executor.
+
+        Args:
+            thread_workers: Size of the thread pool for blocking handlers
+                (defaults to ``min(32, cpu_count + 4)``)
+            process_workers: Size of the process pool for CPU-bound handlers (defaults to ``cpu_count``)
+            mp_context: Multiprocessing start method for the process pool; ``"spawn"`` is safe
+                with running event loops and threads
+            name: Prefix of the worker thread names
+        """
+        cpu_count = os.cpu_count() or 1
+        self.thread_workers = thread_workers or min(32, cpu_count + 4)
+        self.process_workers = process_workers or cpu_count
+        if self.thread_workers < 1 or self.process_workers < 1:
+            raise ValueError("Executor pools need at least one worker")
+        self.mp_context = mp_context
+        self.name = name
+        self._threads: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._processes: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._stats = {BLOCKING: _PoolStats(self.thread_workers), CPU: _PoolStats(self.process_workers)}
+        # Calls submitted and not finished yet, for shutdown()
+        self._futures: Set["concurrent.futures.Future[Tuple[float, Any]]"] = set()
+        # Guards the pools, the counters and the futures, which are updated from worker threads
+        self._lock = threading.Lock()
+
+    def _pool(self, kind: str) -> concurrent.futures.Executor:
+        with self._lock:
+            if kind == BLOCKING:
+                if self._threads is None:
+                    self._threads = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=self.thread_workers, thread_name_prefix=f"{self.name}-handler"
+                    )
+                return self._threads
+            if kind == CPU:
+                if self._processes is None:
+                    self._processes = concurrent.futures.ProcessPoolExecutor(
+                        max_workers=self.process_workers, mp_context=multiprocessing.get_context(self.mp_context)
+                    )
+                return self._processes
+        raise ValueError(f"Unknown offload kind '{kind}', expected one of: {', '.join(OFFLOAD_KINDS)}")
+
+    async def run(self, kind: str, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Run a function on one of the pools and wait for its result.
+
+        Args:
+            kind: ``"blocking"`` for the thread pool or ``"cpu"`` for the process pool
+            func: The function to run; coroutine functions are run on a private event loop
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            The function's result
+        """
+        pool = self._pool(kind)
+        stats = self._stats[kind]
+        submitted_at = time.time()
+        with self._lock:
+            stats.submitted += 1
+            stats.max_queued = max(stats.max_queued, stats.queued)
+        try:
+            future = pool.submit(_invoke, func, args, kwargs)
+        except BaseException:
+            with self._lock:
+                stats.failed += 1
+            raise
+        with self._lock:
+            self._futures.add(future)
+
+        # Count the call as finished when the pool is done with it, not when the caller stops
+        # waiting: a cancelled request does not stop a handler that is already running
+        def finished(done: "concurrent.futures.Future[Tuple[float, Any]]") -> None:
+            with self._lock:
+                self._futures.discard(done)
+                if done.cancelled() or done.exception() is not None:
+                    stats.failed += 1
+                    return
+                stats.completed += 1
+                stats.total_wait += max(0.0, done.result()[0] - submitted_at)
+
+        future.add_done_callback(finished)
+        _, result = await asyncio.wrap_future(future)
+        return result
+
+    def wrap(self, handler: Callable) -> Callable:
+        """Wrap a handler so that it runs on this executor if it is marked with :func:`offload`.
+
+        Args:
+            handler: The handler to wrap
+
+        Returns:
+            An async wrapper for marked handlers, or the handler itself
+        """
+        return wrap_handler(handler, lambda: self)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get the queue metrics of both pools.
+
+        Returns:
+            Per pool (``"blocking"`` and ``"cpu"``): pool size, submitted, running and queued
+            calls, the highest queue length seen, completed and failed calls, and the average
+            time calls waited for a worker
+        """
+        return {kind: stats.as_dict() for kind, stats in self._stats.items()}
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None) -> bool:
+        """Shut down the pools; they are recreated when used again.
+
+        Calls still waiting for a worker are cancelled. Running calls cannot be interrupted:
+        a call still running after the timeout is left to finish in the background.
+
+        Args:
+            wait: Wait for running calls to finish
+            timeout: Maximum seconds to wait for them, or None to wait as long as they run
+
+        Returns:
+            True if no call is still running
+        """
+        with self._lock:
+            threads, self._threads = self._threads, None
+            processes, self._processes = self._processes, None
+            running = set(self._futures)
+        # Without a timeout the pools join their workers; with one, only the calls are waited for
+        join = wait and timeout is None
+        if threads is not None:
+            threads.shutdown(wait=join, cancel_futures=True)
+        if processes is not None:
+            processes.shutdown(wait=join, cancel_futures=True)
+        if not wait:
+            return all(future.done() for future in running)
+        _, not_done = concurrent.futures.wait(running, timeout=timeout)
+        if not_done:
+            logger.warning(
+                "Offloaded handlers still running after shutdown timeout", executor=self.name, running=len(not_done)
+            )
+        return not not_done
+
+
+def wrap_handler(handler: Callable, get_executor: Callable[[], HandlerExecutor]) -> Callable:
+    """Wrap a handler marked with :func:`offload` so that it runs on an executor.
+
+    The executor is looked up on every call, so it can be replaced after registration.
+
+    Args:
+        handler: The handler to wrap
+        get_executor: Returns the executor to run the handler on
+
+    Returns:
+        An async wrapper with the handler's signature for marked handlers, or the handler itself
+
+    Raises:
+        ConfigurationError: If a ``"cpu"`` handler cannot be sent to a worker process
+    """
+    kind = get_offload_kind(handler)
+    if kind is None:
+        return handler
+    if kind == CPU:
+        try:
+            pickle.dumps(handler)
+        except Exception as e:
+            raise ConfigurationError(
+                f"Handler {getattr(handler, '__qualname__', handler)!r} is marked as 'cpu' but cannot be sent to "
+                f"a worker process ({e}); use a module-level function or static method"
+            ) from e
+
+    @functools.wraps(handler)
+    async def offloaded(*args: Any, **kwargs: Any) -> Any:
+        return await get_executor().run(kind, handler, *args, **kwargs)
+
+    setattr(offloaded, _WRAPPED_ATTR, True)
+    return offloaded
+
+
+_default_executor: Optional[HandlerExecutor] = None
+
+
+def get_default_executor() -> HandlerExecutor:
+    """Get the process-wide executor used by communicators that are not owned by an agent.
+
+    Returns:
+        The shared default executor
+    """
+    global _default_executor
+    if _default_executor is None:
+        _default_executor = HandlerExecutor()
+    return _default_executor
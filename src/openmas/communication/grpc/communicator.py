@@ -142,6 +142,9 @@ class GrpcCommunicator(BaseCommunicator):
     It can act as both a client (sending requests) and a server (handling requests).
     """
 
+    # Handlers receive the parameters of a message as keyword arguments
+    handler_call_style = "kwargs"
+
     def __init__(
         self,
         agent_name: str,
@@ -389,7 +392,7 @@ class GrpcCommunicator(BaseCommunicator):
             method: The method name to handle
             handler: The handler function
         """
-        self.handlers[method] = handler
+        self.handlers[method] = self._prepare_handler(handler)
         logger.debug("Registered handler", extra={"method": method})
 
     async def start(self) -> None:
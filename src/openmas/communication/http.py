@@ -2,6 +2,8 @@
 
 import asyncio
 import contextlib
+import os
+import socket
 import uuid
 from typing import Any, Callable, Dict, Optional, Type, TypeVar
 
@@ -19,6 +21,28 @@ logger = get_logger(__name__)
 T = TypeVar("T", bound=BaseModel)
 
 
+def _bind_reuse_port_socket(port: int) -> socket.socket:
+    """Bind a listening socket that other processes can bind to the same port.
+
+    Args:
+        port: The port to listen on
+
+    Returns:
+        The bound socket
+
+    Raises:
+        CommunicationError: If the platform does not support SO_REUSEPORT
+    """
+    if not hasattr(socket, "SO_REUSEPORT"):
+        raise CommunicationError("SO_REUSEPORT is not supported on this platform")
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind(("0.0.0.0", port))
+    sock.listen(2048)
+    return sock
+
+
 class HttpCommunicator(BaseCommunicator):
     """HTTP-based communicator implementation.
 
@@ -30,6 +54,8 @@ class HttpCommunicator(BaseCommunicator):
         agent_name: str,
         service_urls: Dict[str, str],
         port: Optional[int] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        reuse_port: Optional[bool] = None,
         **kwargs: Any,
     ):
         """Initialize the HTTP communicator.
@@ -38,9 +64,15 @@ class HttpCommunicator(BaseCommunicator):
             agent_name: The name of the agent using this communicator
             service_urls: Mapping of service names to URLs
             port: Optional port to use for the server (default is determined by configuration)
+            client: Optional shared HTTP client; it is not closed when the communicator stops
+            reuse_port: Bind the server socket with SO_REUSEPORT so several worker processes can
+                share the port (defaults to true when OPENMAS_REUSE_PORT=1 is set, as done by
+                ``openmas run --workers``)
         """
         super().__init__(agent_name, service_urls)
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = client or httpx.AsyncClient(timeout=30.0)
+        self._owns_client = client is None
+        self.reuse_port = reuse_port if reuse_port is not None else os.environ.get("OPENMAS_REUSE_PORT") == "1"
         self.handlers: Dict[str, Callable] = {}
         self.server_task: Optional[asyncio.Task] = None
         self.port = port
@@ -49,6 +81,17 @@ class HttpCommunicator(BaseCommunicator):
         if self.port is None and kwargs.get("communicator_options"):
             self.port = kwargs.get("communicator_options", {}).get("port")
 
+    def use_client(self, client: httpx.AsyncClient) -> None:
+        """Send requests through a shared HTTP client and its connection pool.
+
+        The shared client is owned by the caller and is not closed by :meth:`stop`.
+
+        Args:
+            client: The HTTP client to use
+        """
+        self.client = client
+        self._owns_client = False
+
     async def send_request(
         self,
         target_service: str,
@@ -74,6 +117,10 @@ class HttpCommunicator(BaseCommunicator):
             CommunicationError: If there is a problem with the communication
             ValidationError: If the response validation fails
         """
+        if self.local_router is not None and self.local_router.get_handler(target_service, method) is not None:
+            # The target lives in this process: call its handler directly
+            return await self.local_router.request(target_service, method, params, response_model, timeout)
+
         if target_service not in self.service_urls:
             raise ServiceNotFoundError(f"Service '{target_service}' not found", target=target_service)
 
@@ -153,6 +200,10 @@ class HttpCommunicator(BaseCommunicator):
             ServiceNotFoundError: If the target service is not found
             CommunicationError: If there is a problem with the communication
         """
+        if self.local_router is not None and self.local_router.get_handler(target_service, method) is not None:
+            await self.local_router.notify(target_service, method, params)
+            return
+
         if target_service not in self.service_urls:
             raise ServiceNotFoundError(f"Service '{target_service}' not found", target=target_service)
 
@@ -176,7 +227,7 @@ class HttpCommunicator(BaseCommunicator):
             method: The method name to handle
             handler: The handler function
         """
-        self.handlers[method] = handler
+        self.handlers[method] = self._prepare_handler(handler)
         logger.debug("Registered handler", method=method)
 
         # If we have handlers and no server is running, start the server
@@ -326,11 +377,17 @@ class HttpCommunicator(BaseCommunicator):
                 # Start the server
                 server = uvicorn.Server(config)
 
+                # With SO_REUSEPORT the kernel spreads connections over all processes bound to the port
+                sockets = [_bind_reuse_port_socket(port)] if self.reuse_port else None
+
                 # Define an async task to run the server
                 async def run_server_task() -> None:
                     """Run the uvicorn server in a controlled way."""
                     try:
-                        await server.serve()
+                        if sockets is None:
+                            await server.serve()
+                        else:
+                            await server.serve(sockets=sockets)
                     except asyncio.CancelledError:
                         logger.debug("Server cancelled, shutting down gracefully")
                     except Exception as e:
@@ -354,6 +411,10 @@ class HttpCommunicator(BaseCommunicator):
 
         This sets up the HTTP client and starts a server if handlers are registered.
         """
+        # A client closed by a previous stop() is replaced so the communicator can restart
+        if self._owns_client and getattr(self.client, "is_closed", False) is True:
+            self.client = httpx.AsyncClient(timeout=30.0)
+
         logger.info("Started HTTP communicator")
 
         # If we have handlers, make sure the server is running
@@ -394,11 +455,12 @@ class HttpCommunicator(BaseCommunicator):
                 self.server_task = None
                 logger.debug("HTTP server task stopped")
 
-        # Close the HTTP client
-        try:
-            await self.client.aclose()
-            logger.debug("HTTP client closed")
-        except Exception as e:
-            logger.warning(f"Error closing HTTP client: {e}")
+        # Close the HTTP client unless it is shared
+        if self._owns_client:
+            try:
+                await self.client.aclose()
+                logger.debug("HTTP client closed")
+            except Exception as e:
+                logger.warning(f"Error closing HTTP client: {e}")
 
         logger.info("Stopped HTTP communicator")
@@ -0,0 +1,148 @@
+"""In-process communicator implementation for OpenMAS.
+
+Agents in the same process (tests, or an :class:`~openmas.agent.runtime.AgentRuntime`) can
+talk through this communicator without any network or serialization: a request is a direct
+call of the target's registered handler through a
+:class:`~openmas.communication.router.LocalRouter`. Parameters and results are passed by
+reference, so handlers must treat them as read-only.
+"""
+
+import asyncio
+from typing import Any, Callable, Dict, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from openmas.communication.base import BaseCommunicator
+from openmas.communication.router import LocalRouter, get_default_router
+from openmas.exceptions import CommunicationError
+from openmas.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+INPROC_SCHEME = "inproc://"
+
+
+class InProcessCommunicator(BaseCommunicator):
+    """Communicator delivering messages to agents in the same process.
+
+    Each communicator has a bounded mailbox: at most ``mailbox_size`` messages are handled
+    concurrently, and further senders wait for a free slot (counted against their timeout).
+
+    Services are addressed by agent name. ``service_urls`` may map a service name to another
+    agent name, optionally written as ``inproc://<agent name>``.
+    """
+
+    def __init__(
+        self,
+        agent_name: str,
+        service_urls: Dict[str, str],
+        router: Optional[LocalRouter] = None,
+        mailbox_size: int = 1000,
+        **kwargs: Any,
+    ):
+        """Initialize the in-process communicator.
+
+        Args:
+            agent_name: The name of the agent using this communicator
+            service_urls: Mapping of service names to agent names (or ``inproc://`` URLs)
+            router: The router to register with (defaults to the process-wide router)
+            mailbox_size: Maximum number of messages handled concurrently
+        """
+        super().__init__(agent_name, service_urls)
+        options = kwargs.get("communicator_options") or {}
+        mailbox_size = options.get("mailbox_size", mailbox_size)
+        if mailbox_size < 1:
+            raise ValueError("mailbox_size must be at least 1")
+
+        self.handlers: Dict[str, Callable] = {}
+        self.local_router = router or get_default_router()
+        self.mailbox_size = mailbox_size
+        self.mailbox = asyncio.Semaphore(mailbox_size)
+        self._registered_router: Optional[LocalRouter] = None
+
+    def _resolve(self, target_service: str) -> str:
+        target = self.service_urls.get(target_service, target_service)
+        if target.startswith(INPROC_SCHEME):
+            target = target[len(INPROC_SCHEME) :]
+        return target
+
+    def _router(self) -> LocalRouter:
+        if self.local_router is None:
+            raise CommunicationError("In-process communicator has no router", target=self.agent_name)
+        return self.local_router
+
+    async def send_request(
+        self,
+        target_service: str,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        response_model: Optional[Type[T]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Send a request to an agent in the same process.
+
+        Args:
+            target_service: The name of the service to send the request to
+            method: The method to call on the service
+            params: The parameters to pass to the method (passed by reference)
+            response_model: Optional Pydantic model to validate and parse the response
+            timeout: Optional timeout in seconds
+
+        Returns:
+            The response from the service
+
+        Raises:
+            ServiceNotFoundError: If the target service is not registered
+            MethodNotFoundError: If the target service has no handler for the method
+            RequestTimeoutError: If the request does not complete within the timeout
+            CommunicationError: If the handler raises an exception
+            ValidationError: If the response validation fails
+        """
+        target = self._resolve(target_service)
+        logger.debug("Sending request", target=target, method=method)
+        return await self._router().request(target, method, params, response_model, timeout)
+
+    async def send_notification(
+        self, target_service: str, method: str, params: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Send a notification to an agent in the same process.
+
+        Args:
+            target_service: The name of the service to send the notification to
+            method: The method to call on the service
+            params: The parameters to pass to the method (passed by reference)
+
+        Raises:
+            ServiceNotFoundError: If the target service is not registered
+            MethodNotFoundError: If the target service has no handler for the method
+            CommunicationError: If the handler raises an exception
+        """
+        target = self._resolve(target_service)
+        logger.debug("Sending notification", target=target, method=method)
+        await self._router().notify(target, method, params)
+
+    async def register_handler(self, method: str, handler: Callable) -> None:
+        """Register a handler for a method.
+
+        Args:
+            method: The method name to handle
+            handler: The handler function, called with the parameters dictionary
+        """
+        self.handlers[method] = self._prepare_handler(handler)
+        logger.debug("Registered handler", method=method)
+
+    async def start(self) -> None:
+        """Start the communicator by registering the agent with its router."""
+        router = self._router()
+        router.register(self.agent_name, self)
+        self._registered_router = router
+        logger.info("Started in-process communicator", agent_name=self.agent_name)
+
+    async def stop(self) -> None:
+        """Stop the communicator by removing the agent from its router."""
+        if self._registered_router is not None:
+            self._registered_router.unregister(self.agent_name, self)
+            self._registered_router = None
+        logger.info("Stopped in-process communicator", agent_name=self.agent_name)
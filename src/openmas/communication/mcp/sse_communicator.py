@@ -2,7 +2,7 @@
 
 import asyncio
 import json
-from typing import Any, Callable, Dict, List, Optional, Set, Type, TypeVar
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Type, TypeVar
 
 import structlog
 
@@ -40,6 +40,7 @@ except ImportError:
     CallToolResult = Any  # type: ignore
 
 from openmas.communication.base import BaseCommunicator, register_communicator
+from openmas.communication.streaming import sampling_result_to_chunks
 from openmas.exceptions import CommunicationError, ServiceNotFoundError
 
 # Set up logging
@@ -59,6 +60,9 @@ class McpSseCommunicator(BaseCommunicator):
     handling are implemented internally to provide a seamless experience for end users.
     """
 
+    # Handlers receive the parameters of a message as keyword arguments
+    handler_call_style = "kwargs"
+
     def __init__(
         self,
         agent_name: str,
@@ -294,7 +298,7 @@ class McpSseCommunicator(BaseCommunicator):
         """
         # Only register handlers in server mode
         if self.server_mode:
-            self.handlers[method] = handler
+            self.handlers[method] = self._prepare_handler(handler)
         else:
             logger.warning(f"Ignoring register_handler({method}) in client mode")
 
@@ -316,6 +320,8 @@ class McpSseCommunicator(BaseCommunicator):
         if not self.server_mode:
             raise RuntimeError("Cannot register tools when not in server mode")
 
+        function = self._prepare_handler(function)
+
         # Store the tool information in the registry
         self.tool_registry[name] = {"name": name, "description": description, "function": function}
         self.handlers[name] = function
@@ -713,6 +719,51 @@ class McpSseCommunicator(BaseCommunicator):
             # Convert to dictionary if not already
             return {"content": str(result)}
 
+    async def sample_prompt_stream(
+        self,
+        target_service: str,
+        messages: List[Dict[str, Any]],
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        include_context: Optional[str] = None,
+        model_preferences: Optional[Dict[str, Any]] = None,
+        stop_sequences: Optional[List[str]] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Sample a prompt on a target service, yielding the result as stream chunks.
+
+        MCP delivers a sampling result as a single message, so the complete content is
+        yielded as one delta, followed by a final chunk with ``done`` set to True.
+
+        Args:
+            target_service: Name of the service to call
+            messages: List of message objects with role and content
+            system_prompt: Optional system prompt
+            temperature: Optional sampling temperature
+            max_tokens: Optional maximum number of tokens
+            include_context: Optional context to include
+            model_preferences: Optional model preferences
+            stop_sequences: Optional stop sequences
+            timeout: Timeout in seconds
+
+        Yields:
+            Stream chunks with a "delta" field
+        """
+        result = await self.sample_prompt(
+            target_service=target_service,
+            messages=messages,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            include_context=include_context,
+            model_preferences=model_preferences,
+            stop_sequences=stop_sequences,
+            timeout=timeout,
+        )
+        for chunk in sampling_result_to_chunks(result):
+            yield chunk
+
     async def get_prompt(
         self,
         target_service: str,
@@ -3,7 +3,7 @@
 import asyncio
 import os
 import shutil  # Needed for finding executable
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, cast
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Type, TypeVar, cast
 
 import structlog
 from mcp.client.session import ClientSession
@@ -22,6 +22,7 @@ except ImportError:
 from pydantic import AnyUrl
 
 from openmas.communication.base import BaseCommunicator, register_communicator
+from openmas.communication.streaming import sampling_result_to_chunks
 from openmas.exceptions import CommunicationError, ServiceNotFoundError
 
 # Set up logging
@@ -48,6 +49,9 @@ class McpStdioCommunicator(BaseCommunicator):
     functionality through the MCP protocol over stdio.
     """
 
+    # Handlers receive the parameters of a message as keyword arguments
+    handler_call_style = "kwargs"
+
     def __init__(
         self,
         agent_name: str,
@@ -267,7 +271,7 @@ class McpStdioCommunicator(BaseCommunicator):
             method: The method name to handle
             handler: The handler function
         """
-        self.handlers[method] = handler
+        self.handlers[method] = self._prepare_handler(handler)
         logger.debug(f"Registered handler for method: {method}")
 
     async def _run_server_internal(self) -> None:
@@ -593,6 +597,51 @@ class McpStdioCommunicator(BaseCommunicator):
             logger.exception(f"Error sampling from {target_service}: {e}")
             raise CommunicationError(f"Error sampling from {target_service}: {e}", target=target_service) from e
 
+    async def sample_prompt_stream(
+        self,
+        target_service: str,
+        messages: List[Dict[str, Any]],
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        include_context: Optional[str] = None,
+        model_preferences: Optional[Dict[str, Any]] = None,
+        stop_sequences: Optional[List[str]] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Sample a prompt on a target service, yielding the result as stream chunks.
+
+        MCP delivers a sampling result as a single message, so the complete content is
+        yielded as one delta, followed by a final chunk with ``done`` set to True.
+
+        Args:
+            target_service: Name of the service to call
+            messages: List of message objects with role and content
+            system_prompt: Optional system prompt
+            temperature: Optional sampling temperature
+            max_tokens: Optional maximum number of tokens
+            include_context: Optional context to include
+            model_preferences: Optional model preferences
+            stop_sequences: Optional stop sequences
+            timeout: Timeout in seconds
+
+        Yields:
+            Stream chunks with a "delta" field
+        """
+        result = await self.sample_prompt(
+            target_service=target_service,
+            messages=messages,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            include_context=include_context,
+            model_preferences=model_preferences,
+            stop_sequences=stop_sequences,
+            timeout=timeout,
+        )
+        for chunk in sampling_result_to_chunks(result):
+            yield chunk
+
     async def _handle_mcp_request(
         self, method: str, params: Optional[Dict[str, Any]] = None, target_service: Optional[str] = None
     ) -> Optional[Any]:
@@ -695,7 +744,7 @@ class McpStdioCommunicator(BaseCommunicator):
             description: The description of the tool
             function: The function to call when the tool is invoked
         """
-        await self._register_tool(name, description, function)
+        await self._register_tool(name, description, self._prepare_handler(function))
 
     async def register_prompt(self, name: str, description: str, function: Callable) -> None:
         """Register a prompt with the MCP server.
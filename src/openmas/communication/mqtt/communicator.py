@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+import os
 import ssl
 import threading
 import time
@@ -28,6 +29,9 @@ class MqttCommunicator(BaseCommunicator):
     It can both publish messages and subscribe to topics.
     """
 
+    # Handlers receive the parameters of a message as keyword arguments
+    handler_call_style = "kwargs"
+
     def __init__(
         self,
         agent_name: str,
@@ -40,6 +44,7 @@ class MqttCommunicator(BaseCommunicator):
         password: Optional[str] = None,
         topic_prefix: str = "openmas",
         keepalive: int = 60,
+        shared_group: Optional[str] = None,
         **kwargs: Any,
     ):
         """Initialize the MQTT communicator.
@@ -55,6 +60,9 @@ class MqttCommunicator(BaseCommunicator):
             password: Optional password for broker authentication
             topic_prefix: Prefix for all MQTT topics
             keepalive: Keepalive interval in seconds
+            shared_group: Receive requests and notifications through an MQTT 5 shared
+                subscription of this group, so replicas of the agent split them (defaults to
+                OPENMAS_MQTT_SHARED_GROUP, set by ``openmas run --workers``)
             **kwargs: Additional options for the communicator
         """
         super().__init__(agent_name, service_urls)
@@ -67,6 +75,7 @@ class MqttCommunicator(BaseCommunicator):
         self.password = password
         self.topic_prefix = topic_prefix
         self.keepalive = keepalive
+        self.shared_group = shared_group or os.environ.get("OPENMAS_MQTT_SHARED_GROUP") or None
 
         # Initialize MQTT client
         self.client = mqtt.Client(client_id=self.client_id, protocol=mqtt.MQTTv5)
@@ -129,8 +138,9 @@ class MqttCommunicator(BaseCommunicator):
         except asyncio.TimeoutError:
             raise CommunicationError(f"Timeout connecting to MQTT broker at {self.broker_host}:{self.broker_port}")
 
-        # Subscribe to all incoming request and response topics for this agent
-        request_topic = f"{self.topic_prefix}/{self.agent_name}/request/#"
+        # Subscribe to all incoming request and response topics for this agent.
+        # Responses always come back to the replica that sent the request.
+        request_topic = self._inbound_topic(f"{self.topic_prefix}/{self.agent_name}/request/#")
         response_topic = f"{self.topic_prefix}/{self.agent_name}/response/#"
 
         self.client.subscribe(request_topic)
@@ -366,15 +376,28 @@ class MqttCommunicator(BaseCommunicator):
             method: The method name to handle
             handler: The handler function
         """
-        self.handlers[method] = handler
+        self.handlers[method] = self._prepare_handler(handler)
         logger.debug(f"Registered handler for method: {method}")
 
         # Subscribe to method-specific notification topic if communicator is started
         if self._is_started:
-            notification_topic = f"{self.topic_prefix}/{self.agent_name}/notification/{method}"
+            notification_topic = self._inbound_topic(f"{self.topic_prefix}/{self.agent_name}/notification/{method}")
             self.client.subscribe(notification_topic)
             logger.debug(f"Subscribed to topic: {notification_topic}")
 
+    def _inbound_topic(self, topic: str) -> str:
+        """Get the subscription for a request or notification topic.
+
+        Args:
+            topic: The topic messages are published on
+
+        Returns:
+            The topic, wrapped in a shared subscription if a shared group is configured
+        """
+        if self.shared_group:
+            return f"$share/{self.shared_group}/{topic}"
+        return topic
+
     def _on_connect(
         self, client: mqtt.Client, userdata: Any, flags: Dict[str, int], rc: int, properties: Any = None
     ) -> None:
@@ -0,0 +1,204 @@
+"""In-process routing between co-located agents.
+
+A :class:`LocalRouter` maps agent names to the communicators of agents hosted in the same
+process. Communicators that have a router attached deliver requests for a registered agent
+straight to its handler, skipping the network and JSON encoding entirely. Parameters and
+results are passed by reference, so handlers must not mutate the objects they receive.
+
+An endpoint with a ``mailbox`` semaphore (such as the ``inproc`` communicator) bounds the
+number of messages it handles at once; further senders wait for a free slot.
+
+Handlers are called the way their own communicator calls them, as recorded by its
+``handler_call_style``: with the parameters dictionary (HTTP, in-process, shared memory) or
+with the parameters as keyword arguments (MQTT, gRPC, MCP).
+"""
+
+import asyncio
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+from pydantic import ValidationError as PydanticValidationError
+
+from openmas.communication.base import BaseCommunicator
+from openmas.exceptions import CommunicationError, MethodNotFoundError, RequestTimeoutError, ServiceNotFoundError
+from openmas.exceptions import ValidationError as OpenMasValidationError
+from openmas.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class LocalRouter:
+    """Delivers messages between communicators living in the same process."""
+
+    def __init__(self) -> None:
+        """Initialize an empty router."""
+        self._endpoints: Dict[str, BaseCommunicator] = {}
+        # Calling convention of each endpoint's handlers, recorded when it registers
+        self._call_styles: Dict[str, str] = {}
+        self.delivered = 0
+
+    def __contains__(self, name: object) -> bool:
+        """Check whether an agent is registered."""
+        return name in self._endpoints
+
+    @property
+    def names(self) -> List[str]:
+        """Get the names of the registered agents."""
+        return list(self._endpoints)
+
+    def register(self, name: str, communicator: BaseCommunicator) -> None:
+        """Make an agent reachable through the router.
+
+        Args:
+            name: The name other agents use to address the agent
+            communicator: The agent's communicator, whose handlers receive the messages
+        """
+        call_style = getattr(communicator, "handler_call_style", "dict")
+        if call_style not in ("dict", "kwargs"):
+            raise ValueError(f"Unknown handler call style '{call_style}' of {type(communicator).__name__}")
+        self._endpoints[name] = communicator
+        self._call_styles[name] = call_style
+        logger.debug("Registered local endpoint", name=name, call_style=call_style)
+
+    def unregister(self, name: str, communicator: Optional[BaseCommunicator] = None) -> None:
+        """Remove an agent from the router.
+
+        Args:
+            name: The name the agent was registered under
+            communicator: If given, only unregister if this communicator is still the endpoint
+        """
+        if communicator is not None and self._endpoints.get(name) is not communicator:
+            return
+        self._call_styles.pop(name, None)
+        if self._endpoints.pop(name, None) is not None:
+            logger.debug("Unregistered local endpoint", name=name)
+
+    def get_endpoint(self, name: str) -> Optional[BaseCommunicator]:
+        """Get the communicator registered under a name.
+
+        Args:
+            name: The agent name
+
+        Returns:
+            The communicator, or None if no agent is registered under the name
+        """
+        return self._endpoints.get(name)
+
+    def get_handler(self, target: str, method: str) -> Optional[Callable]:
+        """Find the handler for a method of a registered agent.
+
+        Args:
+            target: The name of the target agent
+            method: The method name
+
+        Returns:
+            The handler, or None if the agent is not registered or has no such handler
+        """
+        communicator = self._endpoints.get(target)
+        if communicator is None:
+            return None
+        handlers: Dict[str, Callable] = getattr(communicator, "handlers", {})
+        return handlers.get(method)
+
+    async def request(
+        self,
+        target: str,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        response_model: Optional[Type[T]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Call a handler of a registered agent and return its result.
+
+        Args:
+            target: The name of the target agent
+            method: The method to call
+            params: The parameters passed to the handler
+            response_model: Optional Pydantic model to validate and parse the result
+            timeout: Optional timeout in seconds
+
+        Returns:
+            The handler's result
+
+        Raises:
+            ServiceNotFoundError: If the target agent is not registered
+            MethodNotFoundError: If the target agent has no handler for the method
+            RequestTimeoutError: If the handler does not finish within the timeout
+            CommunicationError: If the handler raises an exception
+            ValidationError: If the result does not match the response model
+        """
+        result = await self._call(target, method, params, timeout)
+        if response_model is not None:
+            try:
+                return response_model.model_validate(result)
+            except PydanticValidationError as e:
+                raise OpenMasValidationError(f"Response validation failed: {e}")
+        return result
+
+    async def notify(self, target: str, method: str, params: Optional[Dict[str, Any]] = None) -> None:
+        """Call a handler of a registered agent, discarding its result.
+
+        Args:
+            target: The name of the target agent
+            method: The method to call
+            params: The parameters passed to the handler
+
+        Raises:
+            ServiceNotFoundError: If the target agent is not registered
+            MethodNotFoundError: If the target agent has no handler for the method
+            CommunicationError: If the handler raises an exception
+        """
+        await self._call(target, method, params, None)
+
+    async def _call(self, target: str, method: str, params: Optional[Dict[str, Any]], timeout: Optional[float]) -> Any:
+        endpoint = self._endpoints.get(target)
+        if endpoint is None:
+            raise ServiceNotFoundError(f"Service '{target}' not found", target=target)
+        handler = self.get_handler(target, method)
+        if handler is None:
+            raise MethodNotFoundError(
+                f"Method '{method}' not found on service '{target}'", target=target, details={"method": method}
+            )
+
+        mailbox: Optional[asyncio.Semaphore] = getattr(endpoint, "mailbox", None)
+        call_params = params if params is not None else {}
+        keyword_call = self._call_styles.get(target) == "kwargs"
+
+        async def call_handler() -> Any:
+            if keyword_call:
+                return await handler(**call_params)
+            return await handler(call_params)
+
+        async def invoke() -> Any:
+            if mailbox is None:
+                return await call_handler()
+            async with mailbox:
+                return await call_handler()
+
+        self.delivered += 1
+        try:
+            if timeout is None:
+                return await invoke()
+            return await asyncio.wait_for(invoke(), timeout)
+        except asyncio.TimeoutError:
+            raise RequestTimeoutError(
+                f"Request to '{target}' timed out", target=target, details={"method": method}
+            ) from None
+        except Exception as e:
+            raise CommunicationError(
+                f"Error from service '{target}': Handler error: {e}", target=target, details={"method": method}
+            ) from e
+
+
+_default_router = LocalRouter()
+
+
+def get_default_router() -> LocalRouter:
+    """Get the process-wide router used by communicators without a router of their own.
+
+    Returns:
+        The default router
+    """
+    return _default_router
@@ -0,0 +1,661 @@
+"""Shared-memory IPC communicator for agents on the same host.
+
+Control messages travel over Unix domain sockets as length-prefixed JSON frames. Binary
+payloads (``bytes``, ``bytearray``, ``memoryview`` and, if numpy is installed, numpy arrays)
+of at least ``inline_threshold`` bytes are not put on the socket: the sender writes them
+into its own shared-memory ring buffer and sends a handle (segment name, offset and size)
+instead. The receiver maps the segment and reads the payload in place.
+
+Lifetimes:
+
+* Request payloads reach handlers as read-only ``memoryview`` objects (or numpy arrays)
+  backed by the sender's ring. They are valid until the handler returns; handlers that keep
+  the data must copy it.
+* Response payloads are copied out of shared memory once, then released to the responder.
+
+The communicator is published through the ``openmas.communicators`` entry point as ``shm``.
+"""
+
+import asyncio
+import base64
+import itertools
+import json
+import mmap
+import os
+import socket
+import struct
+import tempfile
+from collections import OrderedDict
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, TypeVar, Union
+
+from pydantic import BaseModel
+from pydantic import ValidationError as PydanticValidationError
+
+from openmas.communication.base import BaseCommunicator
+from openmas.communication.executor import CPU, get_offload_kind
+from openmas.exceptions import CommunicationError, MethodNotFoundError, RequestTimeoutError, ServiceNotFoundError
+from openmas.exceptions import ValidationError as OpenMasValidationError
+from openmas.logging import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import _posixshmem  # type: ignore
+except ImportError:  # Windows has no POSIX shared memory or Unix domain sockets
+    _posixshmem = None
+
+# numpy is optional; arrays are only transferred through shared memory when it is installed
+NUMPY_AVAILABLE = False
+try:
+    import numpy as np  # type: ignore
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+T = TypeVar("T", bound=BaseModel)
+
+_HEADER = struct.Struct(">I")
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+DEFAULT_RING_SIZE = 64 * 1024 * 1024
+DEFAULT_INLINE_THRESHOLD = 16 * 1024
+DEFAULT_SOCKET_DIR = Path(tempfile.gettempdir()) / "openmas-ipc"
+
+# Segments created by this process, so local receivers reuse them instead of mapping them again
+_OWNED_SEGMENTS: Dict[str, SharedMemory] = {}
+
+
+class ShmRing:
+    """A shared-memory segment used as a ring buffer of variable-size allocations.
+
+    Allocations are made at the head and reclaimed from the tail once freed, so payloads
+    freed out of order are reclaimed when all older allocations have been freed as well.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Create the segment.
+
+        Args:
+            size: Size of the segment in bytes
+        """
+        self.shm = SharedMemory(create=True, size=size)
+        self.size = size
+        self._head = 0
+        self._slot_ids = itertools.count(1)
+        # Live allocations in allocation order: slot id -> (start, end, freed)
+        self._allocations: "OrderedDict[int, Tuple[int, int, bool]]" = OrderedDict()
+        _OWNED_SEGMENTS[self.shm.name] = self.shm
+
+    @property
+    def name(self) -> str:
+        """Get the name other processes use to map the segment."""
+        return self.shm.name
+
+    @property
+    def used(self) -> int:
+        """Get the number of allocations not yet reclaimed."""
+        return len(self._allocations)
+
+    def alloc(self, size: int) -> Optional[Tuple[int, int]]:
+        """Allocate a contiguous region.
+
+        Args:
+            size: Number of bytes
+
+        Returns:
+            (slot id, offset) of the region, or None if there is not enough free space
+        """
+        if size <= 0 or size > self.size:
+            return None
+        if not self._allocations:
+            start = 0
+        else:
+            tail = next(iter(self._allocations.values()))[0]
+            if self._head > tail:
+                # Free space is [head, size) followed by [0, tail)
+                if self.size - self._head >= size:
+                    start = self._head
+                elif tail >= size:
+                    start = 0
+                else:
+                    return None
+            elif self._head < tail and tail - self._head >= size:
+                start = self._head
+            else:
+                return None
+
+        slot = next(self._slot_ids)
+        self._allocations[slot] = (start, start + size, False)
+        self._head = start + size
+        return slot, start
+
+    def write(self, offset: int, data: memoryview) -> None:
+        """Copy data into the segment.
+
+        Args:
+            offset: Offset returned by :meth:`alloc`
+            data: The bytes to copy
+        """
+        self.shm.buf[offset : offset + data.nbytes] = data
+
+    def free(self, slot: int) -> None:
+        """Free an allocation.
+
+        Args:
+            slot: Slot id returned by :meth:`alloc`
+        """
+        allocation = self._allocations.get(slot)
+        if allocation is None:
+            return
+        self._allocations[slot] = (allocation[0], allocation[1], True)
+        while self._allocations and next(iter(self._allocations.values()))[2]:
+            self._allocations.popitem(last=False)
+
+    def close(self) -> None:
+        """Close and remove the segment."""
+        _OWNED_SEGMENTS.pop(self.shm.name, None)
+        try:
+            self.shm.close()
+        except BufferError:
+            logger.warning("Shared memory still referenced while closing", segment=self.shm.name)
+        self.shm.unlink()
+
+
+class _MappedSegment:
+    """A mapping of a segment created by another process.
+
+    The segment is mapped directly instead of through :class:`SharedMemory`, which (before
+    Python 3.13) registers every mapped segment with the resource tracker. The tracker would
+    then unlink a segment its owner is still using when the mapping process exits.
+    """
+
+    def __init__(self, name: str) -> None:
+        fd = _posixshmem.shm_open("/" + name, os.O_RDWR, mode=0o600)
+        try:
+            self._mmap = mmap.mmap(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+        self.buf = memoryview(self._mmap)
+
+    def close(self) -> None:
+        self.buf.release()
+        self._mmap.close()
+
+
+def _attach_segment(name: str) -> Union[SharedMemory, _MappedSegment]:
+    """Map a segment created by another communicator."""
+    owned = _OWNED_SEGMENTS.get(name)
+    if owned is not None:
+        return owned
+    return _MappedSegment(name)
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> Optional[Dict[str, Any]]:
+    """Read one control frame, returning None at end of stream."""
+    try:
+        header = await reader.readexactly(_HEADER.size)
+    except asyncio.IncompleteReadError:
+        return None
+    (length,) = _HEADER.unpack(header)
+    if length > MAX_FRAME_SIZE:
+        raise CommunicationError(f"Control frame of {length} bytes exceeds the limit of {MAX_FRAME_SIZE}")
+    message: Dict[str, Any] = json.loads(await reader.readexactly(length))
+    return message
+
+
+def _encode_frame(message: Dict[str, Any]) -> bytes:
+    data = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    return _HEADER.pack(len(data)) + data
+
+
+class _Connection:
+    """Client side of a connection to another agent."""
+
+    def __init__(self, communicator: "SharedMemoryCommunicator", target: str) -> None:
+        self.communicator = communicator
+        self.target = target
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.reader_task: Optional[asyncio.Task] = None
+        # Request id -> (reply future, ring slots holding the request's payloads)
+        self.pending: Dict[int, Tuple[asyncio.Future, List[int]]] = {}
+        self.write_lock = asyncio.Lock()
+
+    @property
+    def closed(self) -> bool:
+        return self.writer is None or self.writer.is_closing()
+
+    async def open(self, path: Path) -> None:
+        self.reader, self.writer = await asyncio.open_unix_connection(str(path))
+        self.reader_task = asyncio.create_task(self._read_replies())
+
+    async def send(self, message: Dict[str, Any]) -> None:
+        if self.writer is None:
+            raise CommunicationError(f"Connection to '{self.target}' is closed", target=self.target)
+        async with self.write_lock:
+            self.writer.write(_encode_frame(message))
+            await self.writer.drain()
+
+    async def _read_replies(self) -> None:
+        assert self.reader is not None
+        try:
+            while True:
+                reply = await _read_frame(self.reader)
+                if reply is None:
+                    break
+                entry = self.pending.pop(reply.get("id", -1), None)
+                if entry is None:
+                    continue
+                future, slots = entry
+                self.communicator._free_slots(slots)
+                if not future.done():
+                    future.set_result(reply)
+                elif reply.get("slots"):
+                    # The caller gave up waiting: release the response payloads unread
+                    await self.send({"release": reply["slots"]})
+        except (ConnectionError, CommunicationError, json.JSONDecodeError) as e:
+            logger.warning("IPC connection failed", target=self.target, error=str(e))
+        finally:
+            self.fail_pending(CommunicationError(f"Connection to '{self.target}' closed", target=self.target))
+
+    def fail_pending(self, error: Exception) -> None:
+        for future, slots in self.pending.values():
+            self.communicator._free_slots(slots)
+            if not future.done():
+                future.set_exception(error)
+        self.pending.clear()
+
+    async def close(self) -> None:
+        if self.reader_task is not None:
+            self.reader_task.cancel()
+            await asyncio.gather(self.reader_task, return_exceptions=True)
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+        self.fail_pending(CommunicationError(f"Connection to '{self.target}' closed", target=self.target))
+
+
+class SharedMemoryCommunicator(BaseCommunicator):
+    """Communicator for agents in different processes on the same host.
+
+    Each agent listens on ``<socket_dir>/<agent name>.sock``. Services are addressed by agent
+    name, or through ``service_urls`` entries of the form ``shm://<agent name>`` or
+    ``unix:///path/to/socket``.
+    """
+
+    def __init__(
+        self,
+        agent_name: str,
+        service_urls: Dict[str, str],
+        socket_dir: Optional[str] = None,
+        ring_size: int = DEFAULT_RING_SIZE,
+        inline_threshold: int = DEFAULT_INLINE_THRESHOLD,
+        **kwargs: Any,
+    ):
+        """Initialize the shared-memory communicator.
+
+        Args:
+            agent_name: The name of the agent using this communicator
+            service_urls: Mapping of service names to ``shm://`` or ``unix://`` addresses
+            socket_dir: Directory of the agents' Unix sockets
+            ring_size: Size in bytes of this agent's shared-memory ring buffer
+            inline_threshold: Payloads smaller than this are sent inline on the socket
+        """
+        super().__init__(agent_name, service_urls)
+        options = kwargs.get("communicator_options") or {}
+        self.socket_dir = Path(options.get("socket_dir", socket_dir) or DEFAULT_SOCKET_DIR)
+        self.ring_size = int(options.get("ring_size", ring_size))
+        self.inline_threshold = int(options.get("inline_threshold", inline_threshold))
+        self.socket_path = self.socket_dir / f"{agent_name}.sock"
+
+        self.handlers: Dict[str, Callable] = {}
+        self._copy_params: Set[str] = set()
+        self._ring: Optional[ShmRing] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        # Accepted connections: serving task -> writer
+        self._server_connections: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+        self._connections: Dict[Path, _Connection] = {}
+        self._connect_lock = asyncio.Lock()
+        self._attached: Dict[str, Union[SharedMemory, _MappedSegment]] = {}
+        self._request_ids = itertools.count(1)
+
+    def _socket_for(self, target_service: str) -> Path:
+        address = self.service_urls.get(target_service)
+        if address is None:
+            path = self.socket_dir / f"{target_service}.sock"
+            if not path.exists():
+                raise ServiceNotFoundError(f"Service '{target_service}' not found", target=target_service)
+            return path
+        if address.startswith("unix://"):
+            return Path(address[len("unix://") :])
+        if address.startswith("shm://"):
+            return self.socket_dir / f"{address[len('shm://'):]}.sock"
+        raise ServiceNotFoundError(
+            f"Service '{target_service}' has no IPC address (expected shm:// or unix://)", target=target_service
+        )
+
+    async def _get_connection(self, target_service: str) -> _Connection:
+        path = self._socket_for(target_service)
+        connection = self._connections.get(path)
+        if connection is not None and not connection.closed:
+            return connection
+        async with self._connect_lock:
+            connection = self._connections.get(path)
+            if connection is None or connection.closed:
+                connection = _Connection(self, target_service)
+                try:
+                    await connection.open(path)
+                except (FileNotFoundError, ConnectionRefusedError) as e:
+                    raise ServiceNotFoundError(
+                        f"Service '{target_service}' is not listening at {path}", target=target_service
+                    ) from e
+                except OSError as e:
+                    raise CommunicationError(
+                        f"Failed to connect to '{target_service}': {e}", target=target_service
+                    ) from e
+                self._connections[path] = connection
+        return connection
+
+    def _get_ring(self) -> ShmRing:
+        if self._ring is None:
+            self._ring = ShmRing(self.ring_size)
+        return self._ring
+
+    def _free_slots(self, slots: List[int]) -> None:
+        if self._ring is not None:
+            for slot in slots:
+                self._ring.free(slot)
+
+    def _encode_buffer(self, buffer: memoryview, slots: List[int]) -> Dict[str, Any]:
+        size = buffer.nbytes
+        if size >= self.inline_threshold:
+            ring = self._get_ring()
+            allocation = ring.alloc(size)
+            if allocation is not None:
+                slot, offset = allocation
+                ring.write(offset, buffer)
+                slots.append(slot)
+                return {"__shm__": ring.name, "offset": offset, "size": size}
+            logger.debug("Shared memory ring full, sending payload inline", size=size)
+        return {"__bytes__": base64.b64encode(buffer).decode("ascii")}
+
+    def _encode(self, value: Any, slots: List[int]) -> Any:
+        if isinstance(value, dict):
+            return {key: self._encode(item, slots) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self._encode(item, slots) for item in value]
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return self._encode_buffer(memoryview(value).cast("B"), slots)
+        if NUMPY_AVAILABLE and isinstance(value, np.ndarray):
+            array = np.ascontiguousarray(value)
+            return {
+                "__ndarray__": self._encode_buffer(memoryview(array).cast("B"), slots),
+                "dtype": array.dtype.str,
+                "shape": list(array.shape),
+            }
+        return value
+
+    def _decode(self, value: Any, copy: bool) -> Any:
+        if isinstance(value, dict):
+            if "__shm__" in value:
+                segment = self._attached.get(value["__shm__"])
+                if segment is None:
+                    segment = self._attached[value["__shm__"]] = _attach_segment(value["__shm__"])
+                view = segment.buf[value["offset"] : value["offset"] + value["size"]]
+                if not copy:
+                    return view.toreadonly()
+                data = bytes(view)
+                view.release()
+                return data
+            if "__bytes__" in value:
+                return base64.b64decode(value["__bytes__"])
+            if "__ndarray__" in value and NUMPY_AVAILABLE:
+                buffer = self._decode(value["__ndarray__"], copy)
+                return np.frombuffer(buffer, dtype=value["dtype"]).reshape(value["shape"])
+            return {key: self._decode(item, copy) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._decode(item, copy) for item in value]
+        return value
+
+    async def _call(
+        self, target_service: str, method: str, params: Optional[Dict[str, Any]], notify: bool, timeout: Optional[float]
+    ) -> Dict[str, Any]:
+        connection = await self._get_connection(target_service)
+        request_id = next(self._request_ids)
+        slots: List[int] = []
+        message = {"id": request_id, "method": method, "params": self._encode(params or {}, slots), "notify": notify}
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        # The reply reader frees the request's slots once the receiver is done with them
+        connection.pending[request_id] = (future, slots)
+        try:
+            await connection.send(message)
+        except (ConnectionError, OSError) as e:
+            connection.pending.pop(request_id, None)
+            self._free_slots(slots)
+            raise CommunicationError(f"IPC error from '{target_service}': {e}", target=target_service) from e
+
+        try:
+            reply: Dict[str, Any] = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise RequestTimeoutError(
+                f"Request to '{target_service}' timed out", target=target_service, details={"method": method}
+            ) from None
+
+        if "error" in reply:
+            error = reply["error"]
+            if error.get("code") == -32601:
+                raise MethodNotFoundError(
+                    f"Method '{method}' not found on service '{target_service}'",
+                    target=target_service,
+                    details={"method": method, "error": error},
+                )
+            raise CommunicationError(
+                f"Error from service '{target_service}': {error.get('message', 'Unknown error')}",
+                target=target_service,
+                details={"method": method, "error": error},
+            )
+        return reply
+
+    async def send_request(
+        self,
+        target_service: str,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        response_model: Optional[Type[T]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Send a request to an agent on the same host.
+
+        Args:
+            target_service: The name of the service to send the request to
+            method: The method to call on the service
+            params: The parameters to pass to the method
+            response_model: Optional Pydantic model to validate and parse the response
+            timeout: Optional timeout in seconds
+
+        Returns:
+            The response from the service, with shared-memory payloads copied into ``bytes``
+
+        Raises:
+            ServiceNotFoundError: If the target service is not found or not listening
+            MethodNotFoundError: If the target service has no handler for the method
+            RequestTimeoutError: If the request times out
+            CommunicationError: If there is a problem with the communication
+            ValidationError: If the response validation fails
+        """
+        logger.debug("Sending request", target=target_service, method=method)
+        reply = await self._call(target_service, method, params, False, timeout)
+        response_data = self._decode(reply.get("result"), copy=True)
+        if reply.get("slots"):
+            connection = await self._get_connection(target_service)
+            await connection.send({"release": reply["slots"]})
+
+        if response_model is not None:
+            try:
+                return response_model.model_validate(response_data)
+            except PydanticValidationError as e:
+                raise OpenMasValidationError(f"Response validation failed: {e}")
+        return response_data
+
+    async def send_notification(
+        self, target_service: str, method: str, params: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Send a notification to an agent on the same host.
+
+        Args:
+            target_service: The name of the service to send the notification to
+            method: The method to call on the service
+            params: The parameters to pass to the method
+
+        Raises:
+            ServiceNotFoundError: If the target service is not found or not listening
+            CommunicationError: If there is a problem with the communication
+        """
+        logger.debug("Sending notification", target=target_service, method=method)
+        await self._call(target_service, method, params, True, None)
+
+    async def register_handler(self, method: str, handler: Callable) -> None:
+        """Register a handler for a method.
+
+        Args:
+            method: The method name to handle
+            handler: The handler function, called with the parameters dictionary
+        """
+        self.handlers[method] = self._prepare_handler(handler)
+        # Views into shared memory cannot be pickled, so process-pool handlers get copies
+        if get_offload_kind(handler) == CPU:
+            self._copy_params.add(method)
+        else:
+            self._copy_params.discard(method)
+        logger.debug("Registered handler", method=method)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        if task is not None:
+            self._server_connections[task] = writer
+        write_lock = asyncio.Lock()
+        # Ring slots holding responses the client has not released yet
+        outstanding: Set[int] = set()
+        handlers: Set[asyncio.Task] = set()
+        try:
+            while True:
+                message = await _read_frame(reader)
+                if message is None:
+                    break
+                if "release" in message:
+                    self._free_slots(message["release"])
+                    outstanding.difference_update(message["release"])
+                    continue
+                handler_task = asyncio.create_task(self._handle(message, writer, write_lock, outstanding))
+                handlers.add(handler_task)
+                handler_task.add_done_callback(handlers.discard)
+        except (ConnectionError, CommunicationError, json.JSONDecodeError) as e:
+            logger.warning("IPC client connection failed", error=str(e))
+        finally:
+            for handler_task in handlers:
+                handler_task.cancel()
+            await asyncio.gather(*handlers, return_exceptions=True)
+            self._free_slots(list(outstanding))
+            writer.close()
+            if task is not None:
+                self._server_connections.pop(task, None)
+
+    async def _handle(
+        self,
+        message: Dict[str, Any],
+        writer: asyncio.StreamWriter,
+        write_lock: asyncio.Lock,
+        outstanding: Set[int],
+    ) -> None:
+        request_id = message.get("id")
+        method = message.get("method")
+        handler = self.handlers.get(method) if isinstance(method, str) else None
+        slots: List[int] = []
+        if handler is None:
+            reply: Dict[str, Any] = {
+                "id": request_id,
+                "error": {"code": -32601, "message": f"Method not found: {method}"},
+            }
+        else:
+            try:
+                params = self._decode(message.get("params") or {}, copy=method in self._copy_params)
+                result = await handler(params)
+                if message.get("notify"):
+                    reply = {"id": request_id}
+                else:
+                    reply = {"id": request_id, "result": self._encode(result, slots), "slots": slots}
+            except Exception as e:
+                logger.exception(f"Handler error: {e}")
+                reply = {"id": request_id, "error": {"code": -32000, "message": f"Handler error: {str(e)}"}}
+
+        try:
+            frame = _encode_frame(reply)
+        except (TypeError, ValueError) as e:
+            self._free_slots(slots)
+            slots = []
+            frame = _encode_frame({"id": request_id, "error": {"code": -32603, "message": f"Internal error: {e}"}})
+        outstanding.update(slots)
+        async with write_lock:
+            writer.write(frame)
+            await writer.drain()
+
+    async def start(self) -> None:
+        """Start listening on this agent's Unix socket.
+
+        Raises:
+            CommunicationError: If the platform lacks Unix domain sockets or POSIX shared memory, or
+                the socket cannot be bound
+        """
+        if not hasattr(socket, "AF_UNIX") or _posixshmem is None:
+            raise CommunicationError(
+                "The shared-memory communicator requires Unix domain sockets and POSIX shared memory"
+            )
+        if self._server is not None:
+            return
+        self.socket_dir.mkdir(parents=True, exist_ok=True)
+        # A socket file left behind by a crashed process would make the bind fail
+        self.socket_path.unlink(missing_ok=True)
+        try:
+            self._server = await asyncio.start_unix_server(self._serve, path=str(self.socket_path))
+        except OSError as e:
+            raise CommunicationError(f"Failed to listen on {self.socket_path}: {e}") from e
+        logger.info("Started shared-memory communicator", socket=str(self.socket_path))
+
+    async def stop(self) -> None:
+        """Stop listening, close connections and release shared memory."""
+        server, self._server = self._server, None
+        if server is not None:
+            server.close()
+            self.socket_path.unlink(missing_ok=True)
+
+        # Close accepted connections first: wait_closed() waits for them on newer Pythons.
+        # Closing the transport ends each serving task's read loop.
+        serving = list(self._server_connections.items())
+        for _, writer in serving:
+            writer.close()
+        await asyncio.gather(*(task for task, _ in serving), return_exceptions=True)
+        if server is not None:
+            await server.wait_closed()
+
+        for connection in self._connections.values():
+            await connection.close()
+        self._connections.clear()
+
+        for name, segment in self._attached.items():
+            if name in _OWNED_SEGMENTS:
+                continue
+            try:
+                segment.close()
+            except BufferError:
+                logger.warning("Shared memory still referenced while closing", segment=name)
+        self._attached.clear()
+
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
+        logger.info("Stopped shared-memory communicator")
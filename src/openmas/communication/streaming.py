@@ -0,0 +1,28 @@
+"""Helpers for streamed communicator results."""
+
+from typing import Any, Dict, List
+
+
+def sampling_result_to_chunks(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Convert a complete sampling result into stream chunks.
+
+    Transports that cannot deliver partial results use this to expose the same chunk
+    format as streaming transports: content deltas followed by a final chunk with
+    ``done`` set to True and any finish reason or usage metadata.
+
+    Args:
+        result: A sampling result dictionary with at least a "content" field
+
+    Returns:
+        The list of chunks to yield
+    """
+    chunks: List[Dict[str, Any]] = []
+    content = str(result.get("content", ""))
+    if content:
+        chunks.append({"delta": content})
+    final: Dict[str, Any] = {"delta": "", "done": True}
+    for key in ("finish_reason", "usage"):
+        if key in result:
+            final[key] = result[key]
+    chunks.append(final)
+    return chunks
@@ -87,6 +87,15 @@ class AgentConfig(BaseModel):
     )
     sampling: Optional[SamplingParameters] = Field(default=None, description="Sampling configuration for the agent")
     required_assets: List[str] = Field(default_factory=list, description="List of asset names required by the agent")
+    handler_thread_workers: Optional[int] = Field(
+        default=None, ge=1, description="Thread pool size for handlers marked with offload('blocking')"
+    )
+    handler_process_workers: Optional[int] = Field(
+        default=None, ge=1, description="Process pool size for handlers marked with offload('cpu')"
+    )
+    handler_shutdown_timeout: float = Field(
+        default=10.0, ge=0, description="Seconds stop() waits for running offloaded handlers before giving up on them"
+    )
 
 
 class AgentConfigEntry(BaseModel):
@@ -9,10 +9,22 @@ from openmas.integrations.llm import (  # noqa
     initialize_llm_client,
     initialize_openai_client,
 )
+from openmas.integrations.rate_limit import (  # noqa
+    LlmPriority,
+    LlmRateLimiter,
+    LlmReservation,
+    extract_token_usage,
+    get_llm_rate_limiter,
+)
 
 __all__ = [
     "initialize_openai_client",
     "initialize_anthropic_client",
     "initialize_google_genai",
     "initialize_llm_client",
+    "LlmPriority",
+    "LlmRateLimiter",
+    "LlmReservation",
+    "extract_token_usage",
+    "get_llm_rate_limiter",
 ]
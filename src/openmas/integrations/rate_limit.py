@@ -0,0 +1,507 @@
+"""Rate limiting and token budgeting for LLM clients.
+
+The clients returned by :func:`openmas.integrations.llm.initialize_llm_client` talk to the
+provider directly and do no throttling. An :class:`LlmRateLimiter` schedules calls made
+through those clients so that a process stays within the provider's requests-per-minute and
+tokens-per-minute quotas:
+
+* Requests and tokens are accounted with token buckets. Each call reserves an estimated
+  number of tokens up front, and the estimate is corrected with the usage reported in the
+  response.
+* Waiting calls are dispatched by priority class, and round-robin across agents within a
+  class, so one busy agent cannot starve the others.
+* A rate-limit error (HTTP 429) pauses dispatch for all callers, honouring ``Retry-After``
+  and backing off exponentially while the provider keeps rejecting requests.
+
+Example:
+    limiter = get_llm_rate_limiter("openai", requests_per_minute=500, tokens_per_minute=200_000)
+    response = await limiter.call(
+        client.chat.completions.create,
+        model="gpt-4o",
+        messages=messages,
+        estimated_tokens=1500,
+        agent="planner",
+    )
+"""
+
+import asyncio
+import inspect
+import itertools
+import time
+from collections import OrderedDict, deque
+from enum import IntEnum
+from types import TracebackType
+from typing import Any, Callable, Deque, Dict, Optional, Type
+
+from openmas.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class LlmPriority(IntEnum):
+    """Priority classes for LLM calls (lower values are dispatched first)."""
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+class TokenBucket:
+    """A token bucket refilled continuously up to its capacity.
+
+    The level may go negative when actual usage exceeds a reservation; later requests then
+    wait until the debt has been refilled.
+    """
+
+    def __init__(self, per_minute: float) -> None:
+        """Initialize the bucket, starting full.
+
+        Args:
+            per_minute: Capacity of the bucket and amount refilled per minute
+        """
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def time_until(self, amount: float) -> float:
+        """Get the number of seconds until ``amount`` can be consumed.
+
+        Amounts larger than the capacity are treated as the full capacity, so an oversized
+        request waits for a full bucket rather than forever.
+
+        Args:
+            amount: The amount to consume
+
+        Returns:
+            Seconds to wait (0 if the amount is available now)
+        """
+        self._refill()
+        missing = min(amount, self.capacity) - self.level
+        return missing / self.rate if missing > 0 else 0.0
+
+    def consume(self, amount: float) -> None:
+        """Take an amount from the bucket (a negative amount returns it).
+
+        Args:
+            amount: The amount to take
+        """
+        self._refill()
+        self.level = min(self.capacity, self.level - amount)
+
+
+def extract_token_usage(response: Any) -> Optional[int]:
+    """Extract the total number of tokens used from an LLM response.
+
+    Supports OpenAI (``usage.total_tokens``), Anthropic (``usage.input_tokens`` and
+    ``usage.output_tokens``) and Google (``usage_metadata.total_token_count``) responses,
+    as objects or dictionaries.
+
+    Args:
+        response: The provider response
+
+    Returns:
+        The total token count, or None if the response does not report usage
+    """
+
+    def field(obj: Any, name: str) -> Any:
+        return obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+
+    usage = field(response, "usage")
+    if usage is not None:
+        total = field(usage, "total_tokens")
+        if isinstance(total, int):
+            return total
+        input_tokens = field(usage, "input_tokens")
+        output_tokens = field(usage, "output_tokens")
+        if isinstance(input_tokens, int) and isinstance(output_tokens, int):
+            return input_tokens + output_tokens
+
+    metadata = field(response, "usage_metadata")
+    if metadata is not None:
+        total = field(metadata, "total_token_count")
+        if isinstance(total, int):
+            return total
+    return None
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Check whether an exception raised by an LLM client is a rate-limit rejection.
+
+    Args:
+        error: The exception
+
+    Returns:
+        True for HTTP 429 errors and the providers' rate-limit exception types
+    """
+    if type(error).__name__ in ("RateLimitError", "ResourceExhausted", "TooManyRequests"):
+        return True
+    status = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+    return status == 429
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    """Get the Retry-After delay from a rate-limit error, if the provider sent one."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is None:
+        return None
+    try:
+        value = headers.get("retry-after")
+        return float(value) if value is not None else None
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+class _Waiter:
+    """A queued call waiting for capacity."""
+
+    def __init__(self, tokens: int, future: "asyncio.Future[None]") -> None:
+        self.tokens = tokens
+        self.future = future
+
+
+class LlmReservation:
+    """Capacity granted to a single LLM call.
+
+    Use as an async context manager around the call and report the actual usage with
+    :meth:`record_usage` so the token budget stays accurate.
+    """
+
+    def __init__(self, limiter: "LlmRateLimiter", estimated_tokens: int) -> None:
+        self._limiter = limiter
+        self.estimated_tokens = estimated_tokens
+        self.used_tokens: Optional[int] = None
+        self._released = False
+
+    def record_usage(self, usage: Any) -> None:
+        """Record the tokens actually used by the call.
+
+        Args:
+            usage: A token count, or a provider response to extract the usage from
+        """
+        tokens = usage if isinstance(usage, int) else extract_token_usage(usage)
+        if tokens is None or self.used_tokens is not None:
+            return
+        self.used_tokens = tokens
+        self._limiter._adjust_tokens(tokens - self.estimated_tokens)
+
+    def release(self, succeeded: bool = True) -> None:
+        """Return the call's concurrency slot to the limiter.
+
+        Args:
+            succeeded: Whether the call succeeded, which resets the rate-limit backoff
+        """
+        if not self._released:
+            self._released = True
+            self._limiter._release(succeeded)
+
+    async def __aenter__(self) -> "LlmReservation":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        if exc is not None and is_rate_limit_error(exc):
+            self._limiter.report_rate_limited(_retry_after(exc))
+        self.release(succeeded=exc is None)
+
+
+class LlmRateLimiter:
+    """Scheduler for LLM calls under requests-per-minute and tokens-per-minute quotas.
+
+    A single limiter should be shared by all agents in a process that use the same provider
+    account; :func:`get_llm_rate_limiter` keeps one per provider.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        default_estimated_tokens: int = 0,
+        max_retries: int = 3,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            requests_per_minute: Maximum requests per minute (None for no limit)
+            tokens_per_minute: Maximum tokens per minute (None for no limit)
+            max_concurrency: Maximum number of calls in flight (None for no limit)
+            default_estimated_tokens: Tokens reserved for calls that give no estimate
+            max_retries: Number of times :meth:`call` retries after a rate-limit error
+            initial_backoff: Pause in seconds after the first rate-limit error
+            max_backoff: Upper bound for the exponential backoff in seconds
+        """
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.max_concurrency = max_concurrency
+        self.default_estimated_tokens = default_estimated_tokens
+        self.max_retries = max_retries
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+
+        self.active = 0
+        self.rate_limited = 0
+        self._backoff = initial_backoff
+        self._paused_until = 0.0
+        # priority -> agent -> FIFO of waiters; agents rotate to the end after each dispatch
+        self._queues: Dict[int, "OrderedDict[str, Deque[_Waiter]]"] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def queued(self) -> int:
+        """Get the number of calls waiting for capacity."""
+        return sum(len(waiters) for agents in self._queues.values() for waiters in agents.values())
+
+    async def acquire(
+        self,
+        estimated_tokens: Optional[int] = None,
+        priority: int = LlmPriority.NORMAL,
+        agent: str = "default",
+    ) -> LlmReservation:
+        """Wait for capacity for one call.
+
+        Args:
+            estimated_tokens: Tokens to reserve (prompt plus expected completion)
+            priority: Priority class; see :class:`LlmPriority`
+            agent: Name of the calling agent, used for fair queuing
+
+        Returns:
+            The reservation; release it when the call has finished
+        """
+        tokens = self.default_estimated_tokens if estimated_tokens is None else estimated_tokens
+        future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        waiter = _Waiter(tokens, future)
+        self._queues.setdefault(int(priority), OrderedDict()).setdefault(agent, deque()).append(waiter)
+        self._dispatch()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Capacity was granted just before cancellation; hand it back
+                if self.requests is not None:
+                    self.requests.consume(-1)
+                self._adjust_tokens(-tokens)
+                self._release(succeeded=False)
+            else:
+                self._remove(waiter)
+            raise
+        return LlmReservation(self, tokens)
+
+    def reserve(
+        self,
+        estimated_tokens: Optional[int] = None,
+        priority: int = LlmPriority.NORMAL,
+        agent: str = "default",
+    ) -> "_ReservationContext":
+        """Wait for capacity in an ``async with`` block.
+
+        Example:
+            async with limiter.reserve(estimated_tokens=800, agent="critic") as slot:
+                response = await asyncio.to_thread(client.messages.create, **request)
+                slot.record_usage(response)
+
+        Args:
+            estimated_tokens: Tokens to reserve (prompt plus expected completion)
+            priority: Priority class; see :class:`LlmPriority`
+            agent: Name of the calling agent, used for fair queuing
+
+        Returns:
+            An async context manager yielding the LlmReservation
+        """
+        return _ReservationContext(self, estimated_tokens, priority, agent)
+
+    async def call(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        estimated_tokens: Optional[int] = None,
+        priority: int = LlmPriority.NORMAL,
+        agent: str = "default",
+        **kwargs: Any,
+    ) -> Any:
+        """Call an LLM client method under the limiter.
+
+        Synchronous client methods are run in a worker thread. Usage is read from the
+        response, and rate-limit errors are retried up to ``max_retries`` times after the
+        limiter's backoff.
+
+        Args:
+            func: The client method, e.g. ``client.chat.completions.create``
+            *args: Positional arguments for the method
+            estimated_tokens: Tokens to reserve (prompt plus expected completion)
+            priority: Priority class; see :class:`LlmPriority`
+            agent: Name of the calling agent, used for fair queuing
+            **kwargs: Keyword arguments for the method
+
+        Returns:
+            The method's response
+
+        Raises:
+            Exception: The last rate-limit error once retries are exhausted, or any other
+                error raised by the method
+        """
+        for attempt in itertools.count():
+            try:
+                async with self.reserve(estimated_tokens, priority, agent) as slot:
+                    if inspect.iscoroutinefunction(func):
+                        response = await func(*args, **kwargs)
+                    else:
+                        response = await asyncio.to_thread(func, *args, **kwargs)
+                    slot.record_usage(response)
+                    return response
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt >= self.max_retries:
+                    raise
+                logger.warning("LLM call rate limited, retrying", agent=agent, attempt=attempt + 1)
+
+    def report_rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """Pause dispatch after the provider rejected a call with a rate-limit error.
+
+        Args:
+            retry_after: Delay requested by the provider in seconds, if any
+        """
+        self.rate_limited += 1
+        delay = max(retry_after or 0.0, self._backoff)
+        self._backoff = min(self._backoff * 2, self.max_backoff)
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        logger.info("LLM rate limit reached, pausing dispatch", delay=delay)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get scheduler metrics.
+
+        Returns:
+            Dictionary with active and queued calls, remaining request and token budget,
+            and the number of rate-limit errors seen
+        """
+        return {
+            "active": self.active,
+            "queued": self.queued,
+            "requests_available": self.requests.level if self.requests else None,
+            "tokens_available": self.tokens.level if self.tokens else None,
+            "rate_limited": self.rate_limited,
+        }
+
+    def _adjust_tokens(self, delta: int) -> None:
+        if self.tokens is not None and delta:
+            self.tokens.consume(delta)
+        if delta <= 0:
+            self._dispatch()
+
+    def _release(self, succeeded: bool) -> None:
+        self.active -= 1
+        if succeeded:
+            self._backoff = self.initial_backoff
+        self._dispatch()
+
+    def _remove(self, waiter: _Waiter) -> None:
+        for agents in self._queues.values():
+            for waiters in agents.values():
+                if waiter in waiters:
+                    waiters.remove(waiter)
+                    return
+
+    def _next_waiter(self) -> Optional["Deque[_Waiter]"]:
+        """Get the queue to dispatch from next: highest priority, then round-robin by agent."""
+        for priority in sorted(self._queues):
+            agents = self._queues[priority]
+            for agent in list(agents):
+                if agents[agent]:
+                    return agents[agent]
+                del agents[agent]
+            del self._queues[priority]
+        return None
+
+    def _rotate(self, waiters: "Deque[_Waiter]") -> None:
+        for agents in self._queues.values():
+            for agent, queue in agents.items():
+                if queue is waiters:
+                    agents.move_to_end(agent)
+                    return
+
+    def _dispatch(self) -> None:
+        """Grant capacity to as many queued calls as the budgets allow."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while True:
+            waiters = self._next_waiter()
+            if waiters is None:
+                return
+            if self.max_concurrency is not None and self.active >= self.max_concurrency:
+                return
+
+            waiter = waiters[0]
+            wait = self._paused_until - time.monotonic()
+            if self.requests is not None:
+                wait = max(wait, self.requests.time_until(1))
+            if self.tokens is not None:
+                wait = max(wait, self.tokens.time_until(waiter.tokens))
+            if wait > 0:
+                self._timer = asyncio.get_running_loop().call_later(wait, self._dispatch)
+                return
+
+            waiters.popleft()
+            self._rotate(waiters)
+            if waiter.future.done():
+                # The caller was cancelled while queued
+                continue
+            if self.requests is not None:
+                self.requests.consume(1)
+            if self.tokens is not None:
+                self.tokens.consume(waiter.tokens)
+            self.active += 1
+            waiter.future.set_result(None)
+
+
+class _ReservationContext:
+    """Async context manager returned by :meth:`LlmRateLimiter.reserve`."""
+
+    def __init__(self, limiter: LlmRateLimiter, estimated_tokens: Optional[int], priority: int, agent: str) -> None:
+        self._limiter = limiter
+        self._args = (estimated_tokens, priority, agent)
+        self._reservation: Optional[LlmReservation] = None
+
+    async def __aenter__(self) -> LlmReservation:
+        self._reservation = await self._limiter.acquire(*self._args)
+        return self._reservation
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        if self._reservation is not None:
+            await self._reservation.__aexit__(exc_type, exc, tb)
+
+
+_LIMITERS: Dict[str, LlmRateLimiter] = {}
+
+
+def get_llm_rate_limiter(provider: str, **kwargs: Any) -> LlmRateLimiter:
+    """Get the process-wide rate limiter for a provider, creating it on first use.
+
+    Args:
+        provider: The LLM provider ("openai", "anthropic" or "google")
+        **kwargs: Arguments for :class:`LlmRateLimiter`, used only when the limiter is created
+
+    Returns:
+        The shared limiter for the provider
+    """
+    provider = provider.lower()
+    if provider not in _LIMITERS:
+        _LIMITERS[provider] = LlmRateLimiter(**kwargs)
+    return _LIMITERS[provider]
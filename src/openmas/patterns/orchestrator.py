@@ -406,7 +406,8 @@ class BaseWorkerAgent(BaseAgent):
             if callable(attr) and hasattr(attr, "_task_handler"):
                 task_info = getattr(attr, "_task_handler")
                 if isinstance(task_info, dict) and "task_type" in task_info:
-                    self._task_handlers[task_info["task_type"]] = attr
+                    # Handlers marked with offload() run on the agent's executor
+                    self._task_handlers[task_info["task_type"]] = self.handler_executor.wrap(attr)
                     self.logger.debug("Registered task handler", task_type=task_info["task_type"], handler=attr_name)
 
     async def register_with_orchestrator(self, orchestrator_name: str) -> bool:
@@ -11,7 +11,23 @@ from typing import Any, Dict, List, Optional, Union
 from openmas.communication.base import BaseCommunicator
 from openmas.exceptions import ConfigurationError
 from openmas.logging import get_logger
-from openmas.sampling.base import BaseSampler, Message, MessageRole, SamplingContext, SamplingParameters, SamplingResult
+from openmas.sampling.base import (
+    BaseSampler,
+    Message,
+    MessageRole,
+    SamplingChunk,
+    SamplingContext,
+    SamplingParameters,
+    SamplingResult,
+    collect_stream,
+)
+from openmas.sampling.cache import (
+    CachingSampler,
+    MemorySamplingCache,
+    SamplingCache,
+    SqliteSamplingCache,
+    sampling_cache_key,
+)
 
 logger = get_logger(__name__)
 
@@ -19,6 +35,7 @@ logger = get_logger(__name__)
 def get_sampler(
     communicator: BaseCommunicator,
     params: Optional[SamplingParameters] = None,
+    cache: Optional[SamplingCache] = None,
     **kwargs: Any,
 ) -> BaseSampler:
     """Get a sampler based on the parameters.
@@ -29,6 +46,7 @@ def get_sampler(
     Args:
         communicator: The communicator to use for sampling
         params: The sampling parameters
+        cache: Optional cache; if given, the sampler is wrapped in a CachingSampler
         **kwargs: Additional arguments for the sampler
 
     Returns:
@@ -41,6 +59,14 @@ def get_sampler(
         # If no parameters provided, use defaults
         params = SamplingParameters()
 
+    sampler = _create_sampler(communicator, params)
+    if cache is not None:
+        return CachingSampler(sampler, cache)
+    return sampler
+
+
+def _create_sampler(communicator: BaseCommunicator, params: SamplingParameters) -> BaseSampler:
+    """Create the provider-specific sampler for the given parameters."""
     # Create a sampler based on the provider
     if params.provider is None or params.provider.lower() == "default":
         # Default sampler uses the base BaseSampler class with the provided communicator
@@ -76,10 +102,17 @@ def get_sampler(
 # Re-export important types
 __all__ = [
     "BaseSampler",
+    "CachingSampler",
+    "MemorySamplingCache",
     "Message",
     "MessageRole",
+    "SamplingCache",
+    "SamplingChunk",
     "SamplingContext",
     "SamplingParameters",
     "SamplingResult",
+    "SqliteSamplingCache",
+    "collect_stream",
     "get_sampler",
+    "sampling_cache_key",
 ]
@@ -4,9 +4,10 @@ This module provides a flexible and extensible sampling system for OpenMAS,
 enabling agents to sample from different language models with consistent parameters.
 """
 
+import asyncio
 import json
 from enum import Enum
-from typing import Any, Dict, List, Optional, Protocol, runtime_checkable
+from typing import Any, AsyncIterator, Dict, List, Optional, Protocol, Sequence, Union, runtime_checkable
 
 from pydantic import BaseModel, Field
 
@@ -164,6 +165,60 @@ class SamplingResult(BaseModel):
         return json.dumps(self.to_dict())
 
 
+class SamplingChunk(BaseModel):
+    """An incremental piece of a streamed sampling result.
+
+    A stream yields chunks with content deltas and ends with a chunk where ``done`` is
+    True. The final chunk carries the finish reason and usage metadata, if available.
+    """
+
+    delta: str = ""
+    done: bool = False
+    finish_reason: Optional[str] = None
+    usage: Optional[Dict[str, int]] = None
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SamplingChunk":
+        """Create a chunk from a communicator stream item.
+
+        Args:
+            data: A dictionary with a "delta" field and optional "done", "finish_reason",
+                "usage" and "metadata" fields
+
+        Returns:
+            The sampling chunk
+        """
+        return cls(
+            delta=str(data.get("delta", "")),
+            done=bool(data.get("done", False)),
+            finish_reason=data.get("finish_reason"),
+            usage=data.get("usage"),
+            metadata=data.get("metadata") or {},
+        )
+
+
+async def collect_stream(stream: AsyncIterator[SamplingChunk]) -> SamplingResult:
+    """Consume a sampling stream and assemble the complete result.
+
+    Args:
+        stream: The stream of sampling chunks
+
+    Returns:
+        The sampling result with the concatenated content and the final chunk's metadata
+    """
+    parts: List[str] = []
+    result = SamplingResult(content="")
+    async for chunk in stream:
+        parts.append(chunk.delta)
+        if chunk.done:
+            result.finish_reason = chunk.finish_reason
+            result.usage = chunk.usage
+            result.metadata = chunk.metadata
+    result.content = "".join(parts)
+    return result
+
+
 @runtime_checkable
 class SamplerProtocol(Protocol):
     """Protocol for samplers."""
@@ -215,6 +270,79 @@ class BaseSampler:
         """
         raise NotImplementedError("Subclasses must implement sample")
 
+    async def sample_stream(
+        self,
+        context: SamplingContext,
+        model: Optional[str] = None,
+    ) -> AsyncIterator[SamplingChunk]:
+        """Sample from the language model, yielding content as it is generated.
+
+        The default implementation waits for :meth:`sample` and yields the complete
+        content as a single delta. Samplers backed by a streaming transport override it.
+
+        Args:
+            context: The sampling context
+            model: Optional model to use
+
+        Yields:
+            Content deltas, followed by a final chunk with ``done`` set
+        """
+        result = await self.sample(context, model)
+        if result.content:
+            yield SamplingChunk(delta=result.content)
+        yield SamplingChunk(done=True, finish_reason=result.finish_reason, usage=result.usage, metadata=result.metadata)
+
+    async def sample_batch(
+        self,
+        contexts: Sequence[SamplingContext],
+        model: Optional[str] = None,
+        max_concurrency: int = 8,
+        timeout: Optional[float] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[SamplingResult, Exception]]:
+        """Sample from many contexts, returning the results in order.
+
+        The default implementation calls :meth:`sample` from a bounded pool of workers.
+        Samplers backed by a provider with a batch endpoint override it to pack requests.
+
+        Args:
+            contexts: The sampling contexts
+            model: Optional model to use
+            max_concurrency: Maximum number of requests in flight
+            timeout: Optional timeout in seconds for each request
+            return_exceptions: Return failed requests' exceptions in place of their results
+                instead of raising the first one
+
+        Returns:
+            One result (or exception, if ``return_exceptions`` is set) per context
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+            Exception: The first failure, unless ``return_exceptions`` is set
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        results: List[Union[SamplingResult, Exception]] = [None] * len(contexts)  # type: ignore[list-item]
+        indices = iter(range(len(contexts)))
+
+        async def worker() -> None:
+            for index in indices:
+                try:
+                    results[index] = await asyncio.wait_for(self.sample(contexts[index], model), timeout)
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results[index] = e
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(min(max_concurrency, len(contexts)))]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+        return results
+
     @classmethod
     def create_context(
         cls,
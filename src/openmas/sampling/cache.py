@@ -0,0 +1,353 @@
+"""Caching of sampling results.
+
+This module provides an opt-in cache layer for samplers. Results are keyed on a canonical
+hash of the sampling context (system prompt, messages and parameters) and the model, so
+repeated identical requests are served without calling the language model again.
+
+By default only deterministic requests (temperature 0) are cached, since caching a
+non-deterministic request would change its behaviour.
+"""
+
+import abc
+import asyncio
+import hashlib
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from contextlib import closing
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Union
+
+from openmas.logging import get_logger
+from openmas.sampling.base import BaseSampler, SamplingChunk, SamplingContext, SamplingResult
+
+logger = get_logger(__name__)
+
+
+def sampling_cache_key(context: SamplingContext, model: Optional[str] = None) -> str:
+    """Compute the cache key for a sampling request.
+
+    The key is the SHA-256 of a canonical JSON encoding of the context and the effective
+    model, so contexts that differ only in dictionary ordering share a key.
+
+    Args:
+        context: The sampling context
+        model: Optional model override passed to the sampler
+
+    Returns:
+        The hex digest identifying the request
+    """
+    payload = {
+        "context": context.to_dict(),
+        "model": model or context.model,
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class SamplingCache(abc.ABC):
+    """Abstract base class for sampling result caches.
+
+    Subclasses implement storage; this class keeps hit/miss counters.
+    """
+
+    def __init__(self, ttl: Optional[float] = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Optional time-to-live for entries in seconds (None means no expiry)
+        """
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> Optional[SamplingResult]:
+        """Look up a cached result and update the hit/miss counters.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cached result, or None on a miss
+        """
+        result = await self._get(key)
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    async def set(self, key: str, result: SamplingResult) -> None:
+        """Store a result.
+
+        Args:
+            key: The cache key
+            result: The sampling result to store
+        """
+        await self._set(key, result)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache metrics.
+
+        Returns:
+            Dictionary with hits, misses and hit_rate
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def _expires_at(self) -> Optional[float]:
+        """Get the expiry timestamp for an entry stored now."""
+        return time.time() + self.ttl if self.ttl is not None else None
+
+    @abc.abstractmethod
+    async def _get(self, key: str) -> Optional[SamplingResult]:
+        """Look up a result without touching the counters."""
+
+    @abc.abstractmethod
+    async def _set(self, key: str, result: SamplingResult) -> None:
+        """Store a result."""
+
+    @abc.abstractmethod
+    async def clear(self) -> None:
+        """Remove all entries."""
+
+
+class MemorySamplingCache(SamplingCache):
+    """In-memory LRU sampling cache."""
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries before the least recently used is evicted
+            ttl: Optional time-to-live for entries in seconds
+        """
+        super().__init__(ttl=ttl)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Optional[float], SamplingResult]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Get the number of cached entries."""
+        return len(self._entries)
+
+    async def _get(self, key: str) -> Optional[SamplingResult]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at is not None and expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return result.model_copy()
+
+    async def _set(self, key: str, result: SamplingResult) -> None:
+        self._entries[key] = (self._expires_at(), result.model_copy())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+
+class SqliteSamplingCache(SamplingCache):
+    """On-disk sampling cache backed by SQLite.
+
+    The cache can be shared by several processes on the same host. Raw provider responses
+    are not persisted.
+    """
+
+    def __init__(self, path: Union[str, Path], ttl: Optional[float] = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: Path to the SQLite database file (created if missing)
+            ttl: Optional time-to-live for entries in seconds
+        """
+        super().__init__(ttl=ttl)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sampling_cache "
+                "(key TEXT PRIMARY KEY, result TEXT NOT NULL, expires_at REAL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30.0)
+
+    def _get_sync(self, key: str) -> Optional[SamplingResult]:
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute("SELECT result, expires_at FROM sampling_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[1] is not None and row[1] <= time.time():
+                conn.execute("DELETE FROM sampling_cache WHERE key = ?", (key,))
+                return None
+        return SamplingResult.model_validate_json(row[0])
+
+    def _set_sync(self, key: str, result: SamplingResult) -> None:
+        encoded = result.model_dump_json(exclude={"raw_response"})
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sampling_cache (key, result, expires_at) VALUES (?, ?, ?)",
+                (key, encoded, self._expires_at()),
+            )
+
+    def _clear_sync(self) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM sampling_cache")
+
+    async def _get(self, key: str) -> Optional[SamplingResult]:
+        return await asyncio.to_thread(self._get_sync, key)
+
+    async def _set(self, key: str, result: SamplingResult) -> None:
+        await asyncio.to_thread(self._set_sync, key, result)
+
+    async def clear(self) -> None:
+        """Remove all entries."""
+        await asyncio.to_thread(self._clear_sync)
+
+
+class CachingSampler(BaseSampler):
+    """Sampler wrapper that serves repeated requests from a SamplingCache."""
+
+    def __init__(self, sampler: BaseSampler, cache: SamplingCache, cache_nondeterministic: bool = False) -> None:
+        """Initialize the caching sampler.
+
+        Args:
+            sampler: The sampler to wrap
+            cache: The cache to use
+            cache_nondeterministic: Also cache requests with a non-zero temperature
+        """
+        super().__init__(communicator=sampler.communicator)
+        self.sampler = sampler
+        self.cache = cache
+        self.cache_nondeterministic = cache_nondeterministic
+
+    def _is_cacheable(self, context: SamplingContext) -> bool:
+        return self.cache_nondeterministic or context.parameters.temperature == 0
+
+    async def sample(
+        self,
+        context: SamplingContext,
+        model: Optional[str] = None,
+    ) -> SamplingResult:
+        """Sample from the cache, falling back to the wrapped sampler on a miss.
+
+        Args:
+            context: The sampling context
+            model: Optional model to use
+
+        Returns:
+            The sampling result
+        """
+        if not self._is_cacheable(context):
+            return await self.sampler.sample(context, model)
+
+        key = sampling_cache_key(context, model)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            logger.debug("Sampling cache hit", key=key)
+            return cached
+
+        result = await self.sampler.sample(context, model)
+        await self.cache.set(key, result)
+        return result
+
+    async def sample_stream(
+        self,
+        context: SamplingContext,
+        model: Optional[str] = None,
+    ) -> AsyncIterator[SamplingChunk]:
+        """Stream from the cache, or from the wrapped sampler while recording the result.
+
+        Args:
+            context: The sampling context
+            model: Optional model to use
+
+        Yields:
+            Content deltas, followed by a final chunk with ``done`` set
+        """
+        if not self._is_cacheable(context):
+            async for chunk in self.sampler.sample_stream(context, model):
+                yield chunk
+            return
+
+        key = sampling_cache_key(context, model)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            if cached.content:
+                yield SamplingChunk(delta=cached.content)
+            yield SamplingChunk(
+                done=True, finish_reason=cached.finish_reason, usage=cached.usage, metadata=cached.metadata
+            )
+            return
+
+        parts: List[str] = []
+        async for chunk in self.sampler.sample_stream(context, model):
+            parts.append(chunk.delta)
+            if chunk.done:
+                await self.cache.set(
+                    key,
+                    SamplingResult(
+                        content="".join(parts),
+                        finish_reason=chunk.finish_reason,
+                        usage=chunk.usage,
+                        metadata=chunk.metadata,
+                    ),
+                )
+            yield chunk
+
+    async def sample_batch(
+        self,
+        contexts: Sequence[SamplingContext],
+        model: Optional[str] = None,
+        max_concurrency: int = 8,
+        timeout: Optional[float] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[SamplingResult, Exception]]:
+        """Sample a batch, sending only the cache misses to the wrapped sampler.
+
+        Args:
+            contexts: The sampling contexts
+            model: Optional model to use
+            max_concurrency: Maximum number of requests in flight
+            timeout: Optional timeout in seconds for each request
+            return_exceptions: Return failed requests' exceptions instead of raising
+
+        Returns:
+            One result (or exception, if ``return_exceptions`` is set) per context
+        """
+        results: List[Union[SamplingResult, Exception]] = [None] * len(contexts)  # type: ignore[list-item]
+        misses: List[int] = []
+        keys: Dict[int, str] = {}
+        for index, context in enumerate(contexts):
+            if self._is_cacheable(context):
+                keys[index] = sampling_cache_key(context, model)
+                cached = await self.cache.get(keys[index])
+                if cached is not None:
+                    results[index] = cached
+                    continue
+            misses.append(index)
+
+        if misses:
+            sampled = await self.sampler.sample_batch(
+                [contexts[index] for index in misses],
+                model,
+                max_concurrency=max_concurrency,
+                timeout=timeout,
+                return_exceptions=return_exceptions,
+            )
+            for index, result in zip(misses, sampled):
+                results[index] = result
+                if index in keys and isinstance(result, SamplingResult):
+                    await self.cache.set(keys[index], result)
+        return results
@@ -4,13 +4,21 @@ This module provides a sampler that uses the MCP protocol to sample from languag
 It integrates with the existing MCP communicators in OpenMAS.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from openmas.agent.mcp import McpAgent
 from openmas.communication.base import BaseCommunicator
 from openmas.exceptions import CommunicationError
 from openmas.logging import get_logger
-from openmas.sampling.base import BaseSampler, Message, MessageRole, SamplingContext, SamplingParameters, SamplingResult
+from openmas.sampling.base import (
+    BaseSampler,
+    Message,
+    MessageRole,
+    SamplingChunk,
+    SamplingContext,
+    SamplingParameters,
+    SamplingResult,
+)
 
 # Configure logging
 logger = get_logger(__name__)
@@ -61,6 +69,50 @@ class McpSampler(BaseSampler):
 
         return await self.sample_from_context(context)
 
+    async def sample_stream(
+        self,
+        context: SamplingContext,
+        model: Optional[str] = None,
+    ) -> AsyncIterator[SamplingChunk]:
+        """Sample from the language model, yielding content as it is generated.
+
+        Uses the communicator's ``sample_prompt_stream`` when available and falls back
+        to a single delta otherwise.
+
+        Args:
+            context: The context to sample from
+            model: Optional model to use
+
+        Yields:
+            Content deltas, followed by a final chunk with ``done`` set
+        """
+        if not hasattr(self.communicator, "sample_prompt_stream"):
+            async for chunk in super().sample_stream(context, model):
+                yield chunk
+            return
+
+        if model:
+            context.model = model
+        params = context.parameters.to_dict() if context.parameters else {}
+
+        try:
+            stream = self.communicator.sample_prompt_stream(  # type: ignore
+                target_service=self.target_service,
+                messages=[msg.to_dict() for msg in context.messages],
+                system_prompt=context.system_prompt,
+                temperature=params.get("temperature", 0.7),
+                max_tokens=params.get("max_tokens"),
+                stop_sequences=params.get("stop_sequences"),
+                model_preferences={"model": context.model} if context.model else {},
+            )
+            async for item in stream:
+                yield SamplingChunk.from_dict(item)
+        except Exception as e:
+            if isinstance(e, CommunicationError):
+                raise
+            logger.exception("Error during streamed sampling: %s", str(e))
+            raise CommunicationError(f"Error during sampling: {str(e)}") from e
+
     async def sample_text(
         self,
         prompt: str,
@@ -376,6 +428,48 @@ class McpAgentSampler(BaseSampler):
                 target=self.target_service,
             ) from e
 
+    async def sample_stream(
+        self,
+        context: SamplingContext,
+        model: Optional[str] = None,
+    ) -> AsyncIterator[SamplingChunk]:
+        """Sample from the language model using the MCP agent, yielding content as it is generated.
+
+        Args:
+            context: The sampling context
+            model: Optional model to use (overrides default_model)
+
+        Yields:
+            Content deltas, followed by a final chunk with ``done`` set
+
+        Raises:
+            AttributeError: If the agent doesn't support sampling
+            CommunicationError: If there's an error communicating with the service
+        """
+        params = context.parameters
+        model_name = model or context.model or self.default_model
+
+        try:
+            stream = self.agent.sample_prompt_stream(
+                target_service=self.target_service,
+                messages=[message.to_dict() for message in context.messages],
+                system_prompt=context.system_prompt,
+                temperature=params.temperature,
+                max_tokens=params.max_tokens,
+                stop_sequences=params.stop_sequences,
+                model_preferences={"model": model_name} if model_name else None,
+            )
+            async for item in stream:
+                yield SamplingChunk.from_dict(item)
+        except Exception as e:
+            logger.error(f"Error sampling from {self.target_service}: {e}")
+            if isinstance(e, (AttributeError, CommunicationError)):
+                raise
+            raise CommunicationError(
+                f"Error sampling from {self.target_service}: {e}",
+                target=self.target_service,
+            ) from e
+
     async def sample_text(
         self,
         prompt: str,
@@ -504,7 +504,7 @@ class MockCommunicator(BaseCommunicator):
             handler: The handler function
         """
         self._record_call("register_handler", method, handler)
-        self._handlers[method] = handler
+        self._handlers[method] = self._prepare_handler(handler)
         logger.debug(
             "Registered handler for method",
             agent_name=self.agent_name,
@@ -2,11 +2,13 @@
 
 import asyncio
 from typing import Dict
+from unittest import mock
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from openmas.agent.bdi import BdiAgent
+from openmas.config import AgentConfig
 
 # Note: bdi_agent fixture is imported from conftest.py
 
@@ -208,3 +210,186 @@ class TestBdiAgent:
         assert bdi_agent.deliberate.called
         assert bdi_agent.plan.called
         assert bdi_agent.execute_intentions.called
+
+    @pytest.mark.asyncio
+    async def test_event_driven_cycle_runs_only_on_changes(self, config) -> None:
+        """In event-driven mode the cycle runs once at start and then only when woken."""
+        agent = BdiAgent(config=config, event_driven=True)
+        agent.update_beliefs = AsyncMock()
+
+        task = asyncio.create_task(agent._run_bdi_cycle())
+        try:
+            await asyncio.sleep(0.05)
+            assert agent.update_beliefs.await_count == 1
+
+            # Several changes before the cycle wakes are coalesced into one run
+            agent.add_belief("a", 1)
+            agent.add_belief("b", 2)
+            agent.add_desire("explore")
+            await asyncio.sleep(0.05)
+            assert agent.update_beliefs.await_count == 2
+
+            # Setting a belief to its current value is not a change
+            agent.add_belief("a", 1)
+            await asyncio.sleep(0.05)
+            assert agent.update_beliefs.await_count == 2
+
+            agent.schedule_cycle(0.01)
+            await asyncio.sleep(0.05)
+            assert agent.update_beliefs.await_count == 3
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_event_driven_cycle_settles_when_plan_reasserts_intentions(self, config) -> None:
+        """Re-adding an unchanged intention every cycle does not wake the cycle again."""
+        agent = BdiAgent(config=config, event_driven=True)
+        agent.on_intention_change = AsyncMock()
+        cycles = 0
+
+        async def plan() -> None:
+            nonlocal cycles
+            cycles += 1
+            agent.add_intention({"id": "patrol", "steps": ["a", "b"]})
+
+        agent.plan = plan  # type: ignore[method-assign]
+
+        task = asyncio.create_task(agent._run_bdi_cycle())
+        try:
+            await asyncio.sleep(0.1)
+            # One run at start, and one for the change the first run made
+            assert cycles == 2
+            assert agent.on_intention_change.await_count == 1
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_bulk_belief_updates_are_batched(self, bdi_agent: BdiAgent) -> None:
+        """A burst of belief changes is delivered as one diff by a single dispatcher task."""
+        bdi_agent.on_beliefs_changed = AsyncMock()
+        bdi_agent.on_belief_change = AsyncMock()
+
+        bdi_agent.add_beliefs({f"cell_{i}": i for i in range(1000)})
+        bdi_agent.add_belief("cell_0", "updated")
+        bdi_agent.remove_belief("cell_1")
+        assert len(bdi_agent._background_tasks) == 1
+        assert bdi_agent.pending_notifications == 1000
+
+        await bdi_agent.flush_notifications()
+
+        bdi_agent.on_beliefs_changed.assert_awaited_once()
+        diff = bdi_agent.on_beliefs_changed.call_args.args[0]
+        assert len(diff) == 1000
+        assert diff["cell_0"] == "updated"
+        assert diff["cell_1"] is None
+        assert bdi_agent.on_belief_change.await_count == 1000
+        assert bdi_agent.pending_notifications == 0
+
+    @pytest.mark.asyncio
+    async def test_notifications_are_ordered_and_isolated(self, bdi_agent: BdiAgent) -> None:
+        """Hooks run in change order and a failing hook does not stop delivery."""
+        delivered = []
+
+        async def on_intention_change(intention, added):
+            delivered.append((intention["id"], added))
+            if intention["id"] == "a":
+                raise RuntimeError("hook failed")
+
+        bdi_agent.on_intention_change = on_intention_change
+        bdi_agent.on_desire_change = AsyncMock()
+
+        bdi_agent.add_intention({"id": "a"})
+        bdi_agent.add_intention({"id": "b"})
+        bdi_agent.remove_intention("a")
+        bdi_agent.add_desire("explore")
+        bdi_agent.remove_desire("explore")
+        await bdi_agent.flush_notifications()
+
+        assert delivered == [("a", True), ("b", True), ("a", False)]
+        assert bdi_agent.on_desire_change.await_args_list == [mock.call("explore", True), mock.call("explore", False)]
+
+    @pytest.mark.asyncio
+    async def test_belief_changes_keep_their_place_among_other_changes(self, bdi_agent: BdiAgent) -> None:
+        """Belief changes are delivered in order with desire changes, coalescing only consecutive ones."""
+        delivered = []
+
+        async def on_beliefs_changed(diff):
+            delivered.append(("beliefs", dict(diff)))
+
+        async def on_desire_change(desire, added):
+            delivered.append(("desire", desire))
+
+        bdi_agent.on_beliefs_changed = on_beliefs_changed
+        bdi_agent.on_desire_change = on_desire_change
+
+        bdi_agent.add_belief("door", "open")
+        bdi_agent.add_belief("door", "closed")
+        bdi_agent.add_desire("leave")
+        bdi_agent.add_belief("door", "open")
+        assert bdi_agent.pending_notifications == 3
+        await bdi_agent.flush_notifications()
+
+        assert delivered == [("beliefs", {"door": "closed"}), ("desire", "leave"), ("beliefs", {"door": "open"})]
+
+    @pytest.mark.asyncio
+    async def test_producers_wait_for_notification_capacity(self, config: AgentConfig) -> None:
+        """Waiting for capacity blocks while too many notifications are pending, until the hooks catch up."""
+        agent = BdiAgent(config=config, max_pending_notifications=10)
+        release = asyncio.Event()
+
+        async def on_desire_change(desire, added):
+            await release.wait()
+
+        agent.on_desire_change = on_desire_change
+        for i in range(20):
+            agent.add_desire(f"d{i}")
+
+        waiter = asyncio.create_task(agent.wait_for_notification_capacity())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        release.set()
+        await asyncio.wait_for(waiter, timeout=1)
+        assert agent.pending_notifications < 10
+        await agent.flush_notifications()
+        with pytest.raises(ValueError, match="max_pending_notifications"):
+            BdiAgent(config=config, max_pending_notifications=0)
+
+    def test_belief_queries_and_intention_index(self, bdi_agent: BdiAgent) -> None:
+        """Beliefs can be queried by pattern and tag, and intentions are indexed by ID."""
+        bdi_agent.add_belief("room.kitchen.temperature", 21, tags=["sensor"])
+        bdi_agent.add_belief("room.hall.temperature", 18, tags=["sensor"])
+        seen = bdi_agent.belief_version
+        bdi_agent.add_belief("room.hall.temperature", 19)
+
+        assert bdi_agent.query_beliefs("room.*.temperature", predicate=lambda _, value: value > 20) == {
+            "room.kitchen.temperature": 21
+        }
+        assert len(bdi_agent.query_beliefs(tag="sensor")) == 2
+        assert bdi_agent.beliefs_changed_since(seen) == {"room.hall.temperature": 19}
+        assert bdi_agent.beliefs["room.kitchen.temperature"] == 21
+
+        bdi_agent.add_intention({"id": "a", "step": 1})
+        bdi_agent.add_intention({"id": "b"})
+        bdi_agent.add_intention({"id": "a", "step": 2})
+        assert bdi_agent.get_intention("a") == {"id": "a", "step": 2}
+        assert [intention["id"] for intention in bdi_agent.get_all_intentions()] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_replaced_intention_is_reported_removed(self, bdi_agent: BdiAgent) -> None:
+        """Adding an intention with an existing ID reports the old one as removed before the new one."""
+        bdi_agent.on_intention_change = AsyncMock()
+        first = {"id": "a", "step": 1}
+        second = {"id": "a", "step": 2}
+
+        bdi_agent.add_intention(first)
+        bdi_agent.add_intention(second)
+        await bdi_agent.flush_notifications()
+
+        assert bdi_agent.on_intention_change.await_args_list == [
+            mock.call(first, True),
+            mock.call(first, False),
+            mock.call(second, True),
+        ]
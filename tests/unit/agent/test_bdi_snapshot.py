@@ -0,0 +1,189 @@
+"""Tests for BDI state snapshots."""
+
+import json
+
+import pytest
+
+from openmas.agent.bdi import BdiAgent
+from openmas.agent.bdi_snapshot import BdiSnapshotStore
+from openmas.config import AgentConfig
+
+
+def _agent(tmp_path, **kwargs) -> BdiAgent:
+    """Create a BDI agent persisting to tmp_path/state."""
+    return BdiAgent(
+        config=AgentConfig(name="snapshot-agent"),
+        project_root=tmp_path,
+        snapshot_dir=tmp_path / "state",
+        **kwargs,
+    )
+
+
+class TestBdiSnapshotStore:
+    """Tests for the BdiSnapshotStore class."""
+
+    def test_snapshot_and_journal_replay(self, tmp_path) -> None:
+        """Loading applies journal records written after the snapshot."""
+        store = BdiSnapshotStore(tmp_path)
+        assert store.load() is None
+
+        store.write_snapshot(
+            {"beliefs": {"a": [1, []], "b": [2, ["x"]]}, "desires": ["explore"], "intentions": [{"id": "i1"}]}
+        )
+        store.append({"beliefs": {"a": [10, []]}, "removed_beliefs": ["b"], "desires": {"rest": True}})
+        store.append({"desires": {"explore": False}, "intentions": [{"id": "i2"}], "removed_intentions": ["i1"]})
+        # A crash mid-write leaves a truncated last line
+        with store.journal_path.open("a") as f:
+            f.write('{"seq": 99, "beliefs": {"c"')
+
+        state = BdiSnapshotStore(tmp_path).load()
+        assert state == {"beliefs": {"a": [10, []]}, "desires": ["rest"], "intentions": [{"id": "i2"}]}
+
+    def test_snapshot_clears_journal(self, tmp_path) -> None:
+        """Writing a snapshot folds the journal into it."""
+        store = BdiSnapshotStore(tmp_path)
+        store.append({"beliefs": {"a": [1, []]}})
+        store.write_snapshot({"beliefs": {"a": [1, []]}, "desires": [], "intentions": []})
+
+        assert not store.journal_path.exists()
+        assert json.loads(store.snapshot_path.read_text())["seq"] == 1
+
+        store.append({"beliefs": {"a": [2, []]}})
+        state = BdiSnapshotStore(tmp_path).load()
+        assert state is not None
+        assert state["beliefs"] == {"a": [2, []]}
+
+    def test_append_after_torn_record(self, tmp_path) -> None:
+        """A torn last record is cut off, so records appended after a crash are not lost."""
+        store = BdiSnapshotStore(tmp_path)
+        store.append({"beliefs": {"a": [1, []]}})
+        with store.journal_path.open("a") as f:
+            f.write('{"seq": 2, "beliefs": {"b"')
+
+        restarted = BdiSnapshotStore(tmp_path)
+        restarted.load()
+        restarted.append({"beliefs": {"c": [3, []]}})
+
+        state = BdiSnapshotStore(tmp_path).load()
+        assert state is not None
+        assert state["beliefs"] == {"a": [1, []], "c": [3, []]}
+
+    def test_append_after_record_without_newline(self, tmp_path) -> None:
+        """A complete last record whose line terminator was not written is kept."""
+        store = BdiSnapshotStore(tmp_path)
+        store.append({"beliefs": {"a": [1, []]}})
+        store.journal_path.write_text(store.journal_path.read_text().rstrip("\n"))
+
+        restarted = BdiSnapshotStore(tmp_path)
+        restarted.load()
+        restarted.append({"beliefs": {"b": [2, []]}})
+
+        state = BdiSnapshotStore(tmp_path).load()
+        assert state is not None
+        assert state["beliefs"] == {"a": [1, []], "b": [2, []]}
+
+
+class TestBdiAgentSnapshots:
+    """Tests for snapshot integration in BdiAgent."""
+
+    @pytest.mark.asyncio
+    async def test_state_survives_restart(self, tmp_path) -> None:
+        """A new agent restores the beliefs, desires and intentions saved by the previous one."""
+        agent = _agent(tmp_path)
+        agent.add_belief("room.kitchen.temperature", 21, tags=["sensor"])
+        agent.add_desire("explore")
+        agent.add_intention({"id": "patrol", "steps": ["a", "b"]})
+        await agent.save_snapshot()
+
+        # Changes after the snapshot go to the journal
+        agent.add_belief("battery", 0.5)
+        agent.remove_desire("explore")
+        await agent.flush_journal()
+
+        restarted = _agent(tmp_path)
+        assert await restarted.restore_snapshot() is True
+        assert restarted.get_all_beliefs() == {"room.kitchen.temperature": 21, "battery": 0.5}
+        assert restarted.query_beliefs(tag="sensor") == {"room.kitchen.temperature": 21}
+        assert restarted.get_all_desires() == set()
+        assert restarted.get_intention("patrol") == {"id": "patrol", "steps": ["a", "b"]}
+
+    @pytest.mark.asyncio
+    async def test_start_restores_and_stop_saves(self, tmp_path, mock_communicator) -> None:
+        """start() restores saved state and stop() writes a final snapshot."""
+        BdiSnapshotStore(tmp_path / "state").write_snapshot(
+            {"beliefs": {"door": ["open", []]}, "desires": [], "intentions": []}
+        )
+        agent = _agent(tmp_path, bdi_enabled=False)
+        agent.communicator = mock_communicator
+
+        await agent.start()
+        assert agent.get_belief("door") == "open"
+        agent.add_belief("door", "closed")
+        await agent.stop()
+
+        state = BdiSnapshotStore(tmp_path / "state").load()
+        assert state is not None
+        assert state["beliefs"] == {"door": ["closed", []]}
+
+    @pytest.mark.asyncio
+    async def test_intentions_without_id_survive_restart(self, tmp_path) -> None:
+        """Intentions added without an id get a stable one, so journaled removals replay correctly."""
+        agent = _agent(tmp_path)
+        agent.add_intention({"goal": "patrol"})
+        agent.add_intention({"goal": "charge"})
+        await agent.save_snapshot()
+        assert [intention["id"] for intention in agent.get_all_intentions()] == ["intention-1", "intention-2"]
+
+        agent.remove_intention("intention-1")
+        await agent.flush_journal()
+
+        restarted = _agent(tmp_path)
+        await restarted.restore_snapshot()
+        assert restarted.get_all_intentions() == [{"goal": "charge", "id": "intention-2"}]
+        # Numbering continues after the restored ids
+        restarted.add_intention({"goal": "dock"})
+        assert restarted.get_intention("intention-3") == {"goal": "dock", "id": "intention-3"}
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_changes(self, tmp_path) -> None:
+        """Changes that cannot be written stay in the journal instead of being dropped."""
+        agent = _agent(tmp_path)
+        agent.add_belief("a", 1)
+        agent.add_belief("bad", object())
+        with pytest.raises(TypeError):
+            await agent.flush_journal()
+
+        agent.add_belief("bad", "fixed")
+        await agent.flush_journal()
+
+        state = BdiSnapshotStore(tmp_path / "state").load()
+        assert state is not None
+        assert state["beliefs"] == {"a": [1, []], "bad": ["fixed", []]}
+
+    @pytest.mark.asyncio
+    async def test_state_is_serialized_before_writing(self, tmp_path) -> None:
+        """Changes made while the journal is written in a thread do not leak into the record."""
+        agent = _agent(tmp_path)
+        route = ["a"]
+        agent.add_belief("route", route)
+        store = agent._snapshot_store
+        assert store is not None
+        append_record = store.append_record
+
+        def mutate_then_append(record: str) -> None:
+            route.append("b")
+            append_record(record)
+
+        store.append_record = mutate_then_append  # type: ignore[method-assign]
+        await agent.flush_journal()
+
+        state = BdiSnapshotStore(tmp_path / "state").load()
+        assert state is not None
+        assert state["beliefs"] == {"route": [["a"], []]}
+
+    @pytest.mark.asyncio
+    async def test_without_snapshot_dir(self, bdi_agent: BdiAgent) -> None:
+        """Persistence is a no-op when no snapshot directory is configured."""
+        bdi_agent.add_belief("a", 1)
+        await bdi_agent.save_snapshot()
+        assert await bdi_agent.restore_snapshot() is False
@@ -0,0 +1,85 @@
+"""Tests for the indexed belief base."""
+
+import pytest
+
+from openmas.agent.beliefs import BeliefBase
+
+
+@pytest.fixture
+def beliefs() -> BeliefBase:
+    """Create a belief base with a few dotted, tagged beliefs."""
+    base = BeliefBase()
+    base.set("room.kitchen.temperature", 21, tags=["sensor"])
+    base.set("room.kitchen.light", "on")
+    base.set("room.hall.temperature", 18, tags=["sensor"])
+    base.set("battery", 0.8, tags=["sensor", "critical"])
+    return base
+
+
+class TestBeliefBase:
+    """Tests for the BeliefBase class."""
+
+    def test_prefix_and_tag_indexes(self, beliefs: BeliefBase) -> None:
+        """Beliefs can be looked up by dotted prefix and by tag."""
+        assert beliefs.with_prefix("room.kitchen") == {"room.kitchen.temperature": 21, "room.kitchen.light": "on"}
+        assert set(beliefs.with_prefix("room")) == {
+            "room.kitchen.temperature",
+            "room.kitchen.light",
+            "room.hall.temperature",
+        }
+        assert beliefs.with_tag("critical") == {"battery": 0.8}
+
+        beliefs.remove("room.kitchen.light")
+        beliefs.set("battery", 0.7, tags=[])
+        assert beliefs.with_prefix("room.kitchen") == {"room.kitchen.temperature": 21}
+        assert beliefs.with_tag("critical") == {}
+        assert beliefs.tags_of("room.hall.temperature") == {"sensor"}
+
+    def test_query(self, beliefs: BeliefBase) -> None:
+        """Queries combine wildcard patterns, tags and predicates."""
+        assert beliefs.query("room.*.temperature") == {"room.kitchen.temperature": 21, "room.hall.temperature": 18}
+        assert beliefs.query("battery") == {"battery": 0.8}
+        assert beliefs.query(tag="sensor", predicate=lambda name, value: value > 20) == {"room.kitchen.temperature": 21}
+        assert beliefs.query("*.light") == {"room.kitchen.light": "on"}
+        assert beliefs.query("garden.*") == {}
+
+    def test_versions_and_changed_since(self, beliefs: BeliefBase) -> None:
+        """Only real changes bump versions, and changed_since reports them including removals."""
+        start = beliefs.version
+        assert beliefs.set("battery", 0.8) is False
+        assert beliefs.version == start
+
+        beliefs.set("room.hall.temperature", 19)
+        beliefs.remove("room.kitchen.light")
+        assert beliefs.version == start + 2
+        assert beliefs.version_of("room.hall.temperature") == start + 1
+        assert beliefs.changed_since(start) == {"room.kitchen.light": None, "room.hall.temperature": 19}
+        assert beliefs.changed_since(beliefs.version) == {}
+
+    def test_tombstones_are_capped(self) -> None:
+        """Only the most recent removals are remembered, and compacted_version says how far back."""
+        beliefs = BeliefBase(max_tombstones=2)
+        for name in "abcd":
+            beliefs.set(name, 1)
+        beliefs.remove("a")
+        removed_a = beliefs.version
+        beliefs.remove("b")
+        beliefs.remove("c")
+        # Re-adding a removed belief turns its tombstone back into a live entry
+        beliefs.set("b", 2)
+
+        assert beliefs.compacted_version == removed_a
+        assert beliefs.version_of("a") == 0
+        assert beliefs.changed_since(0) == {"b": 2, "c": None, "d": 1}
+        assert len(beliefs._changes) == 3
+
+    def test_mapping_interface(self, beliefs: BeliefBase) -> None:
+        """The belief base supports dictionary-style access."""
+        beliefs["mode"] = "auto"
+        assert beliefs["mode"] == "auto"
+        assert "mode" in beliefs
+        del beliefs["mode"]
+        assert beliefs.get("mode") is None
+        with pytest.raises(KeyError):
+            del beliefs["mode"]
+        assert len(beliefs) == 4
@@ -253,6 +253,49 @@ class TestMcpAgent:
                     target_service="test_service", messages=[{"role": "user", "content": "Hello"}]
                 )
 
+    @pytest.mark.asyncio
+    async def test_sample_prompt_stream_passes_through_communicator_stream(self):
+        """Test that sample_prompt_stream forwards chunks from a streaming communicator."""
+        config = AgentConfig(name="test_agent", log_level="INFO", service_urls={})
+        agent = McpAgent(config=config)
+
+        async def fake_stream(**kwargs):
+            yield {"delta": "a"}
+            yield {"delta": "", "done": True}
+
+        communicator = AsyncMock()
+        communicator.sample_prompt_stream = mock.MagicMock(side_effect=fake_stream)
+        agent.set_communicator(communicator)
+
+        chunks = [
+            chunk
+            async for chunk in agent.sample_prompt_stream(
+                target_service="test_service", messages=[{"role": "user", "content": "Hello"}]
+            )
+        ]
+
+        assert chunks == [{"delta": "a"}, {"delta": "", "done": True}]
+        communicator.sample_prompt.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_sample_prompt_stream_falls_back_to_sample_prompt(self):
+        """Test that sample_prompt_stream yields a single delta for non-streaming communicators."""
+        config = AgentConfig(name="test_agent", log_level="INFO", service_urls={})
+        agent = McpAgent(config=config)
+
+        communicator = AsyncMock(spec=["sample_prompt"])
+        communicator.sample_prompt = AsyncMock(return_value={"content": "full", "usage": {"output_tokens": 1}})
+        agent.set_communicator(communicator)
+
+        chunks = [
+            chunk
+            async for chunk in agent.sample_prompt_stream(
+                target_service="test_service", messages=[{"role": "user", "content": "Hello"}]
+            )
+        ]
+
+        assert chunks == [{"delta": "full"}, {"delta": "", "done": True, "usage": {"output_tokens": 1}}]
+
     @pytest.mark.asyncio
     async def test_call_tool(self):
         """Test the call_tool method."""
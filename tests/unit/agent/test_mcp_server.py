@@ -110,6 +110,7 @@ class TestMcpServerAgent:
             agent_name="sse_server",
             service_urls={},
             server_mode=True,
+            http_host="0.0.0.0",
             http_port=8888,
             server_instructions="Test instructions",
         )
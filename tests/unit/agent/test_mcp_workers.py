@@ -0,0 +1,222 @@
+"""Unit tests for the multi-worker MCP SSE server support."""
+
+import asyncio
+from typing import Any, List, Optional, Tuple
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from openmas.agent.mcp_server import McpServerAgent
+from openmas.agent.mcp_workers import McpServerWorkerPool, SseSessionRouter, _endpoint_session_id
+from openmas.exceptions import ConfigurationError
+
+
+async def _start_fake_worker(
+    name: str, session_id: str, heads: Optional[List[bytes]] = None
+) -> Tuple[asyncio.AbstractServer, int]:
+    """Start a fake HTTP worker that announces a session on /sse and echoes its name otherwise."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        head = await reader.readuntil(b"\r\n\r\n")
+        if heads is not None:
+            heads.append(head)
+        if head.startswith(b"GET /sse"):
+            body = f"event: endpoint\r\ndata: /messages/?session_id={session_id}\r\n\r\n".encode()
+        else:
+            body = name.encode()
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\nConnection: close\r\n\r\n" % len(body) + body)
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+async def _http_get(port: int, target: str, headers: str = "") -> bytes:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {target} HTTP/1.1\r\nHost: test\r\n{headers}\r\n".encode())
+    await writer.drain()
+    data = await reader.read()
+    writer.close()
+    return data
+
+
+class TestSseSessionRouter:
+    """Tests for the sticky SSE session router."""
+
+    def test_pick_worker_round_robin(self):
+        """New connections are spread across workers."""
+        router = SseSessionRouter("127.0.0.1", 0, [1001, 1002, 1003])
+        assert [router.pick_worker(b"/sse") for _ in range(4)] == [0, 1, 2, 0]
+
+    def test_pick_worker_sticky_and_forget(self):
+        """Requests for a known session go to its worker until the worker is forgotten."""
+        router = SseSessionRouter("127.0.0.1", 0, [1001, 1002])
+        router._sessions["abc123"] = 1
+        assert router.pick_worker(b"/messages/?session_id=ABC123") == 1
+        assert router.pick_worker(b"/messages/?session_id=abc123") == 1
+
+        router.forget_worker(1)
+        assert router.sessions == {}
+
+    @pytest.mark.asyncio
+    async def test_routes_posts_to_session_owner(self):
+        """The router learns session IDs from SSE streams and pins later requests."""
+        servers: List[asyncio.AbstractServer] = []
+        ports: List[int] = []
+        for index in range(2):
+            server, port = await _start_fake_worker(f"worker-{index}", f"{index:032x}")
+            servers.append(server)
+            ports.append(port)
+
+        router = SseSessionRouter("127.0.0.1", 0, ports)
+        await router.start()
+        try:
+            # Open one SSE stream per worker (round-robin assigns 0 then 1)
+            assert b"session_id=" in await _http_get(router.port, "/sse")
+            assert b"session_id=" in await _http_get(router.port, "/sse")
+
+            # Sessions are dropped when their SSE stream closes, so re-register to test routing
+            router._sessions[f"{1:032x}"] = 1
+            response = await _http_get(router.port, f"/messages/?session_id={1:032x}")
+            assert response.endswith(b"worker-1")
+        finally:
+            await router.stop()
+            for server in servers:
+                server.close()
+
+    def test_endpoint_session_id(self):
+        """Only the endpoint event opening an SSE stream announces a session."""
+        head = b"HTTP/1.1 200 OK\r\ncontent-type: text/event-stream; charset=utf-8\r\n"
+        event = b"event: endpoint\r\ndata: /messages/?session_id=ABC123\r\n\r\n"
+
+        assert _endpoint_session_id(head + b"\r\n" + event) == "abc123"
+        assert _endpoint_session_id(head + b"transfer-encoding: chunked\r\n\r\n3c\r\n" + event) == "abc123"
+        # Incomplete, not an event stream, or mentioned by a later event
+        assert _endpoint_session_id(head + b"\r\n" + event[:40]) is None
+        assert _endpoint_session_id(b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\n\r\n" + event) is None
+        message = b"event: message\r\ndata: see /messages/?session_id=def456\r\n\r\n"
+        assert _endpoint_session_id(head + b"\r\n" + message + event) is None
+
+    @pytest.mark.asyncio
+    async def test_responses_cannot_take_over_sessions(self):
+        """A response mentioning another client's session neither re-routes nor drops it."""
+        session_id = f"{7:032x}"
+        servers: List[asyncio.AbstractServer] = []
+        ports: List[int] = []
+        for index in range(2):
+            server, port = await _start_fake_worker(f"data: /messages/?session_id={session_id}\r\n", "0" * 32)
+            servers.append(server)
+            ports.append(port)
+
+        router = SseSessionRouter("127.0.0.1", 0, ports)
+        router._sessions[session_id] = 1
+        await router.start()
+        try:
+            for _ in range(2):
+                await _http_get(router.port, "/messages/")
+        finally:
+            await router.stop()
+            for server in servers:
+                server.close()
+
+        assert router.sessions == {session_id: 1}
+
+    @pytest.mark.asyncio
+    async def test_requests_ask_workers_to_close_the_connection(self):
+        """Keep-alive is replaced by Connection: close, so every request is routed on its own connection."""
+        heads: List[bytes] = []
+        server, port = await _start_fake_worker("worker", "0" * 32, heads)
+        router = SseSessionRouter("127.0.0.1", 0, [port])
+        await router.start()
+        try:
+            await _http_get(router.port, "/messages/", "Connection: keep-alive\r\nKeep-Alive: timeout=5\r\n")
+        finally:
+            await router.stop()
+            server.close()
+
+        assert heads == [b"GET /messages/ HTTP/1.1\r\nHost: test\r\nConnection: close\r\n\r\n"]
+
+    @pytest.mark.asyncio
+    async def test_unavailable_worker_returns_bad_gateway(self):
+        """A worker that refuses connections yields a 502 response."""
+        server, port = await _start_fake_worker("worker", "0" * 32)
+        server.close()
+        await server.wait_closed()
+
+        router = SseSessionRouter("127.0.0.1", 0, [port])
+        await router.start()
+        try:
+            response = await _http_get(router.port, "/sse")
+            assert response.startswith(b"HTTP/1.1 502")
+        finally:
+            await router.stop()
+
+
+class ModelServer(McpServerAgent):
+    """A server subclass with a required argument of its own."""
+
+    def __init__(self, model_path: str, **kwargs: Any) -> None:
+        self.model_path = model_path
+        super().__init__(**kwargs)
+
+
+class TestMcpServerWorkers:
+    """Tests for McpServerAgent worker configuration."""
+
+    def test_pool_rejects_invalid_worker_count(self):
+        """The pool needs at least one worker."""
+        with pytest.raises(ValueError):
+            McpServerWorkerPool(agent_class=McpServerAgent, agent_kwargs={}, workers=0)
+
+    def test_single_worker_binds_the_configured_host(self):
+        """The SSE communicator listens on the agent's host, as the loopback-only workers rely on."""
+        agent = McpServerAgent(name="test", config={"name": "test"}, host="127.0.0.1", port=0)
+
+        agent.setup_communicator()
+
+        assert agent.communicator.http_host == "127.0.0.1"
+
+    def test_agent_rejects_workers_for_stdio(self):
+        """Multiple workers are only supported for SSE servers."""
+        with pytest.raises(ConfigurationError):
+            McpServerAgent(name="test", config={"name": "test"}, server_type="stdio", workers=2)
+
+    def test_worker_kwargs_include_subclass_arguments(self):
+        """Workers get the arguments a subclass consumes itself, however they were passed."""
+        agent = ModelServer("model.bin", name="test", config={"name": "test"}, port=0, workers=2)
+
+        assert agent.worker_kwargs() == {
+            "model_path": "model.bin",
+            "name": "test",
+            "config": {"name": "test"},
+            "port": 0,
+            "workers": 2,
+        }
+        worker = ModelServer(**{**agent.worker_kwargs(), "host": "127.0.0.1", "workers": 1})
+        assert worker.model_path == "model.bin"
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop_server_use_worker_pool(self):
+        """start_server/stop_server delegate to the worker pool when workers > 1."""
+        agent = McpServerAgent(name="test", config={"name": "test"}, port=0, workers=2)
+
+        pool = MagicMock()
+        pool.start = AsyncMock()
+        pool.stop = AsyncMock()
+        pool.wait_until_ready = AsyncMock(return_value=True)
+        with patch("openmas.agent.mcp_server.McpServerWorkerPool", return_value=pool) as mock_pool_class:
+            await agent.start_server(instructions="Be helpful")
+
+        kwargs = mock_pool_class.call_args.kwargs
+        assert kwargs["agent_class"] is McpServerAgent
+        assert kwargs["workers"] == 2
+        assert kwargs["instructions"] == "Be helpful"
+        assert kwargs["agent_kwargs"]["name"] == "test"
+        pool.start.assert_awaited_once()
+
+        assert await agent.wait_until_ready() is True
+
+        await agent.stop_server()
+        pool.stop.assert_awaited_once()
+        assert agent._worker_pool is None
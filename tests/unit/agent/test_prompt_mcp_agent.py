@@ -7,7 +7,7 @@ import pytest
 from openmas.agent.mcp_prompt import PromptMcpAgent
 from openmas.config import AgentConfig
 from openmas.prompt.base import Prompt, PromptContent, PromptManager, PromptMetadata
-from openmas.sampling import SamplingResult
+from openmas.sampling import SamplingChunk, SamplingResult, collect_stream
 
 
 class TestPromptMcpAgent:
@@ -341,3 +341,59 @@ class TestPromptMcpAgent:
 
         # Check the result
         assert result is mock_result
+
+    @pytest.mark.asyncio
+    async def test_chat_stream(self, agent):
+        """Test chat_stream yields the sampler's chunks."""
+
+        async def fake_stream(context, model=None):
+            yield SamplingChunk(delta="Hel")
+            yield SamplingChunk(delta="lo")
+            yield SamplingChunk(done=True, usage={"output_tokens": 2})
+
+        mock_sampler = MagicMock()
+        mock_sampler.create_context = MagicMock()
+        mock_sampler.sample_stream = MagicMock(side_effect=fake_stream)
+        agent._sampler = mock_sampler
+
+        result = await collect_stream(agent.chat_stream(messages=[{"role": "user", "content": "Hi"}], model="claude-3"))
+
+        assert result.content == "Hello"
+        assert result.usage == {"output_tokens": 2}
+        assert mock_sampler.sample_stream.call_args.args[1] == "claude-3"
+
+    @pytest.mark.asyncio
+    async def test_sample_stream_prompt_not_found(self, agent):
+        """Test sample_stream raises for unknown prompts."""
+        agent.prompt_manager.get_prompt = AsyncMock(return_value=None)
+
+        with pytest.raises(ValueError, match="Prompt not found"):
+            await collect_stream(agent.sample_stream("missing"))
+
+    @pytest.mark.asyncio
+    async def test_sample_batch(self, agent):
+        """Test sample_batch renders the prompt per context and delegates to the sampler."""
+        prompt = Prompt(
+            metadata=PromptMetadata(name="greeting"),
+            content=PromptContent(template="Hello {{name}}"),
+        )
+        agent.prompt_manager.get_prompt = AsyncMock(return_value=prompt)
+
+        mock_sampler = MagicMock()
+        mock_sampler.sample_batch = AsyncMock(return_value=[SamplingResult(content="a"), SamplingResult(content="b")])
+        agent._sampler = mock_sampler
+
+        results = await agent.sample_batch(
+            "greeting", [{"name": "Ada"}, {"name": "Bob"}], parameters={"temperature": 0}, max_concurrency=4, timeout=5
+        )
+
+        assert [result.content for result in results] == ["a", "b"]
+        agent.prompt_manager.get_prompt.assert_awaited_once_with("greeting")
+        contexts = mock_sampler.sample_batch.call_args.args[0]
+        assert [context.messages[0].content for context in contexts] == ["Hello Ada", "Hello Bob"]
+        assert contexts[0].parameters.temperature == 0
+        assert mock_sampler.sample_batch.call_args.kwargs == {
+            "max_concurrency": 4,
+            "timeout": 5,
+            "return_exceptions": False,
+        }
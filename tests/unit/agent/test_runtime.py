@@ -0,0 +1,188 @@
+"""Tests for the multi-agent runtime."""
+
+import asyncio
+from typing import Any, Dict
+
+import pytest
+from pydantic import BaseModel
+
+from openmas.agent import AgentRuntime, BaseAgent
+from openmas.communication import LocalRouter
+from openmas.communication.mcp import McpStdioCommunicator
+from openmas.config import AgentConfig
+from openmas.exceptions import CommunicationError, ConfigurationError, MethodNotFoundError, ServiceNotFoundError
+
+
+class EchoAgent(BaseAgent):
+    """Agent answering "echo" requests and idling until stopped."""
+
+    def __init__(self, name: str, tmp_path: Any, fail_runs: int = 0, run_forever: bool = True) -> None:
+        super().__init__(config=AgentConfig(name=name), project_root=tmp_path)
+        self.fail_runs = fail_runs
+        self.run_forever = run_forever
+        self.starts = 0
+
+    async def setup(self) -> None:
+        self.starts += 1
+
+        async def echo(params: Dict[str, Any]) -> Dict[str, Any]:
+            return {"from": self.name, **params}
+
+        # Register directly so no HTTP server is started
+        self.communicator.handlers["echo"] = echo
+
+    async def run(self) -> None:
+        if self.fail_runs > 0:
+            self.fail_runs -= 1
+            raise RuntimeError("crashed")
+        if self.run_forever:
+            await asyncio.Event().wait()
+
+    async def shutdown(self) -> None:
+        pass
+
+
+class KeywordEchoAgent(EchoAgent):
+    """EchoAgent whose handler takes keyword arguments, as MQTT, gRPC and MCP handlers do."""
+
+    async def setup(self) -> None:
+        self.starts += 1
+
+        async def echo(value: int) -> Dict[str, Any]:
+            return {"from": self.name, "value": value}
+
+        self.communicator.handlers["echo"] = echo
+
+
+class Echo(BaseModel):
+    """Response model for echo requests."""
+
+    value: int
+
+
+class TestLocalRouter:
+    """Tests for the LocalRouter class."""
+
+    @pytest.mark.asyncio
+    async def test_error_semantics(self, tmp_path):
+        """Unknown targets, unknown methods and handler errors raise communication errors."""
+        router = LocalRouter()
+        agent = EchoAgent("a", tmp_path)
+        await agent.setup()
+
+        async def broken(params):
+            raise ValueError("bad input")
+
+        agent.communicator.handlers["broken"] = broken
+        router.register("a", agent.communicator)
+
+        with pytest.raises(ServiceNotFoundError):
+            await router.request("missing", "echo")
+        with pytest.raises(MethodNotFoundError):
+            await router.request("a", "missing")
+        with pytest.raises(CommunicationError, match="bad input"):
+            await router.request("a", "broken")
+
+        router.unregister("a")
+        assert "a" not in router
+
+
+class TestAgentRuntime:
+    """Tests for the AgentRuntime class."""
+
+    @pytest.mark.asyncio
+    async def test_hosted_agents_talk_in_process(self, tmp_path):
+        """Requests between hosted agents bypass HTTP and are validated like remote ones."""
+        runtime = AgentRuntime()
+        first = runtime.add_agent(EchoAgent("first", tmp_path))
+        runtime.add_agent(EchoAgent("second", tmp_path))
+        await runtime.start()
+        try:
+            result = await first.communicator.send_request("second", "echo", {"value": 3})
+            assert result == {"from": "second", "value": 3}
+
+            parsed = await first.communicator.send_request("second", "echo", {"value": 4}, response_model=Echo)
+            assert parsed == Echo(value=4)
+            assert runtime.router.delivered == 2
+            assert runtime.status()["second"]["state"] == "running"
+        finally:
+            await runtime.stop()
+
+        assert runtime.status()["second"]["state"] == "stopped"
+        assert not first._is_running
+
+    @pytest.mark.asyncio
+    async def test_handlers_are_called_with_their_communicators_convention(self, tmp_path):
+        """An HTTP agent reaches a co-located MCP agent, whose handlers take keyword arguments."""
+        runtime = AgentRuntime()
+        first = runtime.add_agent(EchoAgent("first", tmp_path))
+        mcp_agent = KeywordEchoAgent("second", tmp_path)
+        mcp_agent.set_communicator(McpStdioCommunicator("second", {}))
+        runtime.add_agent(mcp_agent)
+        await runtime.start()
+        try:
+            result = await first.communicator.send_request("second", "echo", {"value": 5})
+            assert result == {"from": "second", "value": 5}
+            assert runtime.router.delivered == 1
+        finally:
+            await runtime.stop()
+
+    @pytest.mark.asyncio
+    async def test_http_agents_share_one_client(self, tmp_path):
+        """Hosted HTTP communicators share a client that outlives each communicator."""
+        runtime = AgentRuntime()
+        first = runtime.add_agent(EchoAgent("first", tmp_path))
+        second = runtime.add_agent(EchoAgent("second", tmp_path))
+        await runtime.start()
+
+        shared = first.communicator.client
+        assert second.communicator.client is shared
+        await runtime.remove_agent("first")
+        assert not shared.is_closed
+
+        await runtime.stop()
+        assert shared.is_closed
+
+    @pytest.mark.asyncio
+    async def test_failed_agent_is_restarted_with_backoff(self, tmp_path):
+        """An agent whose run() raises is restarted until it runs normally."""
+        runtime = AgentRuntime(restart_backoff=0.01)
+        agent = runtime.add_agent(EchoAgent("flaky", tmp_path, fail_runs=2))
+        await runtime.start()
+        try:
+            for _ in range(100):
+                if runtime.status()["flaky"]["state"] == "running" and agent.starts == 3:
+                    break
+                await asyncio.sleep(0.01)
+            status = runtime.status()["flaky"]
+            assert status["state"] == "running"
+            assert status["restarts"] == 2
+            assert status["last_error"] == "crashed"
+        finally:
+            await runtime.stop()
+
+    @pytest.mark.asyncio
+    async def test_restart_limit_and_policies(self, tmp_path):
+        """Agents stop being restarted at the limit, and finished agents are not restarted."""
+        runtime = AgentRuntime(restart_backoff=0.01, max_restarts=1)
+        runtime.add_agent(EchoAgent("broken", tmp_path, fail_runs=5))
+        runtime.add_agent(EchoAgent("done", tmp_path, run_forever=False))
+        runtime.add_agent(EchoAgent("once", tmp_path, fail_runs=1), restart="never")
+        await runtime.start()
+        await asyncio.wait_for(runtime.wait(), timeout=2)
+
+        status = runtime.status()
+        assert status["broken"] == {"state": "failed", "restarts": 1, "last_error": "crashed"}
+        assert status["done"]["state"] == "finished"
+        assert status["once"]["state"] == "failed"
+        assert status["once"]["restarts"] == 0
+        await runtime.stop()
+
+    def test_rejects_duplicates_and_unknown_policies(self, tmp_path):
+        """Agent names must be unique and restart policies known."""
+        runtime = AgentRuntime()
+        runtime.add_agent(EchoAgent("a", tmp_path))
+        with pytest.raises(ConfigurationError):
+            runtime.add_agent(EchoAgent("a", tmp_path))
+        with pytest.raises(ConfigurationError):
+            runtime.add_agent(EchoAgent("b", tmp_path), restart="sometimes")
@@ -0,0 +1,42 @@
+"""Fixtures for asset management unit tests."""
+
+import os
+from typing import Any, Callable, Dict
+from unittest.mock import patch
+
+import pytest
+
+from openmas.assets.config import AssetConfig, AssetSettings
+from openmas.assets.manager import AssetManager
+from openmas.config import ProjectConfig, SettingsConfig
+
+
+@pytest.fixture
+def manager_settings() -> Dict[str, Any]:
+    """Asset settings applied to every manager a module creates; override it in a module to change them."""
+    return {}
+
+
+@pytest.fixture
+def make_manager(tmp_path, manager_settings: Dict[str, Any]) -> Callable[..., AssetManager]:
+    """Factory creating AssetManagers with a cache in tmp_path.
+
+    The factory takes the assets to configure, ``node`` naming the cache directory (so that
+    several managers can stand in for separate nodes), and asset settings overriding
+    ``manager_settings``.
+    """
+
+    def make(*assets: AssetConfig, node: str = "cache", **settings: Any) -> AssetManager:
+        project_config = ProjectConfig(
+            name="project",
+            version="0.1.0",
+            agents={},
+            assets=list(assets),
+            settings=SettingsConfig(
+                assets=AssetSettings(cache_dir=tmp_path / node, **{**manager_settings, **settings})
+            ),
+        )
+        with patch.dict(os.environ, {}, clear=True):
+            return AssetManager(project_config)
+
+    return make
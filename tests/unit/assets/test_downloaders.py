@@ -209,9 +209,14 @@ class TestHttpDownloader:
             patch.object(httpx.AsyncClient, "stream", return_value=MockStream()),
             patch("pathlib.Path.mkdir"),
             patch("builtins.open", mock_file),
+            patch("os.replace") as mock_replace,
         ):
             await downloader.download(source_config, target_path)
 
+            # The data is written to a partial file that is renamed into place
+            mock_file.assert_called_once_with(Path("/tmp/test_file.txt.partial"), "wb")
+            mock_replace.assert_called_once_with(Path("/tmp/test_file.txt.partial"), target_path)
+
             # Verify that the file was written with the correct data
             write_handle = mock_file()
             assert write_handle.write.call_count == 3072
@@ -259,7 +264,11 @@ class TestHttpDownloader:
                 mock_client_instance  # for 'async with httpx.AsyncClient(...) as client:'
             )
 
-            with patch("pathlib.Path.mkdir") as mock_mkdir, patch("builtins.open", mock_file_open):
+            with (
+                patch("pathlib.Path.mkdir") as mock_mkdir,
+                patch("builtins.open", mock_file_open),
+                patch("os.replace"),
+            ):
                 await downloader.download(source_config, target_path)
 
         # Check that target directory was created
@@ -357,7 +366,7 @@ class TestHttpDownloader:
         mock_tqdm_constructor.return_value.__enter__.return_value = mock_tqdm_instance  # For 'with tqdm(...) as pbar:'
         mock_file_open = mock_open()
 
-        with patch("pathlib.Path.mkdir"), patch("builtins.open", mock_file_open):
+        with patch("pathlib.Path.mkdir"), patch("builtins.open", mock_file_open), patch("os.replace"):
             await downloader.download(source_config, target_path)
 
         mock_isatty.assert_called()  # Ensure tty check happened
@@ -442,7 +451,7 @@ class TestHttpDownloader:
         mock_async_client_constructor.return_value.__aenter__.return_value = mock_client_instance
         mock_file_open = mock_open()
 
-        with patch("pathlib.Path.mkdir"), patch("builtins.open", mock_file_open):
+        with patch("pathlib.Path.mkdir"), patch("builtins.open", mock_file_open), patch("os.replace"):
             await downloader.download(source_config, target_path)
 
         mock_isatty.assert_called()
@@ -0,0 +1,223 @@
+"""Tests for resumable and segmented HTTP downloads against a local server."""
+
+import hashlib
+import os
+import re
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+import pytest
+
+from openmas.assets.config import AssetSourceConfig
+from openmas.assets.downloaders import HttpDownloader
+from openmas.assets.exceptions import AssetDownloadError, AssetVerificationError
+from openmas.assets.utils import BandwidthLimiter
+
+DATA = os.urandom(1024 * 1024)
+CHECKSUM = f"sha256:{hashlib.sha256(DATA).hexdigest()}"
+
+
+class RangeServer:
+    """A local HTTP server for DATA that supports ranges and can drop connections."""
+
+    def __init__(self):
+        self.etag = '"v1"'
+        self.data = DATA
+        self.requests: List[Optional[str]] = []
+        # Number of upcoming responses to cut off after drop_after bytes
+        self.drops = 0
+        self.drop_after = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                server.requests.append(self.headers.get("Range"))
+                start, end = 0, len(server.data) - 1
+                status = 200
+                match = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range") or "")
+                if match and self.headers.get("If-Range", server.etag) == server.etag:
+                    start = int(match.group(1))
+                    end = int(match.group(2)) if match.group(2) else end
+                    status = 206
+                body = server.data[start : end + 1]
+
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Accept-Ranges", "bytes")
+                self.send_header("ETag", server.etag)
+                if status == 206:
+                    self.send_header("Content-Range", f"bytes {start}-{end}/{len(server.data)}")
+                self.end_headers()
+                if server.drops > 0:
+                    server.drops -= 1
+                    self.wfile.write(body[: server.drop_after])
+                    self.wfile.flush()
+                    self.connection.shutdown(socket.SHUT_RDWR)
+                    return
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/model.bin"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    """A running RangeServer."""
+    range_server = RangeServer()
+    yield range_server
+    range_server.close()
+
+
+def source(url, segments):
+    """An HTTP source splitting files from 256 KB into the given number of segments."""
+    return AssetSourceConfig(
+        type="http", url=url, progress_report=False, download_segments=segments, segment_threshold_mb=0.25
+    )
+
+
+class TestRangedDownloads:
+    """Tests for segmented and resumable downloads."""
+
+    @pytest.mark.asyncio
+    async def test_large_file_is_downloaded_in_segments(self, server, tmp_path):
+        """The initial response feeds the first segment while the others are fetched with range requests."""
+        target = tmp_path / "model.bin"
+
+        await HttpDownloader().download(source(server.url, 4), target)
+
+        assert target.read_bytes() == DATA
+        quarter = len(DATA) // 4
+        assert sorted(server.requests[1:]) == [
+            f"bytes={quarter}-{2 * quarter - 1}",
+            f"bytes={2 * quarter}-{3 * quarter - 1}",
+            f"bytes={3 * quarter}-{len(DATA) - 1}",
+        ]
+        assert not (tmp_path / "model.bin.partial").exists()
+        assert not (tmp_path / "model.bin.partial.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_dropped_segment_is_retried_from_where_it_stopped(self, server, tmp_path):
+        """A segment whose connection drops is requested again from its next byte."""
+        target = tmp_path / "model.bin"
+        server.drops = 1
+        server.drop_after = 100_000
+
+        await HttpDownloader(segment_retries=2).download(source(server.url, 2), target)
+
+        assert target.read_bytes() == DATA
+        assert "bytes=100000-524287" in server.requests
+
+    @pytest.mark.asyncio
+    async def test_failed_download_resumes_from_partial_file(self, server, tmp_path):
+        """A single-stream download that fails is resumed with a range request by the next attempt."""
+        target = tmp_path / "model.bin"
+        server.drops = 1
+        # A multiple of the chunk size, so that every received byte was written
+        server.drop_after = 40 * 8192
+
+        with pytest.raises(AssetDownloadError):
+            await HttpDownloader().download(source(server.url, 1), target)
+        assert (tmp_path / "model.bin.partial").stat().st_size == 40 * 8192
+        assert not target.exists()
+
+        await HttpDownloader().download(source(server.url, 1), target)
+
+        assert target.read_bytes() == DATA
+        assert server.requests == [None, f"bytes={40 * 8192}-{len(DATA) - 1}"]
+
+    @pytest.mark.asyncio
+    async def test_changed_resource_restarts_download(self, server, tmp_path):
+        """If the resource changed since the partial download, it is downloaded again from the start."""
+        target = tmp_path / "model.bin"
+        server.drops = 1
+        server.drop_after = 40 * 8192
+        with pytest.raises(AssetDownloadError):
+            await HttpDownloader().download(source(server.url, 1), target)
+
+        server.etag = '"v2"'
+        server.data = DATA[::-1]
+        await HttpDownloader().download(source(server.url, 1), target)
+
+        assert target.read_bytes() == DATA[::-1]
+        assert server.requests == [None, f"bytes={40 * 8192}-{len(DATA) - 1}", None]
+
+
+class TestStreamingChecksum:
+    """Tests for hashing downloads as the bytes arrive."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("segments", [1, 4])
+    async def test_checksum_is_computed_while_downloading(self, server, tmp_path, segments):
+        """Single-stream and segmented downloads return the checksum of the whole file."""
+        target = tmp_path / "model.bin"
+
+        checksum = await HttpDownloader().download(source(server.url, segments), target, expected_checksum=CHECKSUM)
+
+        assert checksum == CHECKSUM
+        assert target.read_bytes() == DATA
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("segments", [1, 2])
+    async def test_resumed_download_hashes_earlier_bytes(self, server, tmp_path, segments):
+        """The bytes of the failed attempt are read back so that the resumed download has a checksum."""
+        target = tmp_path / "model.bin"
+        server.drops = 1
+        server.drop_after = 40 * 8192
+        downloader = HttpDownloader(segment_retries=0)
+        with pytest.raises(AssetDownloadError):
+            await downloader.download(source(server.url, segments), target)
+
+        assert await downloader.download(source(server.url, segments), target) == CHECKSUM
+        assert target.read_bytes() == DATA
+
+    @pytest.mark.asyncio
+    async def test_mismatch_is_not_moved_into_place(self, server, tmp_path):
+        """A download that does not match the expected checksum is discarded."""
+        target = tmp_path / "model.bin"
+        target.write_bytes(b"stale")
+
+        with pytest.raises(AssetVerificationError, match="failed checksum verification"):
+            await HttpDownloader().download(source(server.url, 4), target, expected_checksum="sha256:" + "0" * 64)
+
+        assert not target.exists()
+        assert not (tmp_path / "model.bin.partial").exists()
+        assert not (tmp_path / "model.bin.partial.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_body_in_order(self, server):
+        """Streaming reads the body in one request and reports the bytes received."""
+        reports = []
+        chunks = [
+            chunk
+            async for chunk in HttpDownloader().stream(source(server.url, 4), progress=lambda *r: reports.append(r))
+        ]
+
+        assert b"".join(chunks) == DATA
+        assert server.requests == [None]
+        assert reports[-1] == (len(DATA), len(DATA))
+
+    @pytest.mark.asyncio
+    async def test_progress_callback_and_rate_limit(self, server, tmp_path):
+        """Downloads report their progress to a callback and respect a shared rate limit."""
+        reports = []
+        limiter = BandwidthLimiter(4 * 1024 * 1024, burst=1)
+
+        started = time.monotonic()
+        await HttpDownloader().download(
+            source(server.url, 4), tmp_path / "model.bin", progress=lambda *r: reports.append(r), rate_limiter=limiter
+        )
+
+        assert time.monotonic() - started >= 0.2
+        assert reports[-1] == (len(DATA), len(DATA))
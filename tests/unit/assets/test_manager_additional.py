@@ -81,7 +81,7 @@ class TestAssetManagerAdditional:
             result = await asset_manager.get_asset_path(asset_name)
 
             # Verify download was triggered due to metadata mismatch
-            asset_manager.download_asset.assert_called_once_with(asset_config)
+            asset_manager.download_asset.assert_called_once_with(asset_config, progress=None)
             assert result == asset_file
 
     @pytest.mark.asyncio
@@ -176,7 +176,7 @@ class TestAssetManagerAdditional:
             result = await asset_manager.get_asset_path(asset_name)
 
             # Verify download and unpack were triggered
-            asset_manager.download_asset.assert_called_once_with(asset_config)
+            asset_manager.download_asset.assert_called_once_with(asset_config, progress=None)
             asset_manager.unpack_asset.assert_called_once()
             assert result == cache_dir
 
@@ -226,7 +226,7 @@ class TestAssetManagerAdditional:
             result = await asset_manager.get_asset_path(asset_name, force_download=True)
 
             # Verify download was triggered despite existing file
-            asset_manager.download_asset.assert_called_once_with(asset_config)
+            asset_manager.download_asset.assert_called_once_with(asset_config, progress=None)
             assert result == asset_file
 
     def test_unpack_asset_destination_is_file(self, asset_manager, tmp_path):
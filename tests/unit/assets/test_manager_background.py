@@ -0,0 +1,78 @@
+"""Tests for hashing and unpacking assets off the event loop."""
+
+import asyncio
+import hashlib
+import io
+import tarfile
+import threading
+
+import pytest
+
+from openmas.assets.config import AssetConfig, AssetSourceConfig
+from openmas.assets.exceptions import AssetCancelledError
+
+
+class TestBackgroundAssetStages:
+    """Tests for running verification and unpacking in worker threads."""
+
+    @pytest.mark.asyncio
+    async def test_progress_is_reported_on_the_loop(self, tmp_path, make_manager):
+        """Verification and unpacking report progress through the callback, called on the event loop thread."""
+        archive = tmp_path / "bundle.tar"
+        with tarfile.open(archive, "w") as tar:
+            for name in ("a.bin", "b.bin"):
+                info = tarfile.TarInfo(name)
+                info.size = 10
+                tar.addfile(info, io.BytesIO(b"x" * 10))
+        asset = AssetConfig(
+            name="bundle",
+            source=AssetSourceConfig(type="local", path=archive),
+            checksum=f"sha256:{hashlib.sha256(archive.read_bytes()).hexdigest()}",
+            unpack=True,
+            unpack_format="tar",
+        )
+        manager = make_manager(asset)
+        reports = []
+
+        def progress(name, stage, done, total):
+            reports.append((name, stage, done, total, threading.current_thread() is threading.main_thread()))
+
+        path = await manager.get_asset_path("bundle", progress=progress)
+        await asyncio.sleep(0)
+
+        assert (path / "a.bin").exists() and (path / "b.bin").exists()
+        # The archive was hashed while it was copied, so only unpacking reports progress
+        assert reports == [
+            ("bundle", "unpack", 10, 20, True),
+            ("bundle", "unpack", 20, 20, True),
+        ]
+
+        # Files that were not hashed while downloading report verification progress
+        reports.clear()
+        packed = AssetConfig(name="archive", source=asset.source, checksum=asset.checksum)
+        await manager._run_off_loop(manager.verify_asset, packed, archive, full=True, stage="verify", progress=progress)
+        await asyncio.sleep(0)
+        size = archive.stat().st_size
+        assert reports == [("archive", "verify", size, size, True)]
+
+    @pytest.mark.asyncio
+    async def test_cancellation_stops_the_worker_before_returning(self, tmp_path, make_manager):
+        """Cancelling the caller sets the cancel event and waits for the worker thread to stop."""
+        asset = AssetConfig(name="model", source=AssetSourceConfig(type="local", path=tmp_path / "model.bin"))
+        manager = make_manager(asset)
+        started = threading.Event()
+        stopped = threading.Event()
+
+        def step(asset_config, progress=None, cancel_event=None):
+            started.set()
+            assert cancel_event.wait(5)
+            stopped.set()
+            raise AssetCancelledError("Operation cancelled")
+
+        task = asyncio.create_task(manager._run_off_loop(step, asset, stage="verify"))
+        await asyncio.to_thread(started.wait, 5)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert stopped.is_set()
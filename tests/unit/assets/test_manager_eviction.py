@@ -0,0 +1,175 @@
+"""Tests for size-bounded cache eviction and pinning."""
+
+import asyncio
+import os
+import subprocess
+import sys
+
+import pytest
+
+from openmas.assets.config import AssetConfig, AssetSourceConfig
+from openmas.assets.utils import asset_lock
+from openmas.config import AgentConfig
+from tests.conftest import SimpleAgent
+
+SIZE = 100_000
+
+
+def local_asset(tmp_path, name, version=None):
+    """A local asset of SIZE random bytes."""
+    source = tmp_path / "sources" / f"{name}-{version}.bin"
+    source.parent.mkdir(exist_ok=True)
+    source.write_bytes(os.urandom(SIZE))
+    return AssetConfig(
+        name=name, version=version, source=AssetSourceConfig(type="local", path=source, filename="model.bin")
+    )
+
+
+def limit_gb(assets):
+    """A cache size limit that fits the given number of assets with their metadata."""
+    return (assets * SIZE + 5000) / 1024**3
+
+
+def cached(manager):
+    """Names of the assets in the cache."""
+    return [entry["name"] for entry in manager.cache_usage()["entries"]]
+
+
+class TestEviction:
+    """Tests for evicting assets beyond max_cache_size_gb."""
+
+    @pytest.mark.asyncio
+    async def test_least_recently_accessed_asset_is_evicted(self, tmp_path, make_manager):
+        """Downloading beyond the limit evicts the asset accessed longest ago, not the oldest download."""
+        assets = [local_asset(tmp_path, name) for name in "abc"]
+        manager = make_manager(*assets, max_cache_size_gb=limit_gb(2))
+        await manager.get_asset_path("a")
+        await manager.get_asset_path("b")
+        # A cache hit makes "a" the most recently used
+        await manager.get_asset_path("a")
+
+        await manager.get_asset_path("c")
+
+        assert cached(manager) == ["a", "c"]
+        assert not (tmp_path / "cache" / "model" / "b").exists()
+        usage = manager.cache_usage()
+        assert 2 * SIZE < usage["total_bytes"] <= usage["max_bytes"]
+
+    @pytest.mark.asyncio
+    async def test_pinned_and_locked_assets_are_kept(self, tmp_path, make_manager):
+        """Assets pinned by a live process or locked right now survive eviction."""
+        assets = [local_asset(tmp_path, name) for name in "abc"]
+        manager = make_manager(*assets)
+        for name in "abc":
+            await manager.get_asset_path(name)
+
+        async with manager.pinned_asset("a") as path:
+            with asset_lock(manager._get_lock_path_for_asset(assets[1])):
+                result = manager.evict_to_limit(0)
+            assert path.exists()
+            # Getting the pinned asset made it the most recently used
+            assert [entry["pinned"] for entry in manager.cache_usage()["entries"]] == [False, True]
+
+        assert result["evicted"] == ["c@latest"]
+        assert result["bytes_freed"] > SIZE
+        assert cached(manager) == ["b", "a"]
+        assert manager.evict_to_limit(0)["evicted"] == ["b@latest", "a@latest"]
+
+    @pytest.mark.asyncio
+    async def test_pins_of_exited_processes_are_ignored(self, tmp_path, make_manager):
+        """A pin left behind by a process that exited does not keep the asset."""
+        asset = local_asset(tmp_path, "a")
+        manager = make_manager(asset)
+        await manager.get_asset_path("a")
+        exited = subprocess.Popen([sys.executable, "-c", "pass"])
+        exited.wait()
+        pins_dir = manager._pins_dir(manager._get_lock_path_for_asset(asset))
+        pins_dir.mkdir()
+        (pins_dir / f"{exited.pid}.1").touch()
+
+        assert manager.evict_to_limit(0)["evicted"] == ["a@latest"]
+        assert list(pins_dir.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_versions_the_project_no_longer_uses_are_evicted(self, tmp_path, make_manager):
+        """Entries of other versions count towards the limit and are evicted first if older."""
+        old = make_manager(local_asset(tmp_path, "model", "1"))
+        await old.get_asset_path("model")
+        manager = make_manager(local_asset(tmp_path, "model", "2"), max_cache_size_gb=limit_gb(1))
+
+        await manager.get_asset_path("model")
+
+        assert [entry["version"] for entry in manager.cache_usage()["entries"]] == ["2"]
+
+    @pytest.mark.asyncio
+    async def test_shared_store_files_are_freed_with_their_last_entry(self, tmp_path, make_manager):
+        """A file shared through the content store counts once and is freed with its last entry."""
+        first = local_asset(tmp_path, "a")
+        second = AssetConfig(name="b", source=first.source)
+        manager = make_manager(first, second, content_store=True)
+        await manager.get_asset_path("a")
+        await manager.get_asset_path("b")
+
+        usage = manager.cache_usage()
+        assert usage["store_bytes"] == SIZE
+        assert SIZE < usage["total_bytes"] < 2 * SIZE
+
+        # Evicting one entry frees its metadata but not the shared file
+        assert manager.evict_to_limit(usage["total_bytes"] - 1)["evicted"] == ["a@latest"]
+        assert manager.store.usage()["objects"] == 1
+        result = manager.evict_to_limit(0)
+        assert result["bytes_freed"] > SIZE
+        assert result["total_bytes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_pins_are_counted(self, tmp_path, make_manager):
+        """Two pins taken while another process holds the lock need two unpins."""
+        asset = local_asset(tmp_path, "a")
+        manager = make_manager(asset)
+        await manager.get_asset_path("a")
+        lock_path = manager._get_lock_path_for_asset(asset)
+        holder = subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                "import sys, time, filelock\n"
+                f"with filelock.FileLock({str(lock_path)!r}):\n"
+                "    print('locked', flush=True)\n"
+                "    time.sleep(0.5)\n",
+            ],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        assert holder.stdout is not None
+        assert holder.stdout.readline().strip() == "locked"
+
+        await asyncio.gather(manager.pin_asset("a"), manager.pin_asset("a"))
+        holder.wait()
+
+        manager.unpin_asset("a")
+        assert manager._is_pinned(lock_path)
+        manager.unpin_asset("a")
+        assert not manager._is_pinned(lock_path)
+
+    @pytest.mark.asyncio
+    async def test_running_agent_pins_its_required_assets(self, tmp_path, mock_communicator, make_manager):
+        """An agent pins its required assets from start() until stop()."""
+        assets = [local_asset(tmp_path, name) for name in "ab"]
+        manager = make_manager(*assets)
+        for name in "ab":
+            await manager.get_asset_path(name)
+        agent = SimpleAgent(config=AgentConfig(name="reader", required_assets=["a", "unknown"]), asset_manager=manager)
+        agent.set_communicator(mock_communicator)
+
+        await agent.start()
+        try:
+            assert manager.evict_to_limit(0)["evicted"] == ["b@latest"]
+        finally:
+            await agent.stop()
+
+        assert manager.evict_to_limit(0)["evicted"] == ["a@latest"]
+
+    def test_eviction_needs_a_limit(self, make_manager):
+        """Evicting without a configured or given limit is an error."""
+        with pytest.raises(ValueError, match="max_cache_size_gb"):
+            make_manager().evict_to_limit()
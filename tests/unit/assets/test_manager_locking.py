@@ -0,0 +1,65 @@
+"""Tests for asset locking in the AssetManager."""
+
+import asyncio
+import io
+import tarfile
+from unittest.mock import patch
+
+import pytest
+
+from openmas.assets.config import AssetConfig, AssetSourceConfig
+
+
+@pytest.fixture
+def manager_settings():
+    """Managers in these tests give up on a held lock after 5 seconds."""
+    return {"lock_timeout": 5}
+
+
+class TestAssetManagerLocking:
+    """Tests for in-process deduplication and lock handling."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_download(self, tmp_path, make_manager):
+        """Concurrent requests for an asset in one process download it once."""
+        source = tmp_path / "model.bin"
+        source.write_bytes(b"weights")
+        asset = AssetConfig(name="model", source=AssetSourceConfig(type="local", path=source, filename="model.bin"))
+        manager = make_manager(asset)
+        original = manager.download_asset
+
+        async def slow_download(asset_config, progress=None):
+            await asyncio.sleep(0.1)
+            return await original(asset_config, progress=progress)
+
+        with patch.object(manager, "download_asset", side_effect=slow_download) as download:
+            paths = await asyncio.gather(*(manager.get_asset_path("model") for _ in range(5)))
+
+        assert download.call_count == 1
+        assert len(set(paths)) == 1
+        assert paths[0].read_bytes() == b"weights"
+        # The file lock was only taken in turn, never contended
+        assert manager.lock_stats.acquired == 5
+        assert manager.lock_stats.contended == 0
+        assert manager.lock_timeout == 5
+
+    @pytest.mark.asyncio
+    async def test_unpack_while_holding_asset_lock(self, tmp_path, make_manager):
+        """Unpacking a freshly downloaded archive does not try to take the held lock again."""
+        archive = tmp_path / "bundle.tar"
+        with tarfile.open(archive, "w") as tar:
+            info = tarfile.TarInfo("weights.bin")
+            info.size = 7
+            tar.addfile(info, io.BytesIO(b"weights"))
+        asset = AssetConfig(
+            name="bundle",
+            source=AssetSourceConfig(type="local", path=archive),
+            unpack=True,
+            unpack_format="tar",
+        )
+        manager = make_manager(asset)
+
+        path = await manager.get_asset_path("bundle")
+
+        assert (path / "weights.bin").read_bytes() == b"weights"
+        assert (path / ".unpacked").exists()
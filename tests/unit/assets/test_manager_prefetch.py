@@ -0,0 +1,75 @@
+"""Tests for prefetching several assets concurrently."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from openmas.assets.config import AssetConfig, AssetSourceConfig
+from openmas.assets.exceptions import AssetDownloadError
+
+
+def local_asset(tmp_path, name, content=b"weights"):
+    """A local asset whose source file is created if content is given."""
+    source = tmp_path / "sources" / f"{name}.bin"
+    if content is not None:
+        source.parent.mkdir(exist_ok=True)
+        source.write_bytes(content)
+    return AssetConfig(name=name, source=AssetSourceConfig(type="local", path=source, filename=f"{name}.bin"))
+
+
+class TestPrefetch:
+    """Tests for AssetManager.prefetch()."""
+
+    @pytest.mark.asyncio
+    async def test_assets_are_fetched_concurrently_within_budget(self, tmp_path, make_manager):
+        """At most `concurrency` assets are in flight, and the run takes about the longest batch, not the sum."""
+        manager = make_manager(*(local_asset(tmp_path, f"a{i}", None) for i in range(6)))
+        in_flight = []
+        peak = 0
+
+        async def fetch(name, force_download=False, progress=None):
+            nonlocal peak
+            in_flight.append(name)
+            peak = max(peak, len(in_flight))
+            await asyncio.sleep(0.1)
+            in_flight.remove(name)
+            return tmp_path / name
+
+        started = time.monotonic()
+        with patch.object(manager, "get_asset_path", side_effect=fetch):
+            report = await manager.prefetch(concurrency=3)
+
+        assert peak == 3
+        assert time.monotonic() - started < 0.5
+        assert [result.name for result in report.results] == [f"a{i}" for i in range(6)]
+        assert report.paths["a5"] == tmp_path / "a5"
+
+    @pytest.mark.asyncio
+    async def test_report_distinguishes_downloads_cache_hits_and_failures(self, tmp_path, make_manager):
+        """A failing asset is recorded without stopping the others, and a second run hits the cache."""
+        manager = make_manager(
+            local_asset(tmp_path, "model"), local_asset(tmp_path, "missing", None), prefetch_concurrency=2
+        )
+
+        first = await manager.prefetch()
+
+        assert [result.as_dict()["status"] for result in first.results] == ["downloaded", "failed"]
+        assert isinstance(first.failed[0].error, AssetDownloadError)
+        assert first.succeeded[0].path.read_bytes() == b"weights"
+        assert "1/2 assets" in first.summary()
+
+        second = await manager.prefetch(["model", "model"])
+        assert [result.as_dict()["status"] for result in second.results] == ["cached"]
+        assert second.as_dict()["succeeded"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_assets_and_bad_concurrency_are_rejected(self, tmp_path, make_manager):
+        """Nothing is fetched if a name is unknown or the concurrency is not positive."""
+        manager = make_manager(local_asset(tmp_path, "model"))
+
+        with pytest.raises(KeyError, match="nope"):
+            await manager.prefetch(["model", "nope"])
+        with pytest.raises(ValueError):
+            await manager.prefetch(concurrency=0)
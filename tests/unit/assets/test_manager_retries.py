@@ -77,7 +77,7 @@ class TestAssetManagerRetries:
 
             # Verify download_asset was called twice (first attempt fails, second succeeds)
             assert mock_download_asset.call_count == 2
-            mock_download_asset.assert_called_with(test_asset)
+            mock_download_asset.assert_called_with(test_asset, progress=None)
 
             # Verify sleep was called with the correct delay
             with patch("asyncio.sleep") as mock_sleep:
@@ -0,0 +1,108 @@
+"""Tests for unpacking archived assets while they download."""
+
+import hashlib
+import io
+import os
+import tarfile
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from openmas.assets.config import AssetConfig, AssetSourceConfig
+from openmas.assets.exceptions import AssetDownloadError
+
+WEIGHTS = os.urandom(200_000)
+
+
+@pytest.fixture
+def archive(tmp_path):
+    """A tar.gz archive holding a model directory."""
+    path = tmp_path / "bundle.tar.gz"
+    with tarfile.open(path, "w:gz") as tar_file:
+        for name, content in (("model/weights.bin", WEIGHTS), ("model/config.json", b"{}")):
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            tar_file.addfile(info, io.BytesIO(content))
+    return path
+
+
+def bundle(archive, checksum=None, unpack_format="tar.gz", **kwargs):
+    """A streamed asset read from the archive."""
+    return AssetConfig(
+        name="bundle",
+        source=AssetSourceConfig(type="local", path=archive),
+        checksum=checksum or f"sha256:{hashlib.sha256(archive.read_bytes()).hexdigest()}",
+        unpack=True,
+        unpack_format=unpack_format,
+        stream_unpack=True,
+        **kwargs,
+    )
+
+
+class TestStreamUnpack:
+    """Tests for the stream_unpack option."""
+
+    @pytest.mark.asyncio
+    async def test_archive_is_extracted_without_being_stored(self, archive, make_manager):
+        """The contents are unpacked and verified through the stream, and the archive never reaches the cache."""
+        asset = bundle(archive)
+        manager = make_manager(asset)
+        reports = []
+
+        with patch.object(manager, "verify_asset") as verify, patch.object(manager, "unpack_asset") as unpack:
+            path = await manager.get_asset_path("bundle", progress=lambda *report: reports.append(report))
+        verify.assert_not_called()
+        unpack.assert_not_called()
+
+        assert (path / "model" / "weights.bin").read_bytes() == WEIGHTS
+        assert sorted(p.name for p in path.iterdir()) == [".asset_info.json", ".unpacked", "model"]
+        size = archive.stat().st_size
+        assert reports[-1] == ("bundle", "unpack", size, size)
+        # The recorded archive digest makes later cache hits skip verification
+        assert manager.verify_asset(asset, path)
+
+    @pytest.mark.asyncio
+    async def test_mismatching_archive_leaves_no_files(self, archive, make_manager):
+        """Contents extracted from an archive with the wrong checksum are discarded."""
+        manager = make_manager(bundle(archive, checksum="sha256:" + "0" * 64))
+
+        with pytest.raises(AssetDownloadError, match="failed checksum verification"):
+            await manager.get_asset_path("bundle")
+
+        asset_dir = manager._get_cache_path_for_asset(manager.assets["bundle"])
+        assert list(asset_dir.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_destination_file(self, tmp_path, make_manager):
+        """A single-file archive resolves to the extracted file."""
+        archive = tmp_path / "model.tar"
+        with tarfile.open(archive, "w") as tar_file:
+            info = tarfile.TarInfo("model.bin")
+            info.size = len(WEIGHTS)
+            tar_file.addfile(info, io.BytesIO(WEIGHTS))
+        manager = make_manager(bundle(archive, unpack_format="tar", unpack_destination_is_file=True))
+
+        path = await manager.get_asset_path("bundle")
+
+        assert path.name == "model.bin"
+        assert path.read_bytes() == WEIGHTS
+
+    def test_config_validation(self, archive):
+        """Streaming needs a tar format and a source that can stream."""
+        with pytest.raises(ValidationError, match="stream_unpack requires"):
+            AssetConfig(
+                name="bundle",
+                source=AssetSourceConfig(type="local", path=archive),
+                unpack=True,
+                unpack_format="zip",
+                stream_unpack=True,
+            )
+        with pytest.raises(ValidationError, match="Hugging Face"):
+            AssetConfig(
+                name="bundle",
+                source=AssetSourceConfig(type="hf", repo_id="org/model", filename="model.tar"),
+                unpack=True,
+                unpack_format="tar",
+                stream_unpack=True,
+            )
@@ -0,0 +1,112 @@
+"""Tests for the verified-checksum cache of the AssetManager."""
+
+import hashlib
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from openmas.assets.config import AssetConfig, AssetSourceConfig
+from openmas.assets.exceptions import AssetDownloadError
+from openmas.assets.utils import verify_checksum
+
+CONTENT = b"model weights" * 1000
+
+
+@pytest.fixture
+def model_asset(tmp_path):
+    """A local asset with a checksum."""
+    source = tmp_path / "model.bin"
+    source.write_bytes(CONTENT)
+    return AssetConfig(
+        name="model",
+        source=AssetSourceConfig(type="local", path=source, filename="model.bin"),
+        checksum=f"sha256:{hashlib.sha256(CONTENT).hexdigest()}",
+    )
+
+
+class TestVerifiedChecksumCache:
+    """Tests for skipping re-hashing of unchanged cached assets."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_rehash_until_file_changes(self, model_asset, make_manager):
+        """The digest is recorded on download, reused for unchanged files and rechecked after a change."""
+        manager = make_manager(model_asset)
+        path = await manager.get_asset_path("model")
+
+        metadata = json.loads((path.parent / ".asset_info.json").read_text())
+        assert metadata["verified"]["digest"] == model_asset.checksum
+        assert metadata["verified"]["size"] == len(CONTENT)
+
+        with patch("openmas.assets.manager.verify_checksum", wraps=verify_checksum) as hashed:
+            assert await manager.get_asset_path("model") == path
+            assert manager.check_asset_status(model_asset)["verified"]
+            assert hashed.call_count == 0
+
+            # Touching the file changes its modification time, so it is hashed again
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            assert await manager.get_asset_path("model") == path
+            assert hashed.call_count == 1
+
+            # The new stat tuple was recorded
+            assert await manager.get_asset_path("model") == path
+            assert hashed.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_copy_is_hashed_once_while_copying(self, model_asset, make_manager):
+        """Local files are verified during the copy, and a mismatching copy never reaches the cache."""
+        manager = make_manager(model_asset)
+        with patch("openmas.assets.manager.verify_checksum", wraps=verify_checksum) as hashed:
+            path = await manager.get_asset_path("model")
+            assert hashed.call_count == 0
+        assert path.read_bytes() == CONTENT
+
+        model_asset.source.path.write_bytes(b"tampered")
+        with pytest.raises(AssetDownloadError, match="failed checksum verification"):
+            await manager.get_asset_path("model", force_download=True)
+        assert not path.exists()
+        assert not path.with_name("model.bin.partial").exists()
+
+    @pytest.mark.asyncio
+    async def test_full_and_paranoid_verification_rehash(self, model_asset, make_manager):
+        """Full verification and paranoid managers always hash, and catch corruption of the same size."""
+        manager = make_manager(model_asset)
+        path = await manager.get_asset_path("model")
+
+        with patch("openmas.assets.manager.verify_checksum", wraps=verify_checksum) as hashed:
+            assert manager.verify_asset(model_asset, path, full=True)
+            paranoid = make_manager(model_asset, paranoid_verification=True)
+            assert paranoid.verify_asset(model_asset, path)
+            assert hashed.call_count == 2
+
+        # Corrupt the file without changing its size or modification time
+        stat = path.stat()
+        path.write_bytes(b"X" * len(CONTENT))
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert manager.verify_asset(model_asset, path)
+        assert not manager.verify_asset(model_asset, path, full=True)
+
+    def test_unpacked_asset_trusts_recorded_archive_digest(self, tmp_path, make_manager):
+        """Unpacked assets are verified through their archive once and trusted while unpacked."""
+        asset = AssetConfig(
+            name="bundle",
+            source=AssetSourceConfig(type="local", path=tmp_path / "bundle.tar"),
+            checksum="sha256:" + "ab" * 32,
+            unpack=True,
+            unpack_format="tar",
+        )
+        manager = make_manager(asset)
+        asset_dir = manager._get_cache_path_for_asset(asset)
+        asset_dir.mkdir(parents=True)
+        (asset_dir / "weights.bin").write_bytes(CONTENT)
+        metadata = {"name": "bundle", "verified": {"digest": asset.checksum, "unpacked": True}}
+        (asset_dir / ".asset_info.json").write_text(json.dumps(metadata))
+
+        with patch("openmas.assets.manager.verify_checksum", return_value=False) as hashed:
+            # Without the marker the unpacking is incomplete and the record is not trusted
+            assert not manager.verify_asset(asset, asset_dir)
+            (asset_dir / ".unpacked").touch()
+            assert manager.verify_asset(asset, asset_dir, full=True)
+            assert hashed.call_count == 1
@@ -0,0 +1,194 @@
+"""Tests for sharing asset caches between nodes through peer mirrors."""
+
+import hashlib
+import io
+import os
+import tarfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+import httpx
+import pytest
+
+from openmas.assets.config import AssetConfig, AssetSourceConfig
+from openmas.assets.downloaders import HttpDownloader, PeerMirrorDownloader
+from openmas.assets.exceptions import AssetDownloadError
+from openmas.assets.server import AssetCacheServer
+from tests.unit.assets import test_http_ranges
+
+DATA = os.urandom(512 * 1024)
+DIGEST = hashlib.sha256(DATA).hexdigest()
+
+
+def model(source, checksum=True):
+    """The model asset, downloaded from the given source."""
+    return AssetConfig(name="model", source=source, checksum=f"sha256:{DIGEST}" if checksum else None)
+
+
+@pytest.fixture
+def origin(tmp_path):
+    """A local origin holding DATA."""
+    path = tmp_path / "origin" / "model.bin"
+    path.parent.mkdir()
+    path.write_bytes(DATA)
+    return AssetSourceConfig(type="local", path=path, filename="model.bin")
+
+
+@pytest.fixture
+async def cache_server(origin, make_manager):
+    """A node that cached the model, serving its cache."""
+    seed = make_manager(model(origin), node="seed")
+    await seed.get_asset_path("model")
+    server = AssetCacheServer(seed, host="127.0.0.1", port=0)
+    await server.start()
+    yield server
+    await server.stop()
+
+
+class StandInPeer:
+    """A local HTTP stand-in for a peer that serves fixed bytes for any path."""
+
+    def __init__(self, body):
+        self.requests: List[str] = []
+        peer = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                peer.requests.append(self.path)
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def corrupt_peer():
+    """A peer serving the wrong bytes."""
+    peer = StandInPeer(b"not the model")
+    yield peer
+    peer.close()
+
+
+class TestAssetCacheServer:
+    """Tests for serving a cache to other nodes."""
+
+    @pytest.mark.asyncio
+    async def test_serves_verified_files_by_digest(self, cache_server):
+        """Cached files are served by digest with range support, and unknown digests are not found."""
+        async with httpx.AsyncClient(base_url=cache_server.url) as client:
+            full = await client.get(f"/assets/sha256/{DIGEST}")
+            ranged = await client.get(f"/assets/sha256/{DIGEST}", headers={"Range": "bytes=100-199"})
+            missing = await client.get(f"/assets/sha256/{'0' * 64}")
+            invalid = await client.get("/assets/sha256/..%2Fsecrets")
+
+        assert full.status_code == 200
+        assert full.content == DATA
+        assert ranged.status_code == 206
+        assert ranged.content == DATA[100:200]
+        assert missing.status_code == 404
+        assert invalid.status_code in (400, 404)
+
+    @pytest.mark.asyncio
+    async def test_changed_files_are_not_served(self, tmp_path, cache_server):
+        """A cached file modified since its verification is no longer vouched for."""
+        seed = cache_server.asset_manager
+        path = seed.find_verified_file(f"sha256:{DIGEST}")
+        assert path is not None
+
+        path.write_bytes(DATA[::-1])
+
+        assert seed.find_verified_file(f"sha256:{DIGEST}") is None
+
+
+class TestPeerMirrors:
+    """Tests for downloading assets from peers before their source."""
+
+    @pytest.mark.asyncio
+    async def test_asset_is_fetched_from_peer_instead_of_origin(self, cache_server, make_manager):
+        """A node with the seed as peer gets the asset without its unreachable origin."""
+        unreachable = AssetSourceConfig(type="http", url="http://127.0.0.1:9/model.bin", filename="model.bin")
+        node = make_manager(model(unreachable), node="node", peer_mirrors=[cache_server.url])
+
+        path = await node.get_asset_path("model")
+
+        assert path.read_bytes() == DATA
+        # The streamed checksum was recorded, so the node can serve the asset in turn
+        assert node.find_verified_file(f"sha256:{DIGEST}") == path
+
+    @pytest.mark.asyncio
+    async def test_falls_back_past_bad_peers_to_origin(self, origin, corrupt_peer, make_manager):
+        """Unreachable peers and peers serving other bytes are skipped, ending at the origin."""
+        node = make_manager(model(origin), node="node", peer_mirrors=["http://127.0.0.1:9", corrupt_peer.url + "/"])
+
+        path = await node.get_asset_path("model")
+
+        assert path.read_bytes() == DATA
+        assert corrupt_peer.requests == [f"/assets/sha256/{DIGEST}"]
+        assert not (path.parent / "model.bin.partial").exists()
+
+    @pytest.mark.asyncio
+    async def test_assets_without_checksum_skip_peers(self, origin, corrupt_peer, make_manager):
+        """Without a checksum nothing can be requested from or verified against a peer."""
+        node = make_manager(model(origin, checksum=False), node="node", peer_mirrors=[corrupt_peer.url])
+
+        path = await node.get_asset_path("model")
+
+        assert path.read_bytes() == DATA
+        assert corrupt_peer.requests == []
+
+    @pytest.mark.asyncio
+    async def test_unpacked_assets_skip_peers(self, tmp_path, corrupt_peer, make_manager):
+        """No node keeps the archive of an unpacked asset, so peers are not asked for it."""
+        archive = tmp_path / "origin" / "model.tar.gz"
+        archive.parent.mkdir()
+        with tarfile.open(archive, "w:gz") as tar:
+            info = tarfile.TarInfo("model.bin")
+            info.size = len(DATA)
+            tar.addfile(info, io.BytesIO(DATA))
+        asset = AssetConfig(
+            name="model",
+            source=AssetSourceConfig(type="local", path=archive, filename="model.tar.gz"),
+            checksum=f"sha256:{hashlib.sha256(archive.read_bytes()).hexdigest()}",
+            unpack=True,
+            unpack_format="tar.gz",
+        )
+        node = make_manager(asset, node="node", peer_mirrors=[corrupt_peer.url])
+
+        path = await node.get_asset_path("model")
+
+        assert (path / "model.bin").read_bytes() == DATA
+        assert corrupt_peer.requests == []
+
+    @pytest.mark.asyncio
+    async def test_origin_resumes_after_peers_fail(self, tmp_path, corrupt_peer):
+        """A partial download from the origin survives an attempt in which no peer has the file."""
+        origin_server = test_http_ranges.RangeServer()
+        try:
+            origin_server.drops = 1
+            origin_server.drop_after = 40 * 8192
+            source = AssetSourceConfig(type="http", url=origin_server.url, progress_report=False, download_segments=1)
+            downloader = PeerMirrorDownloader([corrupt_peer.url], HttpDownloader())
+            target = tmp_path / "model.bin"
+
+            with pytest.raises(AssetDownloadError):
+                await downloader.download(source, target, expected_checksum=test_http_ranges.CHECKSUM)
+            await downloader.download(source, target, expected_checksum=test_http_ranges.CHECKSUM)
+        finally:
+            origin_server.close()
+
+        assert target.read_bytes() == test_http_ranges.DATA
+        assert origin_server.requests == [None, f"bytes={40 * 8192}-{len(test_http_ranges.DATA) - 1}"]
+        assert len(corrupt_peer.requests) == 2
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["model.bin"]
@@ -0,0 +1,161 @@
+"""Tests for the content-addressed asset store."""
+
+import hashlib
+import os
+from unittest.mock import patch
+
+import pytest
+
+from openmas.assets.config import AssetConfig, AssetSourceConfig
+from openmas.assets.store import ContentStore, digest_of
+
+WEIGHTS = b"weights" * 1000
+DIGEST = hashlib.sha256(WEIGHTS).hexdigest()
+
+
+def stored_file(tmp_path, name):
+    """A downloaded file to be added to the store."""
+    path = tmp_path / "cache" / name / "model.bin"
+    path.parent.mkdir(parents=True)
+    path.write_bytes(WEIGHTS)
+    return path
+
+
+class TestContentStore:
+    """Tests for ContentStore."""
+
+    def test_identical_files_are_stored_once(self, tmp_path):
+        """A second copy of the same contents is discarded and its entry linked to the stored object."""
+        store = ContentStore(tmp_path / "store")
+        first = stored_file(tmp_path, "a")
+        second = stored_file(tmp_path, "b")
+
+        object_path = store.add(DIGEST, first, first)
+        store.add(DIGEST, second, second)
+
+        assert object_path == store.object_path(DIGEST)
+        assert first.read_bytes() == second.read_bytes() == WEIGHTS
+        assert os.path.samefile(first, second)
+        assert store.refcount(DIGEST) == 2
+        assert store.usage() == {
+            "objects": 1,
+            "bytes": len(WEIGHTS),
+            "references": 2,
+            "logical_bytes": 2 * len(WEIGHTS),
+        }
+
+    def test_object_is_deleted_with_its_last_entry(self, tmp_path):
+        """Releasing entries keeps the object until no entry links to it."""
+        store = ContentStore(tmp_path / "store")
+        first = stored_file(tmp_path, "a")
+        second = tmp_path / "cache" / "b" / "model.bin"
+        store.add(DIGEST, first, first)
+        assert store.link(DIGEST, second)
+
+        first.unlink()
+        assert not store.release(DIGEST, first)
+        assert store.has(DIGEST)
+
+        second.unlink()
+        assert store.release(DIGEST, second)
+        assert not store.has(DIGEST)
+        assert not store.link(DIGEST, second)
+
+    def test_collect_removes_objects_of_deleted_entries(self, tmp_path):
+        """Entries removed without releasing them leave stale references that collect() cleans up."""
+        store = ContentStore(tmp_path / "store")
+        kept = stored_file(tmp_path, "kept")
+        store.add(DIGEST, kept, kept)
+        orphan = stored_file(tmp_path, "orphan")
+        orphan.write_bytes(b"other")
+        orphan_digest = hashlib.sha256(b"other").hexdigest()
+        store.add(orphan_digest, orphan, orphan)
+        orphan.unlink()
+        # An entry replaced by other means no longer links to the object
+        kept.unlink()
+        kept.write_bytes(WEIGHTS)
+
+        assert store.collect() == {"objects_removed": 2, "bytes_freed": len(WEIGHTS) + 5}
+        assert list(store.refs_dir.iterdir()) == []
+        assert kept.read_bytes() == WEIGHTS
+
+    def test_symlink_mode(self, tmp_path):
+        """Entries can be symbolic links to the objects."""
+        store = ContentStore(tmp_path / "store", link_mode="symlink")
+        entry = stored_file(tmp_path, "a")
+
+        store.add(DIGEST, entry, entry)
+
+        assert entry.is_symlink()
+        assert entry.resolve() == store.object_path(DIGEST)
+        assert store.refcount(DIGEST) == 1
+
+    def test_invalid_arguments(self, tmp_path):
+        """Unknown link modes and checksum formats are rejected."""
+        with pytest.raises(ValueError, match="link mode"):
+            ContentStore(tmp_path / "store", link_mode="copy")
+        with pytest.raises(ValueError, match="sha256"):
+            digest_of("md5:abc")
+        assert digest_of("sha256:ABC") == "abc"
+
+
+def local_asset(tmp_path, name, checksum=True):
+    """A local asset holding WEIGHTS."""
+    source = tmp_path / "sources" / f"{name}.bin"
+    source.parent.mkdir(exist_ok=True)
+    source.write_bytes(WEIGHTS)
+    return AssetConfig(
+        name=name,
+        source=AssetSourceConfig(type="local", path=source, filename="model.bin"),
+        checksum=f"sha256:{DIGEST}" if checksum else None,
+    )
+
+
+@pytest.fixture
+def manager_settings():
+    """Managers in these tests use the content store."""
+    return {"content_store": True}
+
+
+class TestManagerContentStore:
+    """Tests for AssetManager with the content store enabled."""
+
+    @pytest.mark.asyncio
+    async def test_assets_with_the_same_contents_share_one_file(self, tmp_path, make_manager):
+        """The second asset is linked from the store without downloading it."""
+        manager = make_manager(local_asset(tmp_path, "a"), local_asset(tmp_path, "b"))
+        first = await manager.get_asset_path("a")
+
+        with patch.object(manager, "download_asset") as download:
+            second = await manager.get_asset_path("b")
+        download.assert_not_called()
+
+        assert second.read_bytes() == WEIGHTS
+        assert os.path.samefile(first, second)
+        assert manager.store.refcount(DIGEST) == 2
+        # The cache hit trusts the recorded digest of the shared file
+        assert await manager.get_asset_path("b") == second
+
+    @pytest.mark.asyncio
+    async def test_assets_without_checksum_are_hashed_into_the_store(self, tmp_path, make_manager):
+        """Downloads without a configured checksum are hashed and then deduplicated."""
+        manager = make_manager(local_asset(tmp_path, "a", checksum=False), local_asset(tmp_path, "b"))
+
+        first = await manager.get_asset_path("a")
+        second = await manager.get_asset_path("b")
+
+        assert os.path.samefile(first, second)
+        assert manager._read_metadata(first.parent / ".asset_info.json")["content"]["digest"] == f"sha256:{DIGEST}"
+
+    @pytest.mark.asyncio
+    async def test_clearing_assets_releases_the_stored_file(self, tmp_path, make_manager):
+        """The stored file is deleted when the last asset using it is cleared."""
+        manager = make_manager(local_asset(tmp_path, "a"), local_asset(tmp_path, "b"))
+        await manager.get_asset_path("a")
+        await manager.get_asset_path("b")
+
+        manager.clear_asset_cache("a")
+        assert manager.store.has(DIGEST)
+        manager.clear_asset_cache("b")
+        assert not manager.store.has(DIGEST)
+        assert manager.collect_store_garbage() == {"objects_removed": 0, "bytes_freed": 0}
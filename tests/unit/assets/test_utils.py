@@ -1,21 +1,28 @@
 """Tests for the asset management utility functions."""
 
+import asyncio
 import hashlib
 import io  # Import the io module for BytesIO
 import tarfile
+import threading
+import time
 import zipfile
 from pathlib import Path
+from typing import List
 
 import filelock
 import pytest
 
-from openmas.assets.exceptions import AssetUnpackError, AssetVerificationError
+from openmas.assets.exceptions import AssetCancelledError, AssetUnpackError, AssetVerificationError
 from openmas.assets.utils import (
     AssetLock,
+    BandwidthLimiter,
+    LockWaitStats,
     asset_lock,
     async_asset_lock,
     calculate_sha256,
     unpack_archive,
+    unpack_stream,
     verify_checksum,
 )
 
@@ -37,6 +44,20 @@ class TestChecksumUtils:
         result = calculate_sha256(test_file)
         assert result == expected_hash
 
+    def test_calculate_sha256_progress_and_cancellation(self, tmp_path):
+        """Hashing reports progress per chunk and stops when the cancel event is set."""
+        test_file = tmp_path / "test_file.bin"
+        test_file.write_bytes(b"x" * 2500)
+        reports = []
+
+        calculate_sha256(test_file, chunk_size=1000, progress=lambda done, total: reports.append((done, total)))
+        assert reports == [(1000, 2500), (2000, 2500), (2500, 2500)]
+
+        cancel_event = threading.Event()
+        cancel_event.set()
+        with pytest.raises(AssetCancelledError):
+            verify_checksum(test_file, "sha256:" + "0" * 64, cancel_event=cancel_event)
+
     def test_calculate_sha256_nonexistent_file(self):
         """Test calculating SHA256 hash for a nonexistent file."""
         with pytest.raises(FileNotFoundError):
@@ -436,6 +457,102 @@ class TestUnpackUtils:
         # Verify the path traversal was prevented (file should not exist)
         assert not (tmp_path / "outside.txt").exists()
 
+    def test_unpack_progress_and_cancellation(self, tmp_path):
+        """Unpacking reports extracted bytes per member and stops when the cancel event is set."""
+        archive_path = tmp_path / "test.zip"
+        with zipfile.ZipFile(archive_path, "w") as zip_file:
+            for i in range(3):
+                zip_file.writestr(f"file{i}.bin", b"x" * 100)
+
+        reports = []
+        unpack_archive(archive_path, tmp_path / "out", "zip", progress=lambda done, total: reports.append(done))
+        assert reports == [100, 200, 300]
+
+        cancel_event = threading.Event()
+
+        def cancel_after_first(done, total):
+            cancel_event.set()
+
+        with pytest.raises(AssetCancelledError):
+            unpack_archive(
+                archive_path, tmp_path / "cancelled", "zip", progress=cancel_after_first, cancel_event=cancel_event
+            )
+        assert [p.name for p in (tmp_path / "cancelled").iterdir()] == ["file0.bin"]
+
+
+class TestStreamUnpacking:
+    """Tests for extracting archives from a stream of chunks."""
+
+    @staticmethod
+    def make_archive(members, mode="w:gz"):
+        """Build a tar archive from (name, content) pairs."""
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode=mode) as tar_file:
+            for name, content in members:
+                info = tarfile.TarInfo(name)
+                info.size = len(content)
+                tar_file.addfile(info, io.BytesIO(content))
+        return buffer.getvalue()
+
+    @staticmethod
+    async def chunked(data, consumed, size=1000):
+        """Yield data in small chunks, recording how many were consumed."""
+        for start in range(0, len(data), size):
+            consumed.append(start)
+            await asyncio.sleep(0)
+            yield data[start : start + size]
+
+    @pytest.mark.asyncio
+    async def test_unpack_stream_extracts_safe_members(self, tmp_path):
+        """Members are extracted from the chunks, unsafe paths are skipped and the whole stream is consumed."""
+        content = bytes(range(256)) * 200
+        data = self.make_archive([("model/weights.bin", content), ("../outside.txt", b"malicious")])
+        data += b"\0" * 5000  # Trailing padding after the end of the archive
+        consumed: List[int] = []
+
+        path = await unpack_stream(self.chunked(data, consumed), tmp_path / "out", "tar.gz", max_pending_chunks=2)
+
+        assert path == tmp_path / "out"
+        assert (path / "model" / "weights.bin").read_bytes() == content
+        assert not (tmp_path / "outside.txt").exists()
+        assert len(consumed) == -(-len(data) // 1000)
+
+    @pytest.mark.asyncio
+    async def test_unpack_stream_destination_file_and_errors(self, tmp_path):
+        """A single-file archive returns its file, and a corrupt stream stops early with an unpack error."""
+        data = self.make_archive([("model.bin", b"weights")], mode="w:bz2")
+        path = await unpack_stream(self.chunked(data, []), tmp_path / "out", "tar.bz2", destination_is_file=True)
+        assert path.read_bytes() == b"weights"
+
+        consumed: List[int] = []
+        garbage = b"not an archive" * 10_000
+        with pytest.raises(AssetUnpackError):
+            await unpack_stream(self.chunked(garbage, consumed), tmp_path / "bad", "tar.gz", max_pending_chunks=2)
+        assert len(consumed) < len(garbage) // 1000
+
+        with pytest.raises(ValueError):
+            await unpack_stream(self.chunked(data, []), tmp_path / "zip", "zip")
+
+
+class TestBandwidthLimiter:
+    """Tests for the shared download rate limit."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_consumers_share_the_rate(self):
+        """Concurrent downloads together take as long as their combined bytes at the configured rate."""
+        limiter = BandwidthLimiter(1_000_000, burst=1)
+
+        async def download():
+            for _ in range(5):
+                await limiter.consume(20_000)
+
+        started = time.monotonic()
+        await asyncio.gather(*(download() for _ in range(3)))
+
+        assert 0.27 <= time.monotonic() - started < 1.0
+        with pytest.raises(ValueError):
+            BandwidthLimiter(0)
+
 
 class TestLockUtils:
     """Tests for the locking utility functions."""
@@ -549,3 +666,53 @@ class TestLockUtils:
         finally:
             # Release the external lock
             external_lock.release()
+
+    @pytest.mark.asyncio
+    async def test_async_lock_waits_without_blocking_loop(self, tmp_path):
+        """Waiting for a lock held elsewhere keeps the event loop running and is recorded."""
+        lock_path = tmp_path / "test.lock"
+        stats = LockWaitStats()
+        external_lock = filelock.FileLock(str(lock_path))
+        external_lock.acquire()
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticking = asyncio.create_task(ticker())
+        asyncio.get_running_loop().call_later(0.3, external_lock.release)
+        async with async_asset_lock(lock_path, stats=stats):
+            pass
+        ticking.cancel()
+
+        assert ticks > 10
+        assert stats.acquired == stats.contended == 1
+        assert stats.as_dict()["max_wait_ms"] >= 250
+
+    @pytest.mark.asyncio
+    async def test_async_lock_timeout_and_cancellation(self, tmp_path):
+        """The async lock gives up after its timeout and can be cancelled while waiting."""
+        lock_path = tmp_path / "test.lock"
+        stats = LockWaitStats()
+        external_lock = filelock.FileLock(str(lock_path))
+        external_lock.acquire()
+        try:
+            with pytest.raises(filelock.Timeout):
+                async with async_asset_lock(lock_path, timeout=0.1, stats=stats):
+                    pass
+            assert stats.timeouts == 1
+
+            waiting = asyncio.create_task(AssetLock(lock_path).__aenter__())
+            await asyncio.sleep(0.1)
+            waiting.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiting
+        finally:
+            external_lock.release()
+
+        # Neither attempt left the lock held
+        async with async_asset_lock(lock_path, timeout=0.1):
+            pass
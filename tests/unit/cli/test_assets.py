@@ -8,7 +8,7 @@ from typer.testing import CliRunner
 
 from openmas.assets.config import AssetConfig, AssetSourceConfig
 from openmas.assets.exceptions import AssetError
-from openmas.assets.manager import AssetManager
+from openmas.assets.manager import AssetManager, PrefetchReport, PrefetchResult
 from openmas.cli.assets import assets_app
 from openmas.config import ProjectConfig
 
@@ -437,3 +437,130 @@ def test_download_command_with_force(
     assert result.exit_code == 0
     assert "Successfully downloaded asset" in result.stdout
     mock_asset_manager.get_asset_path.assert_called_once_with("asset1", force_download=True)
+
+
+@patch("openmas.cli.assets.load_project_config")
+@patch("openmas.cli.assets.AssetManager")
+def test_download_command_all_prefetches_concurrently(
+    mock_asset_manager_cls, mock_load_config, cli_runner, mock_project_config, mock_asset_manager
+):
+    """Test that --all prefetches every asset and prints a summary, failing if one asset failed."""
+    mock_load_config.return_value = mock_project_config
+    mock_asset_manager_cls.return_value = mock_asset_manager
+    mock_asset_manager.prefetch = AsyncMock(
+        return_value=PrefetchReport(
+            [
+                PrefetchResult("asset1", path=Path("/cache/asset1"), downloaded=True, duration=1.5),
+                PrefetchResult("asset2", error=AssetError("unreachable"), duration=0.2),
+            ],
+            elapsed=1.6,
+        )
+    )
+
+    result = cli_runner.invoke(assets_app, ["download", "--all", "-j", "2", "--force"])
+
+    assert result.exit_code == 1
+    assert "downloaded" in result.stdout
+    assert "unreachable" in result.stdout
+    assert "Prefetched 1/2 assets" in result.stdout
+    mock_asset_manager.prefetch.assert_called_once()
+    args, kwargs = mock_asset_manager.prefetch.call_args
+    assert args == (["asset1", "asset2"],)
+    assert kwargs["concurrency"] == 2
+    assert kwargs["force_download"] is True
+    mock_asset_manager.get_asset_path.assert_not_called()
+
+
+@patch("openmas.cli.assets.load_project_config")
+@patch("openmas.cli.assets.AssetManager")
+def test_download_command_rejects_unknown_names_and_no_names(
+    mock_asset_manager_cls, mock_load_config, cli_runner, mock_project_config, mock_asset_manager
+):
+    """Test that several names must all exist and that some asset must be named."""
+    mock_load_config.return_value = mock_project_config
+    mock_asset_manager_cls.return_value = mock_asset_manager
+
+    result = cli_runner.invoke(assets_app, ["download", "asset1", "nope"])
+    assert result.exit_code == 1
+    assert "nope" in result.stdout
+
+    result = cli_runner.invoke(assets_app, ["download"])
+    assert result.exit_code == 1
+
+
+@patch("openmas.cli.assets.load_project_config")
+@patch("openmas.cli.assets.AssetManager")
+def test_gc_command(mock_asset_manager_cls, mock_load_config, cli_runner, mock_project_config, mock_asset_manager):
+    """Test that gc reports what the content store freed, or that the store is disabled."""
+    mock_load_config.return_value = mock_project_config
+    mock_asset_manager_cls.return_value = mock_asset_manager
+    mock_asset_manager.collect_store_garbage.return_value = {"objects_removed": 3, "bytes_freed": 2 * 1024 * 1024}
+
+    result = cli_runner.invoke(assets_app, ["gc"])
+    assert result.exit_code == 0
+    assert "Removed 3 unused files, freeing 2.00 MB" in result.stdout
+
+    mock_asset_manager.collect_store_garbage.return_value = None
+    result = cli_runner.invoke(assets_app, ["gc"])
+    assert result.exit_code == 0
+    assert "not enabled" in result.stdout
+
+
+@patch("openmas.cli.assets.load_project_config")
+@patch("openmas.cli.assets.AssetManager")
+def test_usage_command(mock_asset_manager_cls, mock_load_config, cli_runner, mock_project_config, mock_asset_manager):
+    """Test that usage lists cached assets with the total and evicts on request."""
+    mock_load_config.return_value = mock_project_config
+    mock_asset_manager_cls.return_value = mock_asset_manager
+    mock_asset_manager.cache_usage.return_value = {
+        "entries": [
+            {
+                "name": "asset1",
+                "version": "1.0.0",
+                "asset_type": "model",
+                "path": Path("/cache/model/asset1/1.0.0"),
+                "bytes": 3 * 1024 * 1024,
+                "last_accessed": 1_700_000_000.0,
+                "pinned": True,
+            }
+        ],
+        "total_bytes": 3 * 1024 * 1024,
+        "store_bytes": 0,
+        "max_bytes": 10 * 1024 * 1024,
+    }
+    mock_asset_manager.evict_to_limit.return_value = {
+        "evicted": ["old@0.9"],
+        "bytes_freed": 1024 * 1024,
+        "total_bytes": 3 * 1024 * 1024,
+    }
+
+    result = cli_runner.invoke(assets_app, ["usage"])
+    assert result.exit_code == 0
+    assert "asset1" in result.stdout
+    assert "3.00 MB of 10.00 MB" in result.stdout
+    mock_asset_manager.evict_to_limit.assert_not_called()
+
+    result = cli_runner.invoke(assets_app, ["usage", "--evict", "--max-size-gb", "1"])
+    assert result.exit_code == 0
+    assert "Evicted 1 assets, freeing 1.00 MB" in result.stdout
+    mock_asset_manager.evict_to_limit.assert_called_once_with(1024**3)
+
+
+@patch("openmas.cli.assets.load_project_config")
+@patch("openmas.cli.assets.AssetManager")
+@patch("openmas.cli.assets.AssetCacheServer")
+def test_serve_command(
+    mock_server_cls, mock_asset_manager_cls, mock_load_config, cli_runner, mock_project_config, mock_asset_manager
+):
+    """Test that serve runs a cache server for the project's asset manager on the given address."""
+    mock_load_config.return_value = mock_project_config
+    mock_asset_manager_cls.return_value = mock_asset_manager
+    mock_asset_manager.cache_dir = Path("/cache")
+    mock_server_cls.return_value.serve_forever = AsyncMock()
+
+    result = cli_runner.invoke(assets_app, ["serve", "--host", "127.0.0.1", "--port", "9000"])
+
+    assert result.exit_code == 0
+    assert "Serving asset cache /cache on 127.0.0.1:9000" in result.stdout
+    mock_server_cls.assert_called_once_with(mock_asset_manager, host="127.0.0.1", port=9000)
+    mock_server_cls.return_value.serve_forever.assert_awaited_once()
@@ -0,0 +1,119 @@
+"""Tests for the multi-process worker supervisor."""
+
+import json
+import sys
+import time
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from openmas.cli.main import cli
+from openmas.cli.workers import WorkerSupervisor
+
+
+def python(script: str) -> list:
+    """Build a replica command running a Python snippet."""
+    return [sys.executable, "-c", script]
+
+
+def wait_until(condition, timeout: float = 10.0) -> bool:
+    """Poll a condition until it holds or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+class TestWorkerSupervisor:
+    """Tests for the WorkerSupervisor class."""
+
+    def test_replicas_get_worker_environment(self, tmp_path):
+        """Every replica knows its id and the sharing settings, and clean exits are not restarted."""
+        script = (
+            "import json, os, sys; "
+            "keys = ['OPENMAS_WORKER_ID', 'OPENMAS_WORKER_COUNT', 'OPENMAS_REUSE_PORT', 'OPENMAS_MQTT_SHARED_GROUP']; "
+            f"open(os.path.join({str(tmp_path)!r}, os.environ['OPENMAS_WORKER_ID'] + '.json'), 'w')"
+            ".write(json.dumps({k: os.environ[k] for k in keys}))"
+        )
+        supervisor = WorkerSupervisor(python(script), 2, env={}, name="calc", poll_interval=0.02)
+
+        assert supervisor.run() == 0
+
+        assert supervisor.finished
+        assert json.loads((tmp_path / "1.json").read_text()) == {
+            "OPENMAS_WORKER_ID": "1",
+            "OPENMAS_WORKER_COUNT": "2",
+            "OPENMAS_REUSE_PORT": "1",
+            "OPENMAS_MQTT_SHARED_GROUP": "calc",
+        }
+        assert supervisor.status()["restarts"] == 0
+
+    def test_crashed_replica_is_restarted(self, tmp_path):
+        """A replica exiting with an error is restarted, and the status file records the restart."""
+        marker = tmp_path / "crashed"
+        status_file = tmp_path / "status.json"
+        # Crash on the first run, then stay up
+        script = (
+            "import os, sys, time\n"
+            f"if not os.path.exists({str(marker)!r}):\n"
+            f"    open({str(marker)!r}, 'w').close()\n"
+            "    sys.exit(3)\n"
+            "time.sleep(30)\n"
+        )
+        supervisor = WorkerSupervisor(
+            python(script), 1, restart_backoff=0.01, status_file=status_file, poll_interval=0.02
+        )
+        supervisor.start()
+
+        def restarted():
+            supervisor.poll()
+            return supervisor.workers[0].restarts == 1
+
+        try:
+            assert wait_until(restarted)
+            assert wait_until(lambda: supervisor.workers[0].alive)
+        finally:
+            supervisor.stop()
+
+        status = json.loads(status_file.read_text())
+        assert status["restarts"] == 1
+        assert status["alive"] == 0
+        assert supervisor.workers[0].restarts == 1
+
+    def test_stop_drains_then_kills(self):
+        """Replicas handling SIGTERM exit gracefully, and those ignoring it are killed after the timeout."""
+        graceful = WorkerSupervisor(python("import time; time.sleep(30)"), 1, drain_timeout=5)
+        graceful.start()
+        graceful.stop()
+        assert graceful.workers[0].last_exit_code == -15
+
+        stubborn_script = "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); time.sleep(30)"
+        stubborn = WorkerSupervisor(python(stubborn_script), 1, drain_timeout=0.2)
+        stubborn.start()
+        # Give the replica a moment to install its handler
+        time.sleep(0.3)
+        started = time.monotonic()
+        stubborn.stop()
+        assert time.monotonic() - started < 5
+        assert stubborn.workers[0].last_exit_code == -9
+
+
+class TestRunWorkersOption:
+    """Tests for the --workers option of openmas run."""
+
+    def test_workers_option_starts_supervisor(self, tmp_path):
+        """More than one worker hands the agent over to the supervisor."""
+        with patch("openmas.cli.workers.run_workers", return_value=0) as run_workers:
+            result = CliRunner().invoke(
+                cli, ["run", "agent", "--workers", "3", "--project-dir", str(tmp_path), "--drain-timeout", "5"]
+            )
+
+        assert result.exit_code == 0
+        run_workers.assert_called_once_with("agent", 3, tmp_path, None, 5.0, None)
+
+    def test_workers_must_be_positive(self):
+        """Zero workers is rejected."""
+        result = CliRunner().invoke(cli, ["run", "agent", "--workers", "0"])
+        assert result.exit_code != 0
@@ -4,7 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from openmas.communication.http import HttpCommunicator
+from openmas.communication.http import HttpCommunicator, _bind_reuse_port_socket
 
 
 @pytest.mark.asyncio
@@ -127,3 +127,18 @@ async def test_port_fallback_for_other_agents():
 
         # Port should now be the default fallback
         assert communicator.port == 8000
+
+
+def test_reuse_port_sockets_share_a_port(monkeypatch):
+    """Replicas started with OPENMAS_REUSE_PORT=1 can all bind the agent's port."""
+    monkeypatch.setenv("OPENMAS_REUSE_PORT", "1")
+    assert HttpCommunicator("test-agent", {}).reuse_port
+
+    first = _bind_reuse_port_socket(0)
+    try:
+        port = first.getsockname()[1]
+        second = _bind_reuse_port_socket(port)
+        assert second.getsockname()[1] == port
+        second.close()
+    finally:
+        first.close()
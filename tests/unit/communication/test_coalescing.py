@@ -0,0 +1,188 @@
+"""Tests for request coalescing."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from openmas.agent.mcp import McpAgent
+from openmas.communication.coalescing import RequestCoalescer
+from openmas.config import AgentConfig
+
+
+class TestRequestCoalescer:
+    """Tests for the RequestCoalescer class."""
+
+    def test_make_key_ignores_dict_order(self):
+        """Parameters that differ only in ordering share a key."""
+        assert RequestCoalescer.make_key("svc", "m", {"a": 1, "b": 2}) == RequestCoalescer.make_key(
+            "svc", "m", {"b": 2, "a": 1}
+        )
+        assert RequestCoalescer.make_key("svc", "m", {"a": 1}) != RequestCoalescer.make_key("other", "m", {"a": 1})
+
+    def test_is_coalescable_patterns(self):
+        """The allowlist accepts exact names and fnmatch patterns."""
+        coalescer = RequestCoalescer(["prompt/sample", "tool/call/get_*"])
+        assert coalescer.is_coalescable("prompt/sample")
+        assert coalescer.is_coalescable("tool/call/get_weather")
+        assert not coalescer.is_coalescable("tool/call/delete_file")
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_requests_share_one_call(self):
+        """Concurrent identical requests trigger a single underlying call."""
+        coalescer = RequestCoalescer(["search"])
+        calls = 0
+        release = asyncio.Event()
+
+        async def call():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"result": calls}
+
+        tasks = [asyncio.create_task(coalescer.run("svc", "search", {"q": "x"}, call)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert coalescer.in_flight == 1
+        release.set()
+
+        results = await asyncio.gather(*tasks)
+        assert results == [{"result": 1}] * 5
+        assert calls == 1
+        assert coalescer.stats() == {"calls": 1, "coalesced": 4, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_callers_get_their_own_copy_of_the_result(self):
+        """A caller modifying a shared result does not change it for the others."""
+        coalescer = RequestCoalescer(["search"])
+        release = asyncio.Event()
+
+        async def call():
+            await release.wait()
+            return {"hits": ["a"]}
+
+        async def search_and_modify():
+            result = await coalescer.run("svc", "search", {"q": "x"}, call)
+            result["hits"].append("mine")
+            return result
+
+        tasks = [asyncio.create_task(search_and_modify()) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*tasks)
+        assert results == [{"hits": ["a", "mine"]}] * 3
+        assert len({id(result) for result in results}) == 3
+
+    @pytest.mark.asyncio
+    async def test_not_allowlisted_or_different_params_are_not_shared(self):
+        """Requests outside the allowlist or with different parameters run separately."""
+        coalescer = RequestCoalescer(["search"])
+        call = AsyncMock(return_value="ok")
+
+        await asyncio.gather(
+            coalescer.run("svc", "write", {"q": "x"}, call),
+            coalescer.run("svc", "write", {"q": "x"}, call),
+            coalescer.run("svc", "search", {"q": "x"}, call),
+            coalescer.run("svc", "search", {"q": "y"}, call),
+        )
+        assert call.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_exception_is_fanned_out(self):
+        """All waiters receive the exception raised by the shared call."""
+        coalescer = RequestCoalescer(["search"])
+
+        async def call():
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            coalescer.run("svc", "search", None, call),
+            coalescer.run("svc", "search", None, call),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert coalescer.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_waiter_does_not_cancel_the_call(self):
+        """The shared call survives while other callers are still waiting."""
+        coalescer = RequestCoalescer(["search"])
+        release = asyncio.Event()
+
+        async def call():
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(coalescer.run("svc", "search", None, call))
+        second = asyncio.create_task(coalescer.run("svc", "search", None, call))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await second == "done"
+        assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_cancelling_last_waiter_cancels_the_call(self):
+        """The shared call is cancelled once nobody is waiting for it."""
+        coalescer = RequestCoalescer(["search"])
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def call():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        task = asyncio.create_task(coalescer.run("svc", "search", None, call))
+        await started.wait()
+        task.cancel()
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        await asyncio.sleep(0)
+        assert coalescer.in_flight == 0
+
+
+class TestMcpAgentCoalescing:
+    """Tests for request coalescing in McpAgent."""
+
+    @pytest.mark.asyncio
+    async def test_call_tool_coalesces_allowlisted_tools(self, tmp_path):
+        """Identical concurrent call_tool requests share one communicator call."""
+        agent = McpAgent(config=AgentConfig(name="test"), project_root=tmp_path)
+        communicator = AsyncMock()
+
+        async def slow_call_tool(**kwargs):
+            await asyncio.sleep(0.01)
+            return {"tool": kwargs["tool_name"]}
+
+        communicator.call_tool.side_effect = slow_call_tool
+        agent.communicator = communicator
+        coalescer = agent.enable_request_coalescing(["tool/call/lookup"])
+
+        results = await asyncio.gather(
+            *[agent.call_tool("svc", "lookup", {"id": 1}) for _ in range(3)],
+            agent.call_tool("svc", "update", {"id": 1}),
+            agent.call_tool("svc", "update", {"id": 1}),
+        )
+
+        assert results[:3] == [{"tool": "lookup"}] * 3
+        assert communicator.call_tool.await_count == 3
+        assert coalescer.stats()["coalesced"] == 2
+
+    @pytest.mark.asyncio
+    async def test_call_tool_without_coalescing(self, tmp_path):
+        """Coalescing is disabled by default."""
+        agent = McpAgent(config=AgentConfig(name="test"), project_root=tmp_path)
+        communicator = AsyncMock()
+        communicator.call_tool.return_value = "ok"
+        agent.communicator = communicator
+
+        await asyncio.gather(agent.call_tool("svc", "lookup", {"id": 1}), agent.call_tool("svc", "lookup", {"id": 1}))
+        assert agent.request_coalescer is None
+        assert communicator.call_tool.await_count == 2
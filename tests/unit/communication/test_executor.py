@@ -0,0 +1,187 @@
+"""Tests for offloading blocking and CPU-bound handlers."""
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from openmas.agent.base import BaseAgent
+from openmas.communication import HandlerExecutor, InProcessCommunicator, LocalRouter, offload
+from openmas.config import AgentConfig
+from openmas.exceptions import CommunicationError, ConfigurationError
+
+
+@offload("cpu")
+def worker_pid(params):
+    """Report the process the handler runs in."""
+    return {"pid": os.getpid(), "square": params["n"] ** 2}
+
+
+class Agent(BaseAgent):
+    """Minimal agent for the tests."""
+
+    async def setup(self) -> None:
+        pass
+
+    async def run(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    @offload("cpu")
+    def bound_cpu_handler(self, params):
+        return params
+
+
+@pytest.fixture
+async def pair():
+    """A started client and server communicator sharing a router and an executor."""
+    router = LocalRouter()
+    executor = HandlerExecutor(thread_workers=2, process_workers=1)
+    client = InProcessCommunicator("client", {}, router=router)
+    server = InProcessCommunicator("server", {}, router=router)
+    server.handler_executor = executor
+    await client.start()
+    await server.start()
+    yield client, server, executor
+    await client.stop()
+    await server.stop()
+    executor.shutdown()
+
+
+class TestHandlerOffload:
+    """Tests for handlers marked with offload()."""
+
+    def test_unknown_kind_is_rejected(self):
+        """Only the blocking and cpu kinds exist."""
+        with pytest.raises(ValueError):
+            offload("gpu")
+
+    @pytest.mark.asyncio
+    async def test_blocking_handler_keeps_loop_responsive(self, pair):
+        """A sync blocking handler runs on the thread pool while the event loop keeps running."""
+        client, server, executor = pair
+        ticks = []
+
+        @offload("blocking")
+        def slow(params):
+            time.sleep(0.3)
+            return {"thread": threading.current_thread().name}
+
+        async def ticker():
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        await server.register_handler("slow", slow)
+        ticking = asyncio.create_task(ticker())
+        result = await client.send_request("server", "slow")
+        ticking.cancel()
+
+        assert result["thread"].startswith("openmas-handler")
+        assert len(ticks) > 10
+        assert executor.stats()["blocking"]["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_blocking_handler_and_errors(self, pair):
+        """Coroutine handlers run on the worker thread's own loop, and their errors reach the caller."""
+        client, server, _ = pair
+
+        @offload("blocking")
+        async def where(params):
+            return threading.current_thread() is threading.main_thread()
+
+        @offload("blocking")
+        def fail(params):
+            raise RuntimeError("boom")
+
+        await server.register_handler("where", where)
+        await server.register_handler("fail", fail)
+
+        assert await client.send_request("server", "where") is False
+        with pytest.raises(CommunicationError, match="boom"):
+            await client.send_request("server", "fail")
+
+    @pytest.mark.asyncio
+    async def test_cpu_handler_runs_in_worker_process(self, pair, tmp_path):
+        """A module-level cpu handler runs in a separate process."""
+        client, server, executor = pair
+        await server.register_handler("square", worker_pid)
+
+        # Spawning a worker needs a valid working directory, which other tests may have removed
+        try:
+            previous_cwd = os.getcwd()
+        except FileNotFoundError:
+            previous_cwd = None
+        os.chdir(tmp_path)
+        try:
+            result = await client.send_request("server", "square", {"n": 7})
+        finally:
+            if previous_cwd is not None:
+                os.chdir(previous_cwd)
+
+        assert result["square"] == 49
+        assert result["pid"] != os.getpid()
+        assert executor.stats()["cpu"]["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_queue_metrics(self):
+        """Calls beyond the pool size are counted as queued while they wait for a worker."""
+        executor = HandlerExecutor(thread_workers=1)
+        try:
+            results = await asyncio.gather(*(executor.run("blocking", time.sleep, 0.05) for _ in range(3)))
+            stats = executor.stats()["blocking"]
+        finally:
+            executor.shutdown()
+
+        assert results == [None, None, None]
+        assert stats["workers"] == 1
+        assert stats["submitted"] == stats["completed"] == 3
+        assert stats["max_queued"] == 2
+        assert stats["queued"] == stats["running"] == 0
+        assert stats["avg_wait_ms"] > 0
+
+
+class TestAgentHandlerExecutor:
+    """Tests for the executor owned by BaseAgent."""
+
+    @pytest.mark.asyncio
+    async def test_agent_owns_executor(self, tmp_path):
+        """The agent sizes the pools from its config, shares them with its communicator and shuts them down."""
+        config = AgentConfig(name="analyst", communicator_type="inproc", handler_thread_workers=3)
+        agent = Agent(config=config, project_root=tmp_path)
+
+        assert agent.handler_executor.thread_workers == 3
+        assert agent.communicator.handler_executor is agent.handler_executor
+        with pytest.raises(ConfigurationError, match="module-level function"):
+            await agent.communicator.register_handler("bound", agent.bound_cpu_handler)
+
+        await agent.start()
+        await agent.handler_executor.run("blocking", time.sleep, 0)
+        await agent.stop()
+        assert agent.handler_executor._threads is None
+
+    @pytest.mark.asyncio
+    async def test_stop_does_not_wait_for_hung_handlers(self, tmp_path):
+        """stop() gives up on a handler still running after handler_shutdown_timeout and cancels queued calls."""
+        config = AgentConfig(
+            name="analyst", communicator_type="inproc", handler_thread_workers=1, handler_shutdown_timeout=0.1
+        )
+        agent = Agent(config=config, project_root=tmp_path)
+        release = threading.Event()
+        await agent.start()
+        hung = asyncio.ensure_future(agent.handler_executor.run("blocking", release.wait))
+        queued = asyncio.ensure_future(agent.handler_executor.run("blocking", time.sleep, 0))
+        await asyncio.sleep(0.05)
+
+        try:
+            await asyncio.wait_for(agent.stop(), timeout=5)
+            assert not hung.done()
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+        finally:
+            release.set()
+        assert await hung is True
@@ -61,6 +61,19 @@ def test_load_mqtt_communicator_already_registered(mock_register):
 # --- Tests for get_communicator_by_type ---
 
 
+@patch.dict(comm_module.COMMUNICATOR_TYPES)
+@patch("openmas.communication.register_communicator")
+def test_get_communicator_by_type_shm_without_entry_points(mock_register):
+    """Test that "shm" resolves through its lazy loader, without installed entry-point metadata."""
+    from openmas.communication.shm import SharedMemoryCommunicator
+
+    comm_module.COMMUNICATOR_TYPES.pop("shm", None)
+    with patch("openmas.communication.discover_communicator_extensions") as mock_discover:
+        assert get_communicator_by_type("shm") is SharedMemoryCommunicator
+    mock_discover.assert_not_called()
+    mock_register.assert_called_once_with("shm", SharedMemoryCommunicator)
+
+
 # Use the real HttpCommunicator for this test, as it's guaranteed available
 def test_get_communicator_by_type_builtin():
     """Test getting a built-in communicator type like http."""
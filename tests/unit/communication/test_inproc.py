@@ -0,0 +1,136 @@
+"""Tests for the in-process communicator."""
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from openmas.communication import InProcessCommunicator, LocalRouter, get_communicator_by_type
+from openmas.exceptions import (
+    CommunicationError,
+    MethodNotFoundError,
+    RequestTimeoutError,
+    ServiceNotFoundError,
+    ValidationError,
+)
+
+
+class Reply(BaseModel):
+    """Response model for the tests."""
+
+    total: int
+
+
+@pytest.fixture
+def router():
+    """A router isolated from the process-wide default."""
+    return LocalRouter()
+
+
+@pytest.fixture
+async def pair(router):
+    """A started client and server communicator sharing a router."""
+    client = InProcessCommunicator("client", {"calc": "inproc://server"}, router=router)
+    server = InProcessCommunicator("server", {}, router=router)
+    await client.start()
+    await server.start()
+    yield client, server
+    await client.stop()
+    await server.stop()
+
+
+class TestInProcessCommunicator:
+    """Tests for the InProcessCommunicator class."""
+
+    def test_registered_as_inproc(self):
+        """The communicator is available under the "inproc" type."""
+        assert get_communicator_by_type("inproc") is InProcessCommunicator
+
+    @pytest.mark.asyncio
+    async def test_request_passes_objects_without_copying(self, pair):
+        """Handlers receive the caller's objects, and aliases in service_urls are resolved."""
+        client, server = pair
+        payload = {"values": [1, 2, 3]}
+        received = []
+
+        async def add(params):
+            received.append(params)
+            return {"total": sum(params["values"])}
+
+        await server.register_handler("add", add)
+
+        assert await client.send_request("calc", "add", payload) == {"total": 6}
+        assert await client.send_request("server", "add", payload, response_model=Reply) == Reply(total=6)
+        assert received[0] is payload
+
+    @pytest.mark.asyncio
+    async def test_notification_calls_handler(self, pair):
+        """Notifications are delivered to the handler."""
+        client, server = pair
+        seen = []
+
+        async def record(params):
+            seen.append(params["event"])
+
+        await server.register_handler("record", record)
+        await client.send_notification("server", "record", {"event": "started"})
+        assert seen == ["started"]
+
+    @pytest.mark.asyncio
+    async def test_errors_match_http_semantics(self, pair):
+        """Missing services and methods, handler errors and bad responses raise OpenMAS errors."""
+        client, server = pair
+
+        async def fail(params):
+            raise RuntimeError("boom")
+
+        async def bad(params):
+            return {"total": "not a number"}
+
+        await server.register_handler("fail", fail)
+        await server.register_handler("bad", bad)
+
+        with pytest.raises(ServiceNotFoundError):
+            await client.send_request("nowhere", "add")
+        with pytest.raises(MethodNotFoundError):
+            await client.send_request("server", "missing")
+        with pytest.raises(CommunicationError, match="boom"):
+            await client.send_request("server", "fail")
+        with pytest.raises(ValidationError):
+            await client.send_request("server", "bad", response_model=Reply)
+
+    @pytest.mark.asyncio
+    async def test_stopped_agent_is_unreachable(self, pair):
+        """Stopping a communicator removes it from the router."""
+        client, server = pair
+
+        async def ping(params):
+            return "pong"
+
+        await server.register_handler("ping", ping)
+        await server.stop()
+        with pytest.raises(ServiceNotFoundError):
+            await client.send_request("server", "ping")
+
+    @pytest.mark.asyncio
+    async def test_full_mailbox_applies_backpressure(self, router):
+        """Senders wait for a mailbox slot, and the wait counts against their timeout."""
+        client = InProcessCommunicator("client", {}, router=router)
+        server = InProcessCommunicator("server", {}, router=router, mailbox_size=1)
+        await server.start()
+        release = asyncio.Event()
+
+        async def slow(params):
+            await release.wait()
+            return "done"
+
+        await server.register_handler("slow", slow)
+
+        first = asyncio.create_task(client.send_request("server", "slow"))
+        await asyncio.sleep(0)
+        with pytest.raises(RequestTimeoutError):
+            await client.send_request("server", "slow", timeout=0.05)
+
+        release.set()
+        assert await first == "done"
+        assert await client.send_request("server", "slow", timeout=1) == "done"
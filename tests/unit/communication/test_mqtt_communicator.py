@@ -119,6 +119,19 @@ class TestMqttCommunicator:
         assert mqtt_communicator._is_started is False
         mqtt_communicator.client.disconnect.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_shared_group_subscriptions(self, mqtt_communicator):
+        """Replicas in a shared group split requests but each receives its own responses."""
+        mqtt_communicator.shared_group = "workers"
+        await mqtt_communicator.start()
+        await mqtt_communicator.register_handler("work", mock.AsyncMock())
+
+        prefix = f"{mqtt_communicator.topic_prefix}/{mqtt_communicator.agent_name}"
+        mqtt_communicator.client.subscribe.assert_any_call(f"$share/workers/{prefix}/request/#")
+        mqtt_communicator.client.subscribe.assert_any_call(f"{prefix}/response/#")
+        mqtt_communicator.client.subscribe.assert_any_call(f"$share/workers/{prefix}/notification/work")
+        await mqtt_communicator.stop()
+
     @pytest.mark.asyncio
     async def test_register_handler(self, mqtt_communicator):
         """Test registering a handler."""
@@ -0,0 +1,138 @@
+"""Tests for the shared-memory IPC communicator."""
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from openmas.communication.shm import SharedMemoryCommunicator, ShmRing
+from openmas.exceptions import CommunicationError, MethodNotFoundError, RequestTimeoutError, ServiceNotFoundError
+
+
+class Size(BaseModel):
+    """Response model for the tests."""
+
+    size: int
+
+
+@pytest.fixture
+async def pair(tmp_path):
+    """A started client and server communicator sharing a socket directory."""
+    options = {"socket_dir": str(tmp_path), "ring_size": 8192, "inline_threshold": 1024}
+    client = SharedMemoryCommunicator("client", {"store": "shm://server"}, communicator_options=options)
+    server = SharedMemoryCommunicator("server", {}, communicator_options=options)
+    await server.start()
+    await client.start()
+    yield client, server
+    await client.stop()
+    await server.stop()
+
+
+class TestShmRing:
+    """Tests for the ShmRing allocator."""
+
+    def test_allocations_wrap_and_are_reclaimed_in_order(self):
+        """Space is reclaimed from the tail once older allocations are freed."""
+        ring = ShmRing(100)
+        try:
+            first = ring.alloc(40)
+            second = ring.alloc(40)
+            assert first == (1, 0) and second == (2, 40)
+            assert ring.alloc(40) is None
+
+            # Freeing the newer allocation does not reclaim anything yet
+            ring.free(2)
+            assert ring.alloc(40) is None
+
+            ring.free(1)
+            assert ring.used == 0
+            assert ring.alloc(60) == (3, 0)
+            assert ring.alloc(30) == (4, 60)
+            ring.free(3)
+            # [90, 100) is too small, so the next allocation wraps to the start
+            assert ring.alloc(50) == (5, 0)
+        finally:
+            ring.close()
+
+
+class TestSharedMemoryCommunicator:
+    """Tests for the SharedMemoryCommunicator class."""
+
+    @pytest.mark.asyncio
+    async def test_large_payloads_travel_through_shared_memory(self, pair):
+        """Large request payloads reach the handler as views, and large results come back as bytes."""
+        client, server = pair
+        received = {}
+
+        async def store(params):
+            # Views are only valid during the handler, so record their properties only
+            received["type"] = type(params["blob"])
+            received["readonly"] = params["blob"].readonly
+            received["size"] = params["blob"].nbytes
+            return {"echo": bytes(params["blob"]), "note": params["note"]}
+
+        await server.register_handler("store", store)
+        blob = bytes(range(256)) * 8
+
+        result = await client.send_request("store", "store", {"blob": blob, "note": "hi"})
+
+        assert received["type"] is memoryview
+        assert received["readonly"]
+        assert received["size"] == len(blob)
+        assert result == {"echo": blob, "note": "hi"}
+        # Request and response slots are released once the exchange completes
+        await asyncio.sleep(0.01)
+        assert client._ring is not None and client._ring.used == 0
+        assert server._ring is not None and server._ring.used == 0
+
+    @pytest.mark.asyncio
+    async def test_small_payloads_and_notifications(self, pair):
+        """Small binary payloads are sent inline, and notifications reach their handler."""
+        client, server = pair
+        seen = []
+
+        async def size(params):
+            return {"size": len(params["data"])}
+
+        async def record(params):
+            seen.append(params["event"])
+
+        await server.register_handler("size", size)
+        await server.register_handler("record", record)
+
+        assert await client.send_request("server", "size", {"data": b"abc"}, response_model=Size) == Size(size=3)
+        assert client._ring is None
+        await client.send_notification("server", "record", {"event": "started"})
+        assert seen == ["started"]
+
+    @pytest.mark.asyncio
+    async def test_error_semantics(self, pair):
+        """Errors map to the same exceptions as the HTTP communicator."""
+        client, server = pair
+
+        async def fail(params):
+            raise RuntimeError("boom")
+
+        async def slow(params):
+            await asyncio.sleep(1)
+
+        await server.register_handler("fail", fail)
+        await server.register_handler("slow", slow)
+
+        with pytest.raises(ServiceNotFoundError):
+            await client.send_request("nowhere", "ping")
+        with pytest.raises(MethodNotFoundError):
+            await client.send_request("server", "missing")
+        with pytest.raises(CommunicationError, match="boom"):
+            await client.send_request("server", "fail")
+        with pytest.raises(RequestTimeoutError):
+            await client.send_request("server", "slow", timeout=0.05)
+
+    @pytest.mark.asyncio
+    async def test_stopped_server_is_not_found(self, pair):
+        """Connecting to an agent that stopped listening raises ServiceNotFoundError."""
+        client, server = pair
+        await server.stop()
+        assert not server.socket_path.exists()
+        with pytest.raises(ServiceNotFoundError):
+            await client.send_request("store", "ping")
@@ -0,0 +1,161 @@
+"""Unit tests for the LLM rate limiter."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from openmas.integrations.rate_limit import (
+    LlmPriority,
+    LlmRateLimiter,
+    TokenBucket,
+    extract_token_usage,
+    get_llm_rate_limiter,
+    is_rate_limit_error,
+)
+
+
+class RateLimitError(Exception):
+    """Stand-in for the providers' rate-limit exception."""
+
+    def __init__(self, retry_after: str = "0") -> None:
+        super().__init__("rate limited")
+        self.response = SimpleNamespace(status_code=429, headers={"retry-after": retry_after})
+
+
+class StubCompletions:
+    """Local stub for a synchronous chat completions client."""
+
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.calls = 0
+
+    def create(self, **kwargs):
+        """Return a response with OpenAI-style usage, failing with 429 first if configured."""
+        self.calls += 1
+        if self.failures:
+            self.failures -= 1
+            raise RateLimitError()
+        return SimpleNamespace(content=kwargs["prompt"], usage=SimpleNamespace(total_tokens=kwargs.get("tokens", 10)))
+
+
+class TestHelpers:
+    """Tests for usage extraction and error classification."""
+
+    def test_extract_token_usage_for_providers(self):
+        """Usage is read from OpenAI, Anthropic and Google response shapes."""
+        assert extract_token_usage({"usage": {"total_tokens": 12}}) == 12
+        assert extract_token_usage(SimpleNamespace(usage=SimpleNamespace(input_tokens=3, output_tokens=4))) == 7
+        assert extract_token_usage(SimpleNamespace(usage_metadata=SimpleNamespace(total_token_count=9))) == 9
+        assert extract_token_usage("no usage") is None
+
+    def test_is_rate_limit_error(self):
+        """429 errors are recognised by status code and exception name."""
+        assert is_rate_limit_error(RateLimitError())
+        assert is_rate_limit_error(SimpleNamespace(status_code=429))  # type: ignore[arg-type]
+        assert not is_rate_limit_error(ValueError("bad request"))
+
+    def test_token_bucket_waits_for_refill(self):
+        """An empty bucket reports the time until enough has been refilled."""
+        bucket = TokenBucket(per_minute=60)
+        bucket.consume(60)
+        assert 0.9 < bucket.time_until(1) <= 1.0
+        assert bucket.time_until(1000) > 59
+
+
+class TestLlmRateLimiter:
+    """Tests for the LlmRateLimiter scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_call_records_usage_from_response(self):
+        """Reserved tokens are corrected with the usage reported by the response."""
+        limiter = LlmRateLimiter(tokens_per_minute=1000)
+        client = StubCompletions()
+
+        response = await limiter.call(client.create, prompt="hi", tokens=50, estimated_tokens=200)
+
+        assert response.content == "hi"
+        assert limiter.stats()["tokens_available"] == pytest.approx(950, abs=1)
+        assert limiter.active == 0
+
+    @pytest.mark.asyncio
+    async def test_requests_per_minute_throttles_calls(self):
+        """Calls beyond the request budget wait for the bucket to refill."""
+        limiter = LlmRateLimiter(requests_per_minute=600)  # 10 per second
+        limiter.requests.level = 1  # type: ignore[union-attr]
+
+        start = time.monotonic()
+        await asyncio.gather(*[limiter.call(StubCompletions().create, prompt="x") for _ in range(3)])
+        assert time.monotonic() - start >= 0.15
+
+    @pytest.mark.asyncio
+    async def test_priority_and_fair_queuing(self):
+        """High priority calls go first, and agents in a class take turns."""
+        limiter = LlmRateLimiter(max_concurrency=1)
+        blocker = await limiter.acquire()
+        order: List[str] = []
+
+        async def run(name: str, agent: str, priority: LlmPriority) -> None:
+            async with limiter.reserve(agent=agent, priority=priority):
+                order.append(name)
+
+        tasks = [
+            asyncio.create_task(run("a1", "a", LlmPriority.NORMAL)),
+            asyncio.create_task(run("a2", "a", LlmPriority.NORMAL)),
+            asyncio.create_task(run("a3", "a", LlmPriority.NORMAL)),
+            asyncio.create_task(run("b1", "b", LlmPriority.NORMAL)),
+            asyncio.create_task(run("urgent", "c", LlmPriority.HIGH)),
+        ]
+        await asyncio.sleep(0)
+        assert limiter.queued == 5
+
+        blocker.release()
+        await asyncio.gather(*tasks)
+        assert order == ["urgent", "a1", "b1", "a2", "a3"]
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_error_backs_off_and_retries(self):
+        """A 429 pauses dispatch and the call is retried."""
+        limiter = LlmRateLimiter(initial_backoff=0.05)
+        client = StubCompletions(failures=2)
+
+        start = time.monotonic()
+        await limiter.call(client.create, prompt="x")
+
+        assert client.calls == 3
+        assert limiter.rate_limited == 2
+        # Backoff doubles: 0.05s then 0.1s
+        assert time.monotonic() - start >= 0.14
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_error_raised_after_retries(self):
+        """The rate-limit error is raised once retries are exhausted."""
+        limiter = LlmRateLimiter(max_retries=1, initial_backoff=0.01)
+        client = StubCompletions(failures=5)
+
+        with pytest.raises(RateLimitError):
+            await limiter.call(client.create, prompt="x")
+        assert client.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        """A call cancelled while queued does not consume capacity."""
+        limiter = LlmRateLimiter(max_concurrency=1)
+        blocker = await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        blocker.release()
+        assert limiter.stats()["active"] == 0
+        assert limiter.queued == 0
+
+    def test_get_llm_rate_limiter_is_shared(self):
+        """The same limiter is returned for a provider."""
+        limiter = get_llm_rate_limiter("stub-provider", requests_per_minute=10)
+        assert get_llm_rate_limiter("STUB-PROVIDER") is limiter
@@ -7,7 +7,7 @@ import pytest
 from openmas.agent.mcp import McpAgent
 from openmas.communication.base import BaseCommunicator
 from openmas.exceptions import CommunicationError
-from openmas.sampling import MessageRole, SamplingContext, SamplingParameters
+from openmas.sampling import MessageRole, SamplingContext, SamplingParameters, collect_stream
 from openmas.sampling.providers.mcp import McpAgentSampler, McpSampler
 
 
@@ -143,6 +143,37 @@ class TestMcpSampler:
         with pytest.raises(CommunicationError, match="Test error"):
             await sampler.sample_text(prompt="Hello", system="You are a helpful assistant.")
 
+    @pytest.mark.asyncio
+    async def test_sample_stream_uses_communicator_stream(self, communicator):
+        """Test streaming through a communicator that supports sample_prompt_stream."""
+
+        async def fake_stream(**kwargs):
+            yield {"delta": "Gener"}
+            yield {"delta": "ated"}
+            yield {"delta": "", "done": True, "usage": {"output_tokens": 2}}
+
+        communicator.sample_prompt_stream = MagicMock(side_effect=fake_stream)
+        sampler = McpSampler(communicator=communicator, params=SamplingParameters(), target_service="llm-service")
+        context = SamplingContext(system_prompt="Be brief", messages=[])
+
+        result = await collect_stream(sampler.sample_stream(context))
+
+        assert result.content == "Generated"
+        assert result.usage == {"output_tokens": 2}
+        kwargs = communicator.sample_prompt_stream.call_args.kwargs
+        assert kwargs["target_service"] == "llm-service"
+        assert kwargs["system_prompt"] == "Be brief"
+
+    @pytest.mark.asyncio
+    async def test_sample_stream_falls_back_to_sample(self, communicator):
+        """Test streaming through a communicator without streaming support."""
+        sampler = McpSampler(communicator=communicator, params=SamplingParameters(), target_service="llm-service")
+
+        chunks = [chunk async for chunk in sampler.sample_stream(SamplingContext())]
+
+        assert [chunk.delta for chunk in chunks] == ["Generated response", ""]
+        assert chunks[-1].done is True
+
 
 class TestMcpAgentSampler:
     """Tests for the McpAgentSampler class."""
@@ -263,3 +294,37 @@ class TestMcpAgentSampler:
         # Call sample_text and expect an exception
         with pytest.raises(CommunicationError, match="Test error"):
             await sampler.sample_text(prompt="Hello", system="You are a helpful assistant.")
+
+    @pytest.mark.asyncio
+    async def test_sample_stream(self, agent):
+        """Test streaming through the agent's sample_prompt_stream."""
+
+        async def fake_stream(**kwargs):
+            yield {"delta": "Hi"}
+            yield {"delta": "", "done": True, "finish_reason": "stop"}
+
+        agent.sample_prompt_stream = MagicMock(side_effect=fake_stream)
+        sampler = McpAgentSampler(agent=agent, target_service="llm-service", default_model="claude-3")
+        context = sampler.create_context(messages=[{"role": "user", "content": "Hello"}])
+
+        result = await collect_stream(sampler.sample_stream(context))
+
+        assert result.content == "Hi"
+        assert result.finish_reason == "stop"
+        kwargs = agent.sample_prompt_stream.call_args.kwargs
+        assert kwargs["messages"] == [{"role": "user", "content": "Hello"}]
+        assert kwargs["model_preferences"] == {"model": "claude-3"}
+
+    @pytest.mark.asyncio
+    async def test_sample_stream_wraps_errors(self, agent):
+        """Test that unexpected errors while streaming become CommunicationErrors."""
+
+        async def failing_stream(**kwargs):
+            raise RuntimeError("boom")
+            yield  # pragma: no cover
+
+        agent.sample_prompt_stream = MagicMock(side_effect=failing_stream)
+        sampler = McpAgentSampler(agent=agent, target_service="llm-service")
+
+        with pytest.raises(CommunicationError, match="boom"):
+            await collect_stream(sampler.sample_stream(SamplingContext()))
@@ -1,5 +1,6 @@
 """Unit tests for the sampling system."""
 
+import asyncio
 import json
 from unittest.mock import Mock
 
@@ -13,9 +14,11 @@ from openmas.sampling.base import (
     Message,
     MessageRole,
     SamplerProtocol,
+    SamplingChunk,
     SamplingContext,
     SamplingParameters,
     SamplingResult,
+    collect_stream,
 )
 
 
@@ -347,6 +350,94 @@ class TestSamplerImplementation(BaseSampler):
         return SamplingResult(content="Test response")
 
 
+class TestSamplingStream:
+    """Tests for streamed sampling."""
+
+    @pytest.mark.asyncio
+    async def test_default_sample_stream_yields_single_delta(self):
+        """The base implementation yields the complete content followed by a final chunk."""
+        sampler = TestSamplerImplementation()
+        chunks = [chunk async for chunk in sampler.sample_stream(SamplingContext())]
+
+        assert [chunk.delta for chunk in chunks] == ["Test response", ""]
+        assert [chunk.done for chunk in chunks] == [False, True]
+
+    @pytest.mark.asyncio
+    async def test_collect_stream(self):
+        """Collecting a stream concatenates deltas and keeps the final metadata."""
+
+        async def stream():
+            yield SamplingChunk(delta="Hello, ")
+            yield SamplingChunk(delta="world")
+            yield SamplingChunk(done=True, finish_reason="stop", usage={"output_tokens": 3})
+
+        result = await collect_stream(stream())
+
+        assert result.content == "Hello, world"
+        assert result.finish_reason == "stop"
+        assert result.usage == {"output_tokens": 3}
+
+    def test_chunk_from_dict(self):
+        """Chunks can be built from communicator stream items."""
+        chunk = SamplingChunk.from_dict({"delta": "", "done": True, "usage": {"input_tokens": 5}})
+        assert chunk.done is True
+        assert chunk.usage == {"input_tokens": 5}
+
+
+class TestSampleBatch:
+    """Tests for batched sampling."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_order_with_bounded_concurrency(self):
+        """Results follow the input order and at most max_concurrency requests run at once."""
+        active = 0
+        peak = 0
+
+        class SlowSampler(BaseSampler):
+            async def sample(self, context, model=None):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                index = int(context.system_prompt)
+                await asyncio.sleep(0.001 * (10 - index))
+                active -= 1
+                return SamplingResult(content=context.system_prompt)
+
+        contexts = [SamplingContext(system_prompt=str(i)) for i in range(10)]
+        results = await SlowSampler().sample_batch(contexts, max_concurrency=3)
+
+        assert [result.content for result in results] == [str(i) for i in range(10)]
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_timeouts_and_errors(self):
+        """Per-request timeouts and errors are raised, or returned in place if requested."""
+
+        class FlakySampler(BaseSampler):
+            async def sample(self, context, model=None):
+                if context.system_prompt == "slow":
+                    await asyncio.sleep(1)
+                if context.system_prompt == "bad":
+                    raise RuntimeError("bad request")
+                return SamplingResult(content="ok")
+
+        contexts = [SamplingContext(system_prompt=p) for p in ("ok", "slow", "bad")]
+        results = await FlakySampler().sample_batch(contexts, timeout=0.01, return_exceptions=True)
+
+        assert results[0].content == "ok"
+        assert isinstance(results[1], asyncio.TimeoutError)
+        assert isinstance(results[2], RuntimeError)
+
+        with pytest.raises(RuntimeError):
+            await FlakySampler().sample_batch([contexts[0], contexts[2]])
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency(self):
+        """max_concurrency must be positive."""
+        with pytest.raises(ValueError):
+            await TestSamplerImplementation().sample_batch([SamplingContext()], max_concurrency=0)
+
+
 class TestSamplerProtocol:
     """Tests for the SamplerProtocol."""
 
@@ -0,0 +1,167 @@
+"""Unit tests for the sampling cache."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from openmas.sampling import (
+    BaseSampler,
+    CachingSampler,
+    MemorySamplingCache,
+    SamplingContext,
+    SamplingParameters,
+    SamplingResult,
+    SqliteSamplingCache,
+    collect_stream,
+    get_sampler,
+    sampling_cache_key,
+)
+from openmas.sampling.base import Message, MessageRole
+
+
+def _context(temperature: float = 0.0, content: str = "Hello") -> SamplingContext:
+    """Create a sampling context for tests."""
+    return SamplingContext(
+        system_prompt="Be brief",
+        messages=[Message(role=MessageRole.USER, content=content)],
+        parameters=SamplingParameters(temperature=temperature),
+    )
+
+
+@pytest.fixture
+def inner_sampler():
+    """Create a mock sampler that counts calls."""
+    sampler = MagicMock(spec=BaseSampler)
+    sampler.communicator = None
+    sampler.sample = AsyncMock(return_value=SamplingResult(content="Hi", usage={"output_tokens": 1}))
+    return sampler
+
+
+class TestSamplingCacheKey:
+    """Tests for sampling_cache_key."""
+
+    def test_identical_contexts_share_key(self):
+        """Identical requests map to the same key."""
+        assert sampling_cache_key(_context()) == sampling_cache_key(_context())
+
+    def test_key_depends_on_content_parameters_and_model(self):
+        """Messages, parameters and the model all change the key."""
+        base = sampling_cache_key(_context())
+        assert sampling_cache_key(_context(content="Bye")) != base
+        assert sampling_cache_key(_context(temperature=0.5)) != base
+        assert sampling_cache_key(_context(), model="other") != base
+
+
+class TestMemorySamplingCache:
+    """Tests for the in-memory LRU cache."""
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        """The least recently used entry is evicted first."""
+        cache = MemorySamplingCache(max_entries=2)
+        await cache.set("a", SamplingResult(content="a"))
+        await cache.set("b", SamplingResult(content="b"))
+        await cache.get("a")  # "a" becomes most recently used
+        await cache.set("c", SamplingResult(content="c"))
+
+        assert await cache.get("b") is None
+        assert (await cache.get("a")).content == "a"
+        assert len(cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self, monkeypatch):
+        """Expired entries are treated as misses."""
+        cache = MemorySamplingCache(ttl=10)
+        monkeypatch.setattr("openmas.sampling.cache.time.time", lambda: 1000.0)
+        await cache.set("a", SamplingResult(content="a"))
+        monkeypatch.setattr("openmas.sampling.cache.time.time", lambda: 1011.0)
+
+        assert await cache.get("a") is None
+        assert cache.stats() == {"hits": 0, "misses": 1, "hit_rate": 0.0}
+
+
+class TestSqliteSamplingCache:
+    """Tests for the SQLite cache."""
+
+    @pytest.mark.asyncio
+    async def test_persists_across_instances(self, tmp_path):
+        """Entries survive re-opening the database."""
+        path = tmp_path / "cache.db"
+        await SqliteSamplingCache(path).set("key", SamplingResult(content="stored", finish_reason="stop"))
+
+        result = await SqliteSamplingCache(path).get("key")
+
+        assert result.content == "stored"
+        assert result.finish_reason == "stop"
+
+    @pytest.mark.asyncio
+    async def test_clear(self, tmp_path):
+        """Clearing removes all entries."""
+        cache = SqliteSamplingCache(tmp_path / "cache.db")
+        await cache.set("key", SamplingResult(content="stored"))
+        await cache.clear()
+
+        assert await cache.get("key") is None
+
+
+class TestCachingSampler:
+    """Tests for the CachingSampler wrapper."""
+
+    @pytest.mark.asyncio
+    async def test_deterministic_requests_are_cached(self, inner_sampler):
+        """Repeated temperature-0 requests are served from the cache."""
+        cache = MemorySamplingCache()
+        sampler = CachingSampler(inner_sampler, cache)
+
+        first = await sampler.sample(_context())
+        second = await sampler.sample(_context())
+
+        assert first.content == second.content == "Hi"
+        inner_sampler.sample.assert_awaited_once()
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_nondeterministic_requests_bypass_cache(self, inner_sampler):
+        """Requests with a non-zero temperature always reach the sampler."""
+        sampler = CachingSampler(inner_sampler, MemorySamplingCache())
+
+        await sampler.sample(_context(temperature=0.7))
+        await sampler.sample(_context(temperature=0.7))
+
+        assert inner_sampler.sample.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_sends_only_misses(self, inner_sampler):
+        """Cached contexts in a batch are not sent to the wrapped sampler."""
+        inner_sampler.sample_batch = AsyncMock(return_value=[SamplingResult(content="New")])
+        sampler = CachingSampler(inner_sampler, MemorySamplingCache())
+        await sampler.sample(_context(content="cached"))
+
+        results = await sampler.sample_batch([_context(content="cached"), _context(content="new")])
+
+        assert [result.content for result in results] == ["Hi", "New"]
+        assert inner_sampler.sample_batch.call_args.args[0] == [_context(content="new")]
+        assert (await sampler.sample(_context(content="new"))).content == "New"
+
+    @pytest.mark.asyncio
+    async def test_stream_is_recorded_and_replayed(self, inner_sampler):
+        """A streamed result is cached and replayed as a stream."""
+        inner_sampler.sample_stream = BaseSampler.sample_stream.__get__(inner_sampler)
+        cache = MemorySamplingCache()
+        sampler = CachingSampler(inner_sampler, cache)
+
+        first = await collect_stream(sampler.sample_stream(_context()))
+        second = await collect_stream(sampler.sample_stream(_context()))
+
+        assert first.content == second.content == "Hi"
+        assert second.usage == {"output_tokens": 1}
+        inner_sampler.sample.assert_awaited_once()
+
+    def test_get_sampler_wraps_with_cache(self):
+        """get_sampler wraps the sampler when a cache is given."""
+        cache = MemorySamplingCache()
+        sampler = get_sampler(MagicMock(), SamplingParameters(provider="mock"), cache=cache)
+
+        assert isinstance(sampler, CachingSampler)
+        assert sampler.cache is cache